@@ -0,0 +1,180 @@
+"""Synthetic GEXF graphs for benchmarking.
+
+Graphs are written as they are generated, one element at a time, so files
+far larger than memory can be produced. Every topology uses node IDs
+``n0`` .. ``n<N-1>`` and the same typed attributes, so one set of scenarios
+runs against all of them:
+
+- nodes: ``type`` (string), ``rank`` (integer), ``score`` (float),
+  ``active`` (boolean)
+- edges: the GEXF ``weight`` and ``cost`` (float)
+
+Usage:
+    python -m benchmarks.generate scale-free 100000 graph.gexf.gz
+"""
+
+import random
+from pathlib import Path
+from typing import Iterator
+
+import click
+
+from grph.compression import open_output
+from grph.exporters import ChunkedWriter
+
+TOPOLOGIES = ("scale-free", "grid", "random", "dag")
+
+# Values of the ``type`` node attribute, drawn uniformly
+NODE_TYPES = ("server", "database", "cache", "queue", "client")
+
+# Edges added per node, on average, by the scale-free, random and DAG models
+DEFAULT_DEGREE = 3
+
+
+def generate(
+    topology: str,
+    num_nodes: int,
+    path: str | Path,
+    degree: int = DEFAULT_DEGREE,
+    seed: int = 0,
+) -> int:
+    """Write a synthetic graph to a GEXF file.
+
+    Args:
+        topology: One of ``TOPOLOGIES``.
+        num_nodes: Number of nodes. Grids are rounded down to a square.
+        path: Output path; ``.gz``, ``.bz2`` and ``.xz`` are compressed.
+        degree: Edges added per node (ignored for grids).
+        seed: Random seed, so the same arguments give the same file.
+
+    Returns:
+        Number of edges written.
+    """
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Unknown topology: {topology}")
+    rng = random.Random(seed)
+    if topology == "grid":
+        side = int(num_nodes**0.5)
+        num_nodes = side * side
+        edges = _grid_edges(side)
+    elif topology == "scale-free":
+        edges = _scale_free_edges(num_nodes, degree, rng)
+    elif topology == "random":
+        edges = _random_edges(num_nodes, degree, rng)
+    else:
+        edges = _dag_edges(num_nodes, degree, rng)
+    directed = topology == "dag"
+
+    count = 0
+    with open_output(path) as f, ChunkedWriter(f) as out:
+        _write_header(out, topology, directed)
+        out.write("    <nodes>\n")
+        for i in range(num_nodes):
+            out.write(
+                f'      <node id="n{i}" label="Node {i}"><attvalues>'
+                f'<attvalue for="0" value="{NODE_TYPES[rng.randrange(len(NODE_TYPES))]}"/>'
+                f'<attvalue for="1" value="{rng.randrange(1000)}"/>'
+                f'<attvalue for="2" value="{rng.random():.6f}"/>'
+                f'<attvalue for="3" value="{"true" if rng.random() < 0.5 else "false"}"/>'
+                "</attvalues></node>\n"
+            )
+        out.write("    </nodes>\n    <edges>\n")
+        for u, v in edges:
+            out.write(
+                f'      <edge id="{count}" source="n{u}" target="n{v}" '
+                f'weight="{rng.uniform(0.1, 10.0):.3f}"><attvalues>'
+                f'<attvalue for="0" value="{rng.uniform(0.1, 10.0):.3f}"/>'
+                "</attvalues></edge>\n"
+            )
+            count += 1
+        out.write("    </edges>\n  </graph>\n</gexf>\n")
+    return count
+
+
+def _write_header(out: ChunkedWriter, topology: str, directed: bool) -> None:
+    """Write the XML declaration, metadata and attribute declarations."""
+    edge_type = "directed" if directed else "undirected"
+    out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    out.write('<gexf xmlns="http://gexf.net/1.3" version="1.3">\n')
+    out.write("  <meta>\n    <creator>grph benchmarks</creator>\n")
+    out.write(f"    <description>Synthetic {topology} graph</description>\n  </meta>\n")
+    out.write(f'  <graph mode="static" defaultedgetype="{edge_type}">\n')
+    out.write(
+        '    <attributes class="node">\n'
+        '      <attribute id="0" title="type" type="string"/>\n'
+        '      <attribute id="1" title="rank" type="integer"/>\n'
+        '      <attribute id="2" title="score" type="float"/>\n'
+        '      <attribute id="3" title="active" type="boolean"/>\n'
+        "    </attributes>\n"
+        '    <attributes class="edge">\n'
+        '      <attribute id="0" title="cost" type="float"/>\n'
+        "    </attributes>\n"
+    )
+
+
+def _grid_edges(side: int) -> Iterator[tuple[int, int]]:
+    """Connect each cell of a square lattice to its right and lower neighbors."""
+    for row in range(side):
+        for col in range(side):
+            node = row * side + col
+            if col + 1 < side:
+                yield node, node + 1
+            if row + 1 < side:
+                yield node, node + side
+
+
+def _scale_free_edges(n: int, m: int, rng: random.Random) -> Iterator[tuple[int, int]]:
+    """Barabasi-Albert preferential attachment.
+
+    Each new node links to ``m`` distinct existing nodes, chosen with
+    probability proportional to their degree.
+    """
+    # Every node appears here once per incident edge
+    endpoints: list[int] = []
+    for node in range(1, n):
+        if node <= m:
+            targets = set(range(node))
+        else:
+            targets = set()
+            while len(targets) < m:
+                targets.add(endpoints[rng.randrange(len(endpoints))])
+        for target in targets:
+            yield node, target
+            endpoints += (node, target)
+
+
+def _random_edges(n: int, degree: int, rng: random.Random) -> Iterator[tuple[int, int]]:
+    """Erdos-Renyi G(n, m) with ``m = n * degree`` distinct undirected edges."""
+    m = min(n * degree, n * (n - 1) // 2)
+    seen: set[int] = set()
+    while len(seen) < m:
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u == v:
+            continue
+        key = min(u, v) * n + max(u, v)
+        if key not in seen:
+            seen.add(key)
+            yield u, v
+
+
+def _dag_edges(n: int, degree: int, rng: random.Random) -> Iterator[tuple[int, int]]:
+    """Link every node to up to ``degree`` distinct earlier nodes."""
+    for node in range(1, n):
+        for target in rng.sample(range(node), min(degree, node)):
+            yield target, node
+
+
+@click.command()
+@click.argument("topology", type=click.Choice(TOPOLOGIES))
+@click.argument("num_nodes", type=int)
+@click.argument("output", type=click.Path(dir_okay=False))
+@click.option("--degree", default=DEFAULT_DEGREE, show_default=True, help="Edges added per node.")
+@click.option("--seed", default=0, show_default=True, help="Random seed.")
+def main(topology: str, num_nodes: int, output: str, degree: int, seed: int) -> None:
+    """Write a synthetic TOPOLOGY graph with NUM_NODES nodes to OUTPUT."""
+    edges = generate(topology, num_nodes, output, degree=degree, seed=seed)
+    click.echo(f"Wrote {topology} graph with {edges} edges to {output}")
+
+
+if __name__ == "__main__":
+    main()
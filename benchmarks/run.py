@@ -0,0 +1,315 @@
+"""Timed benchmark scenarios over synthetic graphs.
+
+Each scenario runs against every requested topology and size. Graphs are
+generated once into a data directory and reused, so repeated runs only pay
+for the scenarios. Results are written as JSON and, given a baseline from an
+earlier run, compared scenario by scenario.
+
+Usage:
+    python -m benchmarks.run --nodes 10000 --output results.json
+    python -m benchmarks.run --nodes 10000 --baseline results.json
+"""
+
+import io
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from grph import __version__
+from grph.models import CentralityType, ExportFormat
+from grph.parser import GEXFGraph
+from grph.profiling import Profiler
+
+from .generate import TOPOLOGIES, generate
+
+DEFAULT_DATA_DIR = Path(__file__).parent / "data"
+
+# Median slowdown, relative to the baseline, reported as a regression
+DEFAULT_THRESHOLD = 0.10
+
+# Untimed runs per scenario before timing, to build lazy structures (CSR etc.)
+DEFAULT_WARMUP = 1
+
+
+def _load(graph: GEXFGraph) -> None:
+    GEXFGraph(graph.file_path, cache_size=0)
+
+
+def _nodes_attr(graph: GEXFGraph) -> None:
+    sum(1 for _ in graph.nodes(attr_filters=[("type", "server")]))
+
+
+def _path(graph: GEXFGraph) -> None:
+    graph.shortest_path("n0", f"n{graph.metadata.node_count - 1}")
+
+
+def _reachable(graph: GEXFGraph) -> None:
+    graph.reachable("n0").count()
+
+
+def _stats(graph: GEXFGraph) -> None:
+    graph.get_stats()
+
+
+def _centrality(graph: GEXFGraph) -> None:
+    graph.get_centrality(CentralityType.PAGERANK)
+
+
+def _export(graph: GEXFGraph) -> None:
+    graph.write_export(ExportFormat.JSON, io.BytesIO())
+
+
+# Scenario name -> function run against a loaded graph
+SCENARIOS: dict[str, Callable[[GEXFGraph], None]] = {
+    "load": _load,
+    "nodes-attr": _nodes_attr,
+    "path": _path,
+    "reachable": _reachable,
+    "stats": _stats,
+    "centrality": _centrality,
+    "export": _export,
+}
+
+
+@dataclass
+class Result:
+    """Timings of one scenario on one graph.
+
+    Attributes:
+        scenario: Scenario name.
+        topology: Graph topology.
+        nodes: Number of nodes in the graph.
+        edges: Number of edges in the graph.
+        times: Wall time of each timed repeat in seconds.
+        phases: Mean wall time per profiling span over the timed repeats, in
+            seconds. Warm-up runs are neither timed nor profiled.
+    """
+
+    scenario: str
+    topology: str
+    nodes: int
+    edges: int
+    times: list[float]
+    phases: dict[str, float]
+
+    @property
+    def key(self) -> str:
+        """Identify the scenario and graph, for matching against a baseline."""
+        return f"{self.scenario}/{self.topology}/{self.nodes}"
+
+    @property
+    def median(self) -> float:
+        """Median wall time in seconds."""
+        return statistics.median(self.times)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {**asdict(self), "median": self.median, "min": min(self.times)}
+
+
+def graph_file(data_dir: Path, topology: str, nodes: int) -> Path:
+    """Get the path of a synthetic graph, generating it on first use."""
+    path = data_dir / f"{topology}-{nodes}.gexf.gz"
+    if not path.exists():
+        data_dir.mkdir(parents=True, exist_ok=True)
+        partial = path.with_suffix(".tmp")
+        generate(topology, nodes, partial)
+        partial.rename(path)
+    return path
+
+
+def run_scenario(
+    name: str, graph: GEXFGraph, topology: str, repeat: int, warmup: int = DEFAULT_WARMUP
+) -> Result:
+    """Time a scenario ``repeat`` times against a loaded graph.
+
+    The first ``warmup`` runs are untimed, so lazily built structures such as
+    the CSR adjacency are not charged to the first timed repeat only. Every
+    timed repeat is profiled.
+    """
+    scenario = SCENARIOS[name]
+    for _ in range(warmup):
+        scenario(graph)
+
+    times = []
+    with Profiler(memory=False) as profiler:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            scenario(graph)
+            times.append(time.perf_counter() - start)
+
+    phases: dict[str, float] = {}
+    for s in profiler.spans:
+        phases[s.name] = phases.get(s.name, 0.0) + s.wall_time / repeat
+    return Result(
+        name,
+        topology,
+        graph.metadata.node_count,
+        graph.metadata.edge_count,
+        times,
+        phases,
+    )
+
+
+def compare(
+    results: list[Result], baseline: dict[str, Any], threshold: float
+) -> list[tuple[Result, float | None, bool]]:
+    """Compare results with a baseline run.
+
+    Args:
+        results: Results of this run.
+        baseline: A results document written by an earlier run.
+        threshold: Relative slowdown of the median counted as a regression.
+
+    Returns:
+        Tuples of (result, median ratio to the baseline or None if the
+        baseline has no matching entry, whether it regressed).
+    """
+    previous = {
+        f"{r['scenario']}/{r['topology']}/{r['nodes']}": r["median"]
+        for r in baseline.get("results", [])
+    }
+    rows = []
+    for result in results:
+        base = previous.get(result.key)
+        ratio = result.median / base if base else None
+        rows.append((result, ratio, ratio is not None and ratio > 1 + threshold))
+    return rows
+
+
+@click.command()
+@click.option(
+    "--topology",
+    "topologies",
+    multiple=True,
+    type=click.Choice(TOPOLOGIES),
+    help="Topology to run (repeatable, default: all).",
+)
+@click.option(
+    "--nodes",
+    "sizes",
+    multiple=True,
+    type=int,
+    help="Graph size in nodes (repeatable, default: 2000).",
+)
+@click.option(
+    "--scenario",
+    "scenarios",
+    multiple=True,
+    type=click.Choice(list(SCENARIOS)),
+    help="Scenario to run (repeatable, default: all).",
+)
+@click.option("--repeat", default=3, show_default=True, help="Timed runs per scenario.")
+@click.option(
+    "--warmup",
+    default=DEFAULT_WARMUP,
+    show_default=True,
+    help="Untimed runs per scenario before timing.",
+)
+@click.option(
+    "--data-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=DEFAULT_DATA_DIR,
+    help="Directory for generated graphs.",
+)
+@click.option(
+    "--output", type=click.Path(dir_okay=False), help="Write results to this JSON file."
+)
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Compare with results from an earlier run.",
+)
+@click.option(
+    "--threshold",
+    default=DEFAULT_THRESHOLD,
+    show_default=True,
+    help="Relative slowdown reported as a regression.",
+)
+def main(
+    topologies: tuple[str, ...],
+    sizes: tuple[int, ...],
+    scenarios: tuple[str, ...],
+    repeat: int,
+    warmup: int,
+    data_dir: Path,
+    output: str | None,
+    baseline: str | None,
+    threshold: float,
+) -> None:
+    """Run the benchmark scenarios and report median wall times.
+
+    Exits with status 1 if a baseline is given and any scenario regressed.
+    """
+    console = Console()
+    results = []
+    for topology in topologies or TOPOLOGIES:
+        for size in sizes or (2000,):
+            path = graph_file(data_dir, topology, size)
+            # Without memoized results, so every repeat times the algorithm
+            graph = GEXFGraph(path, cache_size=0)
+            for name in scenarios or SCENARIOS:
+                console.print(f"[dim]{name} on {topology} ({size} nodes)[/dim]")
+                results.append(run_scenario(name, graph, topology, repeat, warmup))
+
+    document = {
+        "grph_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "repeat": repeat,
+        # Untimed runs before the timed repeats; phases average the timed ones
+        "warmup": warmup,
+        "phase_times": "mean per timed repeat",
+        "results": [r.to_dict() for r in results],
+    }
+    if output:
+        Path(output).write_text(json.dumps(document, indent=2) + "\n")
+
+    if baseline:
+        rows = compare(results, json.loads(Path(baseline).read_text()), threshold)
+    else:
+        rows = [(result, None, False) for result in results]
+
+    table = Table(title="Benchmarks", show_header=True, header_style="bold cyan")
+    table.add_column("Scenario", style="bold")
+    table.add_column("Topology")
+    table.add_column("Nodes", justify="right")
+    table.add_column("Edges", justify="right")
+    table.add_column("Median", justify="right")
+    table.add_column("Min", justify="right")
+    if baseline:
+        table.add_column("vs Baseline", justify="right")
+
+    for result, ratio, regressed in rows:
+        cells = [
+            result.scenario,
+            result.topology,
+            str(result.nodes),
+            str(result.edges),
+            f"{result.median * 1000:.1f} ms",
+            f"{min(result.times) * 1000:.1f} ms",
+        ]
+        if baseline:
+            change = "-" if ratio is None else f"{(ratio - 1) * 100:+.1f}%"
+            cells.append(f"[red]{change}[/red]" if regressed else change)
+        table.add_row(*cells)
+    console.print(table)
+
+    if any(regressed for _, _, regressed in rows):
+        console.print(f"[red]Regressions above {threshold:.0%} against {baseline}[/red]")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -60,8 +60,10 @@ const sidebars: SidebarsConfig = {
         'cli-reference/has-path',
         'cli-reference/reachable',
         'cli-reference/common-neighbors',
+        'cli-reference/similarity',
         'cli-reference/stats',
         'cli-reference/centrality',
+        'cli-reference/ppr',
         'cli-reference/components',
         'cli-reference/degree',
         'cli-reference/ego',
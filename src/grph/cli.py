@@ -1,30 +1,57 @@
-"""CLI entry point for the grph tool."""
+"""CLI entry point for the grph tool.
 
+Only light modules are imported at startup. NetworkX, NumPy, SciPy and Rich
+are imported by the commands that need them, so ``grph --help`` and
+``grph meta`` do not pay for them.
+"""
+
+import os
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Iterable, NoReturn
 
 import click
-from rich.console import Console
 
 from . import __version__
-from .formatters import (
-    print_edges_table,
-    print_info_table,
-    print_json,
-    print_metadata_table,
-    print_nodes_table,
-    print_path_result,
-    print_paths_list,
-    print_stats_table,
-    print_centrality_table,
-    print_components_table,
-    print_degree_table,
+from .compression import compress_stream, open_output
+from .errors import GEXFParseError
+from .metadata import read_metadata
+from .models import (
+    CentralityType,
+    Compression,
+    Edge,
+    ExportFormat,
+    Node,
+    RecordFormat,
+    SimilarityMetric,
+    TimelinePoint,
 )
-from .models import CentralityType, ExportFormat
-from .parser import GEXFGraph, GEXFParseError
+from .profiling import Profiler, cprofile, span, traced
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from .diskgraph import DiskGraph
+    from .frames import EdgeFrame, NodeFrame
+    from .parser import GEXFGraph
+    from .results import NodeSet
+
+
+class LazyConsole:
+    """Stand-in for a Rich console that creates it on first use."""
+
+    def __init__(self) -> None:
+        self._console: "Console | None" = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._console is None:
+            from rich.console import Console
 
+            self._console = Console()
+        return getattr(self._console, name)
 
-console = Console()
+
+console = LazyConsole()
 
 
 def parse_attr_filter(
@@ -51,18 +78,106 @@ def parse_attr_filter(
     return filters
 
 
-def load_graph(file_path: str) -> GEXFGraph:
+def binary_stdout() -> BinaryIO:
+    """Get the binary stream behind stdout, for output that bypasses Rich.
+
+    Pending text output is flushed first so the two streams stay in order.
+    """
+    sys.stdout.flush()
+    return sys.stdout.buffer
+
+
+def exit_stdout_closed() -> NoReturn:
+    """Exit quietly after the reader of stdout stopped early (e.g. ``| head``).
+
+    Stdout is pointed at devnull so the final flush at exit does not fail
+    again. The exit status is 0: the reader got all the output it wanted.
+    """
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+    sys.exit(0)
+
+
+@traced
+def output_json(data: Any, compact: bool = False) -> None:
+    """Write data as JSON to stdout, bypassing Rich.
+
+    Args:
+        data: Data to serialize (models are converted with ``to_dict``).
+        compact: Write everything on one line instead of indenting.
+    """
+    from .serialization import dump
+
+    stdout = binary_stdout()
+    try:
+        dump(data, stdout, compact=compact)
+        stdout.flush()
+    except BrokenPipeError:
+        exit_stdout_closed()
+
+
+@traced
+def output_records(
+    records: "Iterable[Node | Edge | TimelinePoint] | NodeFrame | EdgeFrame",
+    output_format: str,
+    columns: list[str] | None = None,
+) -> None:
+    """Stream nodes, edges or timeline points to stdout, one record per line.
+
+    Args:
+        records: Records consumed lazily, or a frame of nodes or edges.
+        output_format: A ``RecordFormat`` value.
+        columns: Column names for TSV and CSV output (frames know their own).
+    """
+    from .frames import EdgeFrame, NodeFrame
+    from .records import write_frame, write_records
+
+    stdout = binary_stdout()
+    try:
+        if isinstance(records, (NodeFrame, EdgeFrame)):
+            write_frame(records, RecordFormat(output_format), stdout)
+        else:
+            write_records(records, RecordFormat(output_format), columns or [], stdout)
+        stdout.flush()
+    except BrokenPipeError:
+        exit_stdout_closed()
+
+
+def print_profile(profiler: Profiler) -> None:
+    """Print the spans collected by a profiler to stderr."""
+    from rich.console import Console
+
+    from .formatters import print_profile_table
+
+    print_profile_table(profiler.spans, Console(stderr=True))
+
+
+@traced
+def load_graph(file_path: str, disk: bool = False) -> "GEXFGraph | DiskGraph":
     """Load a GEXF graph, handling errors gracefully.
 
     Args:
         file_path: Path to the GEXF file.
+        disk: Use the file's out-of-core index instead of parsing it, if it
+            has a fresh one. Only for commands that ``DiskGraph`` supports.
 
     Returns:
-        Parsed GEXFGraph object.
+        Parsed GEXFGraph object, or a DiskGraph over the index.
 
     Raises:
         SystemExit: If the file cannot be parsed.
     """
+    if disk:
+        with span("import"):
+            from .diskgraph import DiskGraph
+
+        graph = DiskGraph.open(file_path)
+        if graph is not None:
+            return graph
+
+    with span("import"):
+        from .parser import GEXFGraph
+
     try:
         return GEXFGraph(file_path)
     except GEXFParseError as e:
@@ -70,9 +185,144 @@ def load_graph(file_path: str) -> GEXFGraph:
         sys.exit(1)
 
 
+def cached_result(
+    file_path: str,
+    command: str,
+    arguments: dict[str, Any],
+    compute: Callable[["GEXFGraph"], Any],
+    no_cache: bool = False,
+    refresh: bool = False,
+    disk: bool = False,
+) -> Any:
+    """Compute a command result on a graph, or reuse the stored one.
+
+    Results are stored on disk keyed by the file contents, the command, its
+    arguments and the grph version; a hit does not parse the file at all.
+
+    Args:
+        file_path: Path to the GEXF file.
+        command: Command name, part of the cache key.
+        arguments: Arguments that affect the result, part of the cache key.
+        compute: Called with the loaded graph on a miss.
+        no_cache: Neither read nor write the cache.
+        refresh: Recompute and replace any stored result.
+        disk: Compute on the file's out-of-core index, if it has one.
+    """
+    if no_cache:
+        return compute(load_graph(file_path, disk))
+
+    from .result_store import ResultStore
+
+    store = ResultStore.default()
+    with span("result_cache"):
+        key = store.key(file_path, command, arguments)
+        result = None if refresh else store.get(key)
+    if result is None:
+        result = compute(load_graph(file_path, disk))
+        store.put(key, result)
+    return result
+
+
+def time_arguments(at_time: str | None, between: tuple[str, str] | None) -> dict[str, Any]:
+    """Validate the --at/--between options.
+
+    Returns:
+        The selected time window as cache key arguments (empty if none).
+
+    Raises:
+        SystemExit: If both options are given.
+    """
+    if at_time is not None and between:
+        console.print("[red]Error:[/red] Use either --at or --between, not both")
+        sys.exit(1)
+    if at_time is not None:
+        return {"at": at_time}
+    if between:
+        return {"between": list(between)}
+    return {}
+
+
+def time_slice(
+    graph: "GEXFGraph", at_time: str | None, between: tuple[str, str] | None
+) -> "GEXFGraph":
+    """Restrict a graph to the time window selected by --at/--between.
+
+    Raises:
+        SystemExit: If the graph is not dynamic or a time is invalid.
+    """
+    window = time_arguments(at_time, between)
+    if not window:
+        return graph
+    try:
+        return graph.at(at_time) if "at" in window else graph.between(*between)
+    except GEXFParseError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+
+
+def output_node_set(
+    node_set: "NodeSet",
+    as_json: bool,
+    ids_only: bool,
+    count: bool,
+    heading: str,
+    empty_message: str,
+    output_format: str | None = None,
+    compact: bool = False,
+) -> None:
+    """Print a traversal result in the format selected by the output flags.
+
+    Args:
+        node_set: Nodes produced by a traversal.
+        as_json: Output as JSON.
+        ids_only: Output only node IDs, without loading node attributes.
+        count: Output only the number of nodes.
+        heading: Heading shown above the table output.
+        empty_message: Message shown when the table output would be empty.
+        output_format: Stream records in this ``RecordFormat`` instead.
+        compact: Write JSON on a single line.
+    """
+    from .formatters import TABLE_MAX_ROWS, print_nodes_table
+
+    if count:
+        if as_json:
+            output_json({"count": node_set.count()}, compact)
+        else:
+            click.echo(node_set.count())
+    elif ids_only:
+        if as_json:
+            output_json(node_set.ids(), compact)
+        elif node_set:
+            click.echo("\n".join(node_set.ids()))
+    elif output_format:
+        output_records(node_set.to_frame(), output_format)
+    elif as_json:
+        output_json(node_set, compact)
+    elif node_set:
+        # Large results off a terminal are streamed as TSV, without a heading
+        if console.is_terminal or node_set.count() <= TABLE_MAX_ROWS:
+            console.print(heading)
+            console.print()
+        print_nodes_table(node_set, console=console)
+    else:
+        console.print(f"[yellow]{empty_message}[/yellow]")
+
+
 @click.group()
 @click.version_option(version=__version__, prog_name="grph")
-def main() -> None:
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Print wall time, CPU time and peak memory per phase to stderr.",
+)
+@click.option(
+    "--cprofile",
+    "cprofile_path",
+    type=click.Path(dir_okay=False),
+    help="Run under cProfile and write the stats to this file.",
+)
+@click.pass_context
+def main(ctx: click.Context, profile: bool, cprofile_path: str | None) -> None:
     """grph - A CLI tool for exploring, analyzing, and querying graph files.
 
     Like grep, but for graphs. Explore nodes, find paths, calculate centrality,
@@ -89,40 +339,59 @@ def main() -> None:
         grph path graph.gexf nodeA nodeB
 
         grph centrality graph.gexf --type pagerank
+
+        grph --profile centrality graph.gexf
     """
-    pass
+    # Resources close in reverse order: the command span ends, the report
+    # is printed, then profiling stops
+    if cprofile_path:
+        ctx.with_resource(cprofile(cprofile_path))
+    if profile:
+        profiler = ctx.with_resource(Profiler(memory=True))
+        ctx.call_on_close(lambda: print_profile(profiler))
+        ctx.with_resource(span(ctx.invoked_subcommand or "grph"))
 
 
 @main.command()
 @click.argument("file", type=click.Path(exists=True, dir_okay=False))
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
-def meta(file: str, as_json: bool) -> None:
+@click.option("--compact", is_flag=True, help="Write JSON on a single line (with --json).")
+def meta(file: str, as_json: bool, compact: bool) -> None:
     """Display metadata from a GEXF file.
 
     Shows information like creator, description, last modified date,
     graph mode, and default edge type.
     """
-    graph = load_graph(file)
+    try:
+        metadata = read_metadata(file)
+    except GEXFParseError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
 
     if as_json:
-        print_json(graph.metadata, console)
+        output_json(metadata, compact)
     else:
-        print_metadata_table(graph.metadata, console)
+        from .formatters import print_metadata_table
+
+        print_metadata_table(metadata, console)
 
 
 @main.command()
 @click.argument("file", type=click.Path(exists=True, dir_okay=False))
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
-def info(file: str, as_json: bool) -> None:
+@click.option("--compact", is_flag=True, help="Write JSON on a single line (with --json).")
+def info(file: str, as_json: bool, compact: bool) -> None:
     """Display a summary of the graph.
 
     Shows node/edge counts and available attributes.
     """
+    from .formatters import print_info_table
+
     graph = load_graph(file)
     info_data = graph.get_info()
 
     if as_json:
-        print_json(info_data, console)
+        output_json(info_data, compact)
     else:
         print_info_table(info_data, console)
 
@@ -142,17 +411,48 @@ def info(file: str, as_json: bool) -> None:
     help="Filter by label pattern (supports * and ? wildcards).",
 )
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+@click.option("--compact", is_flag=True, help="Write JSON on a single line (with --json).")
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice([f.value for f in RecordFormat]),
+    help="Stream one record per line as NDJSON, TSV or CSV.",
+)
 @click.option(
     "--no-attrs",
     is_flag=True,
     help="Hide the attributes column in table output.",
 )
+@click.option(
+    "--limit",
+    type=click.IntRange(min=0),
+    help="Show at most this many results.",
+)
+@click.option(
+    "--offset",
+    type=click.IntRange(min=0),
+    default=0,
+    help="Skip this many matching results first.",
+)
+@click.option("--at", "at_time", help="Query a dynamic graph as it was at this time.")
+@click.option(
+    "--between",
+    nargs=2,
+    metavar="START END",
+    help="Query everything a dynamic graph held between two times.",
+)
 def nodes(
     file: str,
     attr_filters: list[tuple[str, str]],
     label_pattern: str | None,
     as_json: bool,
+    compact: bool,
+    output_format: str | None,
     no_attrs: bool,
+    limit: int | None,
+    offset: int,
+    at_time: str | None,
+    between: tuple[str, str] | None,
 ) -> None:
     """List and filter nodes in the graph.
 
@@ -163,12 +463,30 @@ def nodes(
         grph nodes graph.gexf --attr type=server
 
         grph nodes graph.gexf --label "Server*" --json
+
+        grph nodes graph.gexf --format ndjson | head
+
+        grph nodes graph.gexf --limit 50 --offset 100
+
+        grph nodes dynamic.gexf --at 2024-06-01
     """
-    graph = load_graph(file)
-    matching_nodes = list(graph.nodes(attr_filters=attr_filters, label_pattern=label_pattern))
+    from .formatters import print_nodes_table
+    from .records import node_columns
 
-    if as_json:
-        print_json(matching_nodes, console)
+    graph = time_slice(load_graph(file), at_time, between)
+
+    if as_json and not output_format:
+        # JSON is rendered column by column from a frame
+        frame = graph.node_frame(attr_filters=attr_filters, label_pattern=label_pattern)
+        output_json(frame[offset:None if limit is None else offset + limit], compact)
+        return
+
+    # Records and tables are built one at a time, so output starts at once
+    matching_nodes = graph.nodes(
+        attr_filters=attr_filters, label_pattern=label_pattern, limit=limit, offset=offset
+    )
+    if output_format:
+        output_records(matching_nodes, output_format, node_columns(graph.node_attribute_keys()))
     else:
         print_nodes_table(matching_nodes, show_attributes=not no_attrs, console=console)
 
@@ -190,11 +508,36 @@ def nodes(
     help="Filter by edge type (e.g., directed, undirected).",
 )
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+@click.option("--compact", is_flag=True, help="Write JSON on a single line (with --json).")
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice([f.value for f in RecordFormat]),
+    help="Stream one record per line as NDJSON, TSV or CSV.",
+)
 @click.option(
     "--no-attrs",
     is_flag=True,
     help="Hide the attributes column in table output.",
 )
+@click.option(
+    "--limit",
+    type=click.IntRange(min=0),
+    help="Show at most this many results.",
+)
+@click.option(
+    "--offset",
+    type=click.IntRange(min=0),
+    default=0,
+    help="Skip this many matching results first.",
+)
+@click.option("--at", "at_time", help="Query a dynamic graph as it was at this time.")
+@click.option(
+    "--between",
+    nargs=2,
+    metavar="START END",
+    help="Query everything a dynamic graph held between two times.",
+)
 def edges(
     file: str,
     attr_filters: list[tuple[str, str]],
@@ -202,7 +545,13 @@ def edges(
     target_filter: str | None,
     type_filter: str | None,
     as_json: bool,
+    compact: bool,
+    output_format: str | None,
     no_attrs: bool,
+    limit: int | None,
+    offset: int,
+    at_time: str | None,
+    between: tuple[str, str] | None,
 ) -> None:
     """List and filter edges in the graph.
 
@@ -213,19 +562,40 @@ def edges(
         grph edges graph.gexf --source node1
 
         grph edges graph.gexf --attr weight=1.0 --json
+
+        grph edges graph.gexf --format tsv > edges.tsv
+
+        grph edges graph.gexf --source lb1 --limit 20
+
+        grph edges dynamic.gexf --between 2024-01-01 2024-03-31
     """
-    graph = load_graph(file)
-    matching_edges = list(
-        graph.edges(
+    from .formatters import print_edges_table
+    from .records import edge_columns
+
+    graph = time_slice(load_graph(file), at_time, between)
+
+    if as_json and not output_format:
+        # JSON is rendered column by column from a frame
+        frame = graph.edge_frame(
             attr_filters=attr_filters,
             source_filter=source_filter,
             target_filter=target_filter,
             type_filter=type_filter,
         )
+        output_json(frame[offset:None if limit is None else offset + limit], compact)
+        return
+
+    # Records and tables are built one at a time, so output starts at once
+    matching_edges = graph.edges(
+        attr_filters=attr_filters,
+        source_filter=source_filter,
+        target_filter=target_filter,
+        type_filter=type_filter,
+        limit=limit,
+        offset=offset,
     )
-
-    if as_json:
-        print_json(matching_edges, console)
+    if output_format:
+        output_records(matching_edges, output_format, edge_columns(graph.edge_attribute_keys()))
     else:
         print_edges_table(matching_edges, show_attributes=not no_attrs, console=console)
 
@@ -250,13 +620,42 @@ def edges(
     default=1,
     help="Number of hops to traverse (default: 1).",
 )
+@click.option(
+    "--edge-where",
+    "edge_filters",
+    multiple=True,
+    callback=parse_attr_filter,
+    help="Only follow edges with this attribute (key=value). Can be specified multiple times.",
+)
+@click.option(
+    "--node-where",
+    "node_filters",
+    multiple=True,
+    callback=parse_attr_filter,
+    help="Only pass through nodes with this attribute (key=value). Can be specified multiple times.",
+)
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+@click.option("--compact", is_flag=True, help="Write JSON on a single line (with --json).")
+@click.option("--ids-only", is_flag=True, help="Output only node IDs, one per line.")
+@click.option("--count", is_flag=True, help="Output only the number of matching nodes.")
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice([f.value for f in RecordFormat]),
+    help="Stream one record per line as NDJSON, TSV or CSV.",
+)
 def neighbors(
     file: str,
     node_id: str,
     direction: str,
     depth: int,
+    edge_filters: list[tuple[str, str]],
+    node_filters: list[tuple[str, str]],
     as_json: bool,
+    compact: bool,
+    ids_only: bool,
+    count: bool,
+    output_format: str | None,
 ) -> None:
     """Find neighbors of a node.
 
@@ -268,24 +667,35 @@ def neighbors(
         grph neighbors graph.gexf server1
 
         grph neighbors graph.gexf lb1 --direction out --depth 2
+
+        grph neighbors graph.gexf lb1 --depth 3 --count
+
+        grph neighbors graph.gexf lb1 --depth 2 --edge-where relationship=routes
     """
-    graph = load_graph(file)
+    graph = load_graph(file, disk=True)
 
     try:
-        neighbor_nodes = graph.neighbors(node_id, direction=direction, depth=depth)
+        neighbor_nodes = graph.neighbors(
+            node_id,
+            direction=direction,
+            depth=depth,
+            edge_filters=edge_filters,
+            node_filters=node_filters,
+        )
     except GEXFParseError as e:
         console.print(f"[red]Error:[/red] {e}")
         sys.exit(1)
 
-    if as_json:
-        print_json(neighbor_nodes, console)
-    else:
-        if neighbor_nodes:
-            console.print(f"[bold]Neighbors of {node_id}[/bold] (depth={depth}, direction={direction})")
-            console.print()
-            print_nodes_table(neighbor_nodes, console=console)
-        else:
-            console.print(f"[yellow]No neighbors found for node {node_id}.[/yellow]")
+    output_node_set(
+        neighbor_nodes,
+        as_json=as_json,
+        ids_only=ids_only,
+        count=count,
+        heading=f"[bold]Neighbors of {node_id}[/bold] (depth={depth}, direction={direction})",
+        empty_message=f"No neighbors found for node {node_id}.",
+        output_format=output_format,
+        compact=compact,
+    )
 
 
 @main.command()
@@ -293,13 +703,40 @@ def neighbors(
 @click.argument("source")
 @click.argument("target")
 @click.option("--weighted", is_flag=True, help="Use edge weights for path calculation.")
+@click.option(
+    "--edge-where",
+    "edge_filters",
+    multiple=True,
+    callback=parse_attr_filter,
+    help="Only follow edges with this attribute (key=value). Can be specified multiple times.",
+)
+@click.option(
+    "--node-where",
+    "node_filters",
+    multiple=True,
+    callback=parse_attr_filter,
+    help="Only pass through nodes with this attribute (key=value). Can be specified multiple times.",
+)
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+@click.option("--compact", is_flag=True, help="Write JSON on a single line (with --json).")
+@click.option("--at", "at_time", help="Query a dynamic graph as it was at this time.")
+@click.option(
+    "--between",
+    nargs=2,
+    metavar="START END",
+    help="Query everything a dynamic graph held between two times.",
+)
 def path(
     file: str,
     source: str,
     target: str,
     weighted: bool,
+    edge_filters: list[tuple[str, str]],
+    node_filters: list[tuple[str, str]],
     as_json: bool,
+    compact: bool,
+    at_time: str | None,
+    between: tuple[str, str] | None,
 ) -> None:
     """Find the shortest path between two nodes.
 
@@ -308,17 +745,31 @@ def path(
         grph path graph.gexf server1 db1
 
         grph path graph.gexf lb1 cache1 --weighted
+
+        grph path london-underground.gexf bank oxford-circus --edge-where line=Central
+
+        grph path dynamic.gexf a b --at 2024-06-01
     """
-    graph = load_graph(file)
+    from .formatters import print_path_result
+
+    # Time windows need the parsed graph
+    disk = not time_arguments(at_time, between)
+    graph = time_slice(load_graph(file, disk), at_time, between)
 
     try:
-        result = graph.shortest_path(source, target, weighted=weighted)
+        result = graph.shortest_path(
+            source,
+            target,
+            weighted=weighted,
+            edge_filters=edge_filters,
+            node_filters=node_filters,
+        )
     except GEXFParseError as e:
         console.print(f"[red]Error:[/red] {e}")
         sys.exit(1)
 
     if as_json:
-        print_json(result, console)
+        output_json(result, compact)
     else:
         print_path_result(result, console)
 
@@ -334,12 +785,14 @@ def path(
     help="Maximum path length.",
 )
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+@click.option("--compact", is_flag=True, help="Write JSON on a single line (with --json).")
 def all_paths(
     file: str,
     source: str,
     target: str,
     max_depth: int | None,
     as_json: bool,
+    compact: bool,
 ) -> None:
     """Find all simple paths between two nodes.
 
@@ -349,6 +802,8 @@ def all_paths(
 
         grph all-paths graph.gexf lb1 cache1 --max-depth 3
     """
+    from .formatters import print_paths_list
+
     graph = load_graph(file)
 
     try:
@@ -358,7 +813,7 @@ def all_paths(
         sys.exit(1)
 
     if as_json:
-        print_json(paths, console)
+        output_json(paths, compact)
     else:
         print_paths_list(paths, console)
 
@@ -398,13 +853,42 @@ def has_path(file: str, source: str, target: str) -> None:
     default=None,
     help="Maximum traversal depth.",
 )
+@click.option(
+    "--edge-where",
+    "edge_filters",
+    multiple=True,
+    callback=parse_attr_filter,
+    help="Only follow edges with this attribute (key=value). Can be specified multiple times.",
+)
+@click.option(
+    "--node-where",
+    "node_filters",
+    multiple=True,
+    callback=parse_attr_filter,
+    help="Only pass through nodes with this attribute (key=value). Can be specified multiple times.",
+)
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+@click.option("--compact", is_flag=True, help="Write JSON on a single line (with --json).")
+@click.option("--ids-only", is_flag=True, help="Output only node IDs, one per line.")
+@click.option("--count", is_flag=True, help="Output only the number of matching nodes.")
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice([f.value for f in RecordFormat]),
+    help="Stream one record per line as NDJSON, TSV or CSV.",
+)
 def reachable(
     file: str,
     node_id: str,
     direction: str,
     max_depth: int | None,
+    edge_filters: list[tuple[str, str]],
+    node_filters: list[tuple[str, str]],
     as_json: bool,
+    compact: bool,
+    ids_only: bool,
+    count: bool,
+    output_format: str | None,
 ) -> None:
     """Find all nodes reachable from a given node.
 
@@ -413,26 +897,35 @@ def reachable(
         grph reachable graph.gexf lb1
 
         grph reachable graph.gexf db1 --direction backward
+
+        grph reachable graph.gexf lb1 --ids-only
+
+        grph reachable npm-dependencies.gexf my-app --edge-where dependency_type=runtime
     """
-    graph = load_graph(file)
+    graph = load_graph(file, disk=True)
 
     try:
-        reachable_nodes = graph.reachable(node_id, direction=direction, max_depth=max_depth)
+        reachable_nodes = graph.reachable(
+            node_id,
+            direction=direction,
+            max_depth=max_depth,
+            edge_filters=edge_filters,
+            node_filters=node_filters,
+        )
     except GEXFParseError as e:
         console.print(f"[red]Error:[/red] {e}")
         sys.exit(1)
 
-    if as_json:
-        print_json(reachable_nodes, console)
-    else:
-        if reachable_nodes:
-            console.print(
-                f"[bold]Nodes reachable from {node_id}[/bold] (direction={direction})"
-            )
-            console.print()
-            print_nodes_table(reachable_nodes, console=console)
-        else:
-            console.print(f"[yellow]No nodes reachable from {node_id}.[/yellow]")
+    output_node_set(
+        reachable_nodes,
+        as_json=as_json,
+        ids_only=ids_only,
+        count=count,
+        heading=f"[bold]Nodes reachable from {node_id}[/bold] (direction={direction})",
+        empty_message=f"No nodes reachable from {node_id}.",
+        output_format=output_format,
+        compact=compact,
+    )
 
 
 @main.command(name="common-neighbors")
@@ -440,11 +933,24 @@ def reachable(
 @click.argument("node1")
 @click.argument("node2")
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+@click.option("--compact", is_flag=True, help="Write JSON on a single line (with --json).")
+@click.option("--ids-only", is_flag=True, help="Output only node IDs, one per line.")
+@click.option("--count", is_flag=True, help="Output only the number of matching nodes.")
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice([f.value for f in RecordFormat]),
+    help="Stream one record per line as NDJSON, TSV or CSV.",
+)
 def common_neighbors_cmd(
     file: str,
     node1: str,
     node2: str,
     as_json: bool,
+    compact: bool,
+    ids_only: bool,
+    count: bool,
+    output_format: str | None,
 ) -> None:
     """Find nodes that are neighbors of both given nodes.
 
@@ -460,17 +966,113 @@ def common_neighbors_cmd(
         console.print(f"[red]Error:[/red] {e}")
         sys.exit(1)
 
+    output_node_set(
+        common,
+        as_json=as_json,
+        ids_only=ids_only,
+        count=count,
+        heading=f"[bold]Common neighbors of {node1} and {node2}[/bold]",
+        empty_message=f"No common neighbors found between {node1} and {node2}.",
+        output_format=output_format,
+        compact=compact,
+    )
+
+
+@main.command()
+@click.argument("file", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--metric",
+    type=click.Choice([m.value for m in SimilarityMetric]),
+    default="common-neighbors",
+    help="Similarity score to compute.",
+)
+@click.option(
+    "--pair",
+    "pairs",
+    nargs=2,
+    multiple=True,
+    help="Score this pair of node IDs. Can be specified multiple times.",
+)
+@click.option(
+    "--pairs-file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Score the node pairs in this file (two whitespace-separated IDs per line).",
+)
+@click.option(
+    "--top-k",
+    type=int,
+    default=None,
+    help="Keep only the K most similar nodes for each node.",
+)
+@click.option(
+    "--limit",
+    type=int,
+    default=20,
+    help="Maximum number of pairs to output when scoring all candidates (0 for all).",
+)
+@click.option(
+    "--exclude-edges",
+    is_flag=True,
+    help="Skip pairs that are already directly connected.",
+)
+@click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+@click.option("--compact", is_flag=True, help="Write JSON on a single line (with --json).")
+def similarity(
+    file: str,
+    metric: str,
+    pairs: tuple[tuple[str, str], ...],
+    pairs_file: str | None,
+    top_k: int | None,
+    limit: int,
+    exclude_edges: bool,
+    as_json: bool,
+    compact: bool,
+) -> None:
+    """Score node-pair similarity for link prediction.
+
+    Computes common-neighbor counts, Jaccard, Adamic-Adar or
+    resource-allocation scores. Without --pair/--pairs-file, every pair of
+    nodes within two hops that shares a neighbor is scored.
+
+    Examples:
+
+        grph similarity graph.gexf --metric jaccard
+
+        grph similarity graph.gexf --pair server1 server2 --pair lb1 db1
+
+        grph similarity graph.gexf --metric adamic-adar --top-k 5 --exclude-edges
+    """
+    from .formatters import print_similarity_table
+
+    graph = load_graph(file)
+
+    pair_list = list(pairs)
+    if pairs_file:
+        for line_no, line in enumerate(Path(pairs_file).read_text().splitlines(), 1):
+            fields = line.split()
+            if not fields:
+                continue
+            if len(fields) != 2:
+                console.print(f"[red]Error:[/red] Expected two node IDs on line {line_no} of {pairs_file}")
+                sys.exit(1)
+            pair_list.append((fields[0], fields[1]))
+
+    try:
+        result = graph.similarity(
+            SimilarityMetric(metric),
+            pairs=pair_list or None,
+            top_k=top_k,
+            limit=limit or None,
+            exclude_edges=exclude_edges,
+        )
+    except GEXFParseError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+
     if as_json:
-        print_json(common, console)
+        output_json(result, compact)
     else:
-        if common:
-            console.print(f"[bold]Common neighbors of {node1} and {node2}[/bold]")
-            console.print()
-            print_nodes_table(common, console=console)
-        else:
-            console.print(
-                f"[yellow]No common neighbors found between {node1} and {node2}.[/yellow]"
-            )
+        print_similarity_table(result, console)
 
 
 # =============================================================================
@@ -481,7 +1083,27 @@ def common_neighbors_cmd(
 @main.command()
 @click.argument("file", type=click.Path(exists=True, dir_okay=False))
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
-def stats(file: str, as_json: bool) -> None:
+@click.option("--compact", is_flag=True, help="Write JSON on a single line (with --json).")
+@click.option(
+    "--no-cache", is_flag=True, help="Compute the result without reading or writing the cache."
+)
+@click.option("--refresh", is_flag=True, help="Recompute the result and replace the cached one.")
+@click.option("--at", "at_time", help="Query a dynamic graph as it was at this time.")
+@click.option(
+    "--between",
+    nargs=2,
+    metavar="START END",
+    help="Query everything a dynamic graph held between two times.",
+)
+def stats(
+    file: str,
+    as_json: bool,
+    compact: bool,
+    no_cache: bool,
+    refresh: bool,
+    at_time: str | None,
+    between: tuple[str, str] | None,
+) -> None:
     """Display comprehensive graph statistics.
 
     Shows density, connectivity, cycles, clustering, and more.
@@ -489,12 +1111,24 @@ def stats(file: str, as_json: bool) -> None:
     Examples:
 
         grph stats graph.gexf
+
+        grph stats graph.gexf --refresh
+
+        grph stats dynamic.gexf --at 2024-06-01
     """
-    graph = load_graph(file)
-    graph_stats = graph.get_stats()
+    from .formatters import print_stats_table
+
+    graph_stats = cached_result(
+        file,
+        "stats",
+        time_arguments(at_time, between),
+        lambda graph: time_slice(graph, at_time, between).get_stats(),
+        no_cache,
+        refresh,
+    )
 
     if as_json:
-        print_json(graph_stats, console)
+        output_json(graph_stats, compact)
     else:
         print_stats_table(graph_stats, console)
 
@@ -503,10 +1137,11 @@ def stats(file: str, as_json: bool) -> None:
 @click.argument("file", type=click.Path(exists=True, dir_okay=False))
 @click.option(
     "--type",
-    "centrality_type",
+    "centrality_types",
     type=click.Choice(["degree", "betweenness", "closeness", "pagerank", "eigenvector"]),
-    default="degree",
-    help="Type of centrality to calculate.",
+    multiple=True,
+    default=["degree"],
+    help="Type of centrality to calculate (repeatable; ranked by the first).",
 )
 @click.option(
     "--top",
@@ -516,11 +1151,19 @@ def stats(file: str, as_json: bool) -> None:
     help="Number of top nodes to display.",
 )
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+@click.option("--compact", is_flag=True, help="Write JSON on a single line (with --json).")
+@click.option(
+    "--no-cache", is_flag=True, help="Compute the result without reading or writing the cache."
+)
+@click.option("--refresh", is_flag=True, help="Recompute the result and replace the cached one.")
 def centrality(
     file: str,
-    centrality_type: str,
+    centrality_types: tuple[str, ...],
     top_n: int,
     as_json: bool,
+    compact: bool,
+    no_cache: bool,
+    refresh: bool,
 ) -> None:
     """Calculate centrality metrics for nodes.
 
@@ -531,14 +1174,101 @@ def centrality(
         grph centrality graph.gexf
 
         grph centrality graph.gexf --type pagerank --top 20
+
+        grph centrality graph.gexf --type pagerank --type degree
+    """
+    from .formatters import print_centrality_table
+    from .models import CentralityResult
+
+    # Repeated types are computed once, in the order given
+    ctypes = [CentralityType(t) for t in dict.fromkeys(centrality_types)]
+    result = cached_result(
+        file,
+        "centrality",
+        {"types": [t.value for t in ctypes]},
+        lambda graph: CentralityResult.combine([graph.get_centrality(t) for t in ctypes]),
+        no_cache,
+        refresh,
+    )
+
+    if as_json:
+        output_json(result, compact)
+    else:
+        print_centrality_table(result, top_n=top_n, console=console)
+
+
+@main.command()
+@click.argument("file", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--seed",
+    "seeds",
+    required=True,
+    help="Comma-separated list of seed node IDs.",
+)
+@click.option(
+    "--top",
+    "top_n",
+    type=int,
+    default=10,
+    help="Number of top nodes to display.",
+)
+@click.option(
+    "--alpha",
+    type=click.FloatRange(0, 1, min_open=True, max_open=True),
+    default=0.85,
+    help="Damping factor (probability of following an edge).",
+)
+@click.option(
+    "--tolerance",
+    type=click.FloatRange(min=0, min_open=True),
+    default=1e-6,
+    help="Residual tolerance per edge; smaller is more accurate but slower.",
+)
+@click.option("--weighted", is_flag=True, help="Split probability mass by edge weight.")
+@click.option("--exclude-seeds", is_flag=True, help="Leave the seed nodes out of the ranking.")
+@click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+@click.option("--compact", is_flag=True, help="Write JSON on a single line (with --json).")
+def ppr(
+    file: str,
+    seeds: str,
+    top_n: int,
+    alpha: float,
+    tolerance: float,
+    weighted: bool,
+    exclude_seeds: bool,
+    as_json: bool,
+    compact: bool,
+) -> None:
+    """Find the nodes most relevant to a set of seed nodes.
+
+    Runs a local personalized PageRank (forward push) that only explores
+    the neighborhood of the seeds, so it stays fast on very large graphs.
+
+    Examples:
+
+        grph ppr graph.gexf --seed server1
+
+        grph ppr graph.gexf --seed a,b,c --top 50 --exclude-seeds
     """
+    from .formatters import print_centrality_table
+
     graph = load_graph(file)
 
-    ctype = CentralityType(centrality_type)
-    result = graph.get_centrality(ctype)
+    seed_list = [n.strip() for n in seeds.split(",") if n.strip()]
+
+    try:
+        result = graph.personalized_pagerank(
+            seed_list, alpha=alpha, tolerance=tolerance, weighted=weighted
+        )
+    except GEXFParseError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+
+    if exclude_seeds:
+        result = result.without(seed_list)
 
     if as_json:
-        print_json(result, console)
+        output_json(result, compact)
     else:
         print_centrality_table(result, top_n=top_n, console=console)
 
@@ -554,11 +1284,28 @@ def centrality(
 )
 @click.option("--list", "show_members", is_flag=True, help="Show component members.")
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+@click.option("--compact", is_flag=True, help="Write JSON on a single line (with --json).")
+@click.option(
+    "--no-cache", is_flag=True, help="Compute the result without reading or writing the cache."
+)
+@click.option("--refresh", is_flag=True, help="Recompute the result and replace the cached one.")
+@click.option("--at", "at_time", help="Query a dynamic graph as it was at this time.")
+@click.option(
+    "--between",
+    nargs=2,
+    metavar="START END",
+    help="Query everything a dynamic graph held between two times.",
+)
 def components(
     file: str,
     component_type: str,
     show_members: bool,
     as_json: bool,
+    compact: bool,
+    no_cache: bool,
+    refresh: bool,
+    at_time: str | None,
+    between: tuple[str, str] | None,
 ) -> None:
     """Analyze connected components in the graph.
 
@@ -569,16 +1316,95 @@ def components(
         grph components graph.gexf
 
         grph components graph.gexf --type strongly --list
+
+        grph components dynamic.gexf --between 2024-01-01 2024-03-31
     """
-    graph = load_graph(file)
-    result = graph.get_components(component_type)
+    from .formatters import print_components_table
+
+    result = cached_result(
+        file,
+        "components",
+        {"type": component_type, **time_arguments(at_time, between)},
+        lambda graph: time_slice(graph, at_time, between).get_components(component_type),
+        no_cache,
+        refresh,
+        disk=not time_arguments(at_time, between),
+    )
 
     if as_json:
-        print_json(result, console)
+        output_json(result, compact)
     else:
         print_components_table(result, show_members=show_members, console=console)
 
 
+@main.command()
+@click.argument("file", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--step",
+    required=True,
+    help="Time between rows: a number, or a number with a unit (s, m, h, d, w) for dates.",
+)
+@click.option(
+    "--metrics",
+    default="degree,components,pagerank",
+    show_default=True,
+    help="Comma-separated metrics: degree, components, pagerank.",
+)
+@click.option("--start", help="Time of the first row (default: earliest time in the graph).")
+@click.option("--end", help="Time after which to stop (default: latest time in the graph).")
+@click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+@click.option("--compact", is_flag=True, help="Write JSON on a single line (with --json).")
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice([f.value for f in RecordFormat]),
+    help="Stream one row per step as NDJSON, TSV or CSV.",
+)
+def timeline(
+    file: str,
+    step: str,
+    metrics: str,
+    start: str | None,
+    end: str | None,
+    as_json: bool,
+    compact: bool,
+    output_format: str | None,
+) -> None:
+    """Track metrics of a dynamic graph through time.
+
+    Emits one row per step with node and edge counts and the selected
+    metrics. Each step only applies what changed since the previous one,
+    so long timelines cost little more than a single snapshot.
+
+    Examples:
+
+        grph timeline dynamic.gexf --step 1d
+
+        grph timeline dynamic.gexf --step 1w --metrics degree,components
+
+        grph timeline dynamic.gexf --step 1d --start 2024-01-01 --end 2024-12-31
+
+        grph timeline dynamic.gexf --step 1d --format ndjson | head
+    """
+    from .formatters import print_timeline_table
+    from .timeline import parse_metrics, timeline_columns
+
+    graph = load_graph(file)
+    try:
+        selected = parse_metrics(metrics)
+        points = graph.timeline(step, selected, start=start, end=end)
+    except GEXFParseError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+
+    if output_format:
+        output_records(points, output_format, timeline_columns(selected))
+    elif as_json:
+        output_json(list(points), compact)
+    else:
+        print_timeline_table(points, timeline_columns(selected), console=console)
+
+
 @main.command()
 @click.argument("file", type=click.Path(exists=True, dir_okay=False))
 @click.option("--node", "node_id", help="Show degree for a specific node.")
@@ -590,11 +1416,19 @@ def components(
     help="Number of top nodes to display.",
 )
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+@click.option("--compact", is_flag=True, help="Write JSON on a single line (with --json).")
+@click.option(
+    "--no-cache", is_flag=True, help="Compute the result without reading or writing the cache."
+)
+@click.option("--refresh", is_flag=True, help="Recompute the result and replace the cached one.")
 def degree(
     file: str,
     node_id: str | None,
     top_n: int,
     as_json: bool,
+    compact: bool,
+    no_cache: bool,
+    refresh: bool,
 ) -> None:
     """Show node degree information.
 
@@ -608,16 +1442,26 @@ def degree(
 
         grph degree graph.gexf --top 20
     """
-    graph = load_graph(file)
+    from .formatters import print_degree_table
 
+    # The table shows only the top nodes, so only those are listed
+    limit = None if as_json else max(top_n, 0)
     try:
-        result = graph.get_degree(node_id)
+        result = cached_result(
+            file,
+            "degree",
+            {"node": node_id, "top": limit},
+            lambda graph: graph.get_degree(node_id, limit),
+            no_cache,
+            refresh,
+            disk=True,
+        )
     except GEXFParseError as e:
         console.print(f"[red]Error:[/red] {e}")
         sys.exit(1)
 
     if as_json:
-        print_json(result, console)
+        output_json(result, compact)
     else:
         print_degree_table(result, top_n=top_n, console=console)
 
@@ -636,18 +1480,42 @@ def degree(
     default=1,
     help="Number of hops to include (default: 1).",
 )
+@click.option(
+    "--edge-where",
+    "edge_filters",
+    multiple=True,
+    callback=parse_attr_filter,
+    help="Only follow edges with this attribute (key=value). Can be specified multiple times.",
+)
+@click.option(
+    "--node-where",
+    "node_filters",
+    multiple=True,
+    callback=parse_attr_filter,
+    help="Only pass through nodes with this attribute (key=value). Can be specified multiple times.",
+)
 @click.option(
     "--output",
     type=click.Path(),
     help="Save subgraph to a file (GEXF format).",
 )
+@click.option(
+    "--compress",
+    type=click.Choice([c.value for c in Compression]),
+    help="Compress the output (default: inferred from a .gz/.bz2/.xz output name).",
+)
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+@click.option("--compact", is_flag=True, help="Write JSON on a single line (with --json).")
 def ego(
     file: str,
     node_id: str,
     radius: int,
+    edge_filters: list[tuple[str, str]],
+    node_filters: list[tuple[str, str]],
     output: str | None,
+    compress: str | None,
     as_json: bool,
+    compact: bool,
 ) -> None:
     """Extract the ego graph (neighborhood) around a node.
 
@@ -661,24 +1529,38 @@ def ego(
         grph ego graph.gexf lb1 --radius 2
 
         grph ego graph.gexf server1 --output server1-ego.gexf
+
+        grph ego graph.gexf server1 --output server1-ego.gexf.gz
+
+        grph ego graph.gexf lb1 --radius 2 --node-where type=server
     """
+    from .formatters import print_info_table
+
     graph = load_graph(file)
 
     try:
-        ego_graph = graph.ego_graph(node_id, radius=radius)
+        ego_graph = graph.ego_graph(
+            node_id,
+            radius=radius,
+            edge_filters=edge_filters,
+            node_filters=node_filters,
+        )
     except GEXFParseError as e:
         console.print(f"[red]Error:[/red] {e}")
         sys.exit(1)
 
     if output:
-        # Export as GEXF
-        import networkx as nx
-
-        nx.write_gexf(ego_graph._graph, output)
+        # Stream as GEXF, copying elements from the source file
+        try:
+            with open_output(output, Compression(compress) if compress else None) as sink:
+                ego_graph.write_gexf(sink)
+        except GEXFParseError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            sys.exit(1)
         console.print(f"[green]Saved ego graph to {output}[/green]")
     elif as_json:
         # Output info as JSON
-        print_json(ego_graph.get_info(), console)
+        output_json(ego_graph.get_info(), compact)
     else:
         # Display summary
         console.print(f"[bold]Ego graph for {node_id}[/bold] (radius={radius})")
@@ -699,12 +1581,20 @@ def ego(
     type=click.Path(),
     help="Save subgraph to a file (GEXF format).",
 )
+@click.option(
+    "--compress",
+    type=click.Choice([c.value for c in Compression]),
+    help="Compress the output (default: inferred from a .gz/.bz2/.xz output name).",
+)
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+@click.option("--compact", is_flag=True, help="Write JSON on a single line (with --json).")
 def subgraph(
     file: str,
     node_ids: str,
     output: str | None,
+    compress: str | None,
     as_json: bool,
+    compact: bool,
 ) -> None:
     """Extract a subgraph containing only specified nodes.
 
@@ -717,6 +1607,8 @@ def subgraph(
 
         grph subgraph graph.gexf --nodes lb1,server1 --output subset.gexf
     """
+    from .formatters import print_info_table
+
     graph = load_graph(file)
 
     nodes_list = [n.strip() for n in node_ids.split(",")]
@@ -728,13 +1620,16 @@ def subgraph(
         sys.exit(1)
 
     if output:
-        # Export as GEXF
-        import networkx as nx
-
-        nx.write_gexf(sub._graph, output)
+        # Stream as GEXF, copying elements from the source file
+        try:
+            with open_output(output, Compression(compress) if compress else None) as sink:
+                sub.write_gexf(sink)
+        except GEXFParseError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            sys.exit(1)
         console.print(f"[green]Saved subgraph to {output}[/green]")
     elif as_json:
-        print_json(sub.get_info(), console)
+        output_json(sub.get_info(), compact)
     else:
         console.print(f"[bold]Subgraph[/bold] with nodes: {', '.join(nodes_list)}")
         console.print()
@@ -751,7 +1646,7 @@ def subgraph(
 @click.option(
     "--format",
     "export_format",
-    type=click.Choice(["json", "graphml", "adjlist", "edgelist"]),
+    type=click.Choice([f.value for f in ExportFormat]),
     default="json",
     help="Output format.",
 )
@@ -760,7 +1655,12 @@ def subgraph(
     type=click.Path(),
     help="Output file (default: stdout).",
 )
-def export(file: str, export_format: str, output: str | None) -> None:
+@click.option(
+    "--compress",
+    type=click.Choice([c.value for c in Compression]),
+    help="Compress the output (default: inferred from a .gz/.bz2/.xz output name).",
+)
+def export(file: str, export_format: str, output: str | None, compress: str | None) -> None:
     """Export the graph to different formats.
 
     Supported formats:
@@ -768,23 +1668,205 @@ def export(file: str, export_format: str, output: str | None) -> None:
     - graphml: GraphML XML format
     - adjlist: Adjacency list (node followed by neighbors)
     - edgelist: Edge list (source target [weight])
+    - npz: CSR adjacency arrays (indptr, indices, weights, node_ids) for NumPy
+    - mtx: Matrix Market sparse adjacency matrix for SciPy and other tools
+    - columns: Typed node and edge attribute columns for NumPy
 
     Examples:
 
         grph export graph.gexf --format json
 
         grph export graph.gexf --format graphml --output graph.graphml
-    """
-    graph = load_graph(file)
 
+        grph export graph.gexf --format npz --output graph.npz
+
+        grph export graph.gexf --format edgelist --compress gzip > edges.txt.gz
+    """
     fmt = ExportFormat(export_format)
-    result = graph.export(fmt)
+    compression = Compression(compress) if compress else None
+    if (fmt.is_binary or compression) and not output and sys.stdout.isatty():
+        console.print(
+            "[red]Error:[/red] Output is binary; use --output or redirect stdout"
+        )
+        sys.exit(1)
+
+    graph = load_graph(file)
 
+    # Stream straight to the destination; Rich never sees the export text
     if output:
-        Path(output).write_text(result)
+        with open_output(output, compression) as sink:
+            graph.write_export(fmt, sink)
         console.print(f"[green]Exported to {output}[/green]")
     else:
-        console.print(result)
+        stdout = binary_stdout()
+        try:
+            if compression:
+                with compress_stream(stdout, compression) as sink:
+                    graph.write_export(fmt, sink)
+            else:
+                graph.write_export(fmt, stdout)
+            stdout.flush()
+        except BrokenPipeError:
+            exit_stdout_closed()
+
+
+# =============================================================================
+# Cache Commands
+# =============================================================================
+
+
+@main.group()
+def cache() -> None:
+    """Inspect or clear the result cache.
+
+    stats, centrality, components and degree store their results on disk,
+    keyed by the input file's contents, so re-running them on an unchanged
+    file skips the computation. The cache lives in $GRPH_CACHE_DIR (default
+    ~/.cache/grph) and is limited to $GRPH_CACHE_SIZE bytes (default 1 GiB).
+    """
+
+
+@cache.command(name="stats")
+@click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+@click.option("--compact", is_flag=True, help="Write JSON on a single line (with --json).")
+def cache_stats(as_json: bool, compact: bool) -> None:
+    """Show the size and contents of the result cache.
+
+    Examples:
+
+        grph cache stats
+    """
+    from .result_store import ResultStore
+
+    store_stats = ResultStore.default().stats()
+
+    if as_json:
+        output_json(store_stats, compact)
+    else:
+        from .formatters import print_cache_stats_table
+
+        print_cache_stats_table(store_stats, console)
+
+
+@cache.command(name="clear")
+def cache_clear() -> None:
+    """Delete every cached result.
+
+    Examples:
+
+        grph cache clear
+    """
+    from .result_store import ResultStore
+
+    removed = ResultStore.default().clear()
+    console.print(f"Removed {removed} cached result{'s' if removed != 1 else ''}")
+
+
+# =============================================================================
+# Index Commands
+# =============================================================================
+
+
+@main.group(name="index")
+def index_group() -> None:
+    """Build or inspect sidecar indexes.
+
+    A sidecar index (FILE.grphidx, next to the graph) holds precomputed
+    structures that every command memory-maps on load instead of
+    recomputing: CSR adjacency and degrees, attribute postings, sorted
+    labels, reachability and landmark distances. It is ignored once the
+    graph file changes.
+    """
+
+
+@index_group.command(name="build")
+@click.argument("file", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--with",
+    "sections",
+    help="Comma-separated sections: adjacency, attrs, labels, reach, landmarks (default: all).",
+)
+@click.option(
+    "--landmarks", default=16, show_default=True, help="Landmarks for the landmarks section."
+)
+@click.option(
+    "--out-of-core",
+    is_flag=True,
+    help="Stream the file into an on-disk index without loading it, for graphs larger than RAM.",
+)
+@click.option(
+    "--memory",
+    default="1G",
+    show_default=True,
+    help="Memory budget for sorting edges with --out-of-core (e.g. 512M, 4G).",
+)
+def index_build(
+    file: str, sections: str | None, landmarks: int, out_of_core: bool, memory: str
+) -> None:
+    """Precompute a sidecar index for a graph file.
+
+    With --out-of-core the graph is never held in memory: neighbors, path,
+    reachable, components and degree then run against the memory-mapped
+    index, and other commands parse the file as usual.
+
+    Examples:
+
+        grph index build graph.gexf
+
+        grph index build graph.gexf --with attrs,labels,reach
+
+        grph index build huge.gexf.gz --out-of-core --memory 4G
+    """
+    if out_of_core:
+        if sections:
+            console.print("[red]Error:[/red] --with does not apply to --out-of-core indexes")
+            sys.exit(1)
+        from .diskbuild import build_disk_index, parse_size
+
+        try:
+            path = build_disk_index(file, parse_size(memory))
+        except GEXFParseError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            sys.exit(1)
+        console.print(f"Built disk index in {path}")
+        return
+
+    graph = load_graph(file)
+    selected = [s.strip() for s in sections.split(",") if s.strip()] if sections else None
+
+    try:
+        path = graph.build_index(selected, landmarks=landmarks)
+    except GEXFParseError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+
+    console.print(f"Built {', '.join(graph.sidecar.sections)} index in {path}")
+
+
+@index_group.command(name="info")
+@click.argument("file", type=click.Path(exists=True, dir_okay=False))
+@click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+@click.option("--compact", is_flag=True, help="Write JSON on a single line (with --json).")
+def index_info(file: str, as_json: bool, compact: bool) -> None:
+    """Show which sidecar indexes exist for a graph file and whether they are fresh.
+
+    Examples:
+
+        grph index info graph.gexf
+    """
+    from .sidecar import read_info
+
+    info = read_info(file)
+    if info is None:
+        console.print(f"[red]Error:[/red] No index for {file}; run 'grph index build {file}'")
+        sys.exit(1)
+
+    if as_json:
+        output_json(info, compact)
+    else:
+        from .formatters import print_index_info
+
+        print_index_info(info, console)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,106 @@
+"""Transparent compression for graph input and output streams.
+
+Compressed input is recognised by its magic bytes, so a ``.gexf.gz`` file
+(or a gzip file without the extension) is decompressed on the fly while it
+is parsed, without an intermediate temporary file.
+"""
+
+import bz2
+import gzip
+import lzma
+from pathlib import Path
+from typing import BinaryIO
+
+from .models import Compression
+
+# Leading bytes that identify each codec
+MAGIC_BYTES = {
+    Compression.GZIP: b"\x1f\x8b",
+    Compression.BZ2: b"BZh",
+    Compression.XZ: b"\xfd7zXZ\x00",
+}
+
+# File name suffixes that imply a codec when writing
+EXTENSIONS = {
+    ".gz": Compression.GZIP,
+    ".bz2": Compression.BZ2,
+    ".xz": Compression.XZ,
+}
+
+
+def detect_compression(path: str | Path) -> Compression | None:
+    """Detect the compression codec of a file from its magic bytes.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        The codec, or None if the file is not compressed.
+    """
+    with open(path, "rb") as f:
+        head = f.read(max(len(magic) for magic in MAGIC_BYTES.values()))
+    for codec, magic in MAGIC_BYTES.items():
+        if head.startswith(magic):
+            return codec
+    return None
+
+
+def compression_for_path(path: str | Path) -> Compression | None:
+    """Infer the codec implied by a file name's extension."""
+    return EXTENSIONS.get(Path(path).suffix.lower())
+
+
+def open_input(path: str | Path) -> BinaryIO:
+    """Open a file for reading, decompressing it if needed.
+
+    Args:
+        path: Path to a plain or compressed file.
+
+    Returns:
+        Binary stream of the uncompressed contents.
+    """
+    compression = detect_compression(path)
+    if compression is None:
+        return open(path, "rb")
+    return _OPENERS[compression](path, "rb")
+
+
+def open_output(path: str | Path, compression: Compression | None = None) -> BinaryIO:
+    """Open a file for writing, compressing it if requested.
+
+    Args:
+        path: Path to write.
+        compression: Codec to use. If None, it is inferred from the file
+            extension (no compression for unknown extensions).
+
+    Returns:
+        Binary stream that writes to the file.
+    """
+    if compression is None:
+        compression = compression_for_path(path)
+    if compression is None:
+        return open(path, "wb")
+    return _OPENERS[compression](path, "wb")
+
+
+def compress_stream(stream: BinaryIO, compression: Compression) -> BinaryIO:
+    """Wrap an open binary stream so that writes to it are compressed.
+
+    Closing the returned stream finishes the compressed data but leaves
+    ``stream`` open, so it is safe to use on stdout.
+
+    Args:
+        stream: Underlying binary stream.
+        compression: Codec to apply.
+
+    Returns:
+        Binary stream that compresses into ``stream``.
+    """
+    return _OPENERS[compression](stream, "wb")
+
+
+_OPENERS = {
+    Compression.GZIP: gzip.open,
+    Compression.BZ2: bz2.open,
+    Compression.XZ: lzma.open,
+}
@@ -0,0 +1,201 @@
+"""Compressed sparse row (CSR) adjacency for fast integer traversal."""
+
+from typing import Hashable, Iterable
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+
+
+class CSRAdjacency:
+    """Integer-indexed adjacency arrays built once from a graph.
+
+    Nodes are numbered ``0..n-1`` in graph iteration order. Edges keep the
+    ordinal they had in ``graph.edges()`` so that per-edge data can be looked
+    up from any CSR slot through ``edge_index``.
+
+    For undirected graphs every edge is stored in both directions and the
+    reverse adjacency is the forward adjacency itself.
+    """
+
+    def __init__(
+        self,
+        node_ids: list[str],
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        edge_index: np.ndarray,
+        directed: bool,
+        index: dict[str, int] | None = None,
+    ):
+        self.node_ids = node_ids
+        self.indptr = indptr
+        self.indices = indices
+        self.edge_index = edge_index
+        self.directed = directed
+        if index is None:
+            index = {nid: i for i, nid in enumerate(node_ids)}
+        self._index = index
+        self._reverse: "CSRAdjacency | None" = None if directed else self
+
+    @classmethod
+    def from_networkx(
+        cls,
+        graph,
+        node_ids: list[str] | None = None,
+        index: dict[str, int] | None = None,
+    ) -> "CSRAdjacency":
+        """Build the forward adjacency of a NetworkX graph.
+
+        ``node_ids`` and ``index`` may pass in the string IDs of
+        ``graph.nodes()`` and their positions when the caller already has
+        them; the adjacency then shares them rather than building its own.
+        """
+        if node_ids is None:
+            node_ids = [str(n) for n in graph.nodes()]
+        if index is None:
+            index = {n: i for i, n in enumerate(graph.nodes())}
+        sources, targets = _edge_arrays(graph.edges(), index)
+        return cls.from_edges(node_ids, sources, targets, graph.is_directed(), index)
+
+    @classmethod
+    def from_edges(
+        cls,
+        node_ids: list[str],
+        sources: np.ndarray,
+        targets: np.ndarray,
+        directed: bool,
+        index: dict[str, int] | None = None,
+    ) -> "CSRAdjacency":
+        """Build an adjacency from parallel arrays of edge endpoints."""
+        edge_index = np.arange(len(sources), dtype=np.int64)
+
+        if not directed:
+            # Store each edge in both directions; self-loops only once
+            loops = sources == targets
+            sources, targets, edge_index = (
+                np.concatenate([sources, targets[~loops]]),
+                np.concatenate([targets, sources[~loops]]),
+                np.concatenate([edge_index, edge_index[~loops]]),
+            )
+
+        indptr, order = _compress(sources, len(node_ids))
+        return cls(
+            node_ids=node_ids,
+            indptr=indptr,
+            indices=targets[order].astype(np.int32, copy=False),
+            edge_index=edge_index[order],
+            directed=directed,
+            index=index,
+        )
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of nodes in the adjacency."""
+        return len(self.node_ids)
+
+    @property
+    def reverse(self) -> "CSRAdjacency":
+        """The predecessor adjacency, built on first use and cached."""
+        if self._reverse is None:
+            sources = np.repeat(
+                np.arange(self.num_nodes, dtype=np.int32), np.diff(self.indptr)
+            )
+            indptr, order = _compress(self.indices, self.num_nodes)
+            reverse = CSRAdjacency(
+                node_ids=self.node_ids,
+                indptr=indptr,
+                indices=sources[order],
+                edge_index=self.edge_index[order],
+                directed=True,
+                index=self._index,
+            )
+            reverse._reverse = self
+            self._reverse = reverse
+        return self._reverse
+
+    def index_of(self, node_id: str) -> int:
+        """Get the integer index of a node ID, or -1 if it is not present."""
+        return self._index.get(node_id, -1)
+
+    def indices_of(self, node_ids: Iterable[str]) -> np.ndarray:
+        """Get integer indices for several node IDs (missing IDs are skipped)."""
+        index = self._index
+        return np.fromiter(
+            (index[n] for n in node_ids if n in index), dtype=np.int32
+        )
+
+    def neighbors(self, i: int) -> np.ndarray:
+        """Get the integer indices adjacent to node ``i``."""
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def degrees(self) -> np.ndarray:
+        """Get the number of stored neighbors of every node."""
+        return np.diff(self.indptr)
+
+    def self_loops(self) -> np.ndarray:
+        """Get the number of self-loops at every node."""
+        rows = np.repeat(np.arange(self.num_nodes, dtype=np.int32), self.degrees())
+        return np.bincount(rows[rows == self.indices], minlength=self.num_nodes)
+
+    def components(self, strong: bool = False) -> tuple[int, np.ndarray]:
+        """Label the connected components of the graph.
+
+        Args:
+            strong: Follow edge direction (strongly connected components).
+                Otherwise direction is ignored (weakly connected).
+
+        Returns:
+            Tuple of (number of components, component label of every node).
+            Labels are numbered in order of each component's first node.
+        """
+        n = self.num_nodes
+        matrix = csr_matrix(
+            (np.ones(self.indices.size, dtype=np.int8), self.indices, self.indptr), shape=(n, n)
+        )
+        count, labels = connected_components(
+            matrix, directed=self.directed, connection="strong" if strong else "weak"
+        )
+        if strong and count:
+            # SciPy numbers strong components in visit order; renumber them
+            first = np.full(count, n, dtype=np.int64)
+            np.minimum.at(first, labels, np.arange(n))
+            rank = np.empty(count, dtype=labels.dtype)
+            rank[np.argsort(first)] = np.arange(count, dtype=labels.dtype)
+            labels = rank[labels]
+        return count, labels
+
+    def expand(self, frontier: np.ndarray) -> np.ndarray:
+        """Gather the neighbors of every node in ``frontier`` at once.
+
+        Returns the concatenated neighbor indices (with repeats).
+        """
+        return self.indices[self.slots(frontier)]
+
+    def slots(self, frontier: np.ndarray) -> np.ndarray:
+        """Get the CSR slot positions of all edges leaving ``frontier``."""
+        starts = self.indptr[frontier]
+        counts = self.indptr[frontier + 1] - starts
+        total = int(counts.sum())
+        if total == 0:
+            return np.empty(0, dtype=np.int64)
+        # Offset of each slot within its row, added to the row start
+        row_offsets = np.cumsum(counts) - counts
+        return np.repeat(starts - row_offsets, counts) + np.arange(total)
+
+
+def _edge_arrays(
+    edges: Iterable[tuple[Hashable, Hashable]], index: dict[Hashable, int]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Translate an edge iterable into integer endpoint arrays."""
+    pairs = np.fromiter(
+        (i for u, v in edges for i in (index[u], index[v])), dtype=np.int32
+    )
+    return pairs[0::2], pairs[1::2]
+
+
+def _compress(rows: np.ndarray, num_rows: int) -> tuple[np.ndarray, np.ndarray]:
+    """Compute a CSR row pointer and the stable order that groups ``rows``."""
+    order = np.argsort(rows, kind="stable")
+    indptr = np.zeros(num_rows + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=num_rows), out=indptr[1:])
+    return indptr, order
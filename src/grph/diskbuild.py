@@ -0,0 +1,752 @@
+"""Streaming build of out-of-core indexes, for graphs larger than memory.
+
+``build_disk_index`` reads a GEXF file once with expat and never holds the
+graph: node and edge attributes are appended to column files as elements go
+by, and edge endpoints, resolved to node indices, to flat endpoint files.
+The CSR adjacency is then built with an external distribution sort: a pass
+over the endpoints counts degrees, a second scatters entries into buckets of
+consecutive rows sized to the memory budget, and each bucket is sorted in
+memory and written to its place in the memory-mapped output. The result is
+the ``disk`` section of the file's sidecar, read by ``grph.diskgraph``.
+
+Apart from the sort buffers, memory use is about 16 bytes per node, for the
+hashes that resolve edge endpoints to node indices.
+
+Elements are read as NetworkX reads them, so node order, CSR order and
+values match ``GEXFGraph``, with these differences: node IDs must be
+unique, nodes must come before edges, dynamic attributes keep only their
+last value, and spells, ``viz`` data and ``parents`` are not kept.
+"""
+
+import json
+import re
+import shutil
+import xml.parsers.expat
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import numpy as np
+
+from .compression import open_input
+from .diskgraph import COLUMN_TYPES, SECTION, StringColumn
+from .errors import GEXFParseError
+from .metadata import READ_SIZE, read_metadata
+from .profiling import span, traced
+from .sidecar import MANIFEST, index_path, new_manifest, staged_directory
+
+# Default memory budget for sorting, in bytes
+DEFAULT_MEMORY = 1 << 30
+
+# Elements buffered before their values are written out
+CHUNK = 1 << 16
+
+# Edges read per step when scanning the endpoint files
+SCAN_CHUNK = 1 << 22
+
+# Memory per entry while a bucket is sorted, in bytes
+ENTRY_BYTES = 64
+
+# Upper bound on buckets, which are all open while entries are scattered
+MAX_BUCKETS = 512
+
+SIZE_UNITS = {"": 1, "k": 1 << 10, "m": 1 << 20, "g": 1 << 30, "t": 1 << 40}
+
+# Element attributes kept as string columns, which replace attvalues of the
+# same title as NetworkX does
+STRING_FIELDS = ("label", "pid", "start", "end", "id")
+
+_DTYPES = {"int": np.int64, "float": np.float64, "bool": np.bool_}
+_FILLS = {"int": 0, "float": np.nan, "bool": False}
+_BOOLEANS = {"true": True, "false": False, "True": True, "False": False, "0": False, "1": True}
+
+# A CSR entry waiting in a bucket
+_ENTRY = np.dtype([("row", "<i4"), ("col", "<i4"), ("ordinal", "<i8")])
+
+
+def parse_size(text: str) -> int:
+    """Parse a size in bytes with an optional unit, e.g. ``512M`` or ``4G``.
+
+    Raises:
+        GEXFParseError: If the size is not valid or not positive.
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([kmgt]?)(?:i?b)?\s*", str(text), re.IGNORECASE)
+    if match is None:
+        raise GEXFParseError(f"Invalid size {text!r} (use a number of bytes, or e.g. 512M or 4G)")
+    size = int(float(match.group(1)) * SIZE_UNITS[match.group(2).lower()])
+    if size <= 0:
+        raise GEXFParseError(f"Size must be positive: {text!r}")
+    return size
+
+
+@traced
+def build_disk_index(file_path: str | Path, memory: int = DEFAULT_MEMORY) -> Path:
+    """Stream a graph file into an out-of-core index next to it.
+
+    An existing sidecar is replaced; readers never see a partial one.
+
+    Args:
+        file_path: Path to the GEXF file (optionally compressed).
+        memory: Memory budget for sorting edges, in bytes.
+
+    Returns:
+        Path of the sidecar directory.
+
+    Raises:
+        GEXFParseError: If the file cannot be read, or has duplicate node
+            IDs or nodes after edges.
+    """
+    path = Path(file_path)
+    header = read_metadata(path, count_elements=False)
+    # Taken before parsing, so a write during the build is seen as a change
+    stat = path.stat()
+    directed = header.default_edge_type == "directed"
+
+    with staged_directory(index_path(path)) as directory:
+        reader = _GraphReader(directory, directed)
+        with span("stream"):
+            reader.read(path)
+
+        with span("columns"):
+            node_columns = _finish_columns(
+                directory, "node", reader.node_columns, reader.node_count
+            )
+            edge_columns = _finish_columns(
+                directory, "edge", reader.edge_columns, reader.edge_count
+            )
+            reader.node_ids.finish(reader.node_count, directory / "disk-node-ids")
+        with span("sort_ids"):
+            ids = StringColumn(
+                np.load(directory / "disk-node-ids-offsets.npy", mmap_mode="r"),
+                np.load(directory / "disk-node-ids-bytes.npy", mmap_mode="r"),
+            )
+            np.save(directory / "disk-node-ids-order.npy", _string_order(ids))
+
+        with span("sort_edges"):
+            sources = _raw(directory / "edges-source.raw", np.int32)
+            targets = _raw(directory / "edges-target.raw", np.int32)
+            args = (sources, targets, reader.node_count, memory)
+            if directed:
+                _write_csr(directory / "disk-forward", *args, "forward")
+                _write_csr(directory / "disk-reverse", *args, "reverse")
+            else:
+                loops = _write_csr(directory / "disk-forward", *args, "undirected")
+                np.save(directory / "disk-self-loops.npy", loops)
+            del sources, targets
+            (directory / "edges-source.raw").unlink()
+            (directory / "edges-target.raw").unlink()
+
+        manifest = new_manifest(directed, (stat.st_mtime_ns, stat.st_size), [SECTION])
+        manifest["node_count"] = reader.node_count
+        manifest["edge_count"] = reader.edge_count
+        fields = header.to_dict()
+        del fields["node_count"], fields["edge_count"]
+        manifest[SECTION] = {
+            "metadata": fields,
+            "node_columns": node_columns,
+            "edge_columns": edge_columns,
+        }
+        (directory / MANIFEST).write_text(json.dumps(manifest, indent=2) + "\n")
+    return index_path(path)
+
+
+class _ColumnWriter:
+    """One column, appended to raw files in row order as values arrive.
+
+    Rows without a value are filled in when the column is flushed, so a
+    column costs nothing per row until it is written.
+    """
+
+    def __init__(self, path: Path, kind: str, fill: Any = None):
+        """Create the raw files, named after ``path``.
+
+        Args:
+            path: Path prefix of the files.
+            kind: "string", "int", "float" or "bool".
+            fill: Value stored in rows without one (default: 0, NaN, False).
+        """
+        self.kind = kind
+        self.missing = False
+        self._path = path
+        self._fill = _FILLS.get(kind) if fill is None else fill
+        parts = ("lengths", "bytes", "present") if kind == "string" else ("values", "present")
+        self._files = {part: open(self._raw(part), "wb") for part in parts}
+        self._rows: list[int] = []
+        self._values: list[Any] = []
+        self._written = 0
+
+    def add(self, row: int, value: Any) -> None:
+        """Set the value of a row; rows must be added in ascending order."""
+        self._rows.append(row)
+        self._values.append(value)
+
+    def flush(self, count: int) -> None:
+        """Write every row before ``count``."""
+        rows = np.asarray(self._rows, dtype=np.int64)
+        values = self._values
+        while self._written < count:
+            # A column first seen late starts with a run of missing rows
+            end = min(count, self._written + CHUNK)
+            taken = int(np.searchsorted(rows, end))
+            self._write(end - self._written, rows[:taken] - self._written, values[:taken])
+            rows, values = rows[taken:], values[taken:]
+            self._written = end
+        self._rows.clear()
+        self._values.clear()
+
+    def _write(self, size: int, slots: np.ndarray, values: list[Any]) -> None:
+        present = np.zeros(size, dtype=bool)
+        present[slots] = True
+        self.missing |= slots.size < size
+        self._files["present"].write(present.tobytes())
+        if self.kind == "string":
+            encoded = [str(v).encode("utf-8") for v in values]
+            lengths = np.zeros(size, dtype=np.int64)
+            lengths[slots] = [len(text) for text in encoded]
+            self._files["lengths"].write(lengths.tobytes())
+            self._files["bytes"].write(b"".join(encoded))
+        else:
+            column = np.full(size, self._fill, dtype=_DTYPES[self.kind])
+            try:
+                column[slots] = values
+            except (OverflowError, TypeError, ValueError) as e:
+                raise GEXFParseError(f"Failed to parse GEXF file: {e}") from e
+            self._files["values"].write(column.tobytes())
+
+    def finish(self, count: int, prefix: Path) -> None:
+        """Flush the column and convert it to ``.npy`` files named ``<prefix>-*``.
+
+        The present mask is kept only if some row has no value.
+        """
+        self.flush(count)
+        for file in self._files.values():
+            file.close()
+        if self.kind == "string":
+            _offsets_from_lengths(self._raw("lengths"), Path(f"{prefix}-offsets.npy"), count)
+            _npy_from_raw(self._raw("bytes"), Path(f"{prefix}-bytes.npy"), np.uint8)
+        else:
+            _npy_from_raw(self._raw("values"), Path(f"{prefix}-values.npy"), _DTYPES[self.kind])
+        if self.missing:
+            _npy_from_raw(self._raw("present"), Path(f"{prefix}-present.npy"), np.bool_)
+        else:
+            self._raw("present").unlink()
+
+    def peek(self) -> tuple[np.ndarray, np.ndarray]:
+        """Get the offsets and bytes of the rows flushed so far (string columns)."""
+        for file in self._files.values():
+            file.flush()
+        lengths = np.fromfile(self._raw("lengths"), dtype=np.int64)
+        offsets = np.zeros(lengths.size + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        return offsets, _raw(self._raw("bytes"), np.uint8)
+
+    def _raw(self, part: str) -> Path:
+        return self._path.with_name(f"{self._path.name}-{part}.raw")
+
+
+class _NodeResolver:
+    """Resolve edge endpoints to node indices with sorted string hashes.
+
+    Declared nodes are found by binary search over their hashes and checked
+    against their stored IDs; anything else (hash collisions, and endpoints
+    that name undeclared nodes) goes through a dict.
+    """
+
+    def __init__(self, ids: StringColumn, hashes: np.ndarray, add: Callable[[str], int]):
+        """Index the declared nodes.
+
+        Args:
+            ids: IDs of the declared nodes, in node order.
+            hashes: ``hash()`` of each ID.
+            add: Called with an undeclared endpoint to create its node;
+                returns the new node's index.
+
+        Raises:
+            GEXFParseError: If a node ID is declared twice.
+        """
+        self._ids = ids
+        self._add = add
+        self._order = np.argsort(hashes, kind="stable")
+        self._sorted = hashes[self._order]
+        self._others: dict[str, int] = {}
+
+        repeated = np.flatnonzero(self._sorted[1:] == self._sorted[:-1])
+        shared = np.unique(self._sorted[repeated])
+        for row in self._order[np.isin(self._sorted, shared)].tolist():
+            node_id = ids[row]
+            if node_id in self._others:
+                raise GEXFParseError(
+                    f"Duplicate node ID: {node_id} (out-of-core indexes need unique node IDs)"
+                )
+            self._others[node_id] = row
+        self._shared = shared
+
+    def resolve(self, names: list[str]) -> np.ndarray:
+        """Get the node index of each endpoint, creating undeclared nodes in order."""
+        found = np.full(len(names), -1, dtype=np.int64)
+        if self._sorted.size:
+            hashes = np.fromiter(map(hash, names), dtype=np.int64, count=len(names))
+            positions = np.minimum(np.searchsorted(self._sorted, hashes), self._sorted.size - 1)
+            hit = self._sorted[positions] == hashes
+            if self._shared.size:
+                hit &= ~np.isin(hashes, self._shared)
+            slots = np.flatnonzero(hit)
+            rows = self._order[positions[slots]]
+            expected = np.empty(slots.size, dtype=object)
+            expected[:] = [names[i] for i in slots.tolist()]
+            same = self._ids[rows] == expected
+            found[slots[same]] = rows[same]
+
+        for slot in np.flatnonzero(found < 0).tolist():
+            name = names[slot]
+            row = self._others.get(name)
+            if row is None:
+                row = self._others[name] = self._add(name)
+            found[slot] = row
+        return found
+
+
+class _GraphReader:
+    """Expat handlers that write the nodes and edges of a document to disk."""
+
+    def __init__(self, directory: Path, directed: bool):
+        self.directory = directory
+        self.directed = directed
+        self.node_count = 0
+        self.edge_count = 0
+        self.node_ids = _ColumnWriter(directory / "node-ids", "string")
+        self.node_columns: dict[str, _ColumnWriter] = {}
+        self.edge_columns: dict[str, _ColumnWriter] = {}
+
+        # Declared attributes by class and id, as (title, type)
+        self._declared: dict[str, dict[str, tuple[str, str]]] = {"node": {}, "edge": {}}
+        self._types: dict[str, dict[str, str]] = {"node": {}, "edge": {}}
+        self._attribute_class: str | None = None
+
+        # Open node elements (subnodes nest), and the open edge element
+        self._nodes: list[tuple[dict[str, str], dict[str, Any]]] = []
+        self._edge: tuple[dict[str, str], dict[str, Any]] | None = None
+
+        self._hashes: list[int] = []
+        self._resolver: _NodeResolver | None = None
+        self._endpoints: list[str] = []
+        self._sources = open(directory / "edges-source.raw", "wb")
+        self._targets = open(directory / "edges-target.raw", "wb")
+
+        self.parser = xml.parsers.expat.ParserCreate()
+        self.parser.StartElementHandler = self._start
+        self.parser.EndElementHandler = self._end
+
+    def read(self, path: Path) -> None:
+        """Parse the whole file, leaving every column flushed to its row count."""
+        try:
+            with open_input(path) as f:
+                while chunk := f.read(READ_SIZE):
+                    self.parser.Parse(chunk, False)
+                self.parser.Parse(b"", True)
+        except xml.parsers.expat.ExpatError as e:
+            raise GEXFParseError(f"Failed to parse GEXF file: {e}") from e
+        except (OSError, EOFError) as e:
+            raise GEXFParseError(f"Failed to read GEXF file: {e}") from e
+
+        if self._resolver is None:
+            self._seal()
+        self._write_edges()
+        self._sources.close()
+        self._targets.close()
+
+    def _start(self, tag: str, attrs: dict[str, str]) -> None:
+        name = tag.rpartition(":")[2]
+        if name == "edge":
+            self._edge = (attrs, {})
+        elif name == "attvalue":
+            self._attvalue(attrs)
+        elif name == "node":
+            if self._resolver is not None:
+                raise GEXFParseError("Nodes must come before edges in an out-of-core index")
+            self._nodes.append((attrs, {}))
+        elif name == "attributes":
+            self._attribute_class = attrs.get("class")
+        elif name == "attribute" and self._attribute_class in self._declared:
+            kind = self._attribute_class
+            title, attribute_type = attrs.get("title"), attrs.get("type", "string")
+            self._declared[kind][attrs.get("id")] = (title, attribute_type)
+            self._types[kind][title] = attribute_type
+
+    def _end(self, tag: str) -> None:
+        name = tag.rpartition(":")[2]
+        if name == "edge" and self._edge is not None:
+            self._end_edge(*self._edge)
+            self._edge = None
+        elif name == "node" and self._nodes:
+            attrs, values = self._nodes.pop()
+            for field in ("start", "end"):
+                if field in attrs:
+                    values[field] = attrs[field]
+            # Every node gets its label, replacing any attvalue of that title
+            values["label"] = attrs.get("label")
+            pid = attrs.get("pid", self._nodes[-1][0].get("id") if self._nodes else None)
+            if pid is not None:
+                values["pid"] = pid
+            self._add_node(attrs.get("id"), values)
+
+    def _attvalue(self, attrs: dict[str, str]) -> None:
+        """Store an attribute value on the open edge or node."""
+        if self._edge is not None:
+            kind, values = "edge", self._edge[1]
+        elif self._nodes:
+            kind, values = "node", self._nodes[-1][1]
+        else:
+            return
+        key = attrs.get("for")
+        if key not in self._declared[kind]:
+            raise GEXFParseError(f"Failed to parse GEXF file: No attribute defined for={key}.")
+        title, attribute_type = self._declared[kind][key]
+        value = attrs.get("value")
+        try:
+            if attribute_type == "boolean":
+                values[title] = _BOOLEANS[value]
+            elif COLUMN_TYPES.get(attribute_type) == "int":
+                values[title] = int(value)
+            elif COLUMN_TYPES.get(attribute_type) == "float":
+                values[title] = float(value)
+            else:
+                values[title] = value
+        except (KeyError, TypeError, ValueError):
+            raise GEXFParseError(
+                f"Failed to parse GEXF file: invalid {attribute_type} {value!r} for {title}"
+            ) from None
+
+    def _end_edge(self, attrs: dict[str, str], values: dict[str, Any]) -> None:
+        edge_type = attrs.get("type")
+        if self.directed and edge_type == "undirected":
+            raise GEXFParseError(
+                "Failed to parse GEXF file: Undirected edge found in directed graph."
+            )
+        if not self.directed and edge_type == "directed":
+            raise GEXFParseError(
+                "Failed to parse GEXF file: Directed edge found in undirected graph."
+            )
+        # NetworkX takes this attvalue as the edge's multigraph key
+        values.pop("networkx_key", None)
+        for field in ("start", "end", "id", "label"):
+            if field in attrs:
+                values[field] = attrs[field]
+        if "weight" in attrs:
+            try:
+                values["weight"] = float(attrs["weight"])
+            except ValueError:
+                raise GEXFParseError(
+                    f"Failed to parse GEXF file: invalid weight {attrs['weight']!r}"
+                ) from None
+
+        source, target = attrs.get("source"), attrs.get("target")
+        if source is None or target is None:
+            raise GEXFParseError("Failed to parse GEXF file: edge without a source or target")
+        self._add_edge(source, target, values)
+        if edge_type == "mutual":
+            self._add_edge(target, source, values)
+
+    def _add_node(self, node_id: str | None, values: dict[str, Any]) -> int:
+        if node_id is None:
+            raise GEXFParseError("Failed to parse GEXF file: node without an id")
+        row = self.node_count
+        self.node_ids.add(row, node_id)
+        if self._resolver is None:
+            self._hashes.append(hash(node_id))
+        for title, value in values.items():
+            if value is not None:
+                self._column("node", title).add(row, value)
+        self.node_count += 1
+        if self.node_count % CHUNK == 0:
+            self._flush_nodes()
+        return row
+
+    def _add_edge(self, source: str, target: str, values: dict[str, Any]) -> None:
+        if self._resolver is None:
+            self._seal()
+        row = self.edge_count
+        self._endpoints += (source, target)
+        for title, value in values.items():
+            self._column("edge", title).add(row, value)
+        self.edge_count += 1
+        if self.edge_count % CHUNK == 0:
+            self._write_edges()
+
+    def _column(self, kind: str, title: str) -> _ColumnWriter:
+        """Get the writer of a column, created when its title is first seen."""
+        columns = self.node_columns if kind == "node" else self.edge_columns
+        if title not in columns:
+            path = self.directory / f"{kind}-{len(columns)}"
+            if title in STRING_FIELDS:
+                columns[title] = _ColumnWriter(path, "string")
+            elif kind == "edge" and title == "weight":
+                # Missing weights count as 1 in weighted searches
+                columns[title] = _ColumnWriter(path, "float", fill=1.0)
+            else:
+                attribute_type = self._types[kind].get(title, "string")
+                columns[title] = _ColumnWriter(path, COLUMN_TYPES.get(attribute_type, "string"))
+        return columns[title]
+
+    def _flush_nodes(self) -> None:
+        self.node_ids.flush(self.node_count)
+        for column in self.node_columns.values():
+            column.flush(self.node_count)
+
+    def _seal(self) -> None:
+        """Index the declared nodes once the first edge arrives."""
+        self._flush_nodes()
+        ids = StringColumn(*self.node_ids.peek())
+        hashes = np.asarray(self._hashes, dtype=np.int64)
+        self._hashes = []
+        self._resolver = _NodeResolver(ids, hashes, lambda name: self._add_node(name, {}))
+
+    def _write_edges(self) -> None:
+        """Resolve the buffered endpoints and append them to the endpoint files."""
+        if not self._endpoints:
+            return
+        indices = self._resolver.resolve(self._endpoints)
+        if self.node_count > np.iinfo(np.int32).max:
+            raise GEXFParseError("Too many nodes for an out-of-core index")
+        self._sources.write(indices[0::2].astype("<i4").tobytes())
+        self._targets.write(indices[1::2].astype("<i4").tobytes())
+        self._endpoints = []
+        for column in self.edge_columns.values():
+            column.flush(self.edge_count)
+        self._flush_nodes()
+
+
+def _finish_columns(
+    directory: Path, kind: str, columns: dict[str, _ColumnWriter], count: int
+) -> dict[str, dict[str, Any]]:
+    """Convert columns to ``.npy`` files and describe them for the manifest.
+
+    Returns:
+        Per title: the column's number in array names, its type, and
+        whether some rows have no value.
+    """
+    specs = {}
+    for number, title in enumerate(sorted(columns)):
+        column = columns[title]
+        column.finish(count, directory / f"disk-{kind}-{number}")
+        specs[title] = {"number": number, "type": column.kind, "missing": column.missing}
+    return specs
+
+
+def _write_csr(
+    prefix: Path,
+    sources: np.ndarray,
+    targets: np.ndarray,
+    node_count: int,
+    memory: int,
+    layout: str,
+) -> np.ndarray | None:
+    """Sort edge entries into CSR arrays on disk, one bucket of rows at a time.
+
+    Writes ``<prefix>-indptr``, ``-indices`` and ``-edge-index``, laid out as
+    ``CSRAdjacency`` lays out the adjacency of the parsed graph.
+
+    Args:
+        prefix: Path prefix of the arrays.
+        sources: Source node of each edge, by edge ordinal.
+        targets: Target node of each edge, by edge ordinal.
+        node_count: Number of nodes.
+        memory: Memory budget for sorting, in bytes.
+        layout: "forward" or "reverse" adjacency of a directed graph, or
+            "undirected".
+
+    Returns:
+        Self-loops per node for undirected graphs, else None.
+    """
+    counts = np.zeros(node_count, dtype=np.int64)
+    loops = np.zeros(node_count, dtype=np.int64)
+    for rows, cols, _ in _entries(sources, targets, layout):
+        counts += np.bincount(rows, minlength=node_count)
+        if layout == "undirected":
+            loops += np.bincount(rows[rows == cols], minlength=node_count)
+    indptr = np.zeros(node_count + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+    total = int(indptr[-1])
+
+    # Buckets are runs of whole rows holding about the same number of entries
+    per_bucket = max(memory // ENTRY_BYTES, -(-total // MAX_BUCKETS), 1)
+    splits = np.searchsorted(indptr, np.arange(per_bucket, total, per_bucket), side="right") - 1
+    bounds = np.unique(np.concatenate([[0], splits, [node_count]]))
+    paths = [prefix.with_name(f"{prefix.name}-bucket-{b}.raw") for b in range(bounds.size - 1)]
+
+    files = [open(path, "wb") for path in paths]
+    try:
+        for rows, cols, ordinals in _entries(sources, targets, layout):
+            buckets = np.searchsorted(bounds, rows, side="right") - 1
+            order = np.argsort(buckets, kind="stable")
+            entries = np.empty(rows.size, dtype=_ENTRY)
+            entries["row"] = rows[order]
+            entries["col"] = cols[order]
+            entries["ordinal"] = ordinals[order]
+            ends = np.cumsum(np.bincount(buckets, minlength=len(files))).tolist()
+            for file, start, end in zip(files, [0] + ends[:-1], ends):
+                if end > start:
+                    file.write(entries[start:end].tobytes())
+    finally:
+        for file in files:
+            file.close()
+
+    ordinal_type = np.int32 if sources.size <= np.iinfo(np.int32).max else np.int64
+    indices = np.lib.format.open_memmap(
+        f"{prefix}-indices.npy", mode="w+", dtype=np.int32, shape=(total,)
+    )
+    edge_index = np.lib.format.open_memmap(
+        f"{prefix}-edge-index.npy", mode="w+", dtype=ordinal_type, shape=(total,)
+    )
+    for bucket, path in enumerate(paths):
+        entries = np.fromfile(path, dtype=_ENTRY)
+        path.unlink()
+        order = _bucket_order(entries, layout)
+        start, end = indptr[bounds[bucket]], indptr[bounds[bucket + 1]]
+        indices[start:end] = entries["col"][order]
+        edge_index[start:end] = entries["ordinal"][order]
+    indices.flush()
+    edge_index.flush()
+    del indices, edge_index
+    np.save(f"{prefix}-indptr.npy", indptr)
+    return loops if layout == "undirected" else None
+
+
+def _entries(
+    sources: np.ndarray, targets: np.ndarray, layout: str
+) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Read the CSR entries of a layout in chunks, as (rows, cols, ordinals).
+
+    Undirected edges give an entry at each end; self-loops only one.
+    """
+    for first in range(0, sources.size, SCAN_CHUNK):
+        rows = np.asarray(sources[first:first + SCAN_CHUNK])
+        cols = np.asarray(targets[first:first + SCAN_CHUNK])
+        ordinals = np.arange(first, first + rows.size, dtype=np.int64)
+        if layout == "reverse":
+            rows, cols = cols, rows
+        elif layout == "undirected":
+            mirror = rows != cols
+            rows, cols, ordinals = (
+                np.concatenate([rows, cols[mirror]]),
+                np.concatenate([cols, rows[mirror]]),
+                np.concatenate([ordinals, ordinals[mirror]]),
+            )
+        yield rows, cols, ordinals
+
+
+def _bucket_order(entries: np.ndarray, layout: str) -> np.ndarray:
+    """Order a bucket's entries as ``CSRAdjacency`` orders the parsed graph.
+
+    NetworkX lists a node's neighbors in the order it first saw an edge to
+    each, with parallel edges together; ``CSRAdjacency`` keeps that order
+    for the edges NetworkX reports from the node, and lists the edges
+    reported from earlier nodes (the other end of undirected edges, and all
+    of the reverse adjacency) after them by neighbor.
+    """
+    rows, cols, ordinals = entries["row"], entries["col"], entries["ordinal"]
+    if layout == "reverse":
+        return np.lexsort((ordinals, cols, rows))
+
+    # Ordinal of the first edge between each pair of nodes
+    by_pair = np.lexsort((ordinals, cols, rows))
+    pair_rows, pair_cols = rows[by_pair], cols[by_pair]
+    starts = np.ones(by_pair.size, dtype=bool)
+    starts[1:] = (pair_rows[1:] != pair_rows[:-1]) | (pair_cols[1:] != pair_cols[:-1])
+    first = np.empty_like(ordinals)
+    first[by_pair] = ordinals[by_pair][np.flatnonzero(starts)][np.cumsum(starts) - 1]
+
+    if layout == "forward":
+        return np.lexsort((ordinals, first, rows))
+    earlier = cols < rows
+    return np.lexsort((ordinals, np.where(earlier, cols, first), earlier, rows))
+
+
+def _string_order(strings: StringColumn) -> np.ndarray:
+    """Sort the rows of a string column by value, without decoding them.
+
+    Rows are sorted on their first 8 bytes, then runs of equal prefixes on
+    the next 8, and so on, so memory use is a few words per row whatever
+    the lengths of the strings. UTF-8 bytes sort as the strings do.
+    """
+    lengths = np.diff(strings.offsets)
+    order = np.arange(lengths.size, dtype=np.int64)
+    groups = np.zeros(lengths.size, dtype=np.int64)
+    active = order.copy()
+    depth = 0
+    while active.size:
+        rows = order[active]
+        keys = _prefix_keys(strings, rows, depth)
+        # Each group is a run of positions, so sorting by group keeps it in place
+        sort = np.lexsort((keys, groups[active]))
+        order[active] = rows[sort]
+        keys, group = keys[sort], groups[active]
+
+        starts = np.ones(active.size, dtype=bool)
+        starts[1:] = (group[1:] != group[:-1]) | (keys[1:] != keys[:-1])
+        firsts = np.flatnonzero(starts)
+        sizes = np.diff(np.append(firsts, active.size))
+        longest = np.maximum.reduceat(lengths[order[active]], firsts)
+        number = np.cumsum(starts) - 1
+        groups[active] = number
+        # Ties stand only where a string continues past the bytes compared
+        active = active[((sizes > 1) & (longest > depth + 8))[number]]
+        depth += 8
+    return order.astype(np.int32) if order.size <= np.iinfo(np.int32).max else order
+
+
+def _prefix_keys(strings: StringColumn, rows: np.ndarray, depth: int) -> np.ndarray:
+    """Get bytes ``depth`` to ``depth + 8`` of each row as big-endian integers.
+
+    Strings that end sooner are padded with zero bytes, which XML text
+    cannot contain.
+    """
+    keys = np.zeros(rows.size, dtype=np.uint64)
+    if strings.data.size == 0:
+        return keys
+    shifts = np.arange(56, -8, -8, dtype=np.uint64)
+    step = SCAN_CHUNK // 8
+    for first in range(0, rows.size, step):
+        part = rows[first:first + step]
+        positions = strings.offsets[part][:, None] + depth + np.arange(8)
+        valid = positions < strings.offsets[part + 1][:, None]
+        block = strings.data[np.minimum(positions, strings.data.size - 1)].astype(np.uint64)
+        block[~valid] = 0
+        keys[first:first + step] = np.bitwise_or.reduce(block << shifts, axis=1)
+    return keys
+
+
+def _raw(path: Path, dtype: Any) -> np.ndarray:
+    """Memory-map a raw file of fixed-size values (an empty array if it is empty)."""
+    if path.stat().st_size == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r")
+
+
+def _npy_from_raw(raw: Path, target: Path, dtype: Any) -> None:
+    """Turn a raw file of values into a ``.npy`` file, streaming the copy."""
+    dtype = np.dtype(dtype)
+    header = {
+        "descr": np.lib.format.dtype_to_descr(dtype),
+        "fortran_order": False,
+        "shape": (raw.stat().st_size // dtype.itemsize,),
+    }
+    with open(raw, "rb") as source, open(target, "wb") as sink:
+        np.lib.format.write_array_header_1_0(sink, header)
+        shutil.copyfileobj(source, sink, 1 << 20)
+    raw.unlink()
+
+
+def _offsets_from_lengths(raw: Path, target: Path, count: int) -> None:
+    """Write the offsets of ``count`` strings from a raw file of their lengths."""
+    offsets = np.lib.format.open_memmap(target, mode="w+", dtype=np.int64, shape=(count + 1,))
+    offsets[0] = 0
+    lengths = _raw(raw, np.int64)
+    total = 0
+    for first in range(0, count, SCAN_CHUNK):
+        part = np.cumsum(lengths[first:first + SCAN_CHUNK]) + total
+        offsets[first + 1:first + 1 + part.size] = part
+        if part.size:
+            total = int(part[-1])
+    offsets.flush()
+    del offsets, lengths
+    raw.unlink()
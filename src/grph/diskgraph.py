@@ -0,0 +1,681 @@
+"""Graphs queried from an out-of-core index, for files too large for memory.
+
+``grph index build --out-of-core`` (see ``grph.diskbuild``) streams a GEXF
+file into the ``disk`` section of its sidecar: CSR adjacency sorted on disk,
+and node and edge attributes as columns. ``DiskGraph`` memory-maps those
+arrays and answers traversal queries from them without parsing the file or
+building a NetworkX graph, so memory use is a few bytes per node and the
+edges stay in the page cache.
+
+Node indices and CSR rows follow the order NetworkX would give the parsed
+graph, so traversal results, ties included, match ``GEXFGraph``. Edge
+ordinals are positions in the file.
+
+Layout of the section's arrays (``<n>`` is a column number from the
+manifest):
+
+- ``disk-node-ids-offsets``/``-bytes``: node IDs as UTF-8, end to end;
+  ``disk-node-ids-order``: node indices sorted by ID, for lookups.
+- ``disk-{node,edge}-<n>-values``: int64, float64 or bool column values;
+  string columns have ``-offsets``/``-bytes`` instead. ``-present`` masks
+  the rows that have a value, for columns where some do not.
+- ``disk-forward-*`` and (directed graphs) ``disk-reverse-*``: CSR
+  adjacency as in ``CSRAdjacency``; ``disk-self-loops`` counts the
+  self-loops of each node in undirected graphs.
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Iterator, Mapping
+
+import numpy as np
+
+from .csr import CSRAdjacency
+from .errors import GEXFParseError
+from .models import ComponentInfo, GraphMetadata, Node, PathResult
+from .profiling import span, traced
+from .results import NodeSet
+from .sidecar import SidecarIndex, index_path, read_manifest, stale_reason
+from .traversal import bfs, bfs_path, dijkstra_path, visited
+
+SECTION = "disk"
+
+# Column value types, by GEXF attribute type
+COLUMN_TYPES = {
+    "integer": "int",
+    "long": "int",
+    "float": "float",
+    "double": "float",
+    "boolean": "bool",
+}
+
+# CSR slots read per chunk when scanning every edge
+SCAN_CHUNK = 1 << 22
+
+# Bytes compared per chunk when matching string columns
+MATCH_CHUNK = 1 << 24
+
+
+class Column(ABC):
+    """A node or edge column held in memory-mapped arrays.
+
+    Indexing with an integer gives one value (None if missing); indexing
+    with an array or slice gives an object array, like the columns of
+    ``GEXFGraph.node_values``.
+    """
+
+    def __init__(self, size: int, present: np.ndarray | None = None):
+        self._size = size
+        self._present = present
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        for start in range(0, self._size, 1 << 16):
+            yield from self[start:start + (1 << 16)].tolist()
+
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, (int, np.integer)):
+            if self._present is not None and not self._present[key]:
+                return None
+            return self._value(int(key))
+        rows = np.arange(self._size)[key] if isinstance(key, slice) else np.asarray(key)
+        column = np.empty(rows.size, dtype=object)
+        column[:] = self._values(rows)
+        if self._present is not None:
+            column[~self._present[rows]] = None
+        return column
+
+    def present(self) -> np.ndarray:
+        """Get a mask of the rows that have a value."""
+        if self._present is None:
+            return np.ones(self._size, dtype=bool)
+        return np.asarray(self._present)
+
+    @abstractmethod
+    def equals(self, value: str) -> np.ndarray:
+        """Mask the rows whose value equals a string, compared as strings.
+
+        Matches ``str(row_value) == value``, as the CLI's key=value filters do.
+        """
+
+    @abstractmethod
+    def _value(self, row: int) -> Any:
+        """Get the value of one row, ignoring the present mask."""
+
+    @abstractmethod
+    def _values(self, rows: np.ndarray) -> list[Any]:
+        """Get the values of several rows, ignoring the present mask."""
+
+
+class EmptyColumn(Column):
+    """A column with no values, for keys no row has."""
+
+    def equals(self, value: str) -> np.ndarray:
+        return np.zeros(self._size, dtype=bool)
+
+    def present(self) -> np.ndarray:
+        return np.zeros(self._size, dtype=bool)
+
+    def _value(self, row: int) -> None:
+        return None
+
+    def _values(self, rows: np.ndarray) -> list[None]:
+        return [None] * rows.size
+
+
+class ValueColumn(Column):
+    """An int64, float64 or bool column."""
+
+    def __init__(self, values: np.ndarray, present: np.ndarray | None = None):
+        super().__init__(values.size, present)
+        self.values = values
+
+    def equals(self, value: str) -> np.ndarray:
+        kind = self.values.dtype.kind
+        try:
+            if kind == "b":
+                target: Any = {"True": True, "False": False}[value]
+            else:
+                target = (int if kind == "i" else float)(value)
+        except (KeyError, ValueError):
+            return np.zeros(self._size, dtype=bool)
+        # Only the value's own spelling matches ("1.0" but not "1" for floats)
+        if str(target) != value:
+            return np.zeros(self._size, dtype=bool)
+        return (np.asarray(self.values) == target) & self.present()
+
+    def _value(self, row: int) -> Any:
+        return self.values[row].item()
+
+    def _values(self, rows: np.ndarray) -> list[Any]:
+        return self.values[rows].tolist()
+
+
+class StringColumn(Column):
+    """Strings stored as UTF-8 bytes end to end, with an offset per row."""
+
+    def __init__(self, offsets: np.ndarray, data: np.ndarray, present: np.ndarray | None = None):
+        super().__init__(offsets.size - 1, present)
+        self.offsets = offsets
+        self.data = data
+
+    def raw(self, row: int) -> bytes:
+        """Get the UTF-8 bytes of one row."""
+        return self.data[self.offsets[row]:self.offsets[row + 1]].tobytes()
+
+    def equals(self, value: str) -> np.ndarray:
+        target = np.frombuffer(value.encode("utf-8"), dtype=np.uint8)
+        mask = np.zeros(self._size, dtype=bool)
+        lengths = np.diff(self.offsets)
+        candidates = np.flatnonzero(lengths == target.size)
+        if target.size:
+            # Compare the candidates byte by byte, a bounded block at a time
+            step = max(MATCH_CHUNK // target.size, 1)
+            for start in range(0, candidates.size, step):
+                rows = candidates[start:start + step]
+                positions = self.offsets[rows][:, None] + np.arange(target.size)
+                rows = rows[np.all(self.data[positions] == target, axis=1)]
+                mask[rows] = True
+        else:
+            mask[candidates] = True
+        return mask & self.present()
+
+    def _value(self, row: int) -> str:
+        return self.raw(row).decode("utf-8")
+
+    def _values(self, rows: np.ndarray) -> list[str]:
+        starts = self.offsets[rows]
+        lengths = self.offsets[rows + 1] - starts
+        total = int(lengths.sum())
+        if total == 0:
+            return [""] * rows.size
+        # Gather every row's bytes at once, then split them apart
+        row_offsets = np.cumsum(lengths) - lengths
+        text = self.data[np.repeat(starts - row_offsets, lengths) + np.arange(total)].tobytes()
+        bounds = np.concatenate([[0], np.cumsum(lengths)]).tolist()
+        return [text[a:b].decode("utf-8") for a, b in zip(bounds[:-1], bounds[1:])]
+
+
+class NodeLookup(Mapping[str, int]):
+    """Map of node ID to node index, by binary search over the sorted IDs.
+
+    Stands in for the ``node_index`` dict of ``GEXFGraph``; only the pages
+    of the ID arrays that a lookup visits are read.
+    """
+
+    def __init__(self, ids: StringColumn, order: np.ndarray):
+        self._ids = ids
+        self._order = order
+
+    def find(self, node_id: str) -> int:
+        """Get the index of a node ID, or -1 if there is no such node."""
+        # UTF-8 bytes sort in the same order as the strings they encode
+        target = node_id.encode("utf-8")
+        low, high = 0, self._order.size
+        while low < high:
+            middle = (low + high) // 2
+            if self._ids.raw(self._order[middle]) < target:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._order.size and self._ids.raw(self._order[low]) == target:
+            return int(self._order[low])
+        return -1
+
+    def get(self, node_id: Any, default: Any = None) -> Any:
+        found = self.find(node_id) if isinstance(node_id, str) else -1
+        return default if found < 0 else found
+
+    def __contains__(self, node_id: object) -> bool:
+        return isinstance(node_id, str) and self.find(node_id) >= 0
+
+    def __getitem__(self, node_id: str) -> int:
+        found = self.get(node_id, -1)
+        if found < 0:
+            raise KeyError(node_id)
+        return found
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+class DiskGraph:
+    """A graph answering queries from the out-of-core index of its file.
+
+    Offers the traversal queries of ``GEXFGraph`` (neighbors, shortest
+    paths, reachability, degrees and components) with the same results.
+
+    Example:
+        >>> graph = DiskGraph.open("huge.gexf")
+        >>> graph.neighbors("n42", depth=2).count()
+    """
+
+    def __init__(self, file_path: str | Path, index: SidecarIndex):
+        """Wrap an opened sidecar that holds the disk section.
+
+        Use ``DiskGraph.open`` to check that the sidecar is fresh first.
+        """
+        self.file_path = Path(file_path)
+        self.index = index
+        disk = index.manifest[SECTION]
+        self._directed = bool(index.manifest["directed"])
+        self._node_specs: dict[str, dict[str, Any]] = disk["node_columns"]
+        self._edge_specs: dict[str, dict[str, Any]] = disk["edge_columns"]
+        self._metadata = GraphMetadata(
+            **disk["metadata"],
+            node_count=index.manifest["node_count"],
+            edge_count=index.manifest["edge_count"],
+        )
+        self._node_ids: StringColumn | None = None
+        self._node_index: NodeLookup | None = None
+        self._adjacency: CSRAdjacency | None = None
+
+    @classmethod
+    def open(cls, file_path: str | Path) -> "DiskGraph | None":
+        """Open the out-of-core index of a graph file.
+
+        Returns:
+            The graph, or None if the file has no out-of-core index or it
+            is stale.
+        """
+        path = index_path(file_path)
+        manifest = read_manifest(path)
+        if manifest is None or SECTION not in manifest.get("sections", []):
+            return None
+        stat = Path(file_path).stat()
+        if stale_reason(manifest, (stat.st_mtime_ns, stat.st_size)) is not None:
+            return None
+        return cls(file_path, SidecarIndex(path, manifest))
+
+    @property
+    def metadata(self) -> GraphMetadata:
+        """Get the graph metadata."""
+        return self._metadata
+
+    @property
+    def node_ids(self) -> StringColumn:
+        """Node IDs in graph order, read from the index as they are used."""
+        if self._node_ids is None:
+            self._node_ids = StringColumn(
+                self.index.array("disk-node-ids-offsets"), self.index.array("disk-node-ids-bytes")
+            )
+        return self._node_ids
+
+    @property
+    def node_index(self) -> NodeLookup:
+        """Map of node ID to its dense integer index, the inverse of ``node_ids``."""
+        if self._node_index is None:
+            self._node_index = NodeLookup(self.node_ids, self.index.array("disk-node-ids-order"))
+        return self._node_index
+
+    @property
+    def adjacency(self) -> CSRAdjacency:
+        """The CSR adjacency, over the mapped arrays of the index."""
+        if self._adjacency is None:
+            array = self.index.array
+            forward = CSRAdjacency(
+                self.node_ids,
+                array("disk-forward-indptr"),
+                array("disk-forward-indices"),
+                array("disk-forward-edge-index"),
+                self._directed,
+                self.node_index,
+            )
+            if self._directed:
+                reverse = CSRAdjacency(
+                    self.node_ids,
+                    array("disk-reverse-indptr"),
+                    array("disk-reverse-indices"),
+                    array("disk-reverse-edge-index"),
+                    True,
+                    self.node_index,
+                )
+                forward._reverse, reverse._reverse = reverse, forward
+            self._adjacency = forward
+        return self._adjacency
+
+    def node_attribute_keys(self) -> list[str]:
+        """Get all unique attribute keys used by nodes."""
+        return sorted(key for key in self._node_specs if key != "label")
+
+    def edge_attribute_keys(self) -> list[str]:
+        """Get all unique attribute keys used by edges."""
+        return sorted(self._edge_specs)
+
+    def node_values(self, key: str, rows: np.ndarray | None = None) -> Column | np.ndarray:
+        """Get a node field or attribute for every node, in graph order.
+
+        Args:
+            key: ``id``, ``label`` or a node attribute key.
+            rows: Only get the values of these node indices.
+
+        Returns:
+            Column of values, or an object array of the given rows; None
+            where a node has no value.
+        """
+        if key == "id":
+            column = self.node_ids
+        else:
+            column = self._column("node", key, self._metadata.node_count)
+        return column if rows is None else column[rows]
+
+    def edge_values(self, key: str, rows: np.ndarray | None = None) -> Column | np.ndarray:
+        """Get an edge attribute for every edge, by edge ordinal.
+
+        Args:
+            key: ``id``, ``weight``, ``label`` or an edge attribute key.
+            rows: Only get the values of these edge ordinals.
+
+        Returns:
+            Column of values, or an object array of the given rows; None
+            where an edge has no value.
+        """
+        column = self._column("edge", key, self._metadata.edge_count)
+        return column if rows is None else column[rows]
+
+    def _column(self, kind: str, key: str, size: int) -> Column:
+        """Open a node or edge column described by the manifest."""
+        spec = (self._node_specs if kind == "node" else self._edge_specs).get(key)
+        if spec is None:
+            return EmptyColumn(size)
+        prefix = f"disk-{kind}-{spec['number']}"
+        present = self.index.array(f"{prefix}-present") if spec["missing"] else None
+        if spec["type"] == "string":
+            return StringColumn(
+                self.index.array(f"{prefix}-offsets"), self.index.array(f"{prefix}-bytes"), present
+            )
+        return ValueColumn(self.index.array(f"{prefix}-values"), present)
+
+    def get_node(self, node_id: str) -> Node | None:
+        """Get a specific node by ID."""
+        i = self.node_index.find(node_id)
+        if i < 0:
+            return None
+        attributes = {}
+        for key in self.node_attribute_keys():
+            value = self.node_values(key)[i]
+            if value is not None:
+                attributes[key] = value
+        return Node(id=node_id, label=self.node_values("label")[i], attributes=attributes)
+
+    def _node_mask(self, filters: list[tuple[str, str]] | None) -> np.ndarray | None:
+        """Build a boolean mask of nodes matching all (key, value) filters."""
+        if not filters:
+            return None
+        mask = np.ones(self._metadata.node_count, dtype=bool)
+        for key, value in filters:
+            mask &= self.node_values(key).equals(value)
+        return mask
+
+    def _edge_mask(self, filters: list[tuple[str, str]] | None) -> np.ndarray | None:
+        """Build a boolean mask of edges matching all (key, value) filters."""
+        if not filters:
+            return None
+        mask = np.ones(self._metadata.edge_count, dtype=bool)
+        for key, value in filters:
+            mask &= self.edge_values(key).equals(value)
+        return mask
+
+    def _edge_weights(self) -> np.ndarray:
+        """Get edge weights by edge ordinal (missing weights are stored as 1)."""
+        spec = self._edge_specs.get("weight")
+        if spec is None:
+            return np.ones(self._metadata.edge_count, dtype=np.float64)
+        return self.index.array(f"disk-edge-{spec['number']}-values")
+
+    def _require(self, node_id: str, message: str = "Node not found") -> int:
+        """Get the index of a node, raising if it does not exist."""
+        i = self.node_index.find(node_id)
+        if i < 0:
+            raise GEXFParseError(f"{message}: {node_id}")
+        return i
+
+    def _bfs_from(
+        self,
+        start: int,
+        direction: str,
+        max_depth: int | None,
+        edge_filters: list[tuple[str, str]] | None = None,
+        node_filters: list[tuple[str, str]] | None = None,
+    ) -> np.ndarray:
+        """Run a BFS from one node and return the indices it reached (excluding itself)."""
+        dist = bfs(
+            self.adjacency,
+            [start],
+            direction=direction,
+            max_depth=max_depth,
+            edge_mask=self._edge_mask(edge_filters),
+            node_mask=self._node_mask(node_filters),
+        )
+        reached = visited(dist)
+        return reached[reached != start]
+
+    @traced
+    def neighbors(
+        self,
+        node_id: str,
+        direction: str = "all",
+        depth: int = 1,
+        edge_filters: list[tuple[str, str]] | None = None,
+        node_filters: list[tuple[str, str]] | None = None,
+    ) -> NodeSet:
+        """Get neighbors of a node; see ``GEXFGraph.neighbors``.
+
+        Raises:
+            GEXFParseError: If node not found.
+        """
+        start = self._require(node_id)
+        found = self._bfs_from(start, direction, depth, edge_filters, node_filters)
+        return NodeSet(self, found)
+
+    @traced
+    def shortest_path(
+        self,
+        source: str,
+        target: str,
+        weighted: bool = False,
+        edge_filters: list[tuple[str, str]] | None = None,
+        node_filters: list[tuple[str, str]] | None = None,
+    ) -> PathResult | None:
+        """Find the shortest path between two nodes; see ``GEXFGraph.shortest_path``.
+
+        Returns:
+            PathResult or None if no path exists.
+        """
+        start = self._require(source, "Source node not found")
+        end = self._require(target, "Target node not found")
+        adj = self.adjacency
+        edge_mask = self._edge_mask(edge_filters)
+        node_mask = self._node_mask(node_filters)
+
+        total_weight = None
+        if weighted:
+            try:
+                found = dijkstra_path(adj, start, end, self._edge_weights(), edge_mask, node_mask)
+            except ValueError as e:
+                raise GEXFParseError(str(e)) from e
+            if found is None:
+                return None
+            indices, weight = found
+            total_weight = float(weight)
+        else:
+            indices = bfs_path(adj, start, end, edge_mask, node_mask)
+            if indices is None:
+                return None
+        path = [adj.node_ids[i] for i in indices]
+        return PathResult(
+            source=source,
+            target=target,
+            path=path,
+            length=len(path) - 1,
+            total_weight=total_weight,
+        )
+
+    @traced
+    def reachable(
+        self,
+        node_id: str,
+        direction: str = "forward",
+        max_depth: int | None = None,
+        edge_filters: list[tuple[str, str]] | None = None,
+        node_filters: list[tuple[str, str]] | None = None,
+    ) -> NodeSet:
+        """Find all nodes reachable from a given node; see ``GEXFGraph.reachable``."""
+        start = self._require(node_id)
+        depth = max_depth or None
+        filters = (edge_filters, node_filters)
+
+        if self._directed:
+            found = np.empty(0, dtype=np.int32)
+            if direction in ("forward", "both"):
+                found = np.union1d(found, self._bfs_from(start, "out", depth, *filters))
+            if direction in ("backward", "both"):
+                found = np.union1d(found, self._bfs_from(start, "in", depth, *filters))
+        else:
+            found = self._bfs_from(start, "all", depth, *filters)
+
+        return NodeSet(self, found)
+
+    @traced
+    def get_components(self, component_type: str = "connected") -> ComponentInfo:
+        """Get information about connected components; see ``GEXFGraph.get_components``.
+
+        Weak components are found by scanning the edges in order, so they
+        need memory only per node. Strong components are labelled by SciPy,
+        which copies the adjacency into memory.
+        """
+        adj = self.adjacency
+        if self._directed and component_type == "strongly":
+            count, labels = adj.components(strong=True)
+        else:
+            with span("weak_components"):
+                count, labels = weak_components(adj)
+
+        # Group node indices by component, in ID order within each group
+        by_id = np.asarray(self.index.array("disk-node-ids-order"))
+        grouped = by_id[np.argsort(labels[by_id], kind="stable")]
+        counts = np.bincount(labels, minlength=count)
+        bounds = np.concatenate([[0], np.cumsum(counts)]).tolist()
+
+        # Largest first; equal sizes keep the order of their first node
+        node_ids = self.node_ids[grouped].tolist()
+        components = [
+            node_ids[bounds[c]:bounds[c + 1]] for c in np.argsort(-counts, kind="stable").tolist()
+        ]
+        sizes = [len(c) for c in components]
+
+        return ComponentInfo(
+            num_components=len(components),
+            component_sizes=sizes,
+            largest_component_size=sizes[0] if sizes else 0,
+            components=components,
+        )
+
+    @traced
+    def get_degree(self, node_id: str | None = None, limit: int | None = None) -> dict[str, Any]:
+        """Get degree information for nodes; see ``GEXFGraph.get_degree``.
+
+        Args:
+            node_id: Specific node ID or None for all nodes.
+            limit: With no ``node_id``, list only this many nodes with the
+                highest degree; the rest are never materialised.
+        """
+        adj = self.adjacency
+        if self._directed:
+            out_degree = np.diff(adj.indptr)
+            in_degree = np.diff(adj.reverse.indptr)
+            total = in_degree + out_degree
+        else:
+            # Self-loops are stored once but count twice
+            total = np.diff(adj.indptr) + self.index.array("disk-self-loops")
+
+        if node_id:
+            i = self._require(node_id)
+            if self._directed:
+                return {
+                    "node": node_id,
+                    "in_degree": int(in_degree[i]),
+                    "out_degree": int(out_degree[i]),
+                    "total_degree": int(total[i]),
+                }
+            return {"node": node_id, "degree": int(total[i])}
+
+        order = top_order(total, limit)
+        ids = self.node_ids[order].tolist()
+        if self._directed:
+            degrees = [
+                {"node": node, "in_degree": i, "out_degree": o, "total_degree": t}
+                for node, i, o, t in zip(
+                    ids,
+                    in_degree[order].tolist(),
+                    out_degree[order].tolist(),
+                    total[order].tolist(),
+                )
+            ]
+        else:
+            degrees = [{"node": node, "degree": d} for node, d in zip(ids, total[order].tolist())]
+        return {"degrees": degrees}
+
+
+def top_order(values: np.ndarray, limit: int | None = None) -> np.ndarray:
+    """Order rows by descending value, ties by row, keeping the first ``limit``.
+
+    Matches ``np.argsort(-values, kind="stable")[:limit]`` without sorting
+    every row when only a few are kept.
+    """
+    if limit is None or limit >= values.size:
+        return np.argsort(-values, kind="stable")
+    if limit <= 0:
+        return np.empty(0, dtype=np.int64)
+    threshold = np.partition(values, values.size - limit)[values.size - limit]
+    above = np.flatnonzero(values > threshold)
+    ties = np.flatnonzero(values == threshold)[: limit - above.size]
+    rows = np.union1d(above, ties)
+    return rows[np.argsort(-values[rows], kind="stable")]
+
+
+def weak_components(adj: CSRAdjacency) -> tuple[int, np.ndarray]:
+    """Label weakly connected components with a sequential scan of the edges.
+
+    Each pass hooks the root of every edge's higher endpoint onto the lower
+    root, then shortens every node's pointer to its root; passes repeat
+    until no edge joins two roots. Only a label per node is held in memory,
+    and the adjacency is read front to back, so it can stay on disk.
+
+    Returns:
+        Tuple of (number of components, component label of every node), as
+        from ``CSRAdjacency.components``: labels in order of each
+        component's first node.
+    """
+    n = adj.num_nodes
+    indptr = adj.indptr
+    parent = np.arange(n, dtype=np.int64)
+    bounds = np.searchsorted(indptr, np.arange(0, int(indptr[-1]), SCAN_CHUNK), side="right") - 1
+    bounds = np.unique(np.concatenate([bounds, [n]]))
+
+    changed = True
+    while changed:
+        changed = False
+        for first, last in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+            lengths = np.diff(indptr[first:last + 1])
+            rows = parent[np.repeat(np.arange(first, last), lengths)]
+            cols = parent[adj.indices[indptr[first]:indptr[last]]]
+            high, low = np.maximum(rows, cols), np.minimum(rows, cols)
+            joins = high != low
+            if joins.any():
+                np.minimum.at(parent, high[joins], low[joins])
+                changed = True
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+    # Every root is the first node of its component
+    roots, labels = np.unique(parent, return_inverse=True)
+    return int(roots.size), labels.astype(np.int32)
@@ -0,0 +1,7 @@
+"""Exceptions raised by grph."""
+
+
+class GEXFParseError(Exception):
+    """Raised when a GEXF file cannot be parsed."""
+
+    pass
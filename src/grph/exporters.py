@@ -0,0 +1,321 @@
+"""Streaming graph exporters.
+
+Text exporters write to a binary file-like sink in bounded chunks, so the
+memory used by an export does not grow with the size of the graph. Array
+exporters write whole NumPy arrays at once from the CSR adjacency, so no
+per-edge formatting is involved.
+"""
+
+import json
+from typing import Any, BinaryIO, Callable, Iterable, Iterator
+from xml.sax.saxutils import escape, quoteattr
+
+import networkx as nx
+import numpy as np
+import scipy.io
+import scipy.sparse as sp
+
+from .csr import CSRAdjacency
+from .models import ExportFormat
+
+# Approximate number of characters buffered before each write to the sink
+CHUNK_SIZE = 1 << 16
+
+
+class ChunkedWriter:
+    """Buffer text and write it to a binary sink in UTF-8 chunks."""
+
+    def __init__(self, sink: BinaryIO, chunk_size: int = CHUNK_SIZE):
+        self._sink = sink
+        self._chunk_size = chunk_size
+        self._parts: list[str] = []
+        self._size = 0
+
+    def write(self, text: str) -> None:
+        """Queue text, flushing to the sink once a chunk is full."""
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self._chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write any buffered text to the sink."""
+        if self._parts:
+            self._sink.write("".join(self._parts).encode("utf-8"))
+            self._parts = []
+            self._size = 0
+
+    def __enter__(self) -> "ChunkedWriter":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.flush()
+
+
+def write_json(graph: nx.Graph, sink: BinaryIO) -> None:
+    """Write node-link JSON, one node or link per line.
+
+    The document has the same structure as ``networkx.node_link_data``.
+    """
+    # Ask NetworkX which key it uses for the link list ("links" or "edges")
+    links_key = [k for k in nx.node_link_data(nx.Graph()) if k not in _NODE_LINK_HEADER][0]
+
+    with ChunkedWriter(sink) as out:
+        out.write("{\n")
+        out.write(f'  "directed": {_json(graph.is_directed())},\n')
+        out.write(f'  "multigraph": {_json(graph.is_multigraph())},\n')
+        out.write(f'  "graph": {_json(graph.graph)},\n')
+
+        out.write('  "nodes": ')
+        _write_json_list(out, ({**attrs, "id": node} for node, attrs in graph.nodes(data=True)))
+        out.write(",\n")
+
+        out.write(f'  "{links_key}": ')
+        _write_json_list(out, _node_links(graph))
+        out.write("\n}\n")
+
+
+def write_graphml(graph: nx.Graph, sink: BinaryIO) -> None:
+    """Write GraphML, emitting nodes and edges as they are iterated.
+
+    Attribute keys are declared up front, which takes one pass over the
+    attribute names (but not the values) before writing. Graph-level
+    attributes (``graph.graph``) are written as ``<data>`` under ``<graph>``,
+    as ``networkx.write_graphml`` does, with ``id`` becoming the graph's id.
+    """
+    graph_data = {k: v for k, v in graph.graph.items() if k not in _GRAPHML_SKIPPED}
+    graph_id = graph_data.pop("id", None)
+    graph_keys = _graphml_keys([graph_data])
+    node_keys = _graphml_keys(attrs for _, attrs in graph.nodes(data=True))
+    edge_keys = _graphml_keys(attrs for _, _, attrs in graph.edges(data=True))
+    key_ids: dict[tuple[str, str], str] = {}
+
+    with ChunkedWriter(sink) as out:
+        out.write("<?xml version='1.0' encoding='utf-8'?>\n")
+        out.write(
+            '<graphml xmlns="http://graphml.graphdrawing.org/xmlns" '
+            'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+            'xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns '
+            'http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">\n'
+        )
+        for domain, keys in (("graph", graph_keys), ("node", node_keys), ("edge", edge_keys)):
+            for name, xml_type in keys.items():
+                key_id = f"d{len(key_ids)}"
+                key_ids[(domain, name)] = key_id
+                out.write(
+                    f'  <key id="{key_id}" for="{domain}" '
+                    f"attr.name={quoteattr(name)} attr.type=\"{xml_type}\" />\n"
+                )
+
+        edge_default = "directed" if graph.is_directed() else "undirected"
+        id_attr = "" if graph_id is None else f" id={quoteattr(str(graph_id))}"
+        out.write(f'  <graph edgedefault="{edge_default}"{id_attr}>\n')
+        for name, value in graph_data.items():
+            out.write(f"    {_graphml_data('graph', name, value, key_ids)}\n")
+
+        for node, attrs in graph.nodes(data=True):
+            out.write(f"    <node id={quoteattr(str(node))}")
+            out.write(_graphml_body("node", attrs, key_ids))
+
+        for source, target, attrs in graph.edges(data=True):
+            out.write(f"    <edge source={quoteattr(str(source))} target={quoteattr(str(target))}")
+            out.write(_graphml_body("edge", attrs, key_ids))
+
+        out.write("  </graph>\n</graphml>\n")
+
+
+def write_adjlist(graph: nx.Graph, sink: BinaryIO) -> None:
+    """Write an adjacency list: each node followed by its neighbors."""
+    with ChunkedWriter(sink) as out:
+        for node in graph.nodes():
+            neighbors = " ".join(str(n) for n in graph.neighbors(node))
+            out.write(f"{node} {neighbors}\n" if neighbors else f"{node}\n")
+
+
+def write_edgelist(graph: nx.Graph, sink: BinaryIO) -> None:
+    """Write an edge list: source, target and (if set) weight per line."""
+    with ChunkedWriter(sink) as out:
+        for source, target, data in graph.edges(data=True):
+            weight = data.get("weight", "")
+            if weight:
+                out.write(f"{source} {target} {weight}\n")
+            else:
+                out.write(f"{source} {target}\n")
+
+
+def write_npz(adjacency: CSRAdjacency, weights: np.ndarray, sink: BinaryIO) -> None:
+    """Write the CSR adjacency as a NumPy ``.npz`` archive.
+
+    The archive holds ``indptr``, ``indices`` and ``weights`` (one per CSR
+    slot), ``node_ids`` (row/column labels) and a ``directed`` flag. Load it
+    with ``numpy.load`` and, if needed, ``scipy.sparse.csr_matrix((weights,
+    indices, indptr))``.
+    """
+    np.savez(
+        sink,
+        indptr=adjacency.indptr,
+        indices=adjacency.indices,
+        weights=weights[adjacency.edge_index],
+        node_ids=np.array(adjacency.node_ids, dtype=str),
+        directed=np.array(adjacency.directed),
+    )
+
+
+def write_matrix_market(adjacency: CSRAdjacency, weights: np.ndarray, sink: BinaryIO) -> None:
+    """Write the weighted adjacency matrix in Matrix Market format.
+
+    Rows and columns follow node order in the source file.
+    """
+    n = adjacency.num_nodes
+    matrix = sp.csr_matrix(
+        (weights[adjacency.edge_index], adjacency.indices, adjacency.indptr), shape=(n, n)
+    )
+    symmetry = "general" if adjacency.directed else "symmetric"
+    scipy.io.mmwrite(
+        sink, matrix, comment="grph adjacency; rows follow GEXF node order", symmetry=symmetry
+    )
+
+
+def write_columns(graph: nx.Graph, adjacency: CSRAdjacency, sink: BinaryIO) -> None:
+    """Write nodes, edges and their attributes as typed columns in an ``.npz``.
+
+    The archive holds ``node_ids``, ``edge_source`` and ``edge_target``
+    (node indices, in edge order), plus ``node/<key>`` and ``edge/<key>``
+    arrays for every attribute. Columns are bool, int64, float64 or string
+    depending on their values, and ``<column>/present`` marks which entries
+    were set.
+    """
+    nodes = list(graph.nodes(data=True))
+    edges = list(graph.edges(data=True))
+
+    columns: dict[str, np.ndarray] = {
+        "node_ids": np.array(adjacency.node_ids, dtype=str),
+        "edge_source": np.fromiter((adjacency.index_of(str(u)) for u, _, _ in edges), dtype=np.int32),
+        "edge_target": np.fromiter((adjacency.index_of(str(v)) for _, v, _ in edges), dtype=np.int32),
+    }
+    for domain, attr_dicts in (("node", [a for _, a in nodes]), ("edge", [a for _, _, a in edges])):
+        keys = dict.fromkeys(k for attrs in attr_dicts for k in attrs)
+        for key in keys:
+            values = [attrs.get(key) for attrs in attr_dicts]
+            column, present = typed_column(values)
+            columns[f"{domain}/{key}"] = column
+            columns[f"{domain}/{key}/present"] = present
+
+    np.savez(sink, **columns)
+
+
+EXPORTERS: dict[ExportFormat, Callable[[nx.Graph, BinaryIO], None]] = {
+    ExportFormat.JSON: write_json,
+    ExportFormat.GRAPHML: write_graphml,
+    ExportFormat.ADJLIST: write_adjlist,
+    ExportFormat.EDGELIST: write_edgelist,
+}
+
+# Formats written straight from the CSR adjacency and per-edge weights
+ARRAY_EXPORTERS: dict[ExportFormat, Callable[[CSRAdjacency, np.ndarray, BinaryIO], None]] = {
+    ExportFormat.NPZ: write_npz,
+    ExportFormat.MTX: write_matrix_market,
+}
+
+_NODE_LINK_HEADER = {"directed", "multigraph", "graph", "nodes"}
+
+# Graph attributes that networkx.write_graphml leaves out of <graph> data
+_GRAPHML_SKIPPED = {"node_default", "edge_default"}
+
+
+def typed_column(values: list[Any]) -> tuple[np.ndarray, np.ndarray]:
+    """Convert attribute values to the narrowest typed array that holds them.
+
+    Returns:
+        Tuple of (values, mask of entries that were present).
+    """
+    present = np.fromiter((v is not None for v in values), dtype=bool, count=len(values))
+    kinds = {type(v) for v in values if v is not None}
+
+    if kinds <= {bool}:
+        dtype, fill = np.bool_, False
+    elif kinds <= {int}:
+        dtype, fill = np.int64, 0
+    elif kinds <= {int, float}:
+        dtype, fill = np.float64, np.nan
+    else:
+        return np.array(["" if v is None else str(v) for v in values], dtype=str), present
+
+    column = np.fromiter(
+        (fill if v is None else v for v in values), dtype=dtype, count=len(values)
+    )
+    return column, present
+
+
+def _node_links(graph: nx.Graph) -> Iterator[dict[str, Any]]:
+    """Yield node-link records for every edge."""
+    if graph.is_multigraph():
+        for source, target, key, attrs in graph.edges(keys=True, data=True):
+            yield {**attrs, "source": source, "target": target, "key": key}
+    else:
+        for source, target, attrs in graph.edges(data=True):
+            yield {**attrs, "source": source, "target": target}
+
+
+def _write_json_list(out: ChunkedWriter, items: Iterable[Any]) -> None:
+    """Write a JSON array with one item per line."""
+    empty = True
+    for item in items:
+        out.write(("[\n    " if empty else ",\n    ") + _json(item))
+        empty = False
+    out.write("[]" if empty else "\n  ]")
+
+
+def _json(value: Any) -> str:
+    """Serialize one JSON value compactly on a single line."""
+    return json.dumps(value, default=str)
+
+
+def _graphml_type(value: Any) -> str:
+    """Map a Python attribute value to a GraphML attribute type."""
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "long"
+    if isinstance(value, float):
+        return "double"
+    return "string"
+
+
+def _graphml_keys(attr_dicts: Any) -> dict[str, str]:
+    """Collect attribute names and their GraphML types.
+
+    Names seen with conflicting types are declared as strings.
+    """
+    keys: dict[str, str] = {}
+    for attrs in attr_dicts:
+        for name, value in attrs.items():
+            xml_type = _graphml_type(value)
+            if keys.setdefault(name, xml_type) != xml_type:
+                keys[name] = "string"
+    return keys
+
+
+def _graphml_body(
+    domain: str, attrs: dict[str, Any], key_ids: dict[tuple[str, str], str]
+) -> str:
+    """Render the <data> children of a node or edge and close the element."""
+    if not attrs:
+        return " />\n"
+    parts = [">"]
+    for name, value in attrs.items():
+        parts.append(_graphml_data(domain, name, value, key_ids))
+    parts.append(f"</{domain}>\n")
+    return "".join(parts)
+
+
+def _graphml_data(
+    domain: str, name: str, value: Any, key_ids: dict[tuple[str, str], str]
+) -> str:
+    """Render one <data> element for an attribute value."""
+    if isinstance(value, bool):
+        text = "true" if value else "false"
+    else:
+        text = escape(str(value))
+    return f'<data key="{key_ids[(domain, name)]}">{text}</data>'
+
@@ -1,11 +1,13 @@
 """Output formatters for table and JSON display."""
 
-import json
-from typing import Any, Iterable
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Any, Iterable, Mapping
 
 from rich.console import Console
+from rich.markup import escape
 from rich.table import Table
 
+from . import serialization
 from .models import (
     Edge,
     GraphMetadata,
@@ -14,37 +16,62 @@ from .models import (
     GraphStats,
     CentralityResult,
     ComponentInfo,
+    SimilarityResult,
+    TimelinePoint,
 )
+from .profiling import Span, traced
+from .result_store import StoreStats
 
+if TYPE_CHECKING:
+    from .sidecar import IndexInfo
 
-def format_json(data: Any) -> str:
+# Largest result drawn as a Rich table; bigger results are streamed
+TABLE_MAX_ROWS = 1000
+
+# Rows used to size columns when streaming, and rows written per batch
+WIDTH_SAMPLE_ROWS = 200
+STREAM_BATCH_ROWS = 1000
+
+# Tabs and line breaks would break the column layout of streamed rows
+_WHITESPACE = str.maketrans("\t\n\r", "   ")
+
+
+def format_json(data: Any, compact: bool = False) -> str:
     """Format data as JSON string.
 
     Args:
         data: Data to serialize. Can be a dict, list, or model object.
+        compact: Write everything on one line instead of indenting.
 
     Returns:
-        Pretty-printed JSON string.
+        JSON string (pretty-printed unless ``compact``).
     """
-    if hasattr(data, "to_dict"):
-        data = data.to_dict()
-    elif isinstance(data, list):
-        data = [item.to_dict() if hasattr(item, "to_dict") else item for item in data]
+    return serialization.dumps(data, compact=compact).decode("utf-8")
 
-    return json.dumps(data, indent=2, default=str)
 
+def print_json(data: Any, console: Console | None = None, compact: bool = False) -> None:
+    """Print data as JSON to the console's output stream.
 
-def print_json(data: Any, console: Console | None = None) -> None:
-    """Print data as JSON to console.
+    The encoded bytes are written straight to the underlying stream, so Rich
+    does not re-scan (or wrap) large documents.
 
     Args:
         data: Data to serialize and print.
         console: Rich console to use. Creates a new one if not provided.
+        compact: Write everything on one line instead of indenting.
     """
     console = console or Console()
-    console.print(format_json(data))
+    out = console.file
+    sink = getattr(out, "buffer", None)
+    if sink is None:
+        out.write(format_json(data, compact=compact) + "\n")
+        return
+    out.flush()
+    serialization.dump(data, sink, compact=compact)
+    sink.flush()
 
 
+@traced
 def print_metadata_table(metadata: GraphMetadata, console: Console | None = None) -> None:
     """Print metadata as a formatted table.
 
@@ -63,6 +90,8 @@ def print_metadata_table(metadata: GraphMetadata, console: Console | None = None
     table.add_row("Description", metadata.description or "N/A")
     table.add_row("Last Modified", metadata.last_modified or "N/A")
     table.add_row("Mode", metadata.mode)
+    if metadata.mode == "dynamic":
+        table.add_row("Time Format", metadata.time_format or "double")
     table.add_row("Default Edge Type", metadata.default_edge_type)
     table.add_row("Node Count", str(metadata.node_count))
     table.add_row("Edge Count", str(metadata.edge_count))
@@ -70,6 +99,7 @@ def print_metadata_table(metadata: GraphMetadata, console: Console | None = None
     console.print(table)
 
 
+@traced
 def print_nodes_table(
     nodes: Iterable[Node],
     show_attributes: bool = True,
@@ -77,38 +107,25 @@ def print_nodes_table(
 ) -> None:
     """Print nodes as a formatted table.
 
+    Large results are streamed rather than collected; see ``print_rows``.
+
     Args:
         nodes: Iterable of nodes to display.
         show_attributes: Whether to show the attributes column.
         console: Rich console to use.
     """
-    console = console or Console()
-    nodes_list = list(nodes)
-
-    if not nodes_list:
-        console.print("[yellow]No nodes found matching the filters.[/yellow]")
-        return
-
-    table = Table(title=f"Nodes ({len(nodes_list)})", show_header=True, header_style="bold cyan")
-    table.add_column("ID", style="bold")
-    table.add_column("Label")
-    if show_attributes:
-        table.add_column("Attributes")
-
-    for node in nodes_list:
-        attrs_str = ""
-        if show_attributes and node.attributes:
-            attrs_str = ", ".join(f"{k}={v}" for k, v in node.attributes.items())
-
-        table.add_row(
-            node.id,
-            node.label or "",
-            attrs_str if show_attributes else None,
-        )
-
-    console.print(table)
+    headers = ["ID", "Label"] + (["Attributes"] if show_attributes else [])
+    rows = (
+        [node.id, node.label or ""]
+        + ([_format_attributes(node.attributes)] if show_attributes else [])
+        for node in nodes
+    )
+    print_rows(
+        "Nodes", headers, rows, console, empty_message="No nodes found matching the filters."
+    )
 
 
+@traced
 def print_edges_table(
     edges: Iterable[Edge],
     show_attributes: bool = True,
@@ -116,44 +133,75 @@ def print_edges_table(
 ) -> None:
     """Print edges as a formatted table.
 
+    Large results are streamed rather than collected; see ``print_rows``.
+
     Args:
         edges: Iterable of edges to display.
         show_attributes: Whether to show the attributes column.
         console: Rich console to use.
     """
-    console = console or Console()
-    edges_list = list(edges)
-
-    if not edges_list:
-        console.print("[yellow]No edges found matching the filters.[/yellow]")
-        return
-
-    table = Table(title=f"Edges ({len(edges_list)})", show_header=True, header_style="bold cyan")
-    table.add_column("ID", style="bold")
-    table.add_column("Source")
-    table.add_column("Target")
-    table.add_column("Weight")
-    table.add_column("Type")
-    if show_attributes:
-        table.add_column("Attributes")
-
-    for edge in edges_list:
-        attrs_str = ""
-        if show_attributes and edge.attributes:
-            attrs_str = ", ".join(f"{k}={v}" for k, v in edge.attributes.items())
-
-        table.add_row(
+    headers = ["ID", "Source", "Target", "Weight", "Type"]
+    headers += ["Attributes"] if show_attributes else []
+    rows = (
+        [
             edge.id or "",
             edge.source,
             edge.target,
             str(edge.weight) if edge.weight is not None else "",
             edge.edge_type or "",
-            attrs_str if show_attributes else None,
-        )
+        ]
+        + ([_format_attributes(edge.attributes)] if show_attributes else [])
+        for edge in edges
+    )
+    print_rows(
+        "Edges", headers, rows, console, empty_message="No edges found matching the filters."
+    )
 
-    console.print(table)
 
+def print_rows(
+    title: str,
+    headers: list[str],
+    rows: Iterable[list[str]],
+    console: Console | None = None,
+    empty_message: str = "No results.",
+) -> None:
+    """Print rows of text cells, choosing a renderer by result size.
+
+    Up to ``TABLE_MAX_ROWS`` rows are drawn as a Rich table. Beyond that,
+    Rich would measure every cell before printing anything, so rows are
+    streamed instead: as fixed-width columns sized from the first rows when
+    writing to a terminal, or as plain TSV otherwise.
 
+    Args:
+        title: Table title, shown with the row count.
+        headers: Column headers.
+        rows: Row cells, consumed lazily.
+        console: Rich console to use.
+        empty_message: Message shown when there are no rows.
+    """
+    console = console or Console()
+    rows = iter(rows)
+    sample = list(islice(rows, TABLE_MAX_ROWS + 1))
+
+    if not sample:
+        console.print(f"[yellow]{empty_message}[/yellow]")
+        return
+
+    if len(sample) <= TABLE_MAX_ROWS:
+        table = Table(title=f"{title} ({len(sample)})", show_header=True, header_style="bold cyan")
+        table.add_column(headers[0], style="bold")
+        for header in headers[1:]:
+            table.add_column(header)
+        for row in sample:
+            table.add_row(*row)
+        console.print(table)
+    elif console.is_terminal:
+        _print_fixed_width(title, headers, chain(sample, rows), console)
+    else:
+        _print_tsv(headers, chain(sample, rows), console)
+
+
+@traced
 def print_info_table(info: dict[str, Any], console: Console | None = None) -> None:
     """Print graph info summary as a formatted table.
 
@@ -193,6 +241,7 @@ def print_info_table(info: dict[str, Any], console: Console | None = None) -> No
         console.print("[bold]Edge Attributes:[/bold] [dim]None[/dim]")
 
 
+@traced
 def print_path_result(
     path_result: PathResult | None,
     console: Console | None = None,
@@ -217,6 +266,7 @@ def print_path_result(
     console.print("[bold]Path:[/bold]", " → ".join(path_result.path))
 
 
+@traced
 def print_paths_list(
     paths: list[PathResult],
     console: Console | None = None,
@@ -241,6 +291,7 @@ def print_paths_list(
         console.print("  " + " → ".join(path.path))
 
 
+@traced
 def print_stats_table(stats: GraphStats, console: Console | None = None) -> None:
     """Print graph statistics as a formatted table.
 
@@ -274,6 +325,59 @@ def print_stats_table(stats: GraphStats, console: Console | None = None) -> None
     console.print(table)
 
 
+def print_cache_stats_table(stats: StoreStats, console: Console | None = None) -> None:
+    """Print the occupancy of the result cache as a formatted table.
+
+    Args:
+        stats: Result cache statistics to display.
+        console: Rich console to use.
+    """
+    console = console or Console()
+
+    table = Table(title="Result Cache", show_header=True, header_style="bold cyan")
+    table.add_column("Metric", style="bold")
+    table.add_column("Value")
+
+    table.add_row("Directory", escape(stats.path))
+    table.add_row("Entries", str(stats.entries))
+    table.add_row("Size", _format_size(stats.size))
+    table.add_row("Limit", _format_size(stats.max_size))
+    for command, count in sorted(stats.commands.items()):
+        table.add_row(f"  {command}", str(count))
+
+    console.print(table)
+
+
+def print_index_info(info: "IndexInfo", console: Console | None = None) -> None:
+    """Print a description of a sidecar index as a formatted table.
+
+    Args:
+        info: Sidecar index description to display.
+        console: Rich console to use.
+    """
+    console = console or Console()
+
+    table = Table(title="Sidecar Index", show_header=True, header_style="bold cyan")
+    table.add_column("Property", style="bold")
+    table.add_column("Value")
+
+    if info.stale:
+        status = f"[red]stale[/red] ({escape(info.reason or '')})"
+    else:
+        status = "[green]fresh[/green]"
+    table.add_row("Path", escape(info.path))
+    table.add_row("Status", status)
+    table.add_row("Sections", ", ".join(info.sections))
+    table.add_row("Built", info.built)
+    table.add_row("grph Version", info.grph_version)
+    table.add_row("Nodes", str(info.node_count))
+    table.add_row("Edges", str(info.edge_count))
+    table.add_row("Size", _format_size(info.size))
+
+    console.print(table)
+
+
+@traced
 def print_centrality_table(
     result: CentralityResult,
     top_n: int = 10,
@@ -288,21 +392,65 @@ def print_centrality_table(
     """
     console = console or Console()
 
+    def title(ctype: str) -> str:
+        return ctype.replace("_", " ").title()
+
     table = Table(
-        title=f"{result.centrality_type.title()} Centrality (Top {top_n})",
+        title=f"{title(result.centrality_type)} Centrality (Top {top_n})",
         show_header=True,
         header_style="bold cyan",
     )
     table.add_column("Rank", style="dim")
     table.add_column("Node", style="bold")
+    if len(result.types) == 1:
+        table.add_column("Score")
+    else:
+        for ctype in result.types:
+            table.add_column(title(ctype))
+
+    rows = result.top_indices(top_n)
+    columns = [result.column(ctype)[rows].tolist() for ctype in result.types]
+    for i, (row, scores) in enumerate(zip(rows.tolist(), zip(*columns)), 1):
+        table.add_row(str(i), result.node_ids[row], *(f"{score:.6f}" for score in scores))
+
+    console.print(table)
+
+
+@traced
+def print_similarity_table(
+    result: SimilarityResult,
+    console: Console | None = None,
+) -> None:
+    """Print node-pair similarity scores as a formatted table.
+
+    Args:
+        result: Similarity result to display.
+        console: Rich console to use.
+    """
+    console = console or Console()
+
+    if not result.pairs:
+        console.print("[yellow]No similar node pairs found.[/yellow]")
+        return
+
+    title = result.metric.replace("-", " ").title()
+    table = Table(
+        title=f"{title} Similarity ({len(result.pairs)} pairs)",
+        show_header=True,
+        header_style="bold cyan",
+    )
+    table.add_column("Rank", style="dim")
+    table.add_column("Node 1", style="bold")
+    table.add_column("Node 2", style="bold")
     table.add_column("Score")
 
-    for i, (node, score) in enumerate(result.top_n(top_n), 1):
-        table.add_row(str(i), node, f"{score:.6f}")
+    for i, (node1, node2, score) in enumerate(result.pairs, 1):
+        table.add_row(str(i), node1, node2, f"{score:.6f}")
 
     console.print(table)
 
 
+@traced
 def print_components_table(
     info: ComponentInfo,
     show_members: bool = False,
@@ -341,6 +489,52 @@ def print_components_table(
         console.print(table)
 
 
+# Headers of timeline columns in table output
+TIMELINE_HEADERS = {
+    "time": "Time",
+    "node_count": "Nodes",
+    "edge_count": "Edges",
+    "avg_degree": "Avg Degree",
+    "max_degree": "Max Degree",
+    "num_components": "Components",
+    "largest_component_size": "Largest",
+    "top_pagerank_node": "Top PageRank",
+    "top_pagerank": "Score",
+    "pagerank_iterations": "Iterations",
+}
+
+
+def print_timeline_table(
+    points: Iterable[TimelinePoint],
+    columns: list[str],
+    console: Console | None = None,
+) -> None:
+    """Print timeline rows as they are computed.
+
+    Args:
+        points: Timeline points, consumed lazily.
+        columns: Columns to show, from ``timeline_columns``.
+        console: Rich console to use.
+    """
+
+    def cell(value: Any) -> str:
+        if value is None:
+            return ""
+        if isinstance(value, float):
+            return f"{value:.4f}"
+        return str(value)
+
+    rows = ([cell(point.to_dict().get(c)) for c in columns] for point in points)
+    print_rows(
+        "Timeline",
+        [TIMELINE_HEADERS[c] for c in columns],
+        rows,
+        console,
+        empty_message="No time steps in the range.",
+    )
+
+
+@traced
 def print_degree_table(
     degree_info: dict[str, Any],
     top_n: int = 10,
@@ -403,3 +597,108 @@ def print_degree_table(
                 table.add_row(str(i), d["node"], str(d["degree"]))
 
         console.print(table)
+
+
+def print_profile_table(spans: list[Span], console: Console | None = None) -> None:
+    """Print a breakdown of the time and memory used by each phase.
+
+    Args:
+        spans: Finished spans in start order, as collected by a ``Profiler``.
+        console: Rich console to use.
+    """
+    console = console or Console()
+
+    table = Table(title="Profile", show_header=True, header_style="bold cyan")
+    table.add_column("Phase", style="bold")
+    table.add_column("Wall", justify="right")
+    table.add_column("CPU", justify="right")
+    table.add_column("Peak Memory", justify="right")
+
+    for s in spans:
+        memory = "-" if s.peak_memory is None else f"{s.peak_memory / 2**20:.1f} MiB"
+        table.add_row(
+            "  " * s.depth + escape(s.name),
+            f"{s.wall_time * 1000:.1f} ms",
+            f"{s.cpu_time * 1000:.1f} ms",
+            memory,
+        )
+
+    console.print(table)
+
+
+def _format_attributes(attributes: Mapping[str, Any]) -> str:
+    """Render attributes as comma-separated key=value pairs."""
+    return ", ".join(f"{k}={v}" for k, v in attributes.items())
+
+
+def _print_fixed_width(
+    title: str, headers: list[str], rows: Iterable[list[str]], console: Console
+) -> None:
+    """Stream rows as aligned columns sized from a sample of the first rows.
+
+    Column widths are fixed after the sample, so each later row is padded or
+    truncated without measuring anything else. The last column takes the
+    remaining terminal width.
+    """
+    rows = iter(rows)
+    sample = list(islice(rows, WIDTH_SAMPLE_ROWS))
+    widths = [
+        max([len(header)] + [len(row[i]) for row in sample])
+        for i, header in enumerate(headers)
+    ]
+    gap = 2
+    for i in range(len(widths) - 1):
+        widths[i] = min(widths[i], max(len(headers[i]), console.width // len(widths)))
+    widths[-1] = max(len(headers[-1]), console.width - sum(widths[:-1]) - gap * (len(widths) - 1))
+
+    def render(cells: list[str]) -> str:
+        # The first column identifies the row, so it overflows rather than truncates
+        first = cells[0].translate(_WHITESPACE).ljust(widths[0])
+        rest = (_fit(cell, width) for cell, width in zip(cells[1:], widths[1:]))
+        return (" " * gap).join([first, *rest]).rstrip()
+
+    console.print(escape(render(headers)), style="bold cyan", highlight=False)
+    count = 0
+    out = console.file
+    for batch in _batches(chain(sample, rows), STREAM_BATCH_ROWS):
+        out.write("".join(render(row) + "\n" for row in batch))
+        count += len(batch)
+    out.flush()
+    console.print(f"[dim]{title} ({count})[/dim]", highlight=False)
+
+
+def _print_tsv(headers: list[str], rows: Iterable[list[str]], console: Console) -> None:
+    """Stream rows as tab-separated values.
+
+    Tabs and line breaks inside cells are replaced by spaces.
+    """
+    out = console.file
+    out.write("\t".join(h.lower() for h in headers) + "\n")
+    for batch in _batches(rows, STREAM_BATCH_ROWS):
+        out.write(
+            "".join("\t".join(c.translate(_WHITESPACE) for c in row) + "\n" for row in batch)
+        )
+    out.flush()
+
+
+def _fit(cell: str, width: int) -> str:
+    """Pad or truncate a cell to exactly ``width`` characters."""
+    cell = cell.translate(_WHITESPACE)
+    if len(cell) > width:
+        return cell[: max(width - 1, 0)] + "…"
+    return cell.ljust(width)
+
+
+def _batches(rows: Iterable[list[str]], size: int) -> Iterable[list[list[str]]]:
+    """Group rows into lists of at most ``size``."""
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+def _format_size(size: int) -> str:
+    """Format a byte count in KiB, MiB or GiB."""
+    for unit, scale in (("GiB", 2**30), ("MiB", 2**20)):
+        if size >= scale:
+            return f"{size / scale:.1f} {unit}"
+    return f"{size / 2**10:.1f} KiB"
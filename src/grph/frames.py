@@ -0,0 +1,193 @@
+"""Columnar containers for bulk node and edge results.
+
+A frame holds an array of row numbers (node indices in graph order, or edge
+ordinals) and gathers columns from the graph only when they are used. The
+graph caches each full column once, so filtering, slicing, sorting and
+serialising a result are array operations rather than per-object Python
+work. A small frame, such as one batch of streamed output, reads only its
+own rows unless the full column is already cached. ``Node`` and ``Edge``
+objects are only built when a frame is iterated.
+"""
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Iterator
+
+import numpy as np
+
+from .exporters import typed_column
+from .models import Edge, Node
+from .records import EDGE_COLUMNS, NODE_COLUMNS, edge_columns, node_columns
+
+if TYPE_CHECKING:
+    from .parser import GEXFGraph
+
+
+class _Frame(ABC):
+    """Rows of a graph, addressed by integer row numbers."""
+
+    # Standard fields, which are not repeated under "attributes"
+    _standard: list[str] = []
+
+    def __init__(self, graph: "GEXFGraph", rows: np.ndarray):
+        self._graph = graph
+        self._rows = np.asarray(rows, dtype=np.int64)
+
+    @property
+    def graph(self) -> "GEXFGraph":
+        """The graph the rows refer to."""
+        return self._graph
+
+    @property
+    def rows(self) -> np.ndarray:
+        """Row numbers into the graph, in frame order."""
+        return self._rows
+
+    @property
+    @abstractmethod
+    def columns(self) -> list[str]:
+        """Column names: the standard fields, then attribute keys."""
+
+    @property
+    def attribute_keys(self) -> list[str]:
+        """Columns that are custom attributes rather than standard fields."""
+        return [c for c in self.columns if c not in self._standard]
+
+    def values(self, name: str) -> np.ndarray:
+        """Get a column as an object array of the original values.
+
+        Missing values are None.
+        """
+        return self._gather(name, self._rows)
+
+    def column(self, name: str) -> np.ndarray:
+        """Get a column as the narrowest typed array that holds its values.
+
+        Bool, int64, float64 or string, depending on the values. Missing
+        entries are filled (False, 0, NaN or ""); see ``present``.
+        """
+        return typed_column(self.values(name).tolist())[0]
+
+    def present(self, name: str) -> np.ndarray:
+        """Get a mask of the rows where a column has a value."""
+        return np.not_equal(self.values(name), None)
+
+    def to_numpy(self, names: list[str] | None = None) -> dict[str, np.ndarray]:
+        """Convert columns to typed NumPy arrays.
+
+        Args:
+            names: Columns to convert (default: all).
+
+        Returns:
+            Mapping of column name to typed array, as from ``column``.
+        """
+        return {name: self.column(name) for name in names or self.columns}
+
+    def sort_by(self, name: str, descending: bool = False) -> "_Frame":
+        """Get a copy of the frame ordered by a column.
+
+        The sort is stable, and rows without a value come last either way.
+        """
+        values = self.column(name)
+        if descending:
+            # Reverse, sort stably, and map back so ties keep their order
+            order = self._rows.size - 1 - np.argsort(values[::-1], kind="stable")[::-1]
+        else:
+            order = np.argsort(values, kind="stable")
+        present = self.present(name)[order]
+        order = np.concatenate([order[present], order[~present]])
+        return type(self)(self._graph, self._rows[order])
+
+    def to_dict(self) -> list[dict[str, Any]]:
+        """Convert every row to a dictionary for JSON serialization.
+
+        Rows have the same shape as ``Node.to_dict``/``Edge.to_dict``.
+        """
+        return list(self.iter_dicts())
+
+    def iter_dicts(self) -> Iterator[dict[str, Any]]:
+        """Yield the dictionaries of ``to_dict`` one at a time.
+
+        Columns are gathered up front, but rows are built as they are
+        consumed, so streaming them keeps few objects alive.
+        """
+        standard = {name: self.values(name).tolist() for name in self._standard}
+        attributes = {
+            key: (self.values(key).tolist(), self.present(key).tolist())
+            for key in self.attribute_keys
+        }
+        for i in range(self._rows.size):
+            record = {name: column[i] for name, column in standard.items()}
+            record["attributes"] = {
+                key: values[i] for key, (values, present) in attributes.items() if present[i]
+            }
+            yield record
+
+    @abstractmethod
+    def _gather(self, name: str, rows: np.ndarray) -> np.ndarray:
+        """Get the values of a column at the given row numbers."""
+
+    @abstractmethod
+    def _row(self, row: int) -> Any:
+        """Build the object for one row number."""
+
+    def __len__(self) -> int:
+        return int(self._rows.size)
+
+    def __bool__(self) -> bool:
+        return self._rows.size > 0
+
+    def __iter__(self) -> Iterator[Any]:
+        for row in self._rows.tolist():
+            yield self._row(row)
+
+    def __getitem__(self, key: Any) -> Any:
+        """Get one row by position, or a sub-frame by slice, index array or mask."""
+        if isinstance(key, (int, np.integer)):
+            return self._row(int(self._rows[key]))
+        return type(self)(self._graph, self._rows[key])
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(count={len(self)})"
+
+
+class NodeFrame(_Frame):
+    """Nodes held as indices in graph order, with columns gathered on demand.
+
+    Example:
+        >>> frame = graph.node_frame(attr_filters=[("type", "server")])
+        >>> frame.sort_by("rank", descending=True)[:10].to_dict()
+    """
+
+    _standard = NODE_COLUMNS
+
+    @property
+    def columns(self) -> list[str]:
+        """Column names: ``id``, ``label``, then node attribute keys."""
+        return node_columns(self._graph.node_attribute_keys())
+
+    def ids(self) -> list[str]:
+        """Node IDs in frame order."""
+        return self.values("id").tolist()
+
+    def _gather(self, name: str, rows: np.ndarray) -> np.ndarray:
+        return self._graph.node_values(name, rows)
+
+    def _row(self, row: int) -> Node:
+        return self._graph.get_node(self._graph.node_ids[row])
+
+
+class EdgeFrame(_Frame):
+    """Edges held as ordinals in graph order, with columns gathered on demand."""
+
+    _standard = EDGE_COLUMNS
+
+    @property
+    def columns(self) -> list[str]:
+        """Column names: the standard edge fields, then edge attribute keys."""
+        return edge_columns(self._graph.edge_attribute_keys())
+
+    def _gather(self, name: str, rows: np.ndarray) -> np.ndarray:
+        return self._graph.edge_values(name, rows)
+
+    def _row(self, row: int) -> Edge:
+        return self._graph.edge_at(row)
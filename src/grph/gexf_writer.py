@@ -0,0 +1,188 @@
+"""Streaming GEXF writer that copies kept elements from the source file.
+
+A subgraph is written by re-reading its source file with expat and copying
+byte ranges: the header (XML declaration, ``<meta>``, ``<attributes>``
+declarations) and every kept ``<node>`` and ``<edge>`` element are passed
+through unchanged, while dropped elements are skipped. Nothing is
+re-serialised, so attribute types, metadata and formatting survive, and only
+the bytes of the element being copied are held in memory.
+"""
+
+import xml.parsers.expat
+from pathlib import Path
+from typing import BinaryIO, Callable
+from xml.sax.saxutils import quoteattr
+
+from .compression import open_input
+
+# Bytes read from the source per parser call
+READ_SIZE = 1 << 16
+
+# Depth of the <nodes>/<edges> containers (gexf=1, graph=2) and their items
+_CONTAINER_DEPTH = 3
+_ITEM_DEPTH = 4
+
+
+def write_subgraph(
+    source: str | Path,
+    sink: BinaryIO,
+    keep_node: Callable[[str], bool],
+    keep_edge: Callable[[str, str, str | None], bool],
+    node_count: int | None = None,
+    edge_count: int | None = None,
+) -> None:
+    """Copy a GEXF file to a sink, keeping only selected nodes and edges.
+
+    Args:
+        source: Path to the source GEXF file (optionally compressed).
+        sink: Binary stream to write to.
+        keep_node: Called with a node ID; True to keep the node.
+        keep_edge: Called with (source, target, edge ID or None); True to
+            keep the edge.
+        node_count: Value for the ``count`` attribute of ``<nodes>``, if
+            the source declares one.
+        edge_count: Value for the ``count`` attribute of ``<edges>``, if
+            the source declares one.
+
+    Raises:
+        xml.parsers.expat.ExpatError: If the source is not well-formed XML.
+    """
+    copier = _RangeCopier(sink, keep_node, keep_edge, {"nodes": node_count, "edges": edge_count})
+    with open_input(source) as f:
+        while chunk := f.read(READ_SIZE):
+            copier.feed(chunk)
+        copier.close()
+
+
+class _RangeCopier:
+    """Expat handlers that decide, element by element, which bytes to copy.
+
+    The source is cut at the start tag of every ``<node>``/``<edge>`` and at
+    the closing tag of its container. Whitespace between items is held back
+    and only written before the next kept item (or the closing tag), so the
+    output keeps the source's indentation however many items are dropped.
+    """
+
+    def __init__(
+        self,
+        sink: BinaryIO,
+        keep_node: Callable[[str], bool],
+        keep_edge: Callable[[str, str, str | None], bool],
+        counts: dict[str, int | None],
+    ):
+        self._sink = sink
+        self._keep_node = keep_node
+        self._keep_edge = keep_edge
+        self._counts = counts
+
+        self._buffer = bytearray()
+        self._buffer_start = 0  # Source offset of self._buffer[0]
+        self._depth = 0
+        self._keep = True  # Whether the bytes since the last cut are kept
+        self._gap = b""  # Whitespace held back before the next item
+        self._encoding = "utf-8"  # As declared by the source, for rewritten tags
+
+        self._parser = xml.parsers.expat.ParserCreate()
+        self._parser.XmlDeclHandler = self._declaration
+        self._parser.StartElementHandler = self._start
+        self._parser.EndElementHandler = self._end
+
+    def feed(self, chunk: bytes) -> None:
+        """Parse the next chunk of the source."""
+        self._buffer += chunk
+        self._parser.Parse(chunk, False)
+
+    def close(self) -> None:
+        """Finish parsing and copy the remainder of the source."""
+        self._parser.Parse(b"", True)
+        self._cut(self._buffer_start + len(self._buffer))
+        self._sink.write(self._gap)
+
+    def _declaration(self, version: str, encoding: str | None, standalone: int) -> None:
+        if encoding:
+            self._encoding = encoding
+
+    def _start(self, tag: str, attrs: dict[str, str]) -> None:
+        self._depth += 1
+        name = tag.rpartition(":")[2]
+        offset = self._parser.CurrentByteIndex
+
+        if self._depth == _CONTAINER_DEPTH and self._counts.get(name) is not None:
+            if "count" in attrs:
+                self._replace_start_tag(offset, tag, attrs, self._counts[name])
+        elif self._depth == _ITEM_DEPTH and name in ("node", "edge"):
+            self._cut(offset)
+            if name == "node":
+                self._keep = self._keep_node(attrs.get("id", ""))
+            else:
+                self._keep = self._keep_edge(
+                    attrs.get("source", ""), attrs.get("target", ""), attrs.get("id")
+                )
+
+    def _end(self, tag: str) -> None:
+        if self._depth == _CONTAINER_DEPTH:
+            self._cut(self._parser.CurrentByteIndex)
+            self._sink.write(self._gap)
+            self._gap = b""
+            self._keep = True
+        self._depth -= 1
+
+    def _replace_start_tag(
+        self, offset: int, tag: str, attrs: dict[str, str], count: int
+    ) -> None:
+        """Rewrite a container start tag with an updated ``count``."""
+        self._cut(offset)
+        self._sink.write(self._gap)
+        self._gap = b""
+
+        end = _tag_end(self._buffer, offset - self._buffer_start) + self._buffer_start
+        rendered = "".join(
+            f" {key}={quoteattr(str(count) if key == 'count' else value)}"
+            for key, value in attrs.items()
+        )
+        close = "/>" if self._buffer[end - self._buffer_start - 2] == ord("/") else ">"
+        # Characters the declared encoding lacks become character references
+        tag_bytes = f"<{tag}{rendered}{close}".encode(self._encoding, "xmlcharrefreplace")
+        self._sink.write(tag_bytes)
+        self._drop(end)
+
+    def _cut(self, offset: int) -> None:
+        """Copy or drop the buffered bytes up to ``offset``.
+
+        Trailing whitespace is held back as the gap before whatever follows.
+        """
+        chunk = bytes(self._buffer[: offset - self._buffer_start])
+        body = chunk.rstrip()
+        if self._keep and body:
+            self._sink.write(self._gap)
+            self._sink.write(body)
+        elif self._keep:
+            # Only whitespace since the last cut; keep the earlier gap too
+            body, chunk = b"", self._gap + chunk
+        self._gap = chunk[len(body):]
+        self._drop(offset)
+
+    def _drop(self, offset: int) -> None:
+        """Discard buffered source bytes up to ``offset``."""
+        cut = offset - self._buffer_start
+        if cut > 0:
+            del self._buffer[:cut]
+            self._buffer_start = offset
+
+
+def _tag_end(buffer: bytearray, start: int) -> int:
+    """Find the end of the tag starting at ``start`` (just past its ``>``).
+
+    A ``>`` inside a quoted attribute value does not end the tag.
+    """
+    quote = None
+    for position in range(start, len(buffer)):
+        byte = buffer[position]
+        if quote is not None:
+            if byte == quote:
+                quote = None
+        elif byte in b"\"'":
+            quote = byte
+        elif byte == ord(">"):
+            return position + 1
+    raise ValueError("Start tag is not complete in the buffer")
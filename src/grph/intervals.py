@@ -0,0 +1,271 @@
+"""Lifetimes of nodes and edges in dynamic GEXF graphs.
+
+Dynamic graphs give elements a lifetime through ``start``/``end``
+attributes or a list of ``<spells>``. Bounds are inclusive, a missing bound
+is open, and an element without any is alive at every time. Times are
+interpreted according to the graph's ``timeformat``: numbers for
+``integer``/``double`` (the default), ISO 8601 dates for
+``date``/``dateTime``, which are compared as UTC timestamps.
+
+``IntervalIndex`` answers which elements are alive at a time, or during a
+range, with a centered interval tree: each tree node keeps the intervals
+that contain its center sorted by start and by end, so a query descends one
+path of the tree and only slices out intervals it returns.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Iterable
+
+import numpy as np
+
+from .errors import GEXFParseError
+
+# GEXF time formats whose values are plain numbers
+NUMERIC_FORMATS = ("integer", "double", "float", "long")
+
+# Seconds per unit of a step between dates
+STEP_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 7 * 86400}
+
+# Intervals below which a subtree is kept as one bucket and scanned
+LEAF_SIZE = 64
+
+
+def parse_time(value: Any, time_format: str | None) -> float:
+    """Convert a GEXF time value to a number that orders correctly.
+
+    Args:
+        value: Time as written in the file or given on the command line.
+        time_format: The graph's ``timeformat`` (None means ``double``).
+
+    Returns:
+        The time as a float; dates become UTC POSIX timestamps.
+
+    Raises:
+        GEXFParseError: If the value does not match the time format.
+    """
+    try:
+        if time_format in (None, *NUMERIC_FORMATS):
+            return float(value)
+        moment = datetime.fromisoformat(str(value))
+    except (TypeError, ValueError) as e:
+        raise GEXFParseError(
+            f"Invalid time {value!r} for timeformat {time_format or 'double'}"
+        ) from e
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def format_time(value: float, time_format: str | None) -> str | int | float:
+    """Convert a number from ``parse_time`` back to the graph's time format.
+
+    Returns:
+        An ISO 8601 string for ``date``/``dateTime``, else the number (an
+        int when it is integral).
+    """
+    if time_format in (None, *NUMERIC_FORMATS):
+        return int(value) if float(value).is_integer() else float(value)
+    moment = datetime.fromtimestamp(value, tz=timezone.utc)
+    if time_format == "date":
+        return moment.date().isoformat()
+    return moment.replace(tzinfo=None).isoformat()
+
+
+def parse_step(value: str, time_format: str | None) -> float:
+    """Convert a step between times to the units of ``parse_time``.
+
+    Numeric time formats take a plain number. ``date``/``dateTime`` take a
+    number with a unit: ``s``, ``m``, ``h``, ``d`` or ``w`` (e.g. ``1d``).
+
+    Raises:
+        GEXFParseError: If the step is not valid for the time format, or
+            not positive.
+    """
+    text = str(value).strip()
+    numeric = time_format in (None, *NUMERIC_FORMATS)
+    try:
+        if numeric:
+            step = float(text)
+        else:
+            step = float(text[:-1]) * STEP_UNITS[text[-1:]]
+    except (KeyError, ValueError):
+        example = "a number" if numeric else "a number with a unit, e.g. 1d, 12h or 1w"
+        raise GEXFParseError(
+            f"Invalid step {value!r} for timeformat {time_format or 'double'} (use {example})"
+        ) from None
+    if not step > 0:
+        raise GEXFParseError(f"Step must be positive: {value!r}")
+    return step
+
+
+def lifetimes(
+    items: Iterable[dict[str, Any]], time_format: str | None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Collect the lifetime intervals of elements from their data dicts.
+
+    Spells take precedence over ``start``/``end`` on the same element.
+
+    Returns:
+        Tuple of (starts, ends, owners): one entry per interval, where
+        ``owners`` is the position of the element in ``items``.
+    """
+    starts: list[float] = []
+    ends: list[float] = []
+    owners: list[int] = []
+    for position, attrs in enumerate(items):
+        spells = attrs.get("spells") or [(attrs.get("start"), attrs.get("end"))]
+        for start, end in spells:
+            starts.append(-np.inf if start is None else parse_time(start, time_format))
+            ends.append(np.inf if end is None else parse_time(end, time_format))
+            owners.append(position)
+    return (
+        np.array(starts, dtype=np.float64),
+        np.array(ends, dtype=np.float64),
+        np.array(owners, dtype=np.int64),
+    )
+
+
+class IntervalIndex:
+    """Centered interval tree over element lifetimes, stored in flat arrays.
+
+    Example:
+        >>> index = IntervalIndex(starts, ends, owners)
+        >>> index.at(5.0)            # Elements alive at time 5
+        >>> index.between(5.0, 9.0)  # Elements alive at any time in [5, 9]
+    """
+
+    def __init__(self, starts: np.ndarray, ends: np.ndarray, owners: np.ndarray):
+        """Build the tree.
+
+        Args:
+            starts: Start of each interval (``-inf`` if open).
+            ends: End of each interval (``inf`` if open).
+            owners: Element each interval belongs to; an element may have
+                several intervals.
+        """
+        self._starts = starts
+        self._ends = ends
+        self._owners = owners
+
+        # Interval IDs overlapping a range that starts before it are found by
+        # stabbing; the rest start inside it, found here
+        self._start_order = np.argsort(starts, kind="stable")
+        self._sorted_starts = starts[self._start_order]
+
+        # Per tree node: center, children (-1 if none), and the slice of its
+        # intervals in by_start (ascending start) and by_end (descending end)
+        self._centers: list[float] = []
+        self._children: list[list[int]] = []
+        self._bounds: list[tuple[int, int]] = []
+        by_start: list[np.ndarray] = []
+        by_end: list[np.ndarray] = []
+
+        count = 0
+        pending = [(np.arange(starts.size), -1, 0)]
+        while pending:
+            ids, parent, side = pending.pop()
+            node = len(self._centers)
+            if parent >= 0:
+                self._children[parent][side] = node
+
+            if ids.size <= LEAF_SIZE:
+                # A bucket: scanned with a mask, so every interval stays here
+                center, here, left, right = np.nan, ids, ids[:0], ids[:0]
+            else:
+                # Open bounds are infinite, so only finite endpoints are used
+                points = np.concatenate([starts[ids], ends[ids]])
+                points = points[np.isfinite(points)]
+                center = float(np.median(points)) if points.size else 0.0
+                left = ids[ends[ids] < center]
+                right = ids[starts[ids] > center]
+                here = ids[(starts[ids] <= center) & (ends[ids] >= center)]
+
+            self._centers.append(center)
+            self._children.append([-1, -1])
+            self._bounds.append((count, count + here.size))
+            by_start.append(here[np.argsort(starts[here], kind="stable")])
+            by_end.append(here[np.argsort(-ends[here], kind="stable")])
+            count += here.size
+            if left.size:
+                pending.append((left, node, 0))
+            if right.size:
+                pending.append((right, node, 1))
+
+        self._by_start = np.concatenate(by_start) if by_start else np.empty(0, dtype=np.int64)
+        self._by_end = np.concatenate(by_end) if by_end else np.empty(0, dtype=np.int64)
+        self._by_start_keys = starts[self._by_start]
+        self._by_end_keys = -ends[self._by_end]
+
+    @property
+    def starts(self) -> np.ndarray:
+        """Start of each interval, in the order given."""
+        return self._starts
+
+    @property
+    def ends(self) -> np.ndarray:
+        """End of each interval, in the order given."""
+        return self._ends
+
+    @property
+    def owners(self) -> np.ndarray:
+        """Element of each interval, in the order given."""
+        return self._owners
+
+    def __len__(self) -> int:
+        """Number of intervals in the index."""
+        return int(self._starts.size)
+
+    def at(self, time: float) -> np.ndarray:
+        """Get the elements alive at a time.
+
+        Returns:
+            Sorted, distinct owners of the intervals containing ``time``.
+        """
+        return distinct(self._owners[self._stab(time)])
+
+    def between(self, start: float, end: float) -> np.ndarray:
+        """Get the elements alive at any time in a range (inclusive).
+
+        Returns:
+            Sorted, distinct owners of the intervals overlapping
+            ``[start, end]``.
+        """
+        if start > end:
+            return np.empty(0, dtype=np.int64)
+        # Overlapping intervals either contain start, or start inside the range
+        first = int(np.searchsorted(self._sorted_starts, start, side="right"))
+        last = int(np.searchsorted(self._sorted_starts, end, side="right"))
+        inside = self._start_order[first:last]
+        ids = np.concatenate([self._stab(start), inside])
+        return distinct(self._owners[ids])
+
+    def _stab(self, time: float) -> np.ndarray:
+        """Get the IDs of the intervals containing a time."""
+        found = []
+        node = 0 if self._centers else -1
+        while node >= 0:
+            center = self._centers[node]
+            low, high = self._bounds[node]
+            if np.isnan(center):
+                ids = self._by_start[low:high]
+                found.append(ids[(self._starts[ids] <= time) & (self._ends[ids] >= time)])
+                break
+            if time <= center:
+                # Every interval here ends at or after the center; keep those
+                # starting by ``time``
+                stop = np.searchsorted(self._by_start_keys[low:high], time, side="right")
+                found.append(self._by_start[low:low + stop])
+                node = self._children[node][0] if time < center else -1
+            else:
+                stop = np.searchsorted(self._by_end_keys[low:high], -time, side="right")
+                found.append(self._by_end[low:low + stop])
+                node = self._children[node][1]
+        return np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+
+
+def distinct(values: np.ndarray) -> np.ndarray:
+    """Sort values and drop repeats (faster than ``np.unique`` for small arrays)."""
+    values = np.sort(values)
+    if values.size:
+        values = values[np.concatenate([[True], values[1:] != values[:-1]])]
+    return values
@@ -0,0 +1,319 @@
+"""Per-graph memoization of expensive results under a memory budget.
+
+Methods decorated with ``memoized`` look their result up in the graph's
+``ResultCache`` before computing it, keyed by method name and normalised
+arguments. The cache evicts least recently used entries once the estimated
+size of what it holds exceeds its budget, and counts hits, misses and
+evictions.
+
+Each call gets its own copy of the cached result, so callers may sort, trim
+or otherwise change what they get back without affecting later calls.
+"""
+
+import copy
+import functools
+import inspect
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Hashable, Iterable, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Default budget per graph, in bytes
+DEFAULT_CACHE_BYTES = 256 << 20
+
+# Items of a container measured before the rest are extrapolated
+SIZE_SAMPLE = 64
+
+_MISSING = object()
+
+# Types whose values ``detach`` can hand out without copying
+_IMMUTABLE = {str, int, float, bool, complex, bytes, type(None), range}
+
+
+@dataclass
+class CacheStats:
+    """Counters and occupancy of a result cache.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups that had to compute the result.
+        evictions: Entries dropped to stay within the budget.
+        entries: Entries currently held.
+        size: Estimated bytes currently held.
+        max_size: Budget in bytes (0 disables caching).
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": self.entries,
+            "size": self.size,
+            "max_size": self.max_size,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class ResultCache:
+    """LRU cache of computed results with a budget in bytes.
+
+    Example:
+        >>> cache = ResultCache(max_size=64 << 20)
+        >>> cache.put(("get_stats",), stats, size=estimate_size(stats))
+        >>> cache.get(("get_stats",)) is stats
+        True
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_BYTES):
+        """Create an empty cache.
+
+        Args:
+            max_size: Budget in bytes. Results estimated larger than the
+                budget are never stored; 0 disables caching.
+        """
+        self._max_size = max_size
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self) -> int:
+        """Budget in bytes; lowering it evicts entries immediately."""
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int) -> None:
+        with self._lock:
+            self._max_size = value
+            self._evict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a cached result, counting a hit or a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, size: int) -> None:
+        """Store a result, evicting the least recently used entries if needed.
+
+        Args:
+            key: Lookup key.
+            value: Result to store.
+            size: Estimated size of ``value`` in bytes.
+        """
+        with self._lock:
+            if size > self._max_size:
+                return
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+            self._entries[key] = (value, size)
+            self._size += size
+            self._evict()
+
+    def clear(self) -> None:
+        """Drop every entry. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> CacheStats:
+        """Get the current counters and occupancy."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size=self._size,
+                max_size=self._max_size,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self) -> None:
+        while self._size > self._max_size and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._size -= size
+            self._evictions += 1
+
+
+def memoized(method: F) -> F:
+    """Cache a graph method's results in the graph's ``ResultCache``.
+
+    Arguments are bound to the signature with defaults applied, so
+    ``get_centrality(PAGERANK)`` and ``get_centrality(centrality_type=
+    PAGERANK)`` share an entry. Calls whose arguments cannot be made
+    hashable are not cached. Every call, hit or miss, returns a copy (see
+    ``detach``), never the cached object itself.
+    """
+    signature = inspect.signature(method)
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        cache = self._result_cache()
+        if cache is None:
+            return method(self, *args, **kwargs)
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        try:
+            key = (name, *(freeze(v) for k, v in bound.arguments.items() if k != "self"))
+            hash(key)
+        except TypeError:
+            return method(self, *args, **kwargs)
+
+        shared = self._shared_objects()
+        result = cache.get(key, _MISSING)
+        if result is _MISSING:
+            result = method(self, *args, **kwargs)
+            cache.put(key, result, estimate_size(result, shared=shared))
+        return detach(result, shared=shared)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def freeze(value: Any) -> Hashable:
+    """Convert lists, dicts and sets in an argument to hashable equivalents."""
+    if isinstance(value, (str, int, float, bool, Enum)) or value is None:
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(v) for v in value)
+    return value
+
+
+def detach(value: Any, shared: Iterable[object] = ()) -> Any:
+    """Copy the mutable parts of a result so the caller cannot change the original.
+
+    Dicts, lists, sets and NumPy arrays are copied, as are the attributes of
+    objects (from ``__dict__`` or ``__slots__``), recursively. Immutable
+    values are returned as they are, and so are objects in ``shared`` (such
+    as the graph's node ID table), which belong to the graph, not the result.
+    """
+    return _detach(value, {id(obj) for obj in shared})
+
+
+def estimate_size(value: Any, shared: Iterable[object] = ()) -> int:
+    """Estimate the memory held by a result, in bytes.
+
+    NumPy arrays count their buffers. Containers count themselves plus their
+    items; beyond ``SIZE_SAMPLE`` items, the rest are assumed to be the
+    size of the sampled ones on average. Strings are not counted: results
+    refer to node IDs and values already held by the graph. Objects in
+    ``shared`` (such as the graph's node ID table) are not counted either.
+    """
+    seen = {id(obj) for obj in shared}
+    return _size(value, seen)
+
+
+def _detach(value: Any, shared: set[int]) -> Any:
+    kind = type(value)
+    if kind in _IMMUTABLE or isinstance(value, Enum) or id(value) in shared:
+        return value
+    # Copy containers in C, then replace only the items that are mutable
+    if kind is dict:
+        clone = value.copy()
+        for k, v in value.items():
+            if type(v) not in _IMMUTABLE:
+                clone[k] = _detach(v, shared)
+        return clone
+    if kind is list:
+        clone = value.copy()
+        for i, v in enumerate(value):
+            if type(v) not in _IMMUTABLE:
+                clone[i] = _detach(v, shared)
+        return clone
+    if kind is tuple:
+        return tuple(_detach(v, shared) for v in value)
+    if kind is set:
+        return set(value)
+    if kind is frozenset:
+        return value
+    if hasattr(value, "__array__") and hasattr(value, "copy"):
+        return value.copy()
+
+    # Objects: copy the shell, then detach every attribute
+    clone = copy.copy(value)
+    attributes = getattr(value, "__dict__", None)
+    if attributes is not None:
+        for name, attr in attributes.items():
+            object.__setattr__(clone, name, _detach(attr, shared))
+    for cls in kind.__mro__:
+        slots = getattr(cls, "__slots__", ())
+        for slot in (slots,) if isinstance(slots, str) else slots:
+            if slot not in ("__dict__", "__weakref__") and hasattr(value, slot):
+                object.__setattr__(clone, slot, _detach(getattr(value, slot), shared))
+    return clone
+
+
+def _size(value: Any, seen: set[int]) -> int:
+    if isinstance(value, str) or id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    # NumPy arrays report their buffer here when they own it
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        return size + _sampled(value.items(), len(value), seen, pairs=True)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + _sampled(value, len(value), seen)
+    if isinstance(value, (int, float, Enum)) or value is None:
+        return size
+
+    # Objects: count their attributes, from __dict__ or __slots__
+    attributes = getattr(value, "__dict__", None)
+    if attributes is not None:
+        return size + _size(attributes, seen)
+    for cls in type(value).__mro__:
+        for slot in getattr(cls, "__slots__", ()):
+            size += _size(getattr(value, slot, None), seen)
+    return size
+
+
+def _sampled(items: Iterable[Any], count: int, seen: set[int], pairs: bool = False) -> int:
+    """Size the first ``SIZE_SAMPLE`` items and extrapolate to ``count``."""
+    total = 0
+    measured = 0
+    for item in items:
+        if measured == SIZE_SAMPLE:
+            break
+        if pairs:
+            total += _size(item[0], seen) + _size(item[1], seen)
+        else:
+            total += _size(item, seen)
+        measured += 1
+    if measured == 0:
+        return 0
+    return total * count // measured
@@ -0,0 +1,115 @@
+"""Lightweight GEXF metadata reader.
+
+Reads the file header, and optionally counts nodes and edges, with a
+streaming expat parser. No graph is built and NetworkX is never imported,
+so commands that only need metadata start and finish quickly.
+"""
+
+import xml.parsers.expat
+from pathlib import Path
+
+from .compression import open_input
+from .errors import GEXFParseError
+from .models import GraphMetadata
+
+# Bytes read from the file per parser call
+READ_SIZE = 1 << 16
+
+
+class _HeaderComplete(Exception):
+    """Raised from a handler to stop parsing once the header has been read."""
+
+
+def read_metadata(file_path: str | Path, count_elements: bool = True) -> GraphMetadata:
+    """Read metadata from a GEXF file without building the graph.
+
+    Args:
+        file_path: Path to the GEXF file (optionally compressed).
+        count_elements: Scan the whole file to count nodes and edges. If
+            False, parsing stops at the ``<graph>`` element and the counts
+            are left at zero.
+
+    Returns:
+        Metadata from the file header.
+
+    Raises:
+        GEXFParseError: If the file is missing or is not valid XML.
+    """
+    path = Path(file_path)
+    if not path.exists():
+        raise GEXFParseError(f"File not found: {file_path}")
+    if not path.is_file():
+        raise GEXFParseError(f"Not a file: {file_path}")
+
+    reader = _MetadataReader(stop_at_graph=not count_elements)
+    try:
+        with open_input(path) as f:
+            while chunk := f.read(READ_SIZE):
+                reader.parser.Parse(chunk, False)
+            reader.parser.Parse(b"", True)
+    except _HeaderComplete:
+        pass
+    except xml.parsers.expat.ExpatError as e:
+        raise GEXFParseError(f"Invalid XML: {e}") from e
+    except (OSError, EOFError) as e:
+        raise GEXFParseError(f"Failed to read GEXF file: {e}") from e
+
+    return GraphMetadata(**reader.fields)
+
+
+class _MetadataReader:
+    """Expat handlers collecting header fields and element counts."""
+
+    def __init__(self, stop_at_graph: bool):
+        self.fields: dict = {
+            "creator": None,
+            "description": None,
+            "last_modified": None,
+            "mode": "static",
+            "default_edge_type": "undirected",
+            "time_format": None,
+            "version": None,
+            "node_count": 0,
+            "edge_count": 0,
+        }
+        self._stop_at_graph = stop_at_graph
+        self._path: list[str] = []
+        self._text: list[str] | None = None
+
+        self.parser = xml.parsers.expat.ParserCreate()
+        self.parser.StartElementHandler = self._start
+        self.parser.EndElementHandler = self._end
+        self.parser.CharacterDataHandler = self._characters
+
+    def _start(self, tag: str, attrs: dict[str, str]) -> None:
+        name = tag.rpartition(":")[2]
+        parent = self._path[-1] if self._path else None
+        self._path.append(name)
+        depth = len(self._path)
+
+        if name == "node" and parent == "nodes":
+            self.fields["node_count"] += 1
+        elif name == "edge" and parent == "edges":
+            self.fields["edge_count"] += 1
+        elif depth == 1:
+            self.fields["version"] = attrs.get("version")
+        elif depth == 2 and name == "meta":
+            self.fields["last_modified"] = attrs.get("lastmodifieddate")
+        elif depth == 3 and parent == "meta" and name in ("creator", "description"):
+            self._text = []
+        elif depth == 2 and name == "graph":
+            self.fields["mode"] = attrs.get("mode", "static")
+            self.fields["default_edge_type"] = attrs.get("defaultedgetype", "undirected")
+            self.fields["time_format"] = attrs.get("timeformat")
+            if self._stop_at_graph:
+                raise _HeaderComplete
+
+    def _end(self, tag: str) -> None:
+        name = self._path.pop()
+        if self._text is not None:
+            self.fields[name] = "".join(self._text)
+            self._text = None
+
+    def _characters(self, data: str) -> None:
+        if self._text is not None:
+            self._text.append(data)
@@ -1,9 +1,39 @@
 """Data models for GEXF graph structures."""
 
+import importlib
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterator, Mapping
 from enum import Enum
 
+if TYPE_CHECKING:
+    import numpy as np
+
+# Keys NetworkX stores alongside custom attributes, exposed as model fields
+NODE_FIELDS = frozenset({"label"})
+EDGE_FIELDS = frozenset({"id", "weight", "type", "label"})
+
+
+class _LazyModule:
+    """Stand-in for a module that is imported on first attribute access.
+
+    Models are imported at CLI startup, which must not pay for NumPy.
+    """
+
+    __slots__ = ("_name", "_module")
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module: Any = None
+
+    def __getattr__(self, attr: str) -> Any:
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+if not TYPE_CHECKING:
+    np = _LazyModule("numpy")
+
 
 class CentralityType(Enum):
     """Types of centrality metrics."""
@@ -14,12 +44,42 @@ class CentralityType(Enum):
     EIGENVECTOR = "eigenvector"
 
 
+class SimilarityMetric(Enum):
+    """Types of node-pair similarity (link prediction) scores."""
+    COMMON_NEIGHBORS = "common-neighbors"
+    JACCARD = "jaccard"
+    ADAMIC_ADAR = "adamic-adar"
+    RESOURCE_ALLOCATION = "resource-allocation"
+
+
 class ExportFormat(Enum):
     """Supported export formats."""
     JSON = "json"
     GRAPHML = "graphml"
     ADJLIST = "adjlist"
     EDGELIST = "edgelist"
+    NPZ = "npz"
+    MTX = "mtx"
+    COLUMNS = "columns"
+
+    @property
+    def is_binary(self) -> bool:
+        """Whether the format is a binary artifact rather than text."""
+        return self in (ExportFormat.NPZ, ExportFormat.COLUMNS)
+
+
+class RecordFormat(Enum):
+    """Line-oriented formats for streaming node and edge records."""
+    NDJSON = "ndjson"
+    TSV = "tsv"
+    CSV = "csv"
+
+
+class Compression(Enum):
+    """Supported stream compression codecs."""
+    GZIP = "gzip"
+    BZ2 = "bz2"
+    XZ = "xz"
 
 
 @dataclass(frozen=True)
@@ -31,6 +91,7 @@ class GraphMetadata:
     last_modified: str | None = None
     mode: str = "static"
     default_edge_type: str = "undirected"
+    time_format: str | None = None
     version: str | None = None
     node_count: int = 0
     edge_count: int = 0
@@ -43,26 +104,83 @@ class GraphMetadata:
             "last_modified": self.last_modified,
             "mode": self.mode,
             "default_edge_type": self.default_edge_type,
+            "time_format": self.time_format,
             "version": self.version,
             "node_count": self.node_count,
             "edge_count": self.edge_count,
         }
 
 
-@dataclass(frozen=True)
+class AttributeView(Mapping[str, Any]):
+    """Read-only view of an attribute dict, hiding the standard fields.
+
+    NetworkX keeps a node's label (and an edge's ID, weight, type and label)
+    in the same dict as its custom attributes. The view exposes only the
+    custom attributes without copying them, and reflects the dict it wraps.
+    """
+
+    __slots__ = ("_data", "_hidden")
+
+    def __init__(self, data: Mapping[str, Any], hidden: frozenset[str] = frozenset()):
+        self._data = data
+        self._hidden = hidden
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._hidden:
+            raise KeyError(key)
+        return self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key not in self._hidden and key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key in self._data if key not in self._hidden)
+
+    def __len__(self) -> int:
+        return sum(1 for key in self._data if key not in self._hidden)
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get an attribute value, or ``default`` if it is not set."""
+        if key in self._hidden:
+            return default
+        return self._data.get(key, default)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Copy the visible attributes into a plain dict."""
+        if not self._hidden:
+            return dict(self._data)
+        return {k: v for k, v in self._data.items() if k not in self._hidden}
+
+
+@dataclass(frozen=True, slots=True)
 class Node:
-    """A node in the graph."""
+    """A node in the graph.
+
+    ``attributes`` is a read-only view; a plain dict passed in is wrapped,
+    not copied. Nodes hash by ID.
+    """
 
     id: str
     label: str | None = None
-    attributes: dict[str, Any] = field(default_factory=dict)
+    attributes: Mapping[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.attributes, AttributeView):
+            object.__setattr__(self, "attributes", AttributeView(self.attributes))
+
+    def __hash__(self) -> int:
+        # str caches its own hash, so there is nothing to gain by storing it
+        return hash(self.id)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert node to a dictionary for JSON serialization."""
         return {
             "id": self.id,
             "label": self.label,
-            "attributes": dict(self.attributes),
+            "attributes": self.attributes.to_dict(),
         }
 
     def matches_filters(
@@ -90,9 +208,13 @@ class Node:
         return True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Edge:
-    """An edge in the graph."""
+    """An edge in the graph.
+
+    ``attributes`` is a read-only view; a plain dict passed in is wrapped,
+    not copied. Edges hash by (source, target, ID), computed once.
+    """
 
     id: str | None
     source: str
@@ -100,7 +222,17 @@ class Edge:
     weight: float | None = None
     edge_type: str | None = None
     label: str | None = None
-    attributes: dict[str, Any] = field(default_factory=dict)
+    attributes: Mapping[str, Any] = field(default_factory=dict)
+    _hash: int | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.attributes, AttributeView):
+            object.__setattr__(self, "attributes", AttributeView(self.attributes))
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            object.__setattr__(self, "_hash", hash((self.source, self.target, self.id)))
+        return self._hash
 
     def to_dict(self) -> dict[str, Any]:
         """Convert edge to a dictionary for JSON serialization."""
@@ -111,7 +243,7 @@ class Edge:
             "weight": self.weight,
             "type": self.edge_type,
             "label": self.label,
-            "attributes": dict(self.attributes),
+            "attributes": self.attributes.to_dict(),
         }
 
     def matches_filters(
@@ -206,24 +338,278 @@ class GraphStats:
         }
 
 
-@dataclass
+class ScoreView(Mapping[str, float]):
+    """Read-only mapping of node ID to score over a result's arrays.
+
+    Iteration follows the node ID table. The ID-to-row index is only built
+    on the first lookup by key.
+    """
+
+    __slots__ = ("_result", "_values")
+
+    def __init__(self, result: "CentralityResult", values: Any):
+        self._result = result
+        self._values = values
+
+    def __getitem__(self, node_id: str) -> float:
+        return float(self._values[self._result.row_of(node_id)])
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._result._row_index()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._result.node_ids)
+
+    def __len__(self) -> int:
+        return len(self._result.node_ids)
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    def items(self) -> Any:
+        """Pairs of node ID and score, without per-key lookups."""
+        return zip(self._result.node_ids, self._values.tolist())
+
+    def values(self) -> Any:
+        """Scores in node ID table order."""
+        return self._values.tolist()
+
+
 class CentralityResult:
-    """Centrality scores for nodes."""
+    """Centrality scores for nodes, held as float64 arrays.
+
+    Scores are aligned with ``node_ids``, normally the graph's interned ID
+    table, so ranking, rounding and summaries are array operations and no
+    per-node dict is built unless ``scores`` is indexed by key. A result can
+    hold several centrality types side by side, one column each (see
+    ``combine``); the first is ``centrality_type`` and the default for
+    ranking.
+
+    A plain mapping can still be passed as ``scores``:
 
-    centrality_type: str
-    scores: dict[str, float]
+    Example:
+        >>> result = CentralityResult("degree", scores={"a": 0.5, "b": 0.25})
+        >>> result.top_n(1)
+        [('a', 0.5)]
+    """
+
+    __slots__ = ("node_ids", "_columns", "_index")
+
+    def __init__(
+        self,
+        centrality_type: str,
+        scores: Mapping[str, float] | None = None,
+        *,
+        node_ids: Any = None,
+        values: Any = None,
+    ):
+        """Create a result from a mapping or from aligned arrays.
+
+        Args:
+            centrality_type: Name of the centrality measure.
+            scores: Mapping of node ID to score.
+            node_ids: Node IDs, when ``scores`` is not given.
+            values: Scores aligned with ``node_ids``.
+        """
+        if scores is not None:
+            node_ids = list(scores)
+            values = np.fromiter(scores.values(), dtype=np.float64, count=len(node_ids))
+        elif node_ids is None or values is None:
+            raise ValueError("Either scores or node_ids and values are required")
+        self.node_ids = node_ids
+        self._columns = {centrality_type: np.asarray(values, dtype=np.float64)}
+        self._index: dict[str, int] | None = None
+
+    @classmethod
+    def combine(cls, results: list["CentralityResult"]) -> "CentralityResult":
+        """Put the columns of several results side by side.
+
+        Rows follow the first result. Other results are reindexed onto its
+        node IDs when they differ, with NaN for nodes they do not score.
+        """
+        first = results[0]
+        combined = cls(first.centrality_type, node_ids=first.node_ids, values=first.values)
+        combined._index = first._index
+        for result in results:
+            same_rows = result.node_ids is first.node_ids or list(result.node_ids) == list(
+                first.node_ids
+            )
+            for ctype, column in result._columns.items():
+                if not same_rows:
+                    aligned = np.full(len(first.node_ids), np.nan)
+                    rows = np.fromiter(
+                        (result._row_index().get(n, -1) for n in first.node_ids),
+                        dtype=np.int64,
+                        count=len(first.node_ids),
+                    )
+                    aligned[rows >= 0] = column[rows[rows >= 0]]
+                    column = aligned
+                combined._columns[ctype] = column
+        return combined
+
+    @property
+    def centrality_type(self) -> str:
+        """The first (primary) centrality type."""
+        return next(iter(self._columns))
+
+    @property
+    def types(self) -> list[str]:
+        """All centrality types held, primary first."""
+        return list(self._columns)
+
+    @property
+    def values(self) -> Any:
+        """Scores of the primary type as a float64 array."""
+        return self._columns[self.centrality_type]
+
+    @property
+    def scores(self) -> ScoreView:
+        """Scores of the primary type as a read-only node ID mapping."""
+        return ScoreView(self, self.values)
+
+    def column(self, centrality_type: str) -> Any:
+        """Get the scores of one centrality type as a float64 array."""
+        return self._columns[centrality_type]
+
+    def row_of(self, node_id: str) -> int:
+        """Get the row of a node ID.
+
+        Raises:
+            KeyError: If the node has no score.
+        """
+        return self._row_index()[node_id]
+
+    def without(self, node_ids: list[str]) -> "CentralityResult":
+        """Get a copy of the result with some nodes left out."""
+        index = self._row_index()
+        keep = np.ones(len(self.node_ids), dtype=bool)
+        keep[[index[n] for n in node_ids if n in index]] = False
+        rows = np.flatnonzero(keep)
+        result = CentralityResult.__new__(CentralityResult)
+        result.node_ids = [self.node_ids[i] for i in rows.tolist()]
+        result._columns = {ctype: column[rows] for ctype, column in self._columns.items()}
+        result._index = None
+        return result
+
+    def top_indices(self, n: int = 10, by: str | None = None) -> Any:
+        """Get the rows of the N highest scores, best first.
+
+        Uses a partial sort, so only the candidates for the top N are fully
+        ordered. Ties keep node ID table order and NaN scores rank last.
+
+        Args:
+            n: Number of rows.
+            by: Centrality type to rank by (default: the primary type).
+        """
+        column = self._columns[by or self.centrality_type]
+        k = min(n, column.size)
+        if k <= 0:
+            return np.empty(0, dtype=np.int64)
+        keys = np.nan_to_num(-column, nan=np.inf)
+        threshold = np.partition(keys, k - 1)[k - 1]
+        # Every score tied with the N-th is a candidate, so ties stay stable
+        candidates = np.flatnonzero(keys <= threshold)
+        return candidates[np.argsort(keys[candidates], kind="stable")[:k]]
+
+    def top_n(self, n: int = 10, by: str | None = None) -> list[tuple[str, float]]:
+        """Get the top N nodes by centrality score."""
+        rows = self.top_indices(n, by)
+        column = self._columns[by or self.centrality_type]
+        return [(self.node_ids[i], score) for i, score in zip(rows.tolist(), column[rows].tolist())]
+
+    def summary(
+        self, percentiles: tuple[float, ...] = (50, 90, 99), by: str | None = None
+    ) -> dict[str, float]:
+        """Summarise the score distribution of one centrality type.
+
+        Returns:
+            Mapping with ``count``, ``min``, ``mean``, ``max`` and ``p<N>``
+            for each percentile. NaN scores are ignored.
+        """
+        column = self._columns[by or self.centrality_type]
+        column = column[~np.isnan(column)]
+        if column.size == 0:
+            return {"count": 0}
+        summary = {
+            "count": int(column.size),
+            "min": float(column.min()),
+            "mean": float(column.mean()),
+            "max": float(column.max()),
+        }
+        for p, value in zip(percentiles, np.percentile(column, percentiles).tolist()):
+            summary[f"p{p:g}"] = value
+        return summary
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert centrality result to a dictionary for JSON serialization."""
+        """Convert centrality result to a dictionary for JSON serialization.
+
+        With several types, each node maps to its score per type.
+        """
+        # Round all scores in one vectorised pass rather than per item
+        rounded = {}
+        for ctype, column in self._columns.items():
+            values = np.round(column, 6).tolist()
+            if np.isnan(column).any():
+                # Nodes a combined type did not score have no JSON number
+                values = [None if v != v else v for v in values]
+            rounded[ctype] = values
+        if len(rounded) == 1:
+            return {
+                "type": self.centrality_type,
+                "scores": dict(zip(self.node_ids, rounded[self.centrality_type])),
+            }
         return {
             "type": self.centrality_type,
-            "scores": {k: round(v, 6) for k, v in self.scores.items()},
+            "types": self.types,
+            "scores": {
+                node: dict(zip(rounded, row))
+                for node, row in zip(self.node_ids, zip(*rounded.values()))
+            },
         }
 
-    def top_n(self, n: int = 10) -> list[tuple[str, float]]:
-        """Get the top N nodes by centrality score."""
-        sorted_scores = sorted(self.scores.items(), key=lambda x: x[1], reverse=True)
-        return sorted_scores[:n]
+    def _row_index(self) -> dict[str, int]:
+        if self._index is None:
+            self._index = {node: i for i, node in enumerate(self.node_ids)}
+        return self._index
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CentralityResult):
+            return NotImplemented
+        return (
+            self.types == other.types
+            and list(self.node_ids) == list(other.node_ids)
+            and all(
+                np.array_equal(column, other._columns[ctype], equal_nan=True)
+                for ctype, column in self._columns.items()
+            )
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"CentralityResult(types={self.types!r}, count={len(self)})"
+
+
+@dataclass
+class SimilarityResult:
+    """Similarity scores for pairs of nodes."""
+
+    metric: str
+    pairs: list[tuple[str, str, float]]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert similarity result to a dictionary for JSON serialization."""
+        scores = np.round(np.array([p[2] for p in self.pairs], dtype=np.float64), 6)
+        return {
+            "metric": self.metric,
+            "pairs": [
+                {"node1": u, "node2": v, "score": score}
+                for (u, v, _), score in zip(self.pairs, scores.tolist())
+            ],
+        }
 
 
 @dataclass
@@ -243,3 +629,22 @@ class ComponentInfo:
             "largest_component_size": self.largest_component_size,
             "components": self.components,
         }
+
+
+@dataclass
+class TimelinePoint:
+    """Metrics of a dynamic graph at one step of a timeline."""
+
+    time: str | int | float
+    node_count: int
+    edge_count: int
+    metrics: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the point to a flat dictionary for JSON serialization."""
+        return {
+            "time": self.time,
+            "node_count": self.node_count,
+            "edge_count": self.edge_count,
+            **self.metrics,
+        }
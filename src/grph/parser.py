@@ -1,12 +1,27 @@
-"""GEXF file parser using NetworkX and ElementTree."""
+"""GEXF file parser using NetworkX."""
 
-import xml.etree.ElementTree as ET
+import fnmatch
+import io
+from dataclasses import replace
+from itertools import islice
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, BinaryIO, Iterable, Iterator
+from xml.parsers.expat import ExpatError
 
 import networkx as nx
-
+import numpy as np
+
+from .compression import open_input
+from .csr import CSRAdjacency
+from .errors import GEXFParseError
+from .exporters import ARRAY_EXPORTERS, EXPORTERS, write_columns
+from .frames import EdgeFrame, NodeFrame
+from .gexf_writer import write_subgraph
+from .intervals import IntervalIndex, format_time, lifetimes, parse_step, parse_time
 from .models import (
+    EDGE_FIELDS,
+    NODE_FIELDS,
+    AttributeView,
     Edge,
     GraphMetadata,
     Node,
@@ -16,13 +31,19 @@ from .models import (
     ComponentInfo,
     CentralityType,
     ExportFormat,
+    SimilarityMetric,
+    SimilarityResult,
+    TimelinePoint,
 )
-
-
-class GEXFParseError(Exception):
-    """Raised when a GEXF file cannot be parsed."""
-
-    pass
+from .memo import DEFAULT_CACHE_BYTES, ResultCache, memoized
+from .metadata import read_metadata
+from .ppr import forward_push
+from .profiling import span, traced
+from .results import NodeSet
+from .sidecar import DEFAULT_LANDMARKS, SidecarIndex, build_index, index_path, open_index
+from .similarity import neighbor_matrix, pair_scores, top_pairs
+from .timeline import METRICS, Timeline, parse_metrics, sample_times
+from .traversal import bfs, bfs_path, dijkstra_path, visited
 
 
 class GEXFGraph:
@@ -36,107 +57,316 @@ class GEXFGraph:
         "1.3": "http://gexf.net/1.3",
     }
 
-    def __init__(self, file_path: str | Path):
+    def __init__(self, file_path: str | Path, cache_size: int = DEFAULT_CACHE_BYTES):
         """Parse a GEXF file.
 
+        Gzip, bzip2 and xz compressed files are detected from their content
+        and decompressed while parsing. A sidecar index built by
+        ``build_index`` is picked up if it still matches the file.
+
         Args:
-            file_path: Path to the GEXF file.
+            file_path: Path to the GEXF file (optionally compressed).
+            cache_size: Memory budget in bytes for memoized results such as
+                statistics and centrality (0 disables the cache).
 
         Raises:
             GEXFParseError: If the file cannot be parsed.
         """
         self.file_path = Path(file_path)
+        self._memo = ResultCache(cache_size)
+        self._load()
 
+    def _load(self) -> None:
+        """Parse ``self.file_path`` and reset everything derived from it."""
         if not self.file_path.exists():
-            raise GEXFParseError(f"File not found: {file_path}")
+            raise GEXFParseError(f"File not found: {self.file_path}")
 
         if not self.file_path.is_file():
-            raise GEXFParseError(f"Not a file: {file_path}")
+            raise GEXFParseError(f"Not a file: {self.file_path}")
+
+        # Taken before parsing, so a write during the parse is seen as a change
+        stat = self.file_path.stat()
+        self._source_stat: tuple[int, int] | None = (stat.st_mtime_ns, stat.st_size)
 
         try:
-            # Parse with NetworkX for graph structure
-            self._graph = nx.read_gexf(str(self.file_path))
+            # Parse with NetworkX for graph structure, decompressing on the fly
+            with span("read_gexf"), open_input(self.file_path) as f:
+                self._graph = _read_gexf(f)
         except Exception as e:
             raise GEXFParseError(f"Failed to parse GEXF file: {e}") from e
 
         # Parse metadata directly from XML
-        self._metadata = self._parse_metadata()
+        with span("metadata"):
+            self._metadata = self._parse_metadata()
         self._node_attr_keys: set[str] = set()
         self._edge_attr_keys: set[str] = set()
-        self._collect_attribute_keys()
+        with span("attribute_keys"):
+            self._collect_attribute_keys()
+        with span("intern"):
+            _share_node_ids(self._graph)
+        self._reset_caches()
+
+        self._sidecar: SidecarIndex | None = None
+        if index_path(self.file_path).is_dir():
+            with span("open_index"):
+                self._sidecar = open_index(
+                    self.file_path,
+                    self._source_stat,
+                    self._metadata.node_count,
+                    self._metadata.edge_count,
+                )
+
+    def _reset_caches(self) -> None:
+        """Drop derived structures so they are rebuilt from ``self._graph``."""
+        self._adjacency: CSRAdjacency | None = None
+        self._node_ids: list[str] | None = None
+        self._node_index: dict[str, int] | None = None
+        self._node_columns: dict[str, np.ndarray] = {}
+        self._edge_columns: dict[str, np.ndarray] = {}
+        self._weights: np.ndarray | None = None
+        self._neighbor_matrix = None
+        self._node_values: dict[str, np.ndarray] = {}
+        self._edge_values: dict[str, np.ndarray] = {}
+        self._edge_data: list[tuple[Any, Any, dict[str, Any]]] | None = None
+        self._lifetimes: tuple[IntervalIndex, IntervalIndex] | None = None
+        self._edge_ends: np.ndarray | None = None
+        self._memo.clear()
+
+    @property
+    def cache(self) -> ResultCache:
+        """The memoized results of this graph, with hit/miss statistics."""
+        return self._memo
+
+    def invalidate_caches(self) -> None:
+        """Drop memoized results and derived structures.
+
+        Needed only after editing the underlying NetworkX graph directly;
+        reloading does this itself. The sidecar index no longer matches an
+        edited graph, so it is dropped too.
+        """
+        self._sidecar = None
+        self._reset_caches()
+
+    def reload(self) -> None:
+        """Parse the file again, dropping every cached result.
+
+        Raises:
+            GEXFParseError: If the file cannot be parsed, or the graph is a
+                subgraph (which has no file of its own).
+        """
+        if self._source_stat is None:
+            raise GEXFParseError("Subgraphs cannot be reloaded; reload the source graph")
+        self._load()
+
+    def refresh(self) -> bool:
+        """Reload the graph if its file changed since it was parsed.
+
+        Only the file's size and modification time are checked, so calling
+        this before each query is cheap.
+
+        Returns:
+            True if the file changed and was reloaded.
+        """
+        if self._source_stat is None:
+            return False
+        stat = self.file_path.stat()
+        if (stat.st_mtime_ns, stat.st_size) == self._source_stat:
+            return False
+        self._load()
+        return True
+
+    @property
+    def sidecar(self) -> SidecarIndex | None:
+        """The sidecar index in use, or None if the file has no fresh one."""
+        return self._sidecar
+
+    def build_index(
+        self, sections: list[str] | None = None, landmarks: int = DEFAULT_LANDMARKS
+    ) -> Path:
+        """Precompute sidecar indexes for the file and start using them.
+
+        Args:
+            sections: Sections to build (default: all); see ``grph.sidecar``.
+            landmarks: Number of landmarks for the landmarks section.
+
+        Returns:
+            Path of the sidecar directory.
+
+        Raises:
+            GEXFParseError: If a section is unknown or the graph is a subgraph.
+        """
+        path = build_index(self, sections, landmarks)
+        self._sidecar = open_index(
+            self.file_path, self._source_stat, self._metadata.node_count, self._metadata.edge_count
+        )
+        return path
+
+    def _result_cache(self) -> ResultCache | None:
+        """Get the cache for ``memoized`` methods, or None when disabled."""
+        return self._memo if self._memo.max_size > 0 else None
 
-    def _detect_namespace(self, root: ET.Element) -> str | None:
-        """Detect the GEXF namespace from the root element."""
-        # Try to extract namespace from the tag
-        if root.tag.startswith("{"):
-            ns_end = root.tag.index("}")
-            return root.tag[1:ns_end]
-        return None
+    def _shared_objects(self) -> list[object]:
+        """Objects owned by the graph that results may refer to."""
+        return [self._node_ids, self._node_index]
 
     def _parse_metadata(self) -> GraphMetadata:
-        """Parse metadata from the GEXF file XML."""
-        try:
-            tree = ET.parse(self.file_path)
-            root = tree.getroot()
-        except ET.ParseError as e:
-            raise GEXFParseError(f"Invalid XML: {e}") from e
-
-        ns = self._detect_namespace(root)
-        ns_prefix = f"{{{ns}}}" if ns else ""
-
-        # Extract version from root
-        version = root.get("version")
-
-        # Find meta element
-        meta = root.find(f"{ns_prefix}meta")
-
-        creator = None
-        description = None
-        last_modified = None
-
-        if meta is not None:
-            last_modified = meta.get("lastmodifieddate")
-            creator_elem = meta.find(f"{ns_prefix}creator")
-            desc_elem = meta.find(f"{ns_prefix}description")
-
-            if creator_elem is not None:
-                creator = creator_elem.text
-            if desc_elem is not None:
-                description = desc_elem.text
-
-        # Find graph element for mode and default edge type
-        graph = root.find(f"{ns_prefix}graph")
-        mode = "static"
-        default_edge_type = "undirected"
-
-        if graph is not None:
-            mode = graph.get("mode", "static")
-            default_edge_type = graph.get("defaultedgetype", "undirected")
-
-        return GraphMetadata(
-            creator=creator,
-            description=description,
-            last_modified=last_modified,
-            mode=mode,
-            default_edge_type=default_edge_type,
-            version=version,
+        """Parse metadata from the GEXF file header.
+
+        Only the header is read; node and edge counts come from the parsed
+        graph.
+        """
+        header = read_metadata(self.file_path, count_elements=False)
+        return replace(
+            header,
             node_count=self._graph.number_of_nodes(),
             edge_count=self._graph.number_of_edges(),
         )
 
     def _collect_attribute_keys(self) -> None:
-        """Collect all unique attribute keys from nodes and edges."""
+        """Collect all unique attribute keys from nodes and edges.
+
+        String values are interned on the way: every element gets a fresh
+        string from the XML parser, so a categorical value such as a type
+        name would otherwise be stored once per node.
+        """
+        pool: dict[str, str] = {}
+
+        def share(attrs: dict[str, Any]) -> None:
+            for key, value in attrs.items():
+                # Edge IDs are unique, so pooling them would only cost memory
+                if type(value) is str and key != "id":
+                    attrs[key] = pool.setdefault(value, value)
+
         # Collect node attribute keys
         for _, attrs in self._graph.nodes(data=True):
             self._node_attr_keys.update(attrs.keys())
+            share(attrs)
 
         # Collect edge attribute keys
         for _, _, attrs in self._graph.edges(data=True):
             self._edge_attr_keys.update(attrs.keys())
+            share(attrs)
 
         # Remove 'label' as it's a standard field, not a custom attribute
         self._node_attr_keys.discard("label")
 
+    @property
+    def node_ids(self) -> list[str]:
+        """Node IDs in graph order; row ``i`` of every per-node array is node ``i``."""
+        if self._node_ids is None:
+            self._node_ids = [str(n) for n in self._graph.nodes()]
+        return self._node_ids
+
+    @property
+    def node_index(self) -> dict[str, int]:
+        """Map of node ID to its dense integer index, the inverse of ``node_ids``."""
+        if self._node_index is None:
+            self._node_index = {node: i for i, node in enumerate(self.node_ids)}
+        return self._node_index
+
+    @property
+    def adjacency(self) -> CSRAdjacency:
+        """Get the integer CSR adjacency, built on first use and cached."""
+        if self._adjacency is None and self._sidecar is not None:
+            if self._sidecar.has("adjacency"):
+                self._adjacency = self._sidecar.adjacency(self.node_ids, self.node_index)
+        if self._adjacency is None:
+            with span("build_csr"):
+                self._adjacency = CSRAdjacency.from_networkx(
+                    self._graph, self.node_ids, self.node_index
+                )
+        return self._adjacency
+
+    def _node_column(self, key: str) -> np.ndarray:
+        """Get a node attribute as strings aligned with adjacency indices.
+
+        Nodes without the attribute hold None. Columns are cached per key.
+        """
+        if key not in self._node_columns:
+            values = [attrs.get(key) for _, attrs in self._graph.nodes(data=True)]
+            self._node_columns[key] = _string_column(values)
+        return self._node_columns[key]
+
+    def _edge_column(self, key: str) -> np.ndarray:
+        """Get an edge attribute as strings aligned with edge ordinals.
+
+        Edges without the attribute hold None. Columns are cached per key.
+        """
+        if key not in self._edge_columns:
+            values = [attrs.get(key) for _, _, attrs in self._graph.edges(data=True)]
+            self._edge_columns[key] = _string_column(values)
+        return self._edge_columns[key]
+
+    def _node_mask(self, filters: list[tuple[str, str]] | None) -> np.ndarray | None:
+        """Build a boolean mask of nodes matching all (key, value) filters."""
+        if not filters:
+            return None
+        mask = np.ones(self.adjacency.num_nodes, dtype=bool)
+        for key, value in filters:
+            indexed = self._indexed_mask("node", key, value)
+            mask &= self._node_column(key) == value if indexed is None else indexed
+        return mask
+
+    def _edge_mask(self, filters: list[tuple[str, str]] | None) -> np.ndarray | None:
+        """Build a boolean mask of edges matching all (key, value) filters."""
+        if not filters:
+            return None
+        mask = np.ones(self._graph.number_of_edges(), dtype=bool)
+        for key, value in filters:
+            indexed = self._indexed_mask("edge", key, value)
+            mask &= self._edge_column(key) == value if indexed is None else indexed
+        return mask
+
+    def _indexed_mask(self, kind: str, key: str, value: str) -> np.ndarray | None:
+        """Mask the nodes or edges whose attribute equals a value, from the sidecar.
+
+        Returns None if there is no sidecar or it does not index the key.
+        """
+        if self._sidecar is None:
+            return None
+        rows = self._sidecar.attribute_rows(kind, key, value)
+        if rows is None:
+            return None
+        size = self._graph.number_of_nodes() if kind == "node" else self._graph.number_of_edges()
+        mask = np.zeros(size, dtype=bool)
+        mask[rows] = True
+        return mask
+
+    def _edge_weights(self) -> np.ndarray:
+        """Get edge weights aligned with edge ordinals (missing weights count as 1).
+
+        Cached with the adjacency, like the attribute columns.
+        """
+        if self._weights is None:
+            self._weights = np.fromiter(
+                (attrs.get("weight", 1) for _, _, attrs in self._graph.edges(data=True)),
+                dtype=np.float64,
+                count=self._graph.number_of_edges(),
+            )
+        return self._weights
+
+    def _bfs_from(
+        self,
+        node_id: str,
+        direction: str,
+        max_depth: int | None,
+        edge_filters: list[tuple[str, str]] | None = None,
+        node_filters: list[tuple[str, str]] | None = None,
+    ) -> np.ndarray:
+        """Run a BFS from one node and return the indices it reached (excluding itself)."""
+        adj = self.adjacency
+        start = adj.index_of(node_id)
+        dist = bfs(
+            adj,
+            [start],
+            direction=direction,
+            max_depth=max_depth,
+            edge_mask=self._edge_mask(edge_filters),
+            node_mask=self._node_mask(node_filters),
+        )
+        reached = visited(dist)
+        return reached[reached != start]
+
     @property
     def metadata(self) -> GraphMetadata:
         """Get the graph metadata."""
@@ -154,29 +384,41 @@ class GEXFGraph:
         self,
         attr_filters: list[tuple[str, str]] | None = None,
         label_pattern: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> Iterator[Node]:
         """Iterate over nodes, optionally filtering.
 
         Args:
             attr_filters: List of (key, value) tuples for attribute filtering.
             label_pattern: Glob pattern to match against node labels.
+            limit: Maximum number of nodes to yield (None for all).
+            offset: Number of matching nodes to skip first.
 
         Yields:
             Node objects matching the filters.
         """
         attr_filters = attr_filters or []
+        items = self._graph.nodes(data=True)
+        if not attr_filters and not label_pattern:
+            # Every node matches, so skip without building Node objects
+            items, offset = islice(items, offset, None), 0
 
-        for node_id, attrs in self._graph.nodes(data=True):
-            # Extract standard fields
-            label = attrs.get("label")
-
-            # Remaining attributes (excluding label)
-            custom_attrs = {k: v for k, v in attrs.items() if k != "label"}
+        matches = self._iter_nodes(items, attr_filters, label_pattern)
+        yield from islice(matches, offset, None if limit is None else offset + limit)
 
+    def _iter_nodes(
+        self,
+        items: Iterable[tuple[Any, dict[str, Any]]],
+        attr_filters: list[tuple[str, str]],
+        label_pattern: str | None,
+    ) -> Iterator[Node]:
+        """Build Node objects from NetworkX node data, applying filters."""
+        for node_id, attrs in items:
             node = Node(
                 id=str(node_id),
-                label=label,
-                attributes=custom_attrs,
+                label=attrs.get("label"),
+                attributes=AttributeView(attrs, NODE_FIELDS),
             )
 
             if node.matches_filters(attr_filters, label_pattern):
@@ -188,6 +430,8 @@ class GEXFGraph:
         source_filter: str | None = None,
         target_filter: str | None = None,
         type_filter: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> Iterator[Edge]:
         """Iterate over edges, optionally filtering.
 
@@ -196,46 +440,197 @@ class GEXFGraph:
             source_filter: Filter by source node ID.
             target_filter: Filter by target node ID.
             type_filter: Filter by edge type.
+            limit: Maximum number of edges to yield (None for all).
+            offset: Number of matching edges to skip first.
 
         Yields:
             Edge objects matching the filters.
         """
         attr_filters = attr_filters or []
+        items = self._graph.edges(data=True)
+        if not (attr_filters or source_filter or target_filter or type_filter):
+            # Every edge matches, so skip without building Edge objects
+            items, offset = islice(items, offset, None), 0
 
-        for source, target, attrs in self._graph.edges(data=True):
-            # Extract standard fields
-            edge_id = attrs.get("id")
-            weight = attrs.get("weight")
-            edge_type = attrs.get("type")
-            label = attrs.get("label")
-
-            # Remaining attributes
-            standard_keys = {"id", "weight", "type", "label"}
-            custom_attrs = {k: v for k, v in attrs.items() if k not in standard_keys}
-
-            edge = Edge(
-                id=str(edge_id) if edge_id else None,
-                source=str(source),
-                target=str(target),
-                weight=float(weight) if weight is not None else None,
-                edge_type=edge_type,
-                label=label,
-                attributes=custom_attrs,
-            )
+        matches = self._iter_edges(items, attr_filters, source_filter, target_filter, type_filter)
+        yield from islice(matches, offset, None if limit is None else offset + limit)
 
+    def _iter_edges(
+        self,
+        items: Iterable[tuple[Any, Any, dict[str, Any]]],
+        attr_filters: list[tuple[str, str]],
+        source_filter: str | None,
+        target_filter: str | None,
+        type_filter: str | None,
+    ) -> Iterator[Edge]:
+        """Build Edge objects from NetworkX edge data, applying filters."""
+        for source, target, attrs in items:
+            edge = _make_edge(source, target, attrs)
             if edge.matches_filters(attr_filters, source_filter, target_filter, type_filter):
                 yield edge
 
+    @traced
+    def node_frame(
+        self,
+        attr_filters: list[tuple[str, str]] | None = None,
+        label_pattern: str | None = None,
+    ) -> NodeFrame:
+        """Select nodes as a columnar frame, filtering with array operations.
+
+        Matches the same nodes as ``nodes()``, in the same order.
+
+        Args:
+            attr_filters: List of (key, value) tuples for attribute filtering.
+            label_pattern: Glob pattern to match against node labels.
+
+        Returns:
+            NodeFrame of the matching nodes.
+        """
+        mask = np.ones(self._graph.number_of_nodes(), dtype=bool)
+        for key, value in attr_filters or []:
+            if key in NODE_FIELDS:
+                # Standard fields are not attributes, as in Node.matches_filters
+                mask[:] = False
+            else:
+                indexed = self._indexed_mask("node", key, value)
+                if indexed is None:
+                    indexed = _string_column(self.node_values(key).tolist()) == value
+                mask &= indexed
+        rows = None
+        if label_pattern and self._sidecar is not None:
+            rows = self._sidecar.label_rows(label_pattern)
+        if rows is not None:
+            matched = np.zeros(mask.size, dtype=bool)
+            matched[rows] = True
+            mask &= matched
+        elif label_pattern:
+            labels = self.node_values("label")
+            mask &= np.fromiter(
+                (bool(label) and fnmatch.fnmatch(label, label_pattern) for label in labels),
+                dtype=bool,
+                count=labels.size,
+            )
+        return NodeFrame(self, np.flatnonzero(mask))
+
+    @traced
+    def edge_frame(
+        self,
+        attr_filters: list[tuple[str, str]] | None = None,
+        source_filter: str | None = None,
+        target_filter: str | None = None,
+        type_filter: str | None = None,
+    ) -> EdgeFrame:
+        """Select edges as a columnar frame, filtering with array operations.
+
+        Matches the same edges as ``edges()``, in the same order.
+
+        Args:
+            attr_filters: List of (key, value) tuples for attribute filtering.
+            source_filter: Filter by source node ID.
+            target_filter: Filter by target node ID.
+            type_filter: Filter by edge type.
+
+        Returns:
+            EdgeFrame of the matching edges.
+        """
+        mask = np.ones(self._graph.number_of_edges(), dtype=bool)
+        for key, value in attr_filters or []:
+            if key in EDGE_FIELDS and key != "weight":
+                # Standard fields are not attributes, as in Edge.matches_filters
+                mask[:] = False
+            else:
+                indexed = self._indexed_mask("edge", key, value)
+                if indexed is None:
+                    indexed = _string_column(self.edge_values(key).tolist()) == value
+                mask &= indexed
+        for key, value in (
+            ("source", source_filter),
+            ("target", target_filter),
+            ("type", type_filter),
+        ):
+            if value:
+                mask &= self.edge_values(key) == value
+        return EdgeFrame(self, np.flatnonzero(mask))
+
+    def node_values(self, key: str, rows: np.ndarray | None = None) -> np.ndarray:
+        """Get a node field or attribute for every node, in graph order.
+
+        Args:
+            key: ``id``, ``label`` or a node attribute key.
+            rows: Only get the values of these node indices. Unless the
+                whole column is cached, or they are most of it, they are
+                read one by one and nothing is cached, so a batch of rows
+                costs nothing per node of the graph.
+
+        Returns:
+            Object array of values, None where a node has no value. Whole
+            columns are cached per key.
+        """
+        count = self._graph.number_of_nodes()
+        if rows is not None and _gather_rows(key, rows, self._node_values, count):
+            node_ids = self.node_ids
+            if key == "id":
+                values = (node_ids[i] for i in rows.tolist())
+            else:
+                nodes = self._graph.nodes
+                values = (nodes[node_ids[i]].get(key) for i in rows.tolist())
+            return np.fromiter(values, dtype=object, count=len(rows))
+
+        if key not in self._node_values:
+            if key == "id":
+                values = iter(self.node_ids)
+            else:
+                values = (attrs.get(key) for _, attrs in self._graph.nodes(data=True))
+            self._node_values[key] = np.fromiter(values, dtype=object, count=count)
+        column = self._node_values[key]
+        return column if rows is None else column[rows]
+
+    def edge_values(self, key: str, rows: np.ndarray | None = None) -> np.ndarray:
+        """Get an edge field or attribute for every edge, by edge ordinal.
+
+        Standard fields are converted as in ``Edge`` (IDs and endpoints to
+        strings, weights to floats).
+
+        Args:
+            key: ``id``, ``source``, ``target``, ``weight``, ``type``,
+                ``label`` or an edge attribute key.
+            rows: Only get the values of these edge ordinals; see
+                ``node_values``.
+
+        Returns:
+            Object array of values, None where an edge has no value. Whole
+            columns are cached per key.
+        """
+        data = self._edge_list()
+        if rows is not None and _gather_rows(key, rows, self._edge_values, len(data)):
+            values = (_edge_value(key, data[i]) for i in rows.tolist())
+            return np.fromiter(values, dtype=object, count=len(rows))
+
+        if key not in self._edge_values:
+            values = (_edge_value(key, item) for item in data)
+            self._edge_values[key] = np.fromiter(values, dtype=object, count=len(data))
+        column = self._edge_values[key]
+        return column if rows is None else column[rows]
+
+    def edge_at(self, ordinal: int) -> Edge:
+        """Get the edge with the given ordinal (its position in ``edges()``)."""
+        return _make_edge(*self._edge_list()[ordinal])
+
+    def _edge_list(self) -> list[tuple[Any, Any, dict[str, Any]]]:
+        """List edge data once, so edges can be addressed by ordinal."""
+        if self._edge_data is None:
+            self._edge_data = list(self._graph.edges(data=True))
+        return self._edge_data
+
     def get_node(self, node_id: str) -> Node | None:
         """Get a specific node by ID."""
         if node_id not in self._graph:
             return None
 
         attrs = self._graph.nodes[node_id]
-        label = attrs.get("label")
-        custom_attrs = {k: v for k, v in attrs.items() if k != "label"}
-
-        return Node(id=node_id, label=label, attributes=custom_attrs)
+        return Node(
+            id=node_id, label=attrs.get("label"), attributes=AttributeView(attrs, NODE_FIELDS)
+        )
 
     def get_info(self) -> dict[str, Any]:
         """Get a summary of the graph."""
@@ -254,21 +649,26 @@ class GEXFGraph:
     # Graph Traversal Methods
     # =========================================================================
 
+    @traced
     def neighbors(
         self,
         node_id: str,
         direction: str = "all",
         depth: int = 1,
-    ) -> list[Node]:
+        edge_filters: list[tuple[str, str]] | None = None,
+        node_filters: list[tuple[str, str]] | None = None,
+    ) -> NodeSet:
         """Get neighbors of a node.
 
         Args:
             node_id: The node to find neighbors for.
             direction: "in" (predecessors), "out" (successors), or "all" (both).
             depth: Number of hops to traverse (default: 1).
+            edge_filters: Only follow edges matching these (key, value) tuples.
+            node_filters: Only pass through nodes matching these (key, value) tuples.
 
         Returns:
-            List of neighbor nodes.
+            Lazy set of neighbor nodes.
 
         Raises:
             GEXFParseError: If node not found.
@@ -276,31 +676,17 @@ class GEXFGraph:
         if node_id not in self._graph:
             raise GEXFParseError(f"Node not found: {node_id}")
 
-        visited: set[str] = set()
-        current_level = {node_id}
-
-        for _ in range(depth):
-            next_level: set[str] = set()
-            for nid in current_level:
-                if self._graph.is_directed():
-                    if direction in ("out", "all"):
-                        next_level.update(self._graph.successors(nid))
-                    if direction in ("in", "all"):
-                        next_level.update(self._graph.predecessors(nid))
-                else:
-                    next_level.update(self._graph.neighbors(nid))
-            visited.update(next_level)
-            current_level = next_level - {node_id}
-
-        # Convert to Node objects (excluding the original node)
-        visited.discard(node_id)
-        return [self.get_node(nid) for nid in sorted(visited) if self.get_node(nid)]
+        found = self._bfs_from(node_id, direction, depth, edge_filters, node_filters)
+        return NodeSet(self, found)
 
+    @traced
     def shortest_path(
         self,
         source: str,
         target: str,
         weighted: bool = False,
+        edge_filters: list[tuple[str, str]] | None = None,
+        node_filters: list[tuple[str, str]] | None = None,
     ) -> PathResult | None:
         """Find the shortest path between two nodes.
 
@@ -308,37 +694,61 @@ class GEXFGraph:
             source: Source node ID.
             target: Target node ID.
             weighted: Whether to use edge weights.
+            edge_filters: Only follow edges matching these (key, value) tuples.
+            node_filters: Only pass through nodes matching these (key, value) tuples.
 
         Returns:
             PathResult or None if no path exists.
+
+        Raises:
+            GEXFParseError: If a node is not found, or a weighted search
+                meets negative edge weights.
         """
         if source not in self._graph:
             raise GEXFParseError(f"Source node not found: {source}")
         if target not in self._graph:
             raise GEXFParseError(f"Target node not found: {target}")
 
-        try:
-            if weighted:
-                path = nx.shortest_path(self._graph, source, target, weight="weight")
-                length = nx.shortest_path_length(self._graph, source, target, weight="weight")
-                return PathResult(
-                    source=source,
-                    target=target,
-                    path=list(path),
-                    length=len(path) - 1,
-                    total_weight=float(length),
-                )
-            else:
-                path = nx.shortest_path(self._graph, source, target)
-                return PathResult(
-                    source=source,
-                    target=target,
-                    path=list(path),
-                    length=len(path) - 1,
-                )
-        except nx.NetworkXNoPath:
-            return None
+        if self._sidecar is not None and not edge_filters and not node_filters:
+            # Unreachable targets would otherwise cost a search of everything reachable
+            index = self.node_index
+            if self._sidecar.has_path(index[source], index[target]) is False:
+                return None
+
+        adj = self.adjacency
+        edge_mask = self._edge_mask(edge_filters)
+        node_mask = self._node_mask(node_filters)
+        start, end = adj.index_of(source), adj.index_of(target)
+
+        if weighted:
+            try:
+                found = dijkstra_path(adj, start, end, self._edge_weights(), edge_mask, node_mask)
+            except ValueError as e:
+                raise GEXFParseError(str(e)) from e
+            if found is None:
+                return None
+            indices, total_weight = found
+            path = [adj.node_ids[i] for i in indices]
+            return PathResult(
+                source=source,
+                target=target,
+                path=path,
+                length=len(path) - 1,
+                total_weight=float(total_weight),
+            )
+        else:
+            indices = bfs_path(adj, start, end, edge_mask, node_mask)
+            if indices is None:
+                return None
+            path = [adj.node_ids[i] for i in indices]
+            return PathResult(
+                source=source,
+                target=target,
+                path=path,
+                length=len(path) - 1,
+            )
 
+    @traced
     def all_paths(
         self,
         source: str,
@@ -375,6 +785,7 @@ class GEXFGraph:
 
         return paths
 
+    @traced
     def has_path(self, source: str, target: str) -> bool:
         """Check if a path exists between two nodes.
 
@@ -387,66 +798,53 @@ class GEXFGraph:
         """
         if source not in self._graph or target not in self._graph:
             return False
+        if self._sidecar is not None:
+            found = self._sidecar.has_path(self.node_index[source], self.node_index[target])
+            if found is not None:
+                return found
         return nx.has_path(self._graph, source, target)
 
+    @traced
     def reachable(
         self,
         node_id: str,
         direction: str = "forward",
         max_depth: int | None = None,
-    ) -> list[Node]:
+        edge_filters: list[tuple[str, str]] | None = None,
+        node_filters: list[tuple[str, str]] | None = None,
+    ) -> NodeSet:
         """Find all nodes reachable from a given node.
 
         Args:
             node_id: Starting node ID.
             direction: "forward" (descendants), "backward" (ancestors), or "both".
             max_depth: Maximum traversal depth.
+            edge_filters: Only follow edges matching these (key, value) tuples.
+            node_filters: Only pass through nodes matching these (key, value) tuples.
 
         Returns:
-            List of reachable nodes.
+            Lazy set of reachable nodes.
         """
         if node_id not in self._graph:
             raise GEXFParseError(f"Node not found: {node_id}")
 
-        reachable_ids: set[str] = set()
+        depth = max_depth or None
+        filters = (edge_filters, node_filters)
 
         if self._graph.is_directed():
+            found = np.empty(0, dtype=np.int32)
             if direction in ("forward", "both"):
-                if max_depth:
-                    # Use BFS with depth limit
-                    reachable_ids.update(
-                        nx.single_source_shortest_path_length(
-                            self._graph, node_id, cutoff=max_depth
-                        ).keys()
-                    )
-                else:
-                    reachable_ids.update(nx.descendants(self._graph, node_id))
-
+                found = np.union1d(found, self._bfs_from(node_id, "out", depth, *filters))
             if direction in ("backward", "both"):
-                if max_depth:
-                    reversed_graph = self._graph.reverse()
-                    reachable_ids.update(
-                        nx.single_source_shortest_path_length(
-                            reversed_graph, node_id, cutoff=max_depth
-                        ).keys()
-                    )
-                else:
-                    reachable_ids.update(nx.ancestors(self._graph, node_id))
+                found = np.union1d(found, self._bfs_from(node_id, "in", depth, *filters))
         else:
-            # For undirected graphs, use connected component
-            if max_depth:
-                reachable_ids.update(
-                    nx.single_source_shortest_path_length(
-                        self._graph, node_id, cutoff=max_depth
-                    ).keys()
-                )
-            else:
-                reachable_ids.update(nx.node_connected_component(self._graph, node_id))
+            # For undirected graphs, this is the connected component
+            found = self._bfs_from(node_id, "all", depth, *filters)
 
-        reachable_ids.discard(node_id)
-        return [self.get_node(nid) for nid in sorted(reachable_ids) if self.get_node(nid)]
+        return NodeSet(self, found)
 
-    def common_neighbors(self, node1: str, node2: str) -> list[Node]:
+    @traced
+    def common_neighbors(self, node1: str, node2: str) -> NodeSet:
         """Find nodes that are neighbors of both given nodes.
 
         For directed graphs, considers both predecessors and successors.
@@ -456,27 +854,88 @@ class GEXFGraph:
             node2: Second node ID.
 
         Returns:
-            List of common neighbor nodes.
+            Lazy set of common neighbor nodes.
         """
         if node1 not in self._graph:
             raise GEXFParseError(f"Node not found: {node1}")
         if node2 not in self._graph:
             raise GEXFParseError(f"Node not found: {node2}")
 
+        adj = self.adjacency
+        i, j = adj.index_of(node1), adj.index_of(node2)
+
         if self._graph.is_directed():
             # For directed graphs, get both predecessors and successors
-            neighbors1 = set(self._graph.predecessors(node1)) | set(self._graph.successors(node1))
-            neighbors2 = set(self._graph.predecessors(node2)) | set(self._graph.successors(node2))
-            common = neighbors1 & neighbors2
+            neighbors1 = np.union1d(adj.neighbors(i), adj.reverse.neighbors(i))
+            neighbors2 = np.union1d(adj.neighbors(j), adj.reverse.neighbors(j))
+            common = np.intersect1d(neighbors1, neighbors2)
+        else:
+            common = np.intersect1d(adj.neighbors(i), adj.neighbors(j))
+            common = common[(common != i) & (common != j)]
+
+        return NodeSet(self, common)
+
+    @traced
+    @memoized
+    def similarity(
+        self,
+        metric: SimilarityMetric = SimilarityMetric.COMMON_NEIGHBORS,
+        pairs: list[tuple[str, str]] | None = None,
+        top_k: int | None = None,
+        limit: int | None = None,
+        exclude_edges: bool = False,
+    ) -> SimilarityResult:
+        """Score the similarity of many node pairs at once.
+
+        Neighbors are predecessors and successors combined, as in
+        ``common_neighbors``. Scores come from sparse matrix products.
+
+        Args:
+            metric: Similarity metric to compute.
+            pairs: Explicit (node1, node2) pairs to score, in order. If not
+                given, every pair sharing at least one neighbor is scored.
+            top_k: Keep only the k most similar nodes for each node.
+            limit: Keep only the best ``limit`` pairs overall.
+            exclude_edges: Skip pairs that are already directly connected.
+
+        Returns:
+            SimilarityResult with (node1, node2, score) triples.
+
+        Raises:
+            GEXFParseError: If a node in ``pairs`` is not found.
+        """
+        adj = self.adjacency
+        if self._neighbor_matrix is None:
+            self._neighbor_matrix = neighbor_matrix(adj)
+        matrix = self._neighbor_matrix
+
+        if pairs is not None:
+            missing = sorted({n for pair in pairs for n in pair if n not in self._graph})
+            if missing:
+                raise GEXFParseError(f"Nodes not found: {', '.join(missing)}")
+            rows = adj.indices_of(u for u, _ in pairs)
+            cols = adj.indices_of(v for _, v in pairs)
+            scores = pair_scores(matrix, metric, rows, cols)
         else:
-            common = set(nx.common_neighbors(self._graph, node1, node2))
+            rows, cols, scores = top_pairs(
+                matrix, metric, k=top_k, limit=limit, exclude_edges=exclude_edges
+            )
 
-        return [self.get_node(nid) for nid in sorted(common) if self.get_node(nid)]
+        node_ids = adj.node_ids
+        return SimilarityResult(
+            metric=metric.value,
+            pairs=[
+                (node_ids[u], node_ids[v], score)
+                for u, v, score in zip(rows.tolist(), cols.tolist(), scores.tolist())
+            ],
+        )
 
     # =========================================================================
     # Graph Analysis Methods
     # =========================================================================
 
+    @traced
+    @memoized
     def get_stats(self) -> GraphStats:
         """Get comprehensive statistics about the graph.
 
@@ -489,9 +948,8 @@ class GEXFGraph:
         is_directed = self._graph.is_directed()
         density = nx.density(self._graph)
 
-        # Calculate average degree
-        degrees = [d for _, d in self._graph.degree()]
-        avg_degree = sum(degrees) / n if n > 0 else 0
+        # Every edge adds one to the degree of each endpoint (two for a loop)
+        avg_degree = 2 * m / n if n > 0 else 0
 
         # Clustering coefficient
         try:
@@ -499,13 +957,9 @@ class GEXFGraph:
         except Exception:
             avg_clustering = 0.0
 
-        # Connected components
-        if is_directed:
-            is_connected = nx.is_weakly_connected(self._graph)
-            num_components = nx.number_weakly_connected_components(self._graph)
-        else:
-            is_connected = nx.is_connected(self._graph) if n > 0 else True
-            num_components = nx.number_connected_components(self._graph)
+        # Connected components (weakly connected for directed graphs)
+        num_components = self.adjacency.components()[0]
+        is_connected = num_components <= 1
 
         # Cycle detection
         try:
@@ -551,6 +1005,8 @@ class GEXFGraph:
             avg_path_length=avg_path_length,
         )
 
+    @traced
+    @memoized
     def get_centrality(self, centrality_type: CentralityType) -> CentralityResult:
         """Calculate centrality scores for all nodes.
 
@@ -561,27 +1017,97 @@ class GEXFGraph:
             CentralityResult with scores for each node.
         """
         if centrality_type == CentralityType.DEGREE:
-            scores = dict(nx.degree_centrality(self._graph))
-        elif centrality_type == CentralityType.BETWEENNESS:
-            scores = dict(nx.betweenness_centrality(self._graph))
+            # Same normalisation as nx.degree_centrality, without the dict
+            n = self._graph.number_of_nodes()
+            values = np.fromiter(
+                (d for _, d in self._graph.degree()), dtype=np.float64, count=n
+            )
+            if n > 1:
+                values /= n - 1
+            else:
+                values[:] = 1.0
+            return CentralityResult(
+                centrality_type.value, node_ids=self.node_ids, values=values
+            )
+
+        if centrality_type == CentralityType.BETWEENNESS:
+            scores = nx.betweenness_centrality(self._graph)
         elif centrality_type == CentralityType.CLOSENESS:
-            scores = dict(nx.closeness_centrality(self._graph))
+            scores = nx.closeness_centrality(self._graph)
         elif centrality_type == CentralityType.PAGERANK:
-            scores = dict(nx.pagerank(self._graph))
+            scores = nx.pagerank(self._graph)
         elif centrality_type == CentralityType.EIGENVECTOR:
             try:
-                scores = dict(nx.eigenvector_centrality(self._graph, max_iter=1000))
+                scores = nx.eigenvector_centrality(self._graph, max_iter=1000)
             except nx.PowerIterationFailedConvergence:
                 # Fall back to numpy-based calculation
-                scores = dict(nx.eigenvector_centrality_numpy(self._graph))
+                scores = nx.eigenvector_centrality_numpy(self._graph)
         else:
             raise ValueError(f"Unknown centrality type: {centrality_type}")
 
+        # Align with the interned ID table, which follows graph order
+        values = np.fromiter(
+            (scores[n] for n in self._graph), dtype=np.float64, count=len(scores)
+        )
         return CentralityResult(
-            centrality_type=centrality_type.value,
-            scores=scores,
+            centrality_type.value, node_ids=self.node_ids, values=values
         )
 
+    @traced
+    @memoized
+    def personalized_pagerank(
+        self,
+        seeds: list[str],
+        alpha: float = 0.85,
+        tolerance: float = 1e-6,
+        weighted: bool = False,
+    ) -> CentralityResult:
+        """Rank nodes by relevance to a seed set with local personalized PageRank.
+
+        Uses forward push, so only the neighborhood that receives meaningful
+        probability mass is visited.
+
+        Args:
+            seeds: Node IDs the random walk restarts from.
+            alpha: Damping factor (probability of following an edge).
+            tolerance: Residual tolerance per out-edge; smaller is more accurate.
+            weighted: Whether to split mass by edge weight.
+
+        Returns:
+            CentralityResult with scores for every node reached.
+
+        Raises:
+            GEXFParseError: If a seed node is not found, ``alpha`` is not
+                strictly between 0 and 1, or ``tolerance`` is not positive.
+        """
+        if not 0.0 < alpha < 1.0:
+            raise GEXFParseError(f"alpha must be between 0 and 1 (exclusive), got {alpha}")
+        if not tolerance > 0.0:
+            raise GEXFParseError(f"tolerance must be positive, got {tolerance}")
+        if not seeds:
+            raise GEXFParseError("At least one seed node is required")
+        missing = [n for n in seeds if n not in self._graph]
+        if missing:
+            raise GEXFParseError(f"Nodes not found: {', '.join(missing)}")
+
+        adj = self.adjacency
+        estimate = forward_push(
+            adj,
+            [adj.index_of(n) for n in seeds],
+            alpha=alpha,
+            tolerance=tolerance,
+            weights=self._edge_weights() if weighted else None,
+        )
+
+        rows = np.fromiter(estimate.keys(), dtype=np.int64, count=len(estimate))
+        return CentralityResult(
+            "personalized_pagerank",
+            node_ids=[adj.node_ids[i] for i in rows.tolist()],
+            values=np.fromiter(estimate.values(), dtype=np.float64, count=len(estimate)),
+        )
+
+    @traced
+    @memoized
     def get_components(self, component_type: str = "connected") -> ComponentInfo:
         """Get information about connected components.
 
@@ -591,16 +1117,22 @@ class GEXFGraph:
         Returns:
             ComponentInfo object.
         """
-        if self._graph.is_directed():
-            if component_type == "strongly":
-                components_gen = nx.strongly_connected_components(self._graph)
-            else:  # weakly or connected
-                components_gen = nx.weakly_connected_components(self._graph)
-        else:
-            components_gen = nx.connected_components(self._graph)
-
-        components = [sorted(c) for c in components_gen]
-        components.sort(key=len, reverse=True)
+        strong = self._graph.is_directed() and component_type == "strongly"
+        indexed = self._sidecar.components(strong) if self._sidecar is not None else None
+        count, labels = indexed or self.adjacency.components(strong=strong)
+
+        # Group node indices by component, in ID order within each group
+        by_id = np.argsort(self.node_values("id"), kind="stable")
+        grouped = by_id[np.argsort(labels[by_id], kind="stable")]
+        counts = np.bincount(labels, minlength=count)
+        bounds = np.concatenate([[0], np.cumsum(counts)]).tolist()
+
+        # Largest first; equal sizes keep the order of their first node
+        node_ids = self.node_ids
+        components = [
+            [node_ids[i] for i in grouped[bounds[c]:bounds[c + 1]].tolist()]
+            for c in np.argsort(-counts, kind="stable").tolist()
+        ]
 
         sizes = [len(c) for c in components]
 
@@ -611,11 +1143,15 @@ class GEXFGraph:
             components=components,
         )
 
-    def get_degree(self, node_id: str | None = None) -> dict[str, Any]:
+    @traced
+    @memoized
+    def get_degree(self, node_id: str | None = None, limit: int | None = None) -> dict[str, Any]:
         """Get degree information for nodes.
 
         Args:
             node_id: Specific node ID or None for all nodes.
+            limit: With no ``node_id``, list only this many nodes with the
+                highest degree (default: all).
 
         Returns:
             Dictionary with degree information.
@@ -637,36 +1173,57 @@ class GEXFGraph:
                     "degree": self._graph.degree(node_id),
                 }
         else:
-            # Return top nodes by degree
+            # Degrees of every node from the CSR row lengths, highest first
+            adj = self.adjacency
+            node_ids = self.node_ids
             if self._graph.is_directed():
+                out_degree = adj.degrees()
+                in_degree = adj.reverse.degrees()
+                total = in_degree + out_degree
+                order = np.argsort(-total, kind="stable")[:limit]
                 degrees = [
                     {
-                        "node": n,
-                        "in_degree": self._graph.in_degree(n),
-                        "out_degree": self._graph.out_degree(n),
-                        "total_degree": d,
+                        "node": node_ids[i],
+                        "in_degree": in_deg,
+                        "out_degree": out_deg,
+                        "total_degree": total_deg,
                     }
-                    for n, d in self._graph.degree()
+                    for i, in_deg, out_deg, total_deg in zip(
+                        order.tolist(),
+                        in_degree[order].tolist(),
+                        out_degree[order].tolist(),
+                        total[order].tolist(),
+                    )
                 ]
-                degrees.sort(key=lambda x: x["total_degree"], reverse=True)
             else:
+                # Self-loops are stored once but count twice
+                total = adj.degrees() + adj.self_loops()
+                order = np.argsort(-total, kind="stable")[:limit]
                 degrees = [
-                    {"node": n, "degree": d}
-                    for n, d in self._graph.degree()
+                    {"node": node_ids[i], "degree": d}
+                    for i, d in zip(order.tolist(), total[order].tolist())
                 ]
-                degrees.sort(key=lambda x: x["degree"], reverse=True)
             return {"degrees": degrees}
 
     # =========================================================================
     # Subgraph Methods
     # =========================================================================
 
-    def ego_graph(self, node_id: str, radius: int = 1) -> "GEXFGraph":
+    @traced
+    def ego_graph(
+        self,
+        node_id: str,
+        radius: int = 1,
+        edge_filters: list[tuple[str, str]] | None = None,
+        node_filters: list[tuple[str, str]] | None = None,
+    ) -> "GEXFGraph":
         """Get the ego graph (neighborhood) around a node.
 
         Args:
             node_id: Center node ID.
             radius: Number of hops to include.
+            edge_filters: Only follow and keep edges matching these (key, value) tuples.
+            node_filters: Only include nodes matching these (key, value) tuples.
 
         Returns:
             New GEXFGraph containing the ego subgraph.
@@ -677,9 +1234,37 @@ class GEXFGraph:
         if node_id not in self._graph:
             raise GEXFParseError(f"Node not found: {node_id}")
 
-        ego = nx.ego_graph(self._graph, node_id, radius=radius)
-        return self._create_subgraph(ego)
+        # Like nx.ego_graph, directed graphs only follow outgoing edges
+        adj = self.adjacency
+        edge_mask = self._edge_mask(edge_filters)
+        dist = bfs(
+            adj,
+            [adj.index_of(node_id)],
+            direction="out",
+            max_depth=radius,
+            edge_mask=edge_mask,
+            node_mask=self._node_mask(node_filters),
+        )
+        members = {adj.node_ids[i] for i in visited(dist)}
 
+        if edge_mask is None:
+            return self._create_subgraph(self._graph.subgraph(members).copy())
+
+        # Keep only matching edges between the members
+        if self._graph.is_multigraph():
+            edge_view = self._graph.edges(keys=True)
+        else:
+            edge_view = self._graph.edges()
+        edges = [
+            edge
+            for edge, keep in zip(edge_view, edge_mask)
+            if keep and edge[0] in members and edge[1] in members
+        ]
+        sub = self._graph.edge_subgraph(edges).copy()
+        sub.add_nodes_from((n, self._graph.nodes[n]) for n in members)
+        return self._create_subgraph(sub)
+
+    @traced
     def subgraph(self, node_ids: list[str]) -> "GEXFGraph":
         """Extract a subgraph containing only specified nodes.
 
@@ -711,6 +1296,7 @@ class GEXFGraph:
             description=f"Subgraph of {self._metadata.description or self.file_path.name}",
             mode=self._metadata.mode,
             default_edge_type=self._metadata.default_edge_type,
+            time_format=self._metadata.time_format,
             version=self._metadata.version,
             node_count=subgraph.number_of_nodes(),
             edge_count=subgraph.number_of_edges(),
@@ -718,8 +1304,150 @@ class GEXFGraph:
         wrapper._node_attr_keys = set()
         wrapper._edge_attr_keys = set()
         wrapper._collect_attribute_keys()
+        wrapper._source_stat = None
+        wrapper._sidecar = None
+        wrapper._memo = ResultCache(self._memo.max_size)
+        wrapper._reset_caches()
         return wrapper
 
+    # =========================================================================
+    # Time Slicing Methods
+    # =========================================================================
+
+    @traced
+    def at(self, time: str | float) -> "GEXFGraph":
+        """Get a dynamic graph as it was at one point in time.
+
+        Args:
+            time: Time in the graph's ``timeformat`` (a number, or an ISO
+                8601 date for ``date``/``dateTime`` graphs).
+
+        Returns:
+            Subgraph of the nodes alive at ``time`` and the edges alive at
+            ``time`` between them.
+
+        Raises:
+            GEXFParseError: If the graph is not dynamic or the time is invalid.
+        """
+        nodes, edges = self._lifetime_index()
+        moment = parse_time(time, self._metadata.time_format)
+        return self._time_slice(nodes.at(moment), edges.at(moment))
+
+    @traced
+    def between(self, start: str | float, end: str | float) -> "GEXFGraph":
+        """Get everything that existed at some point in a time range.
+
+        Args:
+            start: Start of the range (inclusive), as for ``at``.
+            end: End of the range (inclusive).
+
+        Returns:
+            Subgraph of the nodes alive at any time in the range, and the
+            edges between them alive at any time in the range.
+
+        Raises:
+            GEXFParseError: If the graph is not dynamic or a time is invalid.
+        """
+        nodes, edges = self._lifetime_index()
+        time_format = self._metadata.time_format
+        low, high = parse_time(start, time_format), parse_time(end, time_format)
+        return self._time_slice(nodes.between(low, high), edges.between(low, high))
+
+    def timeline(
+        self,
+        step: str | float,
+        metrics: Iterable[str] = METRICS,
+        start: str | float | None = None,
+        end: str | float | None = None,
+    ) -> Iterator[TimelinePoint]:
+        """Compute metrics of a dynamic graph at regular steps through time.
+
+        Each step applies only the nodes and edges that appeared or
+        disappeared since the previous one, rather than rebuilding the
+        snapshot; see ``grph.timeline``. The metrics at each step match those
+        of ``at(time)``.
+
+        Args:
+            step: Time between steps: a number, or for ``date``/``dateTime``
+                graphs a number with a unit (``s``, ``m``, ``h``, ``d``, ``w``).
+            metrics: Any of ``degree``, ``components`` and ``pagerank``.
+            start: First step (default: the earliest time in the graph).
+            end: Last possible step (default: the latest time in the graph).
+
+        Returns:
+            Iterator of one TimelinePoint per step, computed as it is consumed.
+
+        Raises:
+            GEXFParseError: If the graph is not dynamic, an argument is
+                invalid, or the graph has no times to default the range to.
+        """
+        metrics = parse_metrics(list(metrics))
+        nodes, edges = self._lifetime_index()
+        time_format = self._metadata.time_format
+        interval = parse_step(step, time_format)
+
+        bounds = np.concatenate([nodes.starts, nodes.ends, edges.starts, edges.ends])
+        bounds = bounds[np.isfinite(bounds)]
+        if (start is None or end is None) and not bounds.size:
+            raise GEXFParseError("The graph has no times; give a start and an end")
+        low = bounds.min() if start is None else parse_time(start, time_format)
+        high = bounds.max() if end is None else parse_time(end, time_format)
+
+        timeline = Timeline(
+            self.node_ids,
+            nodes,
+            edges,
+            self._edge_ends,
+            self._edge_weights(),
+            self._graph.is_directed(),
+            metrics,
+        )
+        return (
+            replace(timeline.advance(t), time=format_time(t, time_format))
+            for t in sample_times(float(low), float(high), interval)
+        )
+
+    def _lifetime_index(self) -> tuple[IntervalIndex, IntervalIndex]:
+        """Get interval indexes over node and edge lifetimes, built on first use."""
+        if self._metadata.mode != "dynamic":
+            raise GEXFParseError('Time slicing needs a dynamic graph (mode="dynamic")')
+        if self._lifetimes is None:
+            with span("interval_index"):
+                time_format = self._metadata.time_format
+                node_data = (attrs for _, attrs in self._graph.nodes(data=True))
+                edge_data = (attrs for _, _, attrs in self._edge_list())
+                self._lifetimes = (
+                    IntervalIndex(*lifetimes(node_data, time_format)),
+                    IntervalIndex(*lifetimes(edge_data, time_format)),
+                )
+                index = self.node_index
+                self._edge_ends = np.fromiter(
+                    (index[str(end)] for u, v, _ in self._edge_list() for end in (u, v)),
+                    dtype=np.int64,
+                    count=2 * len(self._edge_list()),
+                ).reshape(-1, 2)
+        return self._lifetimes
+
+    def _time_slice(self, nodes: np.ndarray, edges: np.ndarray) -> "GEXFGraph":
+        """Build the subgraph of some nodes and the edges among them.
+
+        Only the selected nodes and edges are visited, so slicing costs time
+        proportional to its result rather than to the whole graph.
+        """
+        alive = np.zeros(self._graph.number_of_nodes(), dtype=bool)
+        alive[nodes] = True
+        ends = self._edge_ends[edges]
+        edges = edges[alive[ends[:, 0]] & alive[ends[:, 1]]]
+
+        node_ids, data = self.node_ids, self._edge_list()
+        snapshot = self._graph.__class__()
+        snapshot.graph.update(self._graph.graph)
+        snapshot.add_nodes_from(
+            (node_ids[i], self._graph.nodes[node_ids[i]]) for i in nodes.tolist()
+        )
+        snapshot.add_edges_from(data[i] for i in edges.tolist())
+        return self._create_subgraph(snapshot)
+
     # =========================================================================
     # Export Methods
     # =========================================================================
@@ -732,42 +1460,156 @@ class GEXFGraph:
 
         Returns:
             String representation of the graph in the target format.
+
+        Raises:
+            ValueError: If the format is binary (use ``write_export`` instead).
         """
-        import io
-        import json
-
-        if format == ExportFormat.JSON:
-            # Export as node-link JSON
-            data = nx.node_link_data(self._graph)
-            return json.dumps(data, indent=2, default=str)
-
-        elif format == ExportFormat.GRAPHML:
-            # Export as GraphML
-            buffer = io.BytesIO()
-            nx.write_graphml(self._graph, buffer)
-            return buffer.getvalue().decode("utf-8")
-
-        elif format == ExportFormat.ADJLIST:
-            # Export as adjacency list
-            lines = []
-            for node in self._graph.nodes():
-                neighbors = list(self._graph.neighbors(node))
-                if neighbors:
-                    lines.append(f"{node} {' '.join(str(n) for n in neighbors)}")
-                else:
-                    lines.append(str(node))
-            return "\n".join(lines)
-
-        elif format == ExportFormat.EDGELIST:
-            # Export as edge list
-            lines = []
-            for source, target, data in self._graph.edges(data=True):
-                weight = data.get("weight", "")
-                if weight:
-                    lines.append(f"{source} {target} {weight}")
-                else:
-                    lines.append(f"{source} {target}")
-            return "\n".join(lines)
+        if format.is_binary:
+            raise ValueError(f"{format.value} is a binary format; use write_export")
+        buffer = io.BytesIO()
+        self.write_export(format, buffer)
+        return buffer.getvalue().decode("utf-8")
+
+    @traced
+    def write_gexf(self, sink: BinaryIO) -> None:
+        """Stream the graph as GEXF, copying its elements from the source file.
+
+        The source file's header, metadata and attribute declarations are
+        kept, and each node or edge present in this graph is copied byte for
+        byte, so subgraphs keep their original attribute types and values.
+
+        Args:
+            sink: Binary stream to write to, such as an open file.
 
+        Raises:
+            GEXFParseError: If the source file can no longer be read.
+        """
+        graph = self._graph
+
+        if graph.is_multigraph():
+            def keep_edge(source: str, target: str, edge_id: str | None) -> bool:
+                if edge_id is None:
+                    return graph.has_edge(source, target)
+                return graph.has_edge(source, target, key=edge_id)
+        else:
+            def keep_edge(source: str, target: str, edge_id: str | None) -> bool:
+                return graph.has_edge(source, target)
+
+        try:
+            write_subgraph(
+                self.file_path,
+                sink,
+                keep_node=graph.__contains__,
+                keep_edge=keep_edge,
+                node_count=graph.number_of_nodes(),
+                edge_count=graph.number_of_edges(),
+            )
+        except (OSError, ExpatError) as e:
+            raise GEXFParseError(f"Failed to copy from {self.file_path}: {e}") from e
+
+    @traced
+    def write_export(self, format: ExportFormat, sink: BinaryIO) -> None:
+        """Stream the graph in a different format to a binary file-like object.
+
+        Text formats are written incrementally in bounded chunks. Array
+        formats (npz, mtx) are written from the CSR adjacency, with edge
+        weights defaulting to 1.
+
+        Args:
+            format: Target export format.
+            sink: Binary stream to write to, such as an open file or stdout.
+        """
+        if format in EXPORTERS:
+            EXPORTERS[format](self._graph, sink)
+        elif format in ARRAY_EXPORTERS:
+            ARRAY_EXPORTERS[format](self.adjacency, self._edge_weights(), sink)
+        elif format == ExportFormat.COLUMNS:
+            write_columns(self._graph, self.adjacency, sink)
         else:
             raise ValueError(f"Unsupported export format: {format}")
+
+
+class _GEXFReader(nx.readwrite.gexf.GEXFReader):
+    """NetworkX's GEXF reader, keeping time values as written.
+
+    NetworkX converts ``start``/``end`` and spell bounds with the graph's
+    ``timeformat``, which fails for ``dateTime``, for a ``start`` without a
+    ``timeformat`` and for open numeric spells, and turns open date spells
+    into the string "None". Here bounds stay strings (None when absent) and
+    are interpreted by ``grph.intervals``.
+    """
+
+    def make_graph(self, graph_xml):  # type: ignore[no-untyped-def]
+        graph_xml.attrib.pop("timeformat", None)
+        self.python_type = {**self.python_type, None: lambda value: value}
+        return super().make_graph(graph_xml)
+
+
+def _read_gexf(stream: BinaryIO) -> nx.Graph:
+    """Read a GEXF document into a NetworkX graph, as ``nx.read_gexf`` does."""
+    return _GEXFReader(node_type=None, version="1.2draft")(stream)
+
+
+def _share_node_ids(graph: nx.Graph) -> None:
+    """Make every adjacency key the same string object as its node ID.
+
+    ``nx.read_gexf`` keys each neighbor dict by the ``source``/``target``
+    string of the edge element, so an ID is stored again for every incident
+    edge. Rebuilding the neighbor dicts around the node table keeps one copy
+    per node. The graph itself is unchanged.
+    """
+    ids = {node: node for node in graph}
+    adjacencies = [graph._adj]
+    if graph.is_directed():
+        adjacencies.append(graph._pred)
+    for adjacency in adjacencies:
+        for node, neighbors in adjacency.items():
+            adjacency[node] = {ids[v]: data for v, data in neighbors.items()}
+
+
+def _make_edge(source: Any, target: Any, attrs: dict[str, Any]) -> Edge:
+    """Build an Edge from NetworkX edge data."""
+    edge_id = attrs.get("id")
+    weight = attrs.get("weight")
+    return Edge(
+        id=str(edge_id) if edge_id else None,
+        source=str(source),
+        target=str(target),
+        weight=float(weight) if weight is not None else None,
+        edge_type=attrs.get("type"),
+        label=attrs.get("label"),
+        attributes=AttributeView(attrs, EDGE_FIELDS),
+    )
+
+
+def _string_column(values: list[Any]) -> np.ndarray:
+    """Convert attribute values to an object array of strings (None if missing).
+
+    Values are compared as strings, matching the CLI's key=value filters.
+    """
+    column = np.empty(len(values), dtype=object)
+    column[:] = [None if v is None else str(v) for v in values]
+    return column
+
+
+def _gather_rows(key: str, rows: np.ndarray, cached: dict[str, np.ndarray], size: int) -> bool:
+    """Whether to read some rows of a column one by one rather than build it whole.
+
+    Past half the rows, building the column once is cheaper.
+    """
+    return key not in cached and len(rows) * 2 < size
+
+
+def _edge_value(key: str, item: tuple[Any, Any, dict[str, Any]]) -> Any:
+    """Get a field or attribute of one edge, converted as in ``Edge``."""
+    source, target, attrs = item
+    if key == "source":
+        return str(source)
+    if key == "target":
+        return str(target)
+    if key == "id":
+        return str(attrs["id"]) if attrs.get("id") else None
+    if key == "weight":
+        return None if attrs.get("weight") is None else float(attrs["weight"])
+    return attrs.get(key)
+
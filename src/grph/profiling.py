@@ -0,0 +1,185 @@
+"""Timed spans around the phases of a command, with a hook API.
+
+Code marks a phase with ``span("name")`` (or the ``traced`` decorator).
+Nothing is measured unless a hook is registered with ``add_span_hook``, so
+spans cost a single check on the normal path. Hooks receive one ``Span`` per
+finished phase, innermost first, and can forward them to any metrics
+system; ``Profiler`` is a hook that keeps them for a report.
+
+Peak memory is recorded only while ``tracemalloc`` is tracing.
+"""
+
+import cProfile
+import functools
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+SpanHook = Callable[["Span"], None]
+
+_hooks: list[SpanHook] = []
+_local = threading.local()
+
+
+@dataclass
+class Span:
+    """A finished, timed phase.
+
+    Attributes:
+        name: Phase name.
+        depth: Nesting level (0 for a top-level span).
+        start: ``time.perf_counter()`` value when the span started.
+        wall_time: Elapsed time in seconds.
+        cpu_time: CPU time of the process in seconds.
+        peak_memory: Peak traced memory during the span, in bytes above the
+            level when it started, or None when ``tracemalloc`` was not
+            tracing.
+    """
+
+    name: str
+    depth: int
+    start: float
+    wall_time: float
+    cpu_time: float
+    peak_memory: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "name": self.name,
+            "depth": self.depth,
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "peak_memory": self.peak_memory,
+        }
+
+
+def add_span_hook(hook: SpanHook) -> None:
+    """Register a callback that receives every finished span."""
+    _hooks.append(hook)
+
+
+def remove_span_hook(hook: SpanHook) -> None:
+    """Unregister a callback added with ``add_span_hook``."""
+    _hooks.remove(hook)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Time the enclosed block as a phase called ``name``."""
+    if not _hooks:
+        yield
+        return
+
+    stack = _stack()
+    tracing = tracemalloc.is_tracing()
+    base = 0
+    if tracing:
+        base, peak = tracemalloc.get_traced_memory()
+        # Each frame keeps the peak seen before its children reset it
+        if stack:
+            stack[-1][0] = max(stack[-1][0], peak)
+        tracemalloc.reset_peak()
+    frame = [0]
+    stack.append(frame)
+    start, cpu_start = time.perf_counter(), time.process_time()
+    try:
+        yield
+    finally:
+        wall_time = time.perf_counter() - start
+        cpu_time = time.process_time() - cpu_start
+        stack.pop()
+        peak = None
+        if tracing:
+            peak = max(tracemalloc.get_traced_memory()[1], frame[0])
+            if stack:
+                stack[-1][0] = max(stack[-1][0], peak)
+            peak -= base
+        finished = Span(name, len(stack), start, wall_time, cpu_time, peak)
+        for hook in list(_hooks):
+            hook(finished)
+
+
+def traced(func: F) -> F:
+    """Decorate a function so that each call is timed as a span."""
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not _hooks:
+            return func(*args, **kwargs)
+        with span(name):
+            return func(*args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+class Profiler:
+    """Collect spans while active, optionally tracing memory.
+
+    Example:
+        >>> with Profiler() as profiler:
+        ...     graph = GEXFGraph("graph.gexf")
+        >>> [s.name for s in profiler.spans]
+        ['read_gexf', 'metadata', 'attribute_keys', 'intern']
+    """
+
+    def __init__(self, memory: bool = True):
+        """Create a profiler.
+
+        Args:
+            memory: Trace allocations with ``tracemalloc`` to record the
+                peak memory of each span. This slows allocation-heavy code.
+        """
+        self.memory = memory
+        self._spans: list[Span] = []
+        self._started_tracing = False
+
+    @property
+    def spans(self) -> list[Span]:
+        """Finished spans in the order they started."""
+        return sorted(self._spans, key=lambda s: s.start)
+
+    def __enter__(self) -> "Profiler":
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        add_span_hook(self._record)
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        remove_span_hook(self._record)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _record(self, finished: Span) -> None:
+        self._spans.append(finished)
+
+
+@contextmanager
+def cprofile(path: str | Path) -> Iterator[cProfile.Profile]:
+    """Run the enclosed block under ``cProfile`` and dump the stats to ``path``.
+
+    The file can be read with ``pstats`` or viewers such as snakeviz.
+    """
+    profile = cProfile.Profile()
+    profile.enable()
+    try:
+        yield profile
+    finally:
+        profile.disable()
+        profile.dump_stats(str(path))
+
+
+def _stack() -> list[list[int]]:
+    """Get the open spans of the current thread."""
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
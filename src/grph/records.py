@@ -0,0 +1,124 @@
+"""Streaming record output for nodes and edges.
+
+Records are written one per line as they are produced, so output starts
+before the last result is computed and memory use does not depend on the
+number of results. Tabular formats (TSV, CSV) need their columns up front;
+they are taken from the attribute keys the graph collected while loading.
+"""
+
+import csv
+import json
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterable
+
+from .exporters import ChunkedWriter
+from .models import Edge, Node, RecordFormat, TimelinePoint
+
+if TYPE_CHECKING:
+    from .frames import EdgeFrame, NodeFrame
+
+# Approximate number of characters written per batch; small enough that the
+# first records of a long stream appear immediately
+BATCH_SIZE = 1 << 13
+
+# Rows rendered at once when writing a frame
+FRAME_BATCH_ROWS = 1 << 12
+
+NODE_COLUMNS = ["id", "label"]
+EDGE_COLUMNS = ["id", "source", "target", "weight", "type", "label"]
+
+
+def write_records(
+    records: Iterable[Node | Edge | TimelinePoint],
+    fmt: RecordFormat,
+    columns: list[str],
+    sink: BinaryIO,
+) -> int:
+    """Write nodes, edges or timeline points to a binary sink, one per line.
+
+    Args:
+        records: Nodes, edges or timeline points, consumed lazily.
+        fmt: Output format.
+        columns: Column names for TSV and CSV output: the standard fields
+            followed by attribute keys. Ignored for NDJSON.
+        sink: Binary stream to write to.
+
+    Returns:
+        Number of records written.
+    """
+    written = 0
+    with ChunkedWriter(sink, chunk_size=BATCH_SIZE) as out:
+        if fmt == RecordFormat.NDJSON:
+            for record in records:
+                out.write(json.dumps(record.to_dict(), default=str))
+                out.write("\n")
+                written += 1
+        else:
+            delimiter = "\t" if fmt == RecordFormat.TSV else ","
+            writer = csv.writer(out, delimiter=delimiter, lineterminator="\n")
+            writer.writerow(columns)
+            for record in records:
+                row = _flatten(record.to_dict())
+                writer.writerow([_cell(row.get(column)) for column in columns])
+                written += 1
+    return written
+
+
+def write_frame(frame: "NodeFrame | EdgeFrame", fmt: RecordFormat, sink: BinaryIO) -> int:
+    """Write a node or edge frame to a binary sink, one record per line.
+
+    The output is the same as ``write_records`` over the frame's nodes or
+    edges, but each batch of rows is rendered from whole columns instead of
+    one object at a time.
+
+    Args:
+        frame: Rows to write, in frame order.
+        fmt: Output format.
+        sink: Binary stream to write to.
+
+    Returns:
+        Number of records written.
+    """
+    columns = frame.columns
+    with ChunkedWriter(sink, chunk_size=BATCH_SIZE) as out:
+        if fmt == RecordFormat.NDJSON:
+            for start in range(0, len(frame), FRAME_BATCH_ROWS):
+                for record in frame[start:start + FRAME_BATCH_ROWS].iter_dicts():
+                    out.write(json.dumps(record, default=str))
+                    out.write("\n")
+        else:
+            delimiter = "\t" if fmt == RecordFormat.TSV else ","
+            writer = csv.writer(out, delimiter=delimiter, lineterminator="\n")
+            writer.writerow(columns)
+            for start in range(0, len(frame), FRAME_BATCH_ROWS):
+                batch = frame[start:start + FRAME_BATCH_ROWS]
+                cells = [[_cell(v) for v in batch.values(c).tolist()] for c in columns]
+                writer.writerows(zip(*cells))
+    return len(frame)
+
+
+def node_columns(attribute_keys: Iterable[str]) -> list[str]:
+    """Columns for node records: standard fields, then attributes."""
+    return NODE_COLUMNS + [k for k in attribute_keys if k not in NODE_COLUMNS]
+
+
+def edge_columns(attribute_keys: Iterable[str]) -> list[str]:
+    """Columns for edge records: standard fields, then attributes."""
+    return EDGE_COLUMNS + [k for k in attribute_keys if k not in EDGE_COLUMNS]
+
+
+def _flatten(record: dict[str, Any]) -> dict[str, Any]:
+    """Merge a record's attributes into its top-level fields.
+
+    Standard fields win if an attribute has the same name.
+    """
+    attributes = record.pop("attributes", {})
+    return {**attributes, **record}
+
+
+def _cell(value: Any) -> str:
+    """Render one TSV/CSV cell (missing values are empty)."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
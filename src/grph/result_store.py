@@ -0,0 +1,303 @@
+"""Persistent, content-addressed cache of command results.
+
+Results are keyed by a hash of the input file's contents, the command, its
+arguments and the grph version, so an unchanged file hits the cache from any
+path or checkout, and upgrading grph never serves stale results. Entries are
+files in the cache directory, evicted least recently used first once their
+total size exceeds the budget.
+
+Each entry is a small binary file: a magic line, a JSON header and a
+payload. Centrality scores are stored as raw float64 columns with the node
+IDs joined by NUL (which cannot occur in XML), so loading a hit is a couple
+of buffer copies. Other results are stored as JSON.
+
+The directory is ``$GRPH_CACHE_DIR``, else ``$XDG_CACHE_HOME/grph``, else
+``~/.cache/grph``. The budget is ``$GRPH_CACHE_SIZE`` bytes (default 1 GiB,
+also used if the variable is not a whole number of bytes).
+"""
+
+import hashlib
+import json
+import os
+import struct
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from . import __version__
+from .models import CentralityResult, ComponentInfo, GraphStats
+
+# Default budget for all entries together, in bytes
+DEFAULT_MAX_SIZE = 1 << 30
+
+# Bytes hashed per read when fingerprinting an input file
+HASH_CHUNK = 1 << 20
+
+MAGIC = b"GRPH-RESULT 1\n"
+SUFFIX = ".bin"
+
+_HEADER = struct.Struct("<I")
+
+
+@dataclass
+class StoreStats:
+    """Occupancy of the result store.
+
+    Attributes:
+        path: Cache directory.
+        entries: Number of stored results.
+        size: Total size of stored results in bytes.
+        max_size: Budget in bytes.
+        commands: Number of stored results per command.
+    """
+
+    path: str
+    entries: int
+    size: int
+    max_size: int
+    commands: dict[str, int]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
+
+
+class ResultStore:
+    """Command results cached on disk, keyed by input content.
+
+    Failures to read or write the cache never fail a command: a damaged
+    entry is dropped and treated as a miss, and a result that cannot be
+    written is simply not cached.
+    """
+
+    def __init__(self, path: str | Path, max_size: int = DEFAULT_MAX_SIZE):
+        """Open a store, creating its directory on first write.
+
+        Args:
+            path: Cache directory.
+            max_size: Budget for all entries together, in bytes.
+        """
+        self.path = Path(path)
+        self.max_size = max_size
+
+    @classmethod
+    def default(cls) -> "ResultStore":
+        """Open the store configured by the environment.
+
+        Like a damaged entry, a ``GRPH_CACHE_SIZE`` that is not a
+        non-negative number of bytes never fails a command; the default
+        budget is used instead.
+        """
+        path = os.environ.get("GRPH_CACHE_DIR")
+        if not path:
+            base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+            path = Path(base) / "grph"
+        try:
+            max_size = int(os.environ.get("GRPH_CACHE_SIZE", DEFAULT_MAX_SIZE))
+        except ValueError:
+            max_size = DEFAULT_MAX_SIZE
+        return cls(path, max_size if max_size >= 0 else DEFAULT_MAX_SIZE)
+
+    def key(self, file_path: str | Path, command: str, arguments: dict[str, Any]) -> str:
+        """Compute the entry name for a command run on a file.
+
+        Returns:
+            ``<command>-<hash>``, where the hash covers the file contents,
+            the arguments and the grph version.
+        """
+        document = json.dumps(
+            [self.file_hash(file_path), command, arguments, __version__],
+            sort_keys=True,
+            default=str,
+        )
+        return f"{command}-{hashlib.blake2b(document.encode(), digest_size=20).hexdigest()}"
+
+    def file_hash(self, file_path: str | Path) -> str:
+        """Hash a file's contents, reusing the last hash while it is unchanged.
+
+        The hash is remembered per path along with the file's size,
+        modification time and inode, so only new or modified files are read.
+        """
+        path = Path(file_path).resolve()
+        stat = path.stat()
+        signature = [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+        name = hashlib.blake2b(str(path).encode(), digest_size=16).hexdigest()
+        record = self.path / "files" / f"{name}.json"
+        try:
+            known = json.loads(record.read_text())
+            if known["signature"] == signature:
+                return known["hash"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        digest = hashlib.blake2b(digest_size=20)
+        with open(path, "rb") as f:
+            while chunk := f.read(HASH_CHUNK):
+                digest.update(chunk)
+        content_hash = digest.hexdigest()
+        try:
+            document = {"signature": signature, "hash": content_hash}
+            _write_atomic(record, json.dumps(document).encode())
+        except OSError:
+            pass
+        return content_hash
+
+    def get(self, key: str) -> Any:
+        """Load a stored result, or None on a miss."""
+        entry = self._entry(key)
+        try:
+            data = entry.read_bytes()
+        except OSError:
+            return None
+        try:
+            result = decode(data)
+        except (ValueError, KeyError, TypeError, struct.error):
+            entry.unlink(missing_ok=True)
+            return None
+        try:
+            # Mark as recently used for eviction
+            os.utime(entry)
+        except OSError:
+            pass
+        return result
+
+    def put(self, key: str, result: Any) -> bool:
+        """Store a result, then evict old entries beyond the budget.
+
+        Returns:
+            True if the result was stored.
+        """
+        try:
+            data = encode(result)
+        except TypeError:
+            return False
+        if len(data) > self.max_size:
+            return False
+        try:
+            _write_atomic(self._entry(key), data)
+        except OSError:
+            return False
+        self._evict()
+        return True
+
+    def clear(self) -> int:
+        """Delete every stored result and remembered file hash.
+
+        Returns:
+            Number of results deleted.
+        """
+        removed = 0
+        for entry in self._entries():
+            entry.unlink(missing_ok=True)
+            removed += 1
+        for record in (self.path / "files").glob("*.json"):
+            record.unlink(missing_ok=True)
+        return removed
+
+    def stats(self) -> StoreStats:
+        """Count the stored results and their total size."""
+        entries = self._entries()
+        commands: dict[str, int] = {}
+        size = 0
+        for entry in entries:
+            command = entry.stem.rpartition("-")[0]
+            commands[command] = commands.get(command, 0) + 1
+            size += entry.stat().st_size
+        return StoreStats(str(self.path), len(entries), size, self.max_size, commands)
+
+    def _entry(self, key: str) -> Path:
+        return self.path / "results" / f"{key}{SUFFIX}"
+
+    def _entries(self) -> list[Path]:
+        return list((self.path / "results").glob(f"*{SUFFIX}"))
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the total fits the budget."""
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_size:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+
+
+def encode(result: Any) -> bytes:
+    """Serialize a command result to the entry format.
+
+    Raises:
+        TypeError: If the result type is not supported.
+    """
+    if isinstance(result, CentralityResult):
+        import numpy as np
+
+        header = {"kind": "centrality", "types": result.types, "count": len(result)}
+        columns = np.stack([result.column(t) for t in result.types]).astype("<f8")
+        payload = columns.tobytes() + "\0".join(result.node_ids).encode("utf-8")
+    elif isinstance(result, (GraphStats, ComponentInfo)):
+        header = {"kind": type(result).__name__}
+        payload = json.dumps(asdict(result), separators=(",", ":")).encode("utf-8")
+    elif isinstance(result, dict):
+        header = {"kind": "dict"}
+        payload = json.dumps(result, separators=(",", ":")).encode("utf-8")
+    else:
+        raise TypeError(f"Cannot store {type(result).__name__} results")
+    encoded = json.dumps(header).encode("utf-8")
+    return MAGIC + _HEADER.pack(len(encoded)) + encoded + payload
+
+
+def decode(data: bytes) -> Any:
+    """Rebuild a command result from the entry format.
+
+    Raises:
+        ValueError: If the data is not a valid entry.
+    """
+    if not data.startswith(MAGIC):
+        raise ValueError("Not a grph result entry")
+    offset = len(MAGIC)
+    (length,) = _HEADER.unpack_from(data, offset)
+    offset += _HEADER.size
+    header = json.loads(data[offset:offset + length])
+    payload = memoryview(data)[offset + length:]
+
+    kind = header["kind"]
+    if kind == "centrality":
+        import numpy as np
+
+        types, count = header["types"], header["count"]
+        width = len(types) * count * 8
+        columns = np.frombuffer(payload[:width], dtype="<f8").reshape(len(types), count)
+        text = bytes(payload[width:]).decode("utf-8")
+        node_ids = text.split("\0") if count else []
+        if len(node_ids) != count:
+            raise ValueError("Damaged centrality entry")
+        results = [
+            CentralityResult(t, node_ids=node_ids, values=columns[i].copy())
+            for i, t in enumerate(types)
+        ]
+        return CentralityResult.combine(results)
+    fields = json.loads(bytes(payload))
+    if kind == "GraphStats":
+        return GraphStats(**fields)
+    if kind == "ComponentInfo":
+        return ComponentInfo(**fields)
+    if kind == "dict":
+        return fields
+    raise ValueError(f"Unknown result kind: {kind}")
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file so that readers never see it partially written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        partial.write_bytes(data)
+        os.replace(partial, path)
+    finally:
+        partial.unlink(missing_ok=True)
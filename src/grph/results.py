@@ -0,0 +1,87 @@
+"""Lazy result containers backed by internal node indices."""
+
+from typing import TYPE_CHECKING, Any, Iterator
+
+import numpy as np
+
+from .frames import NodeFrame
+from .models import Node
+
+if TYPE_CHECKING:
+    from .parser import GEXFGraph
+
+
+class NodeSet:
+    """A set of nodes held as integer indices into a graph's adjacency.
+
+    Counting is free, node IDs are resolved only when asked for, and full
+    ``Node`` objects are built one at a time while iterating. Iteration and
+    ``ids()`` follow node ID order, which is computed once on first use.
+    """
+
+    def __init__(self, graph: "GEXFGraph", indices: np.ndarray):
+        self._graph = graph
+        self._indices = np.asarray(indices, dtype=np.int32)
+        self._sorted: np.ndarray | None = None
+
+    @property
+    def graph(self) -> "GEXFGraph":
+        """The graph the indices refer to."""
+        return self._graph
+
+    @property
+    def indices(self) -> np.ndarray:
+        """Internal node indices, in no particular order."""
+        return self._indices
+
+    def count(self) -> int:
+        """Number of nodes in the set."""
+        return int(self._indices.size)
+
+    def ids(self) -> list[str]:
+        """Node IDs in sorted order."""
+        node_ids = self._graph.adjacency.node_ids
+        return [node_ids[i] for i in self._sorted_indices()]
+
+    def nodes(self) -> list[Node]:
+        """Materialise every node in the set."""
+        return list(self)
+
+    def to_frame(self) -> NodeFrame:
+        """Get the nodes as a columnar frame, in node ID order."""
+        return NodeFrame(self._graph, self._sorted_indices())
+
+    def to_dict(self) -> list[dict[str, Any]]:
+        """Convert the nodes to dictionaries for JSON serialization."""
+        return self.to_frame().to_dict()
+
+    def _sorted_indices(self) -> np.ndarray:
+        """Indices ordered by node ID."""
+        if self._sorted is None:
+            node_ids = self._graph.adjacency.node_ids
+            keys = [node_ids[i] for i in self._indices]
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            self._sorted = self._indices[order] if order else self._indices
+        return self._sorted
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __bool__(self) -> bool:
+        return self.count() > 0
+
+    def __iter__(self) -> Iterator[Node]:
+        node_ids = self._graph.adjacency.node_ids
+        for i in self._sorted_indices():
+            yield self._graph.get_node(node_ids[i])
+
+    def __getitem__(self, position: int) -> Node:
+        i = self._sorted_indices()[position]
+        return self._graph.get_node(self._graph.adjacency.node_ids[i])
+
+    def __contains__(self, node_id: object) -> bool:
+        i = self._graph.adjacency.index_of(node_id) if isinstance(node_id, str) else -1
+        return i >= 0 and bool(np.any(self._indices == i))
+
+    def __repr__(self) -> str:
+        return f"NodeSet(count={self.count()})"
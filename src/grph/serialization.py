@@ -0,0 +1,73 @@
+"""JSON serialization to bytes, using orjson when it is installed.
+
+Models are converted with their ``to_dict`` methods, and NumPy arrays and
+scalars are encoded directly rather than element by element: natively by
+orjson, or with a single ``tolist()`` call by the standard library fallback.
+"""
+
+import json
+import sys
+from typing import Any, BinaryIO
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+
+def to_jsonable(data: Any) -> Any:
+    """Convert models (and lists of models) to plain JSON-compatible data."""
+    if hasattr(data, "to_dict"):
+        return data.to_dict()
+    if isinstance(data, list):
+        return [item.to_dict() if hasattr(item, "to_dict") else item for item in data]
+    return data
+
+
+def dumps(data: Any, compact: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON.
+
+    Args:
+        data: Data to serialize. Can be a dict, list, or model object.
+        compact: Write everything on one line instead of indenting.
+
+    Returns:
+        Encoded JSON document (without a trailing newline).
+    """
+    data = to_jsonable(data)
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_default, option=option)
+
+    if compact:
+        text = json.dumps(data, default=_default, separators=(",", ":"))
+    else:
+        text = json.dumps(data, default=_default, indent=2)
+    return text.encode("utf-8")
+
+
+def dump(data: Any, sink: BinaryIO, compact: bool = False) -> None:
+    """Serialize data to a binary stream, followed by a newline.
+
+    Args:
+        data: Data to serialize.
+        sink: Binary stream to write to.
+        compact: Write everything on one line instead of indenting.
+    """
+    sink.write(dumps(data, compact=compact))
+    sink.write(b"\n")
+
+
+def _default(value: Any) -> Any:
+    """Encode values the JSON encoders do not handle themselves."""
+    # A NumPy value can only exist if NumPy was imported by someone else
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(value, np.ndarray):
+        return value.tolist()
+    if np is not None and isinstance(value, np.generic):
+        return value.item()
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    return str(value)
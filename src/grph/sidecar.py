@@ -0,0 +1,516 @@
+"""Sidecar indexes precomputed for a graph file and memory-mapped on load.
+
+``grph index build`` writes a directory next to the graph (``graph.gexf``
+gets ``graph.gexf.grphidx``) holding a manifest and one ``.npy`` file per
+array. When the graph is loaded and a fresh sidecar exists, its arrays are
+memory-mapped on first use rather than recomputed, so only the pages a query
+touches are read. Each section accelerates one kind of query:
+
+- ``adjacency``: forward and reverse CSR arrays; node degrees are their row
+  lengths, so traversals and ``get_degree`` skip building the CSR.
+- ``attrs``: postings of node and edge attribute values, for key=value
+  filters.
+- ``labels``: node labels in sorted order, for label patterns that start
+  with a literal prefix.
+- ``reach``: strongly connected components and their condensation DAG with
+  topological levels, for ``has_path`` and component queries.
+- ``landmarks``: hop distances from (and, in directed graphs, to) the
+  highest-degree nodes, which prove most reachable pairs reachable without
+  a search.
+
+Arrays are indexed by node index (graph order) or edge ordinal, which are
+stable for a given file. A sidecar is therefore used only while the file has
+the size and modification time recorded when it was built, and only by the
+grph version that wrote it; otherwise it is ignored.
+"""
+
+import json
+import os
+import shutil
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator
+
+import numpy as np
+
+from . import __version__
+from .csr import CSRAdjacency
+from .errors import GEXFParseError
+from .traversal import UNREACHED, bfs
+
+if TYPE_CHECKING:
+    from .parser import GEXFGraph
+
+# Bumped whenever the layout of the arrays changes
+FORMAT_VERSION = 1
+
+INDEX_SUFFIX = ".grphidx"
+MANIFEST = "manifest.json"
+
+# Sections in build order
+SECTIONS = ("adjacency", "attrs", "labels", "reach", "landmarks")
+
+# Landmarks picked by the landmarks section
+DEFAULT_LANDMARKS = 16
+
+# Characters that end the literal prefix of a glob pattern
+_GLOB_CHARS = "*?["
+
+
+@dataclass
+class IndexInfo:
+    """Description of a sidecar index.
+
+    Attributes:
+        path: Sidecar directory.
+        sections: Sections it holds.
+        built: When it was built (ISO 8601, UTC).
+        grph_version: Version of grph that built it.
+        node_count: Nodes in the graph when it was built.
+        edge_count: Edges in the graph when it was built.
+        size: Total size of its files in bytes.
+        stale: Whether it no longer matches the graph file and is ignored.
+        reason: Why it is stale, if it is.
+    """
+
+    path: str
+    sections: list[str]
+    built: str
+    grph_version: str
+    node_count: int
+    edge_count: int
+    size: int
+    stale: bool
+    reason: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
+
+
+class SidecarIndex:
+    """The arrays of a sidecar index, memory-mapped as they are used."""
+
+    def __init__(self, path: Path, manifest: dict[str, Any]):
+        self.path = path
+        self.manifest = manifest
+        self._arrays: dict[str, np.ndarray] = {}
+
+    @property
+    def sections(self) -> list[str]:
+        """Sections this index holds."""
+        return list(self.manifest["sections"])
+
+    def has(self, section: str) -> bool:
+        """Check whether the index holds a section."""
+        return section in self.manifest["sections"]
+
+    def array(self, name: str) -> np.ndarray:
+        """Memory-map one of the index's arrays (read-only)."""
+        if name not in self._arrays:
+            self._arrays[name] = np.load(self.path / f"{name}.npy", mmap_mode="r")
+        return self._arrays[name]
+
+    def adjacency(self, node_ids: list[str], index: dict[str, int]) -> CSRAdjacency:
+        """Build the graph's CSR adjacency, and its reverse, over the mapped arrays."""
+        directed = self.manifest["directed"]
+        forward = CSRAdjacency(
+            node_ids,
+            self.array("forward-indptr"),
+            self.array("forward-indices"),
+            self.array("forward-edge-index"),
+            directed,
+            index,
+        )
+        if directed:
+            reverse = CSRAdjacency(
+                node_ids,
+                self.array("reverse-indptr"),
+                self.array("reverse-indices"),
+                self.array("reverse-edge-index"),
+                True,
+                index,
+            )
+            forward._reverse, reverse._reverse = reverse, forward
+        return forward
+
+    def attribute_rows(self, kind: str, key: str, value: str) -> np.ndarray | None:
+        """Get the rows whose attribute equals a value, compared as strings.
+
+        Args:
+            kind: "node" or "edge".
+            key: Attribute key.
+            value: Value to match.
+
+        Returns:
+            Sorted node indices or edge ordinals, or None if the key is not
+            indexed.
+        """
+        if not self.has("attrs"):
+            return None
+        number = self.manifest["attrs"][kind].get(key)
+        if number is None:
+            return None
+        prefix = f"{kind}-attr-{number}"
+        values = self.array(f"{prefix}-values")
+        position = int(np.searchsorted(values, value))
+        if position == values.size or values[position] != value:
+            return np.empty(0, dtype=np.int64)
+        offsets = self.array(f"{prefix}-offsets")
+        return np.asarray(self.array(f"{prefix}-rows")[offsets[position]:offsets[position + 1]])
+
+    def label_rows(self, pattern: str) -> np.ndarray | None:
+        """Get the nodes whose label matches a glob pattern.
+
+        Only labels sharing the pattern's literal prefix are tested, found
+        by binary search in the sorted labels.
+
+        Returns:
+            Sorted node indices, or None if the index cannot narrow the
+            search (no labels section, or the pattern starts with a
+            wildcard).
+        """
+        import fnmatch
+
+        prefix = pattern
+        for char in _GLOB_CHARS:
+            prefix = prefix.partition(char)[0]
+        # fnmatch folds case on some platforms, where a prefix search would miss
+        if not self.has("labels") or not prefix or os.path.normcase("A") != "A":
+            return None
+        labels = self.array("labels-sorted")
+        start = int(np.searchsorted(labels, prefix, side="left"))
+        stop = int(np.searchsorted(labels, prefix + "\U0010ffff", side="left"))
+        rows = self.array("labels-order")[start:stop]
+        keep = [fnmatch.fnmatchcase(label, pattern) for label in labels[start:stop].tolist()]
+        return np.sort(rows[np.asarray(keep, dtype=bool)])
+
+    def components(self, strong: bool) -> tuple[int, np.ndarray] | None:
+        """Get component labels as from ``CSRAdjacency.components``.
+
+        Returns:
+            Tuple of (number of components, label of every node), or None
+            if the index does not hold these components. Only strong
+            components are stored for directed graphs.
+        """
+        if not self.has("reach") or (self.manifest["directed"] and not strong):
+            return None
+        return self.manifest["components"], np.asarray(self.array("reach-component"))
+
+    def has_path(self, source: int, target: int) -> bool | None:
+        """Check whether a path leads from one node to another.
+
+        Nodes in the same component are connected. Otherwise a landmark
+        reachable from ``source`` that reaches ``target`` proves a path, a
+        target at an earlier topological level rules one out, and the rest
+        are settled by a search of the condensation DAG that never enters
+        components at or past the target's level.
+
+        Returns:
+            Whether a path exists, or None if the index has no reach section.
+        """
+        if not self.has("reach"):
+            return None
+        component = self.array("reach-component")
+        start, end = int(component[source]), int(component[target])
+        if start == end:
+            return True
+        if not self.manifest["directed"]:
+            return False
+
+        level = self.array("reach-level")
+        if level[start] >= level[end]:
+            return False
+        if self.has("landmarks"):
+            to_landmark = self.array("landmarks-to")[:, source]
+            from_landmark = self.array("landmarks-from")[:, target]
+            if np.any((to_landmark != UNREACHED) & (from_landmark != UNREACHED)):
+                return True
+
+        indptr, indices = self.array("reach-dag-indptr"), self.array("reach-dag-indices")
+        seen = np.zeros(level.size, dtype=bool)
+        seen[start] = True
+        frontier = np.array([start])
+        while frontier.size:
+            successors = _expand(indptr, indices, frontier)
+            if np.any(successors == end):
+                return True
+            successors = successors[(level[successors] < level[end]) & ~seen[successors]]
+            frontier = np.unique(successors)
+            seen[frontier] = True
+        return False
+
+
+def index_path(file_path: str | Path) -> Path:
+    """Get the sidecar directory of a graph file."""
+    path = Path(file_path)
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+def open_index(
+    file_path: str | Path, source_stat: tuple[int, int], node_count: int, edge_count: int
+) -> SidecarIndex | None:
+    """Open the sidecar of a graph file if it matches the loaded graph.
+
+    Args:
+        file_path: Path to the graph file.
+        source_stat: (mtime_ns, size) of the file when it was parsed.
+        node_count: Nodes in the parsed graph.
+        edge_count: Edges in the parsed graph.
+
+    Returns:
+        The index, or None if there is none or it is stale.
+    """
+    path = index_path(file_path)
+    manifest = read_manifest(path)
+    if manifest is None or stale_reason(manifest, source_stat) is not None:
+        return None
+    if (manifest["node_count"], manifest["edge_count"]) != (node_count, edge_count):
+        return None
+    return SidecarIndex(path, manifest)
+
+
+def read_info(file_path: str | Path) -> IndexInfo | None:
+    """Describe the sidecar of a graph file, or None if it has none."""
+    path = index_path(file_path)
+    manifest = read_manifest(path)
+    if manifest is None:
+        return None
+    stat = Path(file_path).stat()
+    reason = stale_reason(manifest, (stat.st_mtime_ns, stat.st_size))
+    return IndexInfo(
+        path=str(path),
+        sections=list(manifest.get("sections", [])),
+        built=manifest.get("built", ""),
+        grph_version=manifest.get("grph_version", ""),
+        node_count=manifest.get("node_count", 0),
+        edge_count=manifest.get("edge_count", 0),
+        size=sum(f.stat().st_size for f in path.iterdir() if f.is_file()),
+        stale=reason is not None,
+        reason=reason,
+    )
+
+
+def build_index(
+    graph: "GEXFGraph",
+    sections: list[str] | None = None,
+    landmarks: int = DEFAULT_LANDMARKS,
+) -> Path:
+    """Precompute a graph's sidecar index and write it next to its file.
+
+    An existing sidecar is replaced; readers never see a partial one.
+
+    Args:
+        graph: Graph loaded from its file.
+        sections: Sections to build (default: all of ``SECTIONS``).
+        landmarks: Number of landmarks for the landmarks section.
+
+    Returns:
+        Path of the sidecar directory.
+
+    Raises:
+        GEXFParseError: If a section is unknown or the graph is a subgraph.
+    """
+    sections = list(SECTIONS) if sections is None else sections
+    unknown = [s for s in sections if s not in SECTIONS]
+    if unknown:
+        raise GEXFParseError(
+            f"Unknown index section: {', '.join(unknown)} (expected {', '.join(SECTIONS)})"
+        )
+    if graph._source_stat is None:
+        raise GEXFParseError("Subgraphs cannot be indexed; index the source file")
+
+    adj = graph.adjacency
+    directed = adj.directed
+    manifest = new_manifest(directed, graph._source_stat, [s for s in SECTIONS if s in sections])
+    manifest["node_count"] = graph.metadata.node_count
+    manifest["edge_count"] = graph.metadata.edge_count
+    arrays: dict[str, np.ndarray] = {}
+
+    if "adjacency" in sections:
+        arrays["forward-indptr"] = adj.indptr
+        arrays["forward-indices"] = adj.indices
+        arrays["forward-edge-index"] = adj.edge_index
+        if directed:
+            arrays["reverse-indptr"] = adj.reverse.indptr
+            arrays["reverse-indices"] = adj.reverse.indices
+            arrays["reverse-edge-index"] = adj.reverse.edge_index
+
+    if "attrs" in sections:
+        manifest["attrs"] = {"node": {}, "edge": {}}
+        for kind, keys, column in (
+            ("node", graph.node_attribute_keys(), graph._node_column),
+            ("edge", graph.edge_attribute_keys(), graph._edge_column),
+        ):
+            for number, key in enumerate(keys):
+                manifest["attrs"][kind][key] = number
+                values, offsets, rows = _postings(column(key))
+                arrays[f"{kind}-attr-{number}-values"] = values
+                arrays[f"{kind}-attr-{number}-offsets"] = offsets
+                arrays[f"{kind}-attr-{number}-rows"] = rows
+
+    if "labels" in sections:
+        labels = graph.node_values("label")
+        # Nodes without a label never match a pattern
+        rows = np.flatnonzero(np.fromiter(map(bool, labels), dtype=bool, count=labels.size))
+        strings = np.array([str(label) for label in labels[rows].tolist()], dtype=str)
+        order = np.argsort(strings, kind="stable")
+        arrays["labels-sorted"] = strings[order]
+        arrays["labels-order"] = rows[order]
+
+    if "reach" in sections:
+        count, component = adj.components(strong=directed)
+        manifest["components"] = count
+        arrays["reach-component"] = component.astype(np.int32)
+        if directed:
+            indptr, indices, level = _condensation(adj, count, component)
+            arrays["reach-dag-indptr"] = indptr
+            arrays["reach-dag-indices"] = indices
+            arrays["reach-level"] = level
+
+    if "landmarks" in sections:
+        degrees = adj.degrees() + (adj.reverse.degrees() if directed else 0)
+        chosen = np.argsort(-degrees, kind="stable")[: min(landmarks, adj.num_nodes)]
+        manifest["landmarks"] = [adj.node_ids[i] for i in chosen.tolist()]
+        arrays["landmarks-nodes"] = chosen
+        arrays["landmarks-from"] = _distances(adj, chosen, "out")
+        if directed:
+            arrays["landmarks-to"] = _distances(adj, chosen, "in")
+
+    path = index_path(graph.file_path)
+    _write_directory(path, arrays, manifest)
+    return path
+
+
+def _postings(column: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Group rows by value.
+
+    Returns:
+        Tuple of (sorted distinct values, offsets into rows per value, rows
+        grouped by value in ascending order).
+    """
+    present = np.flatnonzero(np.not_equal(column, None))
+    strings = np.array(column[present].tolist(), dtype=str)
+    values, codes = np.unique(strings, return_inverse=True)
+    offsets = np.zeros(values.size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(codes, minlength=values.size), out=offsets[1:])
+    return values, offsets, present[np.argsort(codes, kind="stable")]
+
+
+def _condensation(
+    adj: CSRAdjacency, count: int, component: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Build the DAG of strong components and a topological level per component.
+
+    Every DAG edge leads from a lower level to a higher one.
+
+    Returns:
+        Tuple of (indptr, indices, level) of the condensation.
+    """
+    sources = component[np.repeat(np.arange(adj.num_nodes), adj.degrees())]
+    targets = component[adj.indices]
+    crossing = sources != targets
+    pairs = np.unique(sources[crossing].astype(np.int64) * count + targets[crossing])
+    sources, targets = pairs // count, (pairs % count).astype(np.int32)
+    indptr = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=count), out=indptr[1:])
+
+    # Kahn's algorithm, one level of the DAG at a time
+    in_degree = np.bincount(targets, minlength=count)
+    level = np.zeros(count, dtype=np.int32)
+    frontier = np.flatnonzero(in_degree == 0)
+    depth = 0
+    while frontier.size:
+        level[frontier] = depth
+        depth += 1
+        successors = _expand(indptr, targets, frontier)
+        np.subtract.at(in_degree, successors, 1)
+        frontier = np.unique(successors[in_degree[successors] == 0])
+    return indptr, targets, level
+
+
+def _expand(indptr: np.ndarray, indices: np.ndarray, frontier: np.ndarray) -> np.ndarray:
+    """Gather the successors of every row in ``frontier`` of a CSR structure."""
+    starts = indptr[frontier]
+    counts = indptr[frontier + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    # Offset of each slot within its row, added to the row start
+    row_offsets = np.cumsum(counts) - counts
+    return indices[np.repeat(starts - row_offsets, counts) + np.arange(total)]
+
+
+def _distances(adj: CSRAdjacency, landmarks: np.ndarray, direction: str) -> np.ndarray:
+    """Get hop distances from each landmark, one row per landmark."""
+    rows = [bfs(adj, [landmark], direction=direction) for landmark in landmarks.tolist()]
+    if not rows:
+        return np.empty((0, adj.num_nodes), dtype=np.int32)
+    return np.stack(rows)
+
+
+def read_manifest(path: Path) -> dict[str, Any] | None:
+    """Read the manifest of a sidecar directory, or None if it has none."""
+    try:
+        return json.loads((path / MANIFEST).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def stale_reason(manifest: dict[str, Any], source_stat: tuple[int, int]) -> str | None:
+    """Explain why a sidecar cannot be used for a file, or None if it can."""
+    if manifest.get("format") != FORMAT_VERSION:
+        return "written in an unsupported format"
+    if manifest.get("grph_version") != __version__:
+        return f"built by grph {manifest.get('grph_version')}"
+    source = manifest.get("source", {})
+    mtime_ns, size = source_stat
+    if (source.get("mtime_ns"), source.get("size")) != (mtime_ns, size):
+        return "graph file changed since the index was built"
+    return None
+
+
+def new_manifest(
+    directed: bool, source_stat: tuple[int, int], sections: list[str]
+) -> dict[str, Any]:
+    """Start the manifest of a sidecar built from a file with the given stat."""
+    mtime_ns, size = source_stat
+    return {
+        "format": FORMAT_VERSION,
+        "grph_version": __version__,
+        "built": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "source": {"size": size, "mtime_ns": mtime_ns},
+        "directed": directed,
+        "sections": sections,
+    }
+
+
+@contextmanager
+def staged_directory(path: Path) -> Iterator[Path]:
+    """Fill a temporary directory, then swap it into place as ``path``.
+
+    Readers never see a partial sidecar: the directory is renamed into
+    place only if the block completes, and is removed otherwise.
+    """
+    partial = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    previous = path.with_name(f".{path.name}.{os.getpid()}.old")
+    shutil.rmtree(partial, ignore_errors=True)
+    partial.mkdir(parents=True)
+    try:
+        yield partial
+        if path.exists():
+            path.rename(previous)
+        partial.rename(path)
+    finally:
+        shutil.rmtree(partial, ignore_errors=True)
+        shutil.rmtree(previous, ignore_errors=True)
+
+
+def _write_directory(path: Path, arrays: dict[str, np.ndarray], manifest: dict[str, Any]) -> None:
+    """Write the arrays and manifest, then swap the directory into place."""
+    with staged_directory(path) as partial:
+        for name, array in arrays.items():
+            np.save(partial / f"{name}.npy", np.ascontiguousarray(array))
+        (partial / MANIFEST).write_text(json.dumps(manifest, indent=2) + "\n")
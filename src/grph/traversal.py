@@ -0,0 +1,203 @@
+"""Traversal primitives over a CSR adjacency.
+
+Searches can be constrained with boolean masks: ``edge_mask`` is indexed by
+edge ordinal and ``node_mask`` by node index. Masked-out edges are never
+followed and masked-out nodes are never entered (start nodes are always
+included), so filtered searches need no copy of the graph.
+"""
+
+import heapq
+from typing import Iterable
+
+import numpy as np
+
+from .csr import CSRAdjacency
+
+# Hop distance recorded for nodes a search never reached
+UNREACHED = -1
+
+
+def bfs(
+    adjacency: CSRAdjacency,
+    sources: Iterable[int],
+    direction: str = "out",
+    max_depth: int | None = None,
+    edge_mask: np.ndarray | None = None,
+    node_mask: np.ndarray | None = None,
+) -> np.ndarray:
+    """Run a depth-limited breadth-first search from one or more sources.
+
+    Each level is expanded for the whole frontier at once, and predecessors
+    are walked through the cached reverse adjacency rather than a reversed
+    copy of the graph.
+
+    Args:
+        adjacency: Adjacency to traverse.
+        sources: Integer indices of the start nodes (depth 0).
+        direction: "out" (successors), "in" (predecessors), or "all" (both).
+        max_depth: Maximum number of hops (None for unlimited).
+        edge_mask: Edges that may be followed, by edge ordinal.
+        node_mask: Nodes that may be entered, by node index.
+
+    Returns:
+        Array of hop distances per node, ``UNREACHED`` where not visited.
+    """
+    layers = _layers(adjacency, direction)
+
+    dist = np.full(adjacency.num_nodes, UNREACHED, dtype=np.int32)
+    frontier = np.unique(np.asarray(list(sources), dtype=np.int32))
+    dist[frontier] = 0
+
+    depth = 0
+    while frontier.size and (max_depth is None or depth < max_depth):
+        depth += 1
+        candidates, _ = _step(layers, frontier, edge_mask, node_mask)
+        frontier = np.unique(candidates[dist[candidates] == UNREACHED])
+        dist[frontier] = depth
+
+    return dist
+
+
+def visited(dist: np.ndarray) -> np.ndarray:
+    """Get the indices of every node a search reached."""
+    return np.flatnonzero(dist != UNREACHED)
+
+
+def bfs_path(
+    adjacency: CSRAdjacency,
+    source: int,
+    target: int,
+    edge_mask: np.ndarray | None = None,
+    node_mask: np.ndarray | None = None,
+) -> list[int] | None:
+    """Find a path with the fewest hops between two nodes.
+
+    The search stops as soon as the level containing ``target`` is reached.
+
+    Returns:
+        Node indices from source to target, or None if no path exists.
+    """
+    layers = _layers(adjacency, "out")
+    parent = np.full(adjacency.num_nodes, UNREACHED, dtype=np.int32)
+    seen = np.zeros(adjacency.num_nodes, dtype=bool)
+    seen[source] = True
+    frontier = np.array([source], dtype=np.int32)
+
+    while frontier.size and not seen[target]:
+        candidates, parents = _step(layers, frontier, edge_mask, node_mask)
+        fresh = ~seen[candidates]
+        frontier, first = np.unique(candidates[fresh], return_index=True)
+        parent[frontier] = parents[fresh][first]
+        seen[frontier] = True
+
+    if not seen[target]:
+        return None
+
+    path = [target]
+    while path[-1] != source:
+        path.append(int(parent[path[-1]]))
+    return path[::-1]
+
+
+def dijkstra_path(
+    adjacency: CSRAdjacency,
+    source: int,
+    target: int,
+    weights: np.ndarray,
+    edge_mask: np.ndarray | None = None,
+    node_mask: np.ndarray | None = None,
+) -> tuple[list[int], float] | None:
+    """Find the lowest-weight path between two nodes.
+
+    Args:
+        adjacency: Adjacency to traverse.
+        source: Start node index.
+        target: End node index.
+        weights: Non-negative weight per edge ordinal.
+        edge_mask: Edges that may be followed, by edge ordinal.
+        node_mask: Nodes that may be entered, by node index.
+
+    Returns:
+        Tuple of (node indices from source to target, total weight), or None.
+
+    Raises:
+        ValueError: If any weight is negative, as Dijkstra's algorithm
+            would return a wrong path.
+    """
+    if weights.size and weights.min() < 0:
+        raise ValueError("Negative edge weights are not supported by weighted shortest paths")
+    indptr, indices, edge_index = adjacency.indptr, adjacency.indices, adjacency.edge_index
+    dist = {source: 0.0}
+    parent: dict[int, int] = {}
+    done: set[int] = set()
+    heap = [(0.0, source)]
+
+    while heap:
+        d, u = heapq.heappop(heap)
+        if u in done:
+            continue
+        done.add(u)
+        if u == target:
+            break
+        lo, hi = indptr[u], indptr[u + 1]
+        nbrs, edges = indices[lo:hi], edge_index[lo:hi]
+        if edge_mask is not None:
+            keep = edge_mask[edges]
+            nbrs, edges = nbrs[keep], edges[keep]
+        if node_mask is not None:
+            keep = node_mask[nbrs]
+            nbrs, edges = nbrs[keep], edges[keep]
+        for v, w in zip(nbrs.tolist(), weights[edges].tolist()):
+            nd = d + w
+            if v not in dist or nd < dist[v]:
+                dist[v] = nd
+                parent[v] = u
+                heapq.heappush(heap, (nd, v))
+
+    if target not in done:
+        return None
+
+    path = [target]
+    while path[-1] != source:
+        path.append(parent[path[-1]])
+    return path[::-1], dist[target]
+
+
+def _step(
+    layers: list[CSRAdjacency],
+    frontier: np.ndarray,
+    edge_mask: np.ndarray | None,
+    node_mask: np.ndarray | None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Expand a frontier one hop, applying the masks.
+
+    Returns:
+        Tuple of (neighbor indices, index of the frontier node each came from).
+    """
+    targets = []
+    parents = []
+    for layer in layers:
+        counts = layer.indptr[frontier + 1] - layer.indptr[frontier]
+        slots = layer.slots(frontier)
+        origin = np.repeat(frontier, counts)
+        if edge_mask is not None:
+            keep = edge_mask[layer.edge_index[slots]]
+            slots, origin = slots[keep], origin[keep]
+        found = layer.indices[slots]
+        if node_mask is not None:
+            keep = node_mask[found]
+            found, origin = found[keep], origin[keep]
+        targets.append(found)
+        parents.append(origin)
+    return np.concatenate(targets), np.concatenate(parents)
+
+
+def _layers(adjacency: CSRAdjacency, direction: str) -> list[CSRAdjacency]:
+    """Pick the adjacencies to expand for a traversal direction."""
+    if not adjacency.directed or direction == "out":
+        return [adjacency]
+    if direction == "in":
+        return [adjacency.reverse]
+    if direction == "all":
+        return [adjacency, adjacency.reverse]
+    raise ValueError(f"Unknown direction: {direction}")
@@ -0,0 +1,88 @@
+"""Tests for the benchmark graph generator and result comparison."""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from benchmarks.generate import TOPOLOGIES, generate
+from benchmarks.run import SCENARIOS, Result, compare, run_scenario
+from grph.parser import GEXFGraph
+
+
+class TestGenerator:
+    """Tests for synthetic GEXF generation."""
+
+    @pytest.mark.parametrize("topology", TOPOLOGIES)
+    def test_generated_graph_loads(self, topology: str, tmp_path: Path) -> None:
+        """Test that every topology produces a valid graph with typed attributes."""
+        path = tmp_path / f"{topology}.gexf.gz"
+        edges = generate(topology, 100, path)
+
+        graph = GEXFGraph(path)
+        assert graph.metadata.node_count == 100
+        assert graph.metadata.edge_count == edges
+        node = graph.get_node("n0")
+        assert isinstance(node.attributes["rank"], int)
+        assert isinstance(node.attributes["score"], float)
+        assert isinstance(node.attributes["active"], bool)
+
+    def test_generation_is_deterministic(self, tmp_path: Path) -> None:
+        """Test that the same seed writes the same file."""
+        generate("scale-free", 50, tmp_path / "a.gexf", seed=7)
+        generate("scale-free", 50, tmp_path / "b.gexf", seed=7)
+
+        assert (tmp_path / "a.gexf").read_bytes() == (tmp_path / "b.gexf").read_bytes()
+
+
+class TestRunScenario:
+    """Tests for timing and profiling a scenario."""
+
+    def test_warmup_and_phases(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that warm-up runs are untimed and phases cover every timed repeat."""
+        from grph.profiling import span
+
+        calls = []
+
+        def scenario(graph: GEXFGraph) -> None:
+            calls.append(len(calls))
+            with span("step"):
+                # Only the first timed repeat is slow
+                if len(calls) == 3:
+                    time.sleep(0.03)
+
+        monkeypatch.setitem(SCENARIOS, "counted", scenario)
+        graph = GEXFGraph(Path(__file__).parent / "fixtures" / "sample.gexf")
+
+        result = run_scenario("counted", graph, "sample", repeat=3, warmup=2)
+
+        assert len(calls) == 5
+        assert len(result.times) == 3
+        assert set(result.phases) == {"step"}
+        assert result.phases["step"] == pytest.approx(sum(result.times) / 3, abs=0.005)
+
+
+class TestCompare:
+    """Tests for comparing results with a baseline."""
+
+    def test_flags_regressions(self) -> None:
+        """Test that only slowdowns above the threshold are regressions."""
+        results = [
+            Result("load", "grid", 100, 180, [0.2], {}),
+            Result("path", "grid", 100, 180, [0.1], {}),
+            Result("stats", "grid", 100, 180, [0.1], {}),
+        ]
+        baseline = {
+            "results": [
+                {"scenario": "load", "topology": "grid", "nodes": 100, "median": 0.1},
+                {"scenario": "path", "topology": "grid", "nodes": 100, "median": 0.095},
+            ]
+        }
+
+        rows = compare(results, baseline, threshold=0.1)
+
+        assert [(ratio is None, regressed) for _, ratio, regressed in rows] == [
+            (False, True),
+            (False, False),
+            (True, False),
+        ]
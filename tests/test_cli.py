@@ -1,16 +1,26 @@
 """Integration tests for the CLI commands."""
 
+import json
+import os
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
 from click.testing import CliRunner
 
+import grph
 from grph.cli import main
 
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 SAMPLE_FILE = str(FIXTURES_DIR / "sample.gexf")
 
+# Cumulative import time allowed for grph.cli, in microseconds
+STARTUP_BUDGET_US = 250_000
+
+HEAVY_MODULES = ("networkx", "numpy", "scipy", "rich")
+
 
 @pytest.fixture
 def runner() -> CliRunner:
@@ -18,6 +28,14 @@ def runner() -> CliRunner:
     return CliRunner()
 
 
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep the result cache of every test in its own directory."""
+    path = tmp_path / "cache"
+    monkeypatch.setenv("GRPH_CACHE_DIR", str(path))
+    return path
+
+
 class TestBasicCommands:
     """Tests for basic CLI commands."""
 
@@ -44,6 +62,30 @@ class TestBasicCommands:
         assert result.exit_code == 0
         assert '"creator"' in result.output
 
+    def test_profile(self, runner: CliRunner) -> None:
+        """Test that --profile reports phases without touching stdout."""
+        result = runner.invoke(main, ["--profile", "stats", SAMPLE_FILE, "--json"])
+        assert result.exit_code == 0
+        assert json.loads(result.stdout)["node_count"] == 5
+        assert "read_gexf" in result.stderr
+        assert "get_stats" in result.stderr
+
+    def test_cprofile(self, runner: CliRunner, tmp_path: Path) -> None:
+        """Test that --cprofile writes stats readable by pstats."""
+        import pstats
+
+        out = tmp_path / "grph.prof"
+        result = runner.invoke(main, ["--cprofile", str(out), "info", SAMPLE_FILE])
+        assert result.exit_code == 0
+        assert pstats.Stats(str(out)).total_calls > 0
+
+    def test_json_compact(self, runner: CliRunner) -> None:
+        """Test that --compact writes JSON on a single line."""
+        result = runner.invoke(main, ["nodes", SAMPLE_FILE, "--json", "--compact"])
+        assert result.exit_code == 0
+        assert result.output.count("\n") == 1
+        assert len(json.loads(result.output)) == 5
+
     def test_info(self, runner: CliRunner) -> None:
         """Test info command."""
         result = runner.invoke(main, ["info", SAMPLE_FILE])
@@ -70,6 +112,63 @@ class TestBasicCommands:
         assert result.exit_code == 0
         assert "lb1" in result.output
 
+    def test_nodes_limit_offset(self, runner: CliRunner) -> None:
+        """Test paging through nodes with --limit and --offset."""
+        result = runner.invoke(
+            main, ["nodes", SAMPLE_FILE, "--limit", "2", "--offset", "3", "--json"]
+        )
+        assert result.exit_code == 0
+        assert [n["id"] for n in json.loads(result.output)] == ["cache1", "lb1"]
+
+    def test_edges_limit(self, runner: CliRunner) -> None:
+        """Test limiting the number of edges shown."""
+        result = runner.invoke(main, ["edges", SAMPLE_FILE, "--limit", "1"])
+        assert result.exit_code == 0
+        assert "Edges (1)" in result.output
+
+
+class TestRecordOutput:
+    """Tests for --format ndjson|tsv|csv streaming output."""
+
+    def test_nodes_ndjson(self, runner: CliRunner) -> None:
+        """Test one JSON object per node line."""
+        result = runner.invoke(main, ["nodes", SAMPLE_FILE, "--format", "ndjson"])
+        assert result.exit_code == 0
+        records = [json.loads(line) for line in result.output.splitlines()]
+        assert len(records) == 5
+        assert records[0]["attributes"]["type"] == "server"
+
+    def test_nodes_tsv_columns(self, runner: CliRunner) -> None:
+        """Test that TSV output has a header with attribute columns."""
+        result = runner.invoke(
+            main, ["nodes", SAMPLE_FILE, "--attr", "type=server", "--format", "tsv"]
+        )
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        assert lines[0].split("\t") == ["id", "label", "type", "weight"]
+        assert lines[1].split("\t") == ["server1", "Web Server 1", "server", "1.5"]
+        assert len(lines) == 3
+
+    def test_edges_csv(self, runner: CliRunner) -> None:
+        """Test CSV edge output is readable by the csv module."""
+        import csv
+        import io
+
+        result = runner.invoke(main, ["edges", SAMPLE_FILE, "--format", "csv"])
+        assert result.exit_code == 0
+        rows = list(csv.DictReader(io.StringIO(result.output)))
+        assert len(rows) == 6
+        assert {row["relationship"] for row in rows} == {"routes", "queries", "caches"}
+
+    def test_traversal_ndjson(self, runner: CliRunner) -> None:
+        """Test that traversal commands stream records in node ID order."""
+        result = runner.invoke(
+            main, ["reachable", SAMPLE_FILE, "lb1", "--format", "ndjson"]
+        )
+        assert result.exit_code == 0
+        ids = [json.loads(line)["id"] for line in result.output.splitlines()]
+        assert ids == ["cache1", "db1", "server1", "server2"]
+
 
 class TestNeighborsCommand:
     """Tests for the neighbors command."""
@@ -99,6 +198,12 @@ class TestNeighborsCommand:
         assert result.exit_code == 0
         assert '"id"' in result.output
 
+    def test_neighbors_ids_only(self, runner: CliRunner) -> None:
+        """Test neighbors with only node IDs in the output."""
+        result = runner.invoke(main, ["neighbors", SAMPLE_FILE, "lb1", "--ids-only"])
+        assert result.exit_code == 0
+        assert result.output.split() == ["server1", "server2"]
+
     def test_neighbors_not_found(self, runner: CliRunner) -> None:
         """Test neighbors with invalid node."""
         result = runner.invoke(main, ["neighbors", SAMPLE_FILE, "nonexistent"])
@@ -128,6 +233,14 @@ class TestPathCommand:
         assert result.exit_code == 0
         assert "No path found" in result.output
 
+    def test_path_edge_where(self, runner: CliRunner) -> None:
+        """Test path restricted to matching edges."""
+        result = runner.invoke(
+            main, ["path", SAMPLE_FILE, "lb1", "db1", "--edge-where", "relationship=routes"]
+        )
+        assert result.exit_code == 0
+        assert "No path found" in result.output
+
     def test_path_json(self, runner: CliRunner) -> None:
         """Test path with JSON output."""
         result = runner.invoke(main, ["path", SAMPLE_FILE, "lb1", "db1", "--json"])
@@ -182,6 +295,32 @@ class TestReachableCommand:
         assert result.exit_code == 0
         assert "lb1" in result.output
 
+    def test_reachable_ids_only(self, runner: CliRunner) -> None:
+        """Test reachable with only node IDs in the output."""
+        result = runner.invoke(main, ["reachable", SAMPLE_FILE, "lb1", "--ids-only"])
+        assert result.exit_code == 0
+        assert result.output.split() == ["cache1", "db1", "server1", "server2"]
+
+    def test_reachable_node_where(self, runner: CliRunner) -> None:
+        """Test reachable restricted to matching nodes."""
+        result = runner.invoke(
+            main, ["reachable", SAMPLE_FILE, "lb1", "--node-where", "type=server", "--ids-only"]
+        )
+        assert result.exit_code == 0
+        assert result.output.split() == ["server1", "server2"]
+
+    def test_reachable_count(self, runner: CliRunner) -> None:
+        """Test reachable with only the count in the output."""
+        result = runner.invoke(main, ["reachable", SAMPLE_FILE, "lb1", "--count"])
+        assert result.exit_code == 0
+        assert result.output.strip() == "4"
+
+    def test_reachable_count_json(self, runner: CliRunner) -> None:
+        """Test reachable count as JSON."""
+        result = runner.invoke(main, ["reachable", SAMPLE_FILE, "lb1", "--count", "--json"])
+        assert result.exit_code == 0
+        assert '"count": 4' in result.output
+
 
 class TestCommonNeighborsCommand:
     """Tests for the common-neighbors command."""
@@ -194,6 +333,41 @@ class TestCommonNeighborsCommand:
         assert "cache1" in result.output
 
 
+class TestSimilarityCommand:
+    """Tests for the similarity command."""
+
+    def test_similarity_all_pairs(self, runner: CliRunner) -> None:
+        """Test scoring all candidate pairs."""
+        result = runner.invoke(main, ["similarity", SAMPLE_FILE, "--metric", "jaccard"])
+        assert result.exit_code == 0
+        assert "Jaccard" in result.output
+        assert "server2" in result.output
+
+    def test_similarity_pairs_json(self, runner: CliRunner) -> None:
+        """Test scoring explicit pairs as JSON."""
+        result = runner.invoke(
+            main, ["similarity", SAMPLE_FILE, "--pair", "lb1", "db1", "--json"]
+        )
+        assert result.exit_code == 0
+        assert '"score": 2.0' in result.output
+
+    def test_similarity_pairs_file(self, runner: CliRunner, tmp_path: Path) -> None:
+        """Test reading pairs from a file."""
+        pairs_file = tmp_path / "pairs.txt"
+        pairs_file.write_text("server1 server2\nlb1 db1\n")
+        result = runner.invoke(
+            main, ["similarity", SAMPLE_FILE, "--pairs-file", str(pairs_file), "--json"]
+        )
+        assert result.exit_code == 0
+        assert '"node2": "db1"' in result.output
+
+    def test_similarity_missing_node(self, runner: CliRunner) -> None:
+        """Test an unknown node in a pair."""
+        result = runner.invoke(main, ["similarity", SAMPLE_FILE, "--pair", "lb1", "nope"])
+        assert result.exit_code == 1
+        assert "Error" in result.output
+
+
 class TestStatsCommand:
     """Tests for the stats command."""
 
@@ -233,6 +407,53 @@ class TestCentralityCommand:
         assert result.exit_code == 0
         assert "Top 3" in result.output
 
+    def test_centrality_several_types(self, runner: CliRunner) -> None:
+        """Test showing several centrality types side by side."""
+        result = runner.invoke(
+            main, ["centrality", SAMPLE_FILE, "--type", "pagerank", "--type", "degree", "--json"]
+        )
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["types"] == ["pagerank", "degree"]
+        assert set(data["scores"]["db1"]) == {"pagerank", "degree"}
+
+
+class TestPprCommand:
+    """Tests for the ppr command."""
+
+    def test_ppr_basic(self, runner: CliRunner) -> None:
+        """Test ranking nodes around a seed."""
+        result = runner.invoke(main, ["ppr", SAMPLE_FILE, "--seed", "server1", "--top", "2"])
+        assert result.exit_code == 0
+        assert "Personalized Pagerank" in result.output
+        assert "server1" in result.output
+
+    def test_ppr_exclude_seeds_json(self, runner: CliRunner) -> None:
+        """Test leaving seeds out of JSON output."""
+        result = runner.invoke(
+            main, ["ppr", SAMPLE_FILE, "--seed", "lb1", "--exclude-seeds", "--json"]
+        )
+        assert result.exit_code == 0
+        assert '"server1"' in result.output
+        assert '"lb1"' not in result.output
+
+    def test_ppr_missing_seed(self, runner: CliRunner) -> None:
+        """Test an unknown seed node."""
+        result = runner.invoke(main, ["ppr", SAMPLE_FILE, "--seed", "nope"])
+        assert result.exit_code == 1
+        assert "Error" in result.output
+
+    @pytest.mark.parametrize(
+        "option", [["--alpha", "1.0"], ["--alpha", "0"], ["--tolerance", "0"]]
+    )
+    def test_ppr_rejects_non_converging_options(
+        self, runner: CliRunner, option: list[str]
+    ) -> None:
+        """Test that options the push would never converge with are usage errors."""
+        result = runner.invoke(main, ["ppr", SAMPLE_FILE, "--seed", "lb1", *option])
+        assert result.exit_code == 2
+        assert "Invalid value" in result.output
+
 
 class TestComponentsCommand:
     """Tests for the components command."""
@@ -287,6 +508,16 @@ class TestEgoCommand:
             assert result.exit_code == 0
             assert Path("ego.gexf").exists()
 
+    def test_ego_output_compressed(self, runner: CliRunner, tmp_path: Path) -> None:
+        """Test that a .gz output name writes gzip that loads back."""
+        output = tmp_path / "ego.gexf.gz"
+        result = runner.invoke(main, ["ego", SAMPLE_FILE, "server1", "--output", str(output)])
+        assert result.exit_code == 0
+        assert output.read_bytes()[:2] == b"\x1f\x8b"
+
+        result = runner.invoke(main, ["info", str(output), "--json"])
+        assert result.exit_code == 0
+
 
 class TestSubgraphCommand:
     """Tests for the subgraph command."""
@@ -307,6 +538,19 @@ class TestSubgraphCommand:
             assert result.exit_code == 0
             assert Path("sub.gexf").exists()
 
+    def test_subgraph_output_compress_option(self, runner: CliRunner, tmp_path: Path) -> None:
+        """Test that --compress overrides the output file extension."""
+        import lzma
+
+        output = tmp_path / "sub.gexf"
+        result = runner.invoke(
+            main,
+            ["subgraph", SAMPLE_FILE, "--nodes", "server1,db1", "--output", str(output),
+             "--compress", "xz"],
+        )
+        assert result.exit_code == 0
+        assert b"<gexf" in lzma.decompress(output.read_bytes())
+
 
 class TestExportCommand:
     """Tests for the export command."""
@@ -329,6 +573,14 @@ class TestExportCommand:
         assert result.exit_code == 0
         assert "lb1" in result.output
 
+    def test_export_json_is_valid(self, runner: CliRunner) -> None:
+        """Test that JSON on stdout is passed through untouched."""
+        import json
+
+        result = runner.invoke(main, ["export", SAMPLE_FILE, "--format", "json"])
+        assert result.exit_code == 0
+        assert len(json.loads(result.output)["nodes"]) == 5
+
     def test_export_to_file(self, runner: CliRunner) -> None:
         """Test export to file."""
         with runner.isolated_filesystem():
@@ -338,3 +590,326 @@ class TestExportCommand:
             )
             assert result.exit_code == 0
             assert Path("graph.json").exists()
+
+    def test_export_npz_to_file(self, runner: CliRunner) -> None:
+        """Test binary npz export to a file."""
+        import numpy as np
+
+        with runner.isolated_filesystem():
+            result = runner.invoke(
+                main,
+                ["export", SAMPLE_FILE, "--format", "npz", "--output", "graph.npz"],
+            )
+            assert result.exit_code == 0
+            assert np.load("graph.npz")["indptr"].size == 6
+
+    def test_export_compressed_stdout(self, runner: CliRunner) -> None:
+        """Test that --compress compresses exports written to stdout."""
+        import gzip
+
+        result = runner.invoke(
+            main, ["export", SAMPLE_FILE, "--format", "edgelist", "--compress", "gzip"]
+        )
+        assert result.exit_code == 0
+        lines = gzip.decompress(result.stdout_bytes).decode().splitlines()
+        assert len(lines) == 6
+
+    @pytest.mark.parametrize(
+        "command",
+        [["export", "--format", "edgelist"], ["nodes", "--format", "ndjson"]],
+        ids=["export", "nodes"],
+    )
+    def test_closed_pipe(self, tmp_path: Path, command: list[str]) -> None:
+        """Test that a reader closing stdout early (e.g. `| head`) ends output quietly."""
+        edges = "".join(f'<edge source="n{i}" target="n{i + 1}"/>' for i in range(20000))
+        path = tmp_path / "chain.gexf"
+        path.write_text(
+            '<gexf xmlns="http://gexf.net/1.3" version="1.3"><graph defaultedgetype="directed">'
+            f"<edges>{edges}</edges></graph></gexf>"
+        )
+        env = {**os.environ, "PYTHONPATH": str(Path(grph.__file__).parents[1])}
+        process = subprocess.Popen(
+            [sys.executable, "-m", "grph.cli", command[0], str(path), *command[1:]],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env,
+        )
+        process.stdout.read(10)
+        process.stdout.close()
+        stderr = process.stderr.read().decode()
+        process.wait(timeout=60)
+
+        assert process.returncode == 0
+        assert "Traceback" not in stderr
+
+
+def run_python(code: str, *args: str) -> subprocess.CompletedProcess:
+    """Run Python code in a fresh interpreter with grph importable."""
+    env = {**os.environ, "PYTHONPATH": str(Path(grph.__file__).parents[1])}
+    return subprocess.run(
+        [sys.executable, *args, "-c", code], capture_output=True, text=True, env=env, check=True
+    )
+
+
+class TestResultCacheCommands:
+    """Tests for the on-disk result cache and the cache command."""
+
+    def test_second_run_hits(self, runner: CliRunner) -> None:
+        """Test that a repeated command is served from the cache."""
+        first = runner.invoke(main, ["centrality", SAMPLE_FILE, "--type", "pagerank", "--json"])
+        second = runner.invoke(main, ["centrality", SAMPLE_FILE, "--type", "pagerank", "--json"])
+
+        assert first.exit_code == second.exit_code == 0
+        assert second.output == first.output
+        stats = json.loads(runner.invoke(main, ["cache", "stats", "--json"]).output)
+        assert stats["commands"] == {"centrality": 1}
+
+    def test_invalid_cache_size(self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a bad GRPH_CACHE_SIZE does not break cached commands."""
+        monkeypatch.setenv("GRPH_CACHE_SIZE", "1G")
+        result = runner.invoke(main, ["stats", SAMPLE_FILE, "--json"])
+
+        assert result.exit_code == 0
+        assert json.loads(result.output)["node_count"] == 5
+
+    def test_arguments_get_separate_entries(self, runner: CliRunner) -> None:
+        """Test that results for different arguments are stored separately."""
+        runner.invoke(main, ["components", SAMPLE_FILE])
+        runner.invoke(main, ["components", SAMPLE_FILE, "--type", "strongly"])
+        runner.invoke(main, ["degree", SAMPLE_FILE, "--node", "lb1"])
+
+        stats = json.loads(runner.invoke(main, ["cache", "stats", "--json"]).output)
+        assert stats["commands"] == {"components": 2, "degree": 1}
+
+    def test_no_cache_and_clear(self, runner: CliRunner, cache_dir: Path) -> None:
+        """Test that --no-cache writes nothing and clear empties the cache."""
+        runner.invoke(main, ["stats", SAMPLE_FILE, "--no-cache"])
+        assert not (cache_dir / "results").exists()
+
+        runner.invoke(main, ["stats", SAMPLE_FILE])
+        result = runner.invoke(main, ["cache", "clear"])
+
+        assert "Removed 1 cached result" in result.output
+        assert json.loads(runner.invoke(main, ["cache", "stats", "--json"]).output)["entries"] == 0
+
+    def test_refresh_replaces_entry(self, runner: CliRunner, cache_dir: Path) -> None:
+        """Test that --refresh recomputes and rewrites the stored result."""
+        runner.invoke(main, ["stats", SAMPLE_FILE])
+        (entry,) = (cache_dir / "results").iterdir()
+        entry.write_bytes(b"damaged")
+
+        result = runner.invoke(main, ["stats", SAMPLE_FILE, "--refresh", "--json"])
+
+        assert json.loads(result.output)["node_count"] == 5
+        assert entry.read_bytes().startswith(b"GRPH-RESULT")
+
+    def test_hit_skips_parsing(self) -> None:
+        """Test that a cached stats result is printed without loading NetworkX."""
+        code = (
+            "import sys\n"
+            "from grph.cli import main\n"
+            f"try:\n    main(['stats', {SAMPLE_FILE!r}, '--json'])\n"
+            "except SystemExit:\n    pass\n"
+            "print('networkx' in sys.modules, file=sys.stderr)"
+        )
+        run_python(code)
+        result = run_python(code)
+
+        assert json.loads(result.stdout)["node_count"] == 5
+        assert result.stderr.strip() == "False"
+
+
+class TestIndexCommands:
+    """Tests for the index command."""
+
+    def test_build_and_info(self, runner: CliRunner, tmp_path: Path) -> None:
+        """Test that a built index is reported as fresh."""
+        graph_file = tmp_path / "sample.gexf"
+        graph_file.write_bytes(Path(SAMPLE_FILE).read_bytes())
+
+        built = runner.invoke(main, ["index", "build", str(graph_file), "--with", "attrs,reach"])
+        info = runner.invoke(main, ["index", "info", str(graph_file), "--json"])
+
+        assert built.exit_code == 0
+        assert "attrs, reach" in built.output
+        data = json.loads(info.output)
+        assert data["sections"] == ["attrs", "reach"]
+        assert data["stale"] is False
+
+    def test_info_without_index(self, runner: CliRunner) -> None:
+        """Test that info fails for a file without an index."""
+        result = runner.invoke(main, ["index", "info", SAMPLE_FILE])
+
+        assert result.exit_code == 1
+        assert "No index" in result.output
+
+    def test_out_of_core_build(self, runner: CliRunner, tmp_path: Path) -> None:
+        """Test that commands answer the same from an out-of-core index."""
+        graph_file = tmp_path / "sample.gexf"
+        graph_file.write_bytes(Path(SAMPLE_FILE).read_bytes())
+        commands = [
+            ["neighbors", str(graph_file), "lb1", "--depth", "2", "--json"],
+            ["reachable", str(graph_file), "db1", "--direction", "backward", "--json"],
+            ["path", str(graph_file), "lb1", "db1", "--weighted", "--json"],
+            ["components", str(graph_file), "--type", "weakly", "--no-cache", "--json"],
+            ["degree", str(graph_file), "--top", "2", "--no-cache"],
+        ]
+        before = [runner.invoke(main, command).output for command in commands]
+
+        built = runner.invoke(
+            main, ["index", "build", str(graph_file), "--out-of-core", "--memory", "64K"]
+        )
+        info = runner.invoke(main, ["index", "info", str(graph_file), "--json"])
+
+        assert built.exit_code == 0
+        assert json.loads(info.output)["sections"] == ["disk"]
+        assert [runner.invoke(main, command).output for command in commands] == before
+
+    def test_out_of_core_options(self, runner: CliRunner, tmp_path: Path) -> None:
+        """Test that --with and bad memory sizes are rejected with --out-of-core."""
+        graph_file = tmp_path / "sample.gexf"
+        graph_file.write_bytes(Path(SAMPLE_FILE).read_bytes())
+
+        sections = runner.invoke(
+            main, ["index", "build", str(graph_file), "--out-of-core", "--with", "attrs"]
+        )
+        memory = runner.invoke(
+            main, ["index", "build", str(graph_file), "--out-of-core", "--memory", "lots"]
+        )
+
+        assert sections.exit_code == 1
+        assert memory.exit_code == 1
+        assert "Invalid size" in memory.output
+
+
+class TestTimeSlicingCommands:
+    """Tests for the --at and --between options."""
+
+    DYNAMIC_FILE = str(FIXTURES_DIR / "dynamic.gexf")
+
+    def test_nodes_at(self, runner: CliRunner) -> None:
+        """Test listing the nodes alive at a time."""
+        result = runner.invoke(main, ["nodes", self.DYNAMIC_FILE, "--at", "2024-03-15", "--json"])
+
+        assert result.exit_code == 0
+        assert [n["id"] for n in json.loads(result.output)] == ["web", "api"]
+
+    def test_stats_between(self, runner: CliRunner) -> None:
+        """Test that cached results are kept apart per time window."""
+        window = runner.invoke(
+            main, ["stats", self.DYNAMIC_FILE, "--between", "2024-03-01", "2024-04-30", "--json"]
+        )
+        whole = runner.invoke(main, ["stats", self.DYNAMIC_FILE, "--json"])
+
+        assert json.loads(window.output)["node_count"] == 3
+        assert json.loads(whole.output)["node_count"] == 4
+
+    def test_path_at(self, runner: CliRunner) -> None:
+        """Test that paths only use edges alive at the time."""
+        result = runner.invoke(
+            main, ["path", self.DYNAMIC_FILE, "web", "db", "--at", "2024-06-01", "--json"]
+        )
+
+        assert json.loads(result.output)["path"] == ["web", "cache", "db"]
+
+    def test_both_options(self, runner: CliRunner) -> None:
+        """Test that --at and --between are exclusive."""
+        result = runner.invoke(
+            main, ["edges", self.DYNAMIC_FILE, "--at", "2024-01-01", "--between", "a", "b"]
+        )
+
+        assert result.exit_code == 1
+        assert "either --at or --between" in result.output
+
+    def test_static_graph(self, runner: CliRunner) -> None:
+        """Test that slicing a static graph fails with a clear error."""
+        result = runner.invoke(main, ["components", SAMPLE_FILE, "--at", "1"])
+
+        assert result.exit_code == 1
+        assert "dynamic graph" in result.output
+
+
+class TestTimelineCommand:
+    """Tests for the timeline command."""
+
+    DYNAMIC_FILE = str(FIXTURES_DIR / "dynamic.gexf")
+
+    def test_ndjson(self, runner: CliRunner) -> None:
+        """Test streaming one row per step."""
+        result = runner.invoke(
+            main,
+            ["timeline", self.DYNAMIC_FILE, "--step", "30d", "--format", "ndjson"],
+        )
+
+        assert result.exit_code == 0
+        rows = [json.loads(line) for line in result.output.splitlines()]
+        assert [row["time"] for row in rows[:2]] == ["2024-01-01", "2024-01-31"]
+        assert [row["num_components"] for row in rows] == [2, 2, 1, 1, 1, 1, 1]
+
+    def test_metrics_and_range(self, runner: CliRunner) -> None:
+        """Test selecting metrics and the time range."""
+        result = runner.invoke(
+            main,
+            [
+                "timeline", self.DYNAMIC_FILE, "--step", "1w", "--metrics", "degree",
+                "--start", "2024-02-01", "--end", "2024-02-15", "--format", "tsv",
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert result.output.splitlines() == [
+            "time\tnode_count\tedge_count\tavg_degree\tmax_degree",
+            "2024-02-01\t3\t2\t1.3333\t2",
+            "2024-02-08\t3\t2\t1.3333\t2",
+            "2024-02-15\t3\t2\t1.3333\t2",
+        ]
+
+    def test_table(self, runner: CliRunner) -> None:
+        """Test the default table output."""
+        result = runner.invoke(main, ["timeline", self.DYNAMIC_FILE, "--step", "90d"])
+
+        assert result.exit_code == 0
+        assert "Timeline (3)" in result.output
+
+    def test_invalid_step(self, runner: CliRunner) -> None:
+        """Test that date graphs need a unit on the step."""
+        result = runner.invoke(main, ["timeline", self.DYNAMIC_FILE, "--step", "7"])
+
+        assert result.exit_code == 1
+        assert "Invalid step" in result.output
+
+
+class TestStartup:
+    """Tests for the cost of starting the CLI."""
+
+    def test_import_skips_heavy_modules(self) -> None:
+        """Test that importing the CLI does not import heavy dependencies."""
+        result = run_python(
+            f"import sys, grph.cli; print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_import_time_budget(self) -> None:
+        """Test that importing the CLI stays within the startup budget."""
+        result = run_python("import grph.cli", "-X", "importtime")
+        # Lines read "import time: self [us] | cumulative | imported package"
+        cumulative = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            _, total, name = line.split("|")
+            if total.strip().isdigit():
+                cumulative[name.strip()] = int(total)
+        assert cumulative["grph.cli"] < STARTUP_BUDGET_US
+
+    def test_meta_json_skips_heavy_modules(self) -> None:
+        """Test that meta --json reads the file without NetworkX or Rich."""
+        result = run_python(
+            "import sys\n"
+            "from grph.cli import main\n"
+            f"try:\n    main(['meta', {SAMPLE_FILE!r}, '--json'])\n"
+            "except SystemExit:\n    pass\n"
+            f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules], file=sys.stderr)"
+        )
+        assert json.loads(result.stdout)["node_count"] == 5
+        assert result.stderr.strip() == "[]"
@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from grph.models import CentralityType, ExportFormat
+from grph.models import CentralityType, ExportFormat, SimilarityMetric
 from grph.parser import GEXFGraph, GEXFParseError
 
 
@@ -99,6 +99,28 @@ class TestShortestPath:
         with pytest.raises(GEXFParseError, match="Source node not found"):
             graph.shortest_path("nonexistent", "db1")
 
+    def test_weighted_path_follows_edited_weights(self) -> None:
+        """Test that cached weights are rebuilt after invalidate_caches."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        before = graph.shortest_path("lb1", "db1", weighted=True)
+        for _, _, attrs in graph._graph.edges(data=True):
+            attrs["weight"] = attrs.get("weight", 1) * 2
+        graph.invalidate_caches()
+
+        after = graph.shortest_path("lb1", "db1", weighted=True)
+        assert after.path == before.path
+        assert after.total_weight == 2 * before.total_weight
+
+    def test_negative_weights_rejected(self) -> None:
+        """Test that weighted searches refuse negative weights."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        for _, _, attrs in graph._graph.edges(data=True):
+            attrs["weight"] = -1.0
+        graph.invalidate_caches()
+
+        with pytest.raises(GEXFParseError, match="Negative edge weights"):
+            graph.shortest_path("lb1", "db1", weighted=True)
+
 
 class TestAllPaths:
     """Tests for the all_paths method."""
@@ -215,6 +237,263 @@ class TestCommonNeighbors:
         assert len(common) == 2
 
 
+class TestFilteredTraversal:
+    """Tests for traversals constrained by edge and node attributes."""
+
+    def test_reachable_edge_filter(self) -> None:
+        """Test following only edges with a matching attribute."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        result = graph.reachable("lb1", edge_filters=[("relationship", "routes")])
+
+        assert result.ids() == ["server1", "server2"]
+
+    def test_reachable_node_filter(self) -> None:
+        """Test passing only through nodes with a matching attribute."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        result = graph.reachable("lb1", node_filters=[("type", "server")])
+
+        assert result.ids() == ["server1", "server2"]
+
+    def test_neighbors_edge_filter(self) -> None:
+        """Test filtered multi-hop neighbors."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        result = graph.neighbors(
+            "server1", direction="all", edge_filters=[("relationship", "queries")]
+        )
+
+        assert result.ids() == ["db1"]
+
+    def test_shortest_path_edge_filter(self) -> None:
+        """Test that filtered edges are not used by the path search."""
+        graph = GEXFGraph(SAMPLE_FILE)
+
+        assert graph.shortest_path("lb1", "db1", edge_filters=[("relationship", "routes")]) is None
+        result = graph.shortest_path(
+            "server1", "db1", edge_filters=[("relationship", "queries")]
+        )
+        assert result is not None
+        assert result.path == ["server1", "db1"]
+
+    def test_weighted_path_node_filter(self) -> None:
+        """Test weighted path search restricted to some nodes."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        result = graph.shortest_path(
+            "lb1",
+            "db1",
+            weighted=True,
+            node_filters=[("type", "server"), ("weight", "2.0")],
+        )
+
+        # db1 is not a server, so it can never be entered
+        assert result is None
+
+    def test_ego_graph_edge_filter(self) -> None:
+        """Test that the ego graph keeps only matching edges."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        ego = graph.ego_graph("lb1", radius=2, edge_filters=[("relationship", "routes")])
+
+        assert {n.id for n in ego.nodes()} == {"lb1", "server1", "server2"}
+        assert ego.metadata.edge_count == 2
+
+    def test_unknown_attribute_matches_nothing(self) -> None:
+        """Test filtering on an attribute no edge has."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        assert graph.reachable("lb1", edge_filters=[("missing", "x")]).count() == 0
+
+
+class TestNodeSet:
+    """Tests for lazy traversal results."""
+
+    def test_ids_sorted(self) -> None:
+        """Test that IDs come back in sorted order."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        result = graph.reachable("lb1")
+
+        assert result.ids() == ["cache1", "db1", "server1", "server2"]
+
+    def test_count(self) -> None:
+        """Test counting without materialising nodes."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        assert graph.neighbors("lb1", depth=2).count() == 4
+
+    def test_materialises_nodes(self) -> None:
+        """Test on-demand Node objects with attributes."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        result = graph.neighbors("db1", direction="in")
+
+        assert result[0].id == "server1"
+        assert result[0].attributes.get("type") == "server"
+        assert "server2" in result
+        assert "lb1" not in result
+
+    def test_empty(self) -> None:
+        """Test an empty result set."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        result = graph.reachable("db1")
+
+        assert not result
+        assert result.ids() == []
+        assert result.to_dict() == []
+
+
+class TestFrames:
+    """Tests for columnar node and edge frames."""
+
+    def test_node_frame_matches_nodes(self) -> None:
+        """Test that frames select the same nodes as the iterator API."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        cases = [
+            {},
+            {"attr_filters": [("type", "server")]},
+            {"attr_filters": [("weight", "2.0")]},
+            {"label_pattern": "*Server*"},
+            {"attr_filters": [("label", "Load Balancer")]},
+        ]
+        for filters in cases:
+            frame = graph.node_frame(**filters)
+            assert frame.ids() == [n.id for n in graph.nodes(**filters)]
+            assert frame.to_dict() == [n.to_dict() for n in graph.nodes(**filters)]
+
+    def test_edge_frame_matches_edges(self) -> None:
+        """Test that frames select the same edges as the iterator API."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        cases = [
+            {},
+            {"source_filter": "server1"},
+            {"target_filter": "db1", "attr_filters": [("relationship", "queries")]},
+            {"attr_filters": [("weight", "2.0")]},
+        ]
+        for filters in cases:
+            frame = graph.edge_frame(**filters)
+            assert frame.to_dict() == [e.to_dict() for e in graph.edges(**filters)]
+            assert list(frame) == list(graph.edges(**filters))
+
+    def test_sort_and_slice(self) -> None:
+        """Test stable sorting with missing values last, and slicing."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        frame = graph.node_frame()
+        weights = frame.sort_by("weight", descending=True).values("weight").tolist()
+        present = [w for w in weights if w is not None]
+
+        assert present == sorted(present, reverse=True)
+        assert weights[len(present):] == [None] * (len(weights) - len(present))
+        assert len(frame[1:3]) == 2
+        assert frame[1:3].ids() == frame.ids()[1:3]
+        assert frame[0].id == frame.ids()[0]
+
+    def test_to_numpy(self) -> None:
+        """Test conversion of columns to typed arrays."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        arrays = graph.node_frame(attr_filters=[("type", "server")]).to_numpy(["id", "weight"])
+
+        assert arrays["id"].tolist() == ["server1", "server2"]
+        assert arrays["weight"].dtype.kind == "f"
+
+    def test_write_frame_matches_write_records(self) -> None:
+        """Test that frames and iterators render identical TSV and NDJSON."""
+        import io
+
+        from grph.models import RecordFormat
+        from grph.records import edge_columns, write_frame, write_records
+
+        graph = GEXFGraph(SAMPLE_FILE)
+        columns = edge_columns(graph.edge_attribute_keys())
+        for fmt in (RecordFormat.TSV, RecordFormat.NDJSON):
+            from_frame, from_records = io.BytesIO(), io.BytesIO()
+            write_frame(graph.edge_frame(), fmt, from_frame)
+            write_records(graph.edges(), fmt, columns, from_records)
+            assert from_frame.getvalue() == from_records.getvalue()
+
+    def test_node_set_to_frame(self) -> None:
+        """Test that traversal results convert to frames in ID order."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        result = graph.reachable("lb1")
+
+        assert result.to_frame().ids() == result.ids()
+
+    def test_small_frames_gather_their_rows(self) -> None:
+        """Test that a few rows are read without building, or disturbing, whole columns."""
+        import numpy as np
+
+        graph = GEXFGraph(SAMPLE_FILE)
+        rows = np.array([3, 0])
+        gathered = {key: graph.node_values(key, rows).tolist() for key in ("id", "type")}
+        edges = {key: graph.edge_values(key, rows).tolist() for key in ("source", "weight")}
+
+        for key, values in gathered.items():
+            assert values == graph.node_values(key)[rows].tolist()
+            assert graph.node_values(key, rows).tolist() == values
+        for key, values in edges.items():
+            assert values == graph.edge_values(key)[rows].tolist()
+        assert graph.node_frame()[[3, 0]].to_dict() == [
+            graph.node_frame()[3].to_dict(), graph.node_frame()[0].to_dict()
+        ]
+
+class TestSimilarity:
+    """Tests for the bulk similarity method."""
+
+    def test_pairs_match_networkx(self) -> None:
+        """Test explicit pairs against NetworkX's undirected link predictors."""
+        import networkx as nx
+
+        graph = GEXFGraph(SAMPLE_FILE)
+        undirected = graph._graph.to_undirected()
+        pairs = [("server1", "server2"), ("lb1", "db1"), ("lb1", "server1")]
+
+        expected = {
+            SimilarityMetric.JACCARD: nx.jaccard_coefficient(undirected, pairs),
+            SimilarityMetric.ADAMIC_ADAR: nx.adamic_adar_index(undirected, pairs),
+            SimilarityMetric.RESOURCE_ALLOCATION: nx.resource_allocation_index(undirected, pairs),
+        }
+        for metric, reference in expected.items():
+            result = graph.similarity(metric, pairs=pairs)
+            for (u, v, score), (_, _, ref) in zip(result.pairs, reference):
+                assert score == pytest.approx(ref)
+
+    def test_common_neighbor_counts(self) -> None:
+        """Test that counts agree with common_neighbors."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        result = graph.similarity(pairs=[("server1", "server2"), ("lb1", "db1")])
+
+        assert [score for _, _, score in result.pairs] == [
+            graph.common_neighbors("server1", "server2").count(),
+            graph.common_neighbors("lb1", "db1").count(),
+        ]
+
+    def test_all_candidate_pairs(self) -> None:
+        """Test scoring every pair that shares a neighbor, best first."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        result = graph.similarity()
+
+        assert result.pairs[0] == ("server1", "server2", 3.0)
+        assert len(result.pairs) == 4
+        scores = [score for _, _, score in result.pairs]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_top_k_per_node(self) -> None:
+        """Test keeping only the best partner of each node."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        result = graph.similarity(top_k=1)
+
+        firsts = [u for u, _, _ in result.pairs]
+        assert len(firsts) == len(set(firsts)) == 5
+
+    def test_exclude_edges(self) -> None:
+        """Test skipping pairs that are already connected."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        result = graph.similarity(top_k=5, exclude_edges=True)
+
+        for u, v, _ in result.pairs:
+            assert not graph._graph.has_edge(u, v)
+            assert not graph._graph.has_edge(v, u)
+
+    def test_missing_node(self) -> None:
+        """Test that unknown nodes in pairs raise an error."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        with pytest.raises(GEXFParseError, match="Nodes not found"):
+            graph.similarity(pairs=[("lb1", "nonexistent")])
+
+
 class TestGetStats:
     """Tests for the get_stats method."""
 
@@ -302,6 +581,127 @@ class TestCentrality:
         # Top nodes should be sorted by score descending
         assert top_3[0][1] >= top_3[1][1] >= top_3[2][1]
 
+    def test_top_n_matches_full_sort(self) -> None:
+        """Test that partial-sort ranking matches a stable full sort, ties included."""
+        from grph.models import CentralityResult
+
+        scores = {f"n{i}": float(i % 7) for i in range(100)}
+        result = CentralityResult("degree", scores=scores)
+        expected = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+
+        for n in (0, 1, 5, 20, 100, 500):
+            assert result.top_n(n) == expected[:n]
+
+    def test_scores_view(self) -> None:
+        """Test the read-only mapping over the score array."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        result = graph.get_centrality(CentralityType.DEGREE)
+
+        assert list(result.scores) == graph.node_ids
+        assert result.scores["server1"] == pytest.approx(0.75)
+        assert "nope" not in result.scores
+        assert result.scores.get("nope", -1.0) == -1.0
+        with pytest.raises(TypeError):
+            result.scores["server1"] = 0.0  # type: ignore[index]
+        with pytest.raises(AttributeError):
+            result.scores = {}  # type: ignore[misc]
+
+    def test_combine_types(self) -> None:
+        """Test holding several centrality types side by side."""
+        from grph.models import CentralityResult
+
+        graph = GEXFGraph(SAMPLE_FILE)
+        pagerank = graph.get_centrality(CentralityType.PAGERANK)
+        degree = graph.get_centrality(CentralityType.DEGREE)
+        result = CentralityResult.combine([pagerank, degree])
+
+        assert result.types == ["pagerank", "degree"]
+        assert result.top_n(2) == pagerank.top_n(2)
+        assert result.top_n(2, by="degree") == degree.top_n(2)
+        d = result.to_dict()
+        assert d["scores"]["server1"]["degree"] == 0.75
+
+    def test_combine_reindexes_partial_results(self) -> None:
+        """Test that nodes missing from a combined result have no score."""
+        from grph.models import CentralityResult
+
+        full = CentralityResult("degree", scores={"a": 1.0, "b": 0.5})
+        partial = CentralityResult("ppr", scores={"b": 0.2})
+        d = CentralityResult.combine([full, partial]).to_dict()
+
+        assert d["scores"] == {"a": {"degree": 1.0, "ppr": None}, "b": {"degree": 0.5, "ppr": 0.2}}
+
+    def test_summary_and_without(self) -> None:
+        """Test percentile summaries and leaving nodes out."""
+        from grph.models import CentralityResult
+
+        result = CentralityResult("degree", scores={"a": 1.0, "b": 2.0, "c": 3.0})
+        summary = result.summary(percentiles=(50,))
+
+        assert summary == {"count": 3, "min": 1.0, "mean": 2.0, "max": 3.0, "p50": 2.0}
+        assert list(result.without(["b", "z"]).scores) == ["a", "c"]
+
+
+class TestPersonalizedPageRank:
+    """Tests for local personalized PageRank."""
+
+    def test_matches_networkx(self) -> None:
+        """Test that forward push approximates NetworkX's personalized PageRank."""
+        import networkx as nx
+
+        graph = GEXFGraph(SAMPLE_FILE)
+        result = graph.personalized_pagerank(["server1"], tolerance=1e-9)
+        expected = nx.pagerank(graph._graph, personalization={"server1": 1}, weight=None)
+
+        for node, score in expected.items():
+            assert result.scores.get(node, 0.0) == pytest.approx(score, abs=1e-6)
+
+    def test_only_reached_nodes_scored(self) -> None:
+        """Test that nodes the walk cannot reach are never touched."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        result = graph.personalized_pagerank(["server1"])
+
+        assert set(result.scores) == {"server1", "db1", "cache1"}
+        assert result.top_n(1)[0][0] == "server1"
+
+    def test_multiple_seeds(self) -> None:
+        """Test seeding the walk from several nodes."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        result = graph.personalized_pagerank(["server1", "server2"], tolerance=1e-9)
+
+        assert result.scores["server1"] == pytest.approx(result.scores["server2"])
+        assert sum(result.scores.values()) == pytest.approx(1.0, abs=1e-6)
+
+    def test_missing_seed(self) -> None:
+        """Test that unknown seeds raise an error."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        with pytest.raises(GEXFParseError, match="Nodes not found"):
+            graph.personalized_pagerank(["nonexistent"])
+
+    @pytest.mark.parametrize("alpha", [0.0, 1.0, 1.5, -0.1])
+    def test_alpha_out_of_range(self, alpha: float) -> None:
+        """Test that damping factors the push would never converge with are rejected."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        with pytest.raises(GEXFParseError, match="alpha"):
+            graph.personalized_pagerank(["lb1"], alpha=alpha)
+
+    @pytest.mark.parametrize("tolerance", [0.0, -1e-6])
+    def test_tolerance_not_positive(self, tolerance: float) -> None:
+        """Test that tolerances the push would never converge with are rejected."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        with pytest.raises(GEXFParseError, match="tolerance"):
+            graph.personalized_pagerank(["lb1"], tolerance=tolerance)
+
+    def test_forward_push_validates(self) -> None:
+        """Test that forward push itself rejects parameters it would loop on."""
+        from grph.ppr import forward_push
+
+        adjacency = GEXFGraph(SAMPLE_FILE).adjacency
+        with pytest.raises(ValueError, match="alpha"):
+            forward_push(adjacency, [0], alpha=1.0)
+        with pytest.raises(ValueError, match="tolerance"):
+            forward_push(adjacency, [0], tolerance=0.0)
+
 
 class TestComponents:
     """Tests for the components method."""
@@ -326,6 +726,32 @@ class TestComponents:
         assert "component_sizes" in d
         assert "components" in d
 
+    def test_components_match_networkx(self, tmp_path: Path) -> None:
+        """Test CSR components against NetworkX on a directed graph."""
+        import networkx as nx
+
+        from benchmarks.generate import generate
+
+        path = tmp_path / "dag.gexf"
+        generate("dag", 200, path, degree=1, seed=3)
+        graph = GEXFGraph(path)
+
+        for component_type, reference in [
+            ("weakly", nx.weakly_connected_components),
+            ("strongly", nx.strongly_connected_components),
+        ]:
+            result = graph.get_components(component_type)
+            expected = sorted((sorted(c) for c in reference(graph._graph)), key=len, reverse=True)
+            assert sorted(result.components) == sorted(expected)
+            assert result.component_sizes == [len(c) for c in expected]
+
+    def test_strong_components_in_node_order(self) -> None:
+        """Test that equal-size components are listed in graph order."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        result = graph.get_components("strongly")
+
+        assert [c[0] for c in result.components] == graph.node_ids
+
 
 class TestDegree:
     """Tests for the degree method."""
@@ -352,6 +778,21 @@ class TestDegree:
         for i in range(len(degrees) - 1):
             assert degrees[i]["total_degree"] >= degrees[i + 1]["total_degree"]
 
+    def test_degrees_match_networkx(self, tmp_path: Path) -> None:
+        """Test CSR degrees against NetworkX, counting self-loops twice."""
+        source = SAMPLE_FILE.read_text().replace('"directed"', '"undirected"')
+        source = source.replace("</edges>", '<edge id="loop" source="db1" target="db1"/></edges>')
+        path = tmp_path / "loop.gexf"
+        path.write_text(source)
+        graph = GEXFGraph(path)
+
+        degrees = {d["node"]: d["degree"] for d in graph.get_degree()["degrees"]}
+
+        assert degrees == dict(graph._graph.degree())
+        assert graph.get_stats().avg_degree == pytest.approx(
+            sum(degrees.values()) / len(degrees)
+        )
+
 
 class TestEgoGraph:
     """Tests for the ego_graph method."""
@@ -433,6 +874,136 @@ class TestExport:
         lines = result.strip().split("\n")
         assert len(lines) == 6  # 6 edges
 
+    def test_export_json_matches_node_link_data(self) -> None:
+        """Test that streamed JSON has the same content as node_link_data."""
+        import json
+
+        import networkx as nx
+
+        graph = GEXFGraph(SAMPLE_FILE)
+        result = json.loads(graph.export(ExportFormat.JSON))
+
+        assert result == json.loads(json.dumps(nx.node_link_data(graph._graph), default=str))
+
+    def test_export_graphml_round_trip(self) -> None:
+        """Test that streamed GraphML can be read back with its attributes."""
+        import io
+
+        import networkx as nx
+
+        graph = GEXFGraph(SAMPLE_FILE)
+        buffer = io.BytesIO()
+        graph.write_export(ExportFormat.GRAPHML, buffer)
+        buffer.seek(0)
+        loaded = nx.read_graphml(buffer)
+
+        assert loaded.number_of_edges() == 6
+        assert loaded.nodes["server1"]["weight"] == 1.5
+        assert loaded.edges["server1", "db1"]["relationship"] == "queries"
+
+    def test_export_graphml_keeps_graph_attributes(self) -> None:
+        """Test that graph-level attributes survive a GraphML round trip."""
+        import io
+
+        import networkx as nx
+
+        graph = GEXFGraph(SAMPLE_FILE)
+        graph._graph.graph.update({"id": "net", "revision": 3, "label": "a < b"})
+        expected = io.BytesIO()
+        nx.write_graphml(graph._graph.copy(), expected)
+        buffer = io.BytesIO()
+        graph.write_export(ExportFormat.GRAPHML, buffer)
+
+        loaded = nx.read_graphml(io.BytesIO(buffer.getvalue()))
+        reference = nx.read_graphml(io.BytesIO(expected.getvalue()))
+        assert loaded.graph == reference.graph
+        assert loaded.graph["mode"] == graph._graph.graph["mode"]
+        assert loaded.graph["revision"] == 3
+        assert loaded.graph["label"] == "a < b"
+
+    def test_write_export_in_chunks(self) -> None:
+        """Test that exporters write to the sink incrementally."""
+        from grph.exporters import ChunkedWriter
+
+        class RecordingSink:
+            def __init__(self) -> None:
+                self.writes: list[bytes] = []
+
+            def write(self, data: bytes) -> int:
+                self.writes.append(data)
+                return len(data)
+
+        sink = RecordingSink()
+        with ChunkedWriter(sink, chunk_size=16) as out:
+            for i in range(10):
+                out.write(f"line {i}\n")
+
+        assert len(sink.writes) > 1
+        assert max(len(w) for w in sink.writes) < 32
+        assert b"".join(sink.writes).count(b"\n") == 10
+
+    def test_export_npz_round_trip(self) -> None:
+        """Test that the npz export rebuilds the weighted CSR adjacency."""
+        import io
+
+        import numpy as np
+        import scipy.sparse as sp
+
+        graph = GEXFGraph(SAMPLE_FILE)
+        buffer = io.BytesIO()
+        graph.write_export(ExportFormat.NPZ, buffer)
+        buffer.seek(0)
+        data = np.load(buffer)
+
+        matrix = sp.csr_matrix((data["weights"], data["indices"], data["indptr"]))
+        ids = list(data["node_ids"])
+        assert matrix.nnz == 6
+        assert bool(data["directed"])
+        assert matrix[ids.index("lb1"), ids.index("server1")] == 1.0
+
+    def test_export_matrix_market(self) -> None:
+        """Test that the Matrix Market export can be read by SciPy."""
+        import io
+
+        import scipy.io
+
+        graph = GEXFGraph(SAMPLE_FILE)
+        buffer = io.BytesIO()
+        graph.write_export(ExportFormat.MTX, buffer)
+        buffer.seek(0)
+        matrix = scipy.io.mmread(buffer)
+
+        assert matrix.shape == (5, 5)
+        assert matrix.nnz == 6
+        assert "%%MatrixMarket" in graph.export(ExportFormat.MTX)
+
+    def test_export_columns_are_typed(self) -> None:
+        """Test that attribute columns keep numeric types and presence masks."""
+        import io
+
+        import numpy as np
+
+        graph = GEXFGraph(SAMPLE_FILE)
+        buffer = io.BytesIO()
+        graph.write_export(ExportFormat.COLUMNS, buffer)
+        buffer.seek(0)
+        data = np.load(buffer)
+
+        ids = list(data["node_ids"])
+        weights = data["node/weight"]
+        assert weights.dtype == np.float64
+        assert weights[ids.index("server1")] == 1.5
+        assert data["node/weight/present"].dtype == bool
+        assert data["edge_source"].size == 6
+        assert data["edge/relationship"].dtype.kind == "U"
+
+    def test_export_binary_format_as_string_raises(self) -> None:
+        """Test that binary formats are rejected by the string export."""
+        graph = GEXFGraph(SAMPLE_FILE)
+
+        with pytest.raises(ValueError, match="binary"):
+            graph.export(ExportFormat.NPZ)
+
 
 class TestModelSerialization:
     """Tests for model to_dict methods."""
@@ -485,3 +1056,843 @@ class TestModelSerialization:
         assert d["num_components"] == 2
         assert d["component_sizes"] == [3, 2]
         assert d["largest_component_size"] == 3
+
+
+class TestGEXFWriter:
+    """Tests for streaming GEXF output copied from the source file."""
+
+    def _write(self, graph: GEXFGraph) -> bytes:
+        """Write a graph with write_gexf and return the bytes."""
+        import io
+
+        buffer = io.BytesIO()
+        graph.write_gexf(buffer)
+        return buffer.getvalue()
+
+    def test_subgraph_round_trip(self) -> None:
+        """Test that a written subgraph reads back with the same structure."""
+        from io import BytesIO
+
+        import networkx as nx
+
+        sub = GEXFGraph(SAMPLE_FILE).subgraph(["lb1", "server1", "db1"])
+        loaded = nx.read_gexf(BytesIO(self._write(sub)))
+
+        assert set(loaded.nodes()) == {"lb1", "server1", "db1"}
+        assert set(loaded.edges()) == {("lb1", "server1"), ("server1", "db1")}
+        assert loaded.nodes["server1"]["weight"] == 1.5
+
+    def test_keeps_source_header(self) -> None:
+        """Test that metadata and attribute declarations are copied verbatim."""
+        output = self._write(GEXFGraph(SAMPLE_FILE).subgraph(["db1"])).decode()
+
+        assert "<creator>GFX Test Suite</creator>" in output
+        assert '<attribute id="1" title="weight" type="float"/>' in output
+        assert 'id="server1"' not in output
+
+    def test_kept_elements_are_byte_identical(self) -> None:
+        """Test that kept elements are copied rather than re-serialised."""
+        source = SAMPLE_FILE.read_text()
+        start = source.index('<node id="cache1"')
+        element = source[start:source.index("</node>", start) + len("</node>")]
+
+        output = self._write(GEXFGraph(SAMPLE_FILE).subgraph(["cache1"])).decode()
+
+        assert element in output
+        assert "        </nodes>\n" in output
+
+    def test_edge_filtered_ego_graph(self) -> None:
+        """Test that edges removed by a filter are not written."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        ego = graph.ego_graph("server1", radius=1, edge_filters=[("relationship", "queries")])
+
+        output = self._write(ego).decode()
+
+        assert 'id="e2"' in output
+        assert 'id="e4"' not in output
+
+    def test_rewrites_declared_counts(self, tmp_path: Path) -> None:
+        """Test that count attributes on <nodes>/<edges> match the output."""
+        source = SAMPLE_FILE.read_text().replace("<nodes>", '<nodes count="5">')
+        path = tmp_path / "counted.gexf"
+        path.write_text(source)
+
+        output = self._write(GEXFGraph(path).subgraph(["lb1", "server1"])).decode()
+
+        assert '<nodes count="2">' in output
+
+    def test_rewritten_tag_with_quoted_bracket(self, tmp_path: Path) -> None:
+        """Test that a '>' inside an attribute value does not end the rewritten tag."""
+        source = SAMPLE_FILE.read_text().replace("<nodes>", '<nodes note="a>b" count="5">')
+        path = tmp_path / "counted.gexf"
+        path.write_text(source)
+
+        output = self._write(GEXFGraph(path).subgraph(["lb1"])).decode()
+
+        assert '<nodes note="a&gt;b" count="1">' in output
+        assert '<node id="lb1"' in output
+        assert 'b" count="5">' not in output
+
+    def test_rewritten_tag_keeps_declared_encoding(self, tmp_path: Path) -> None:
+        """Test that rewritten tags are encoded like the rest of the document."""
+        from io import BytesIO
+
+        import networkx as nx
+
+        source = (
+            SAMPLE_FILE.read_text()
+            .replace('encoding="UTF-8"', 'encoding="ISO-8859-1"')
+            .replace("<nodes>", '<nodes note="café" count="5">')
+        )
+        path = tmp_path / "latin1.gexf"
+        path.write_bytes(source.encode("latin-1"))
+
+        output = self._write(GEXFGraph(path).subgraph(["lb1", "server1"]))
+
+        assert '<nodes note="café" count="2">'.encode("latin-1") in output
+        assert set(nx.read_gexf(BytesIO(output)).nodes()) == {"lb1", "server1"}
+
+
+class TestJSONSerialization:
+    """Tests for the JSON serialization layer."""
+
+    @pytest.fixture(params=["orjson", "stdlib"])
+    def serialization(self, request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch):
+        """The serialization module, with and without orjson."""
+        from grph import serialization
+
+        if request.param == "stdlib":
+            monkeypatch.setattr(serialization, "orjson", None)
+        elif serialization.orjson is None:
+            pytest.skip("orjson is not installed")
+        return serialization
+
+    def test_numpy_values(self, serialization) -> None:
+        """Test that NumPy arrays and scalars are encoded as JSON values."""
+        import json
+
+        import numpy as np
+
+        data = {"ids": np.arange(3, dtype=np.int32), "score": np.float64(0.5)}
+
+        assert json.loads(serialization.dumps(data)) == {"ids": [0, 1, 2], "score": 0.5}
+
+    def test_compact_output(self, serialization) -> None:
+        """Test that compact output is a single line."""
+        from grph.models import CentralityResult
+
+        result = CentralityResult(centrality_type="degree", scores={"a": 0.1234567})
+
+        assert serialization.dumps(result, compact=True) == (
+            b'{"type":"degree","scores":{"a":0.123457}}'
+        )
+
+    def test_indented_output_matches_stdlib(self, serialization) -> None:
+        """Test that indented output has the same layout as json.dumps(indent=2)."""
+        import json
+
+        data = {"nodes": [{"id": "a", "attributes": {}}], "count": 1}
+
+        assert serialization.dumps(data).decode() == json.dumps(data, indent=2)
+
+
+class TestPagination:
+    """Tests for limit/offset on node and edge iteration."""
+
+    def test_nodes_limit_offset(self) -> None:
+        """Test that limit and offset select a window of nodes."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        all_ids = [n.id for n in graph.nodes()]
+
+        page = [n.id for n in graph.nodes(limit=2, offset=1)]
+
+        assert page == all_ids[1:3]
+
+    def test_nodes_offset_applies_after_filters(self) -> None:
+        """Test that the offset counts matching nodes only."""
+        graph = GEXFGraph(SAMPLE_FILE)
+
+        page = list(graph.nodes(attr_filters=[("type", "server")], offset=1))
+
+        assert [n.id for n in page] == ["server2"]
+
+    def test_edges_limit_stops_early(self) -> None:
+        """Test that a limit stops reading edges once it is reached."""
+        graph = GEXFGraph(SAMPLE_FILE)
+
+        assert len(list(graph.edges(limit=2))) == 2
+        assert list(graph.edges(limit=0)) == []
+        assert len(list(graph.edges(offset=5))) == 1
+
+
+class TestTableRendering:
+    """Tests for choosing between Rich tables and streamed rows."""
+
+    def _render(self, rows: int, terminal: bool, monkeypatch: pytest.MonkeyPatch) -> str:
+        """Render ``rows`` nodes with a table limit of 10 and return the output."""
+        import io
+
+        from rich.console import Console
+
+        from grph import formatters
+        from grph.models import Node
+
+        monkeypatch.setattr(formatters, "TABLE_MAX_ROWS", 10)
+        buffer = io.StringIO()
+        console = Console(file=buffer, force_terminal=terminal, width=60)
+        nodes = (Node(id=f"n{i}", label=f"Node {i}", attributes={"k": i}) for i in range(rows))
+        formatters.print_nodes_table(nodes, console=console)
+        return buffer.getvalue()
+
+    def test_small_result_uses_table(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that results within the limit are drawn as a Rich table."""
+        output = self._render(5, terminal=False, monkeypatch=monkeypatch)
+
+        assert "Nodes (5)" in output
+        assert "┃" in output
+
+    def test_large_result_streams_tsv_off_terminal(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that large non-terminal output falls back to TSV."""
+        lines = self._render(25, terminal=False, monkeypatch=monkeypatch).splitlines()
+
+        assert lines[0] == "id\tlabel\tattributes"
+        assert lines[1] == "n0\tNode 0\tk=0"
+        assert len(lines) == 26
+
+    def test_large_result_streams_columns_on_terminal(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that large terminal output uses fixed-width columns."""
+        output = self._render(25, terminal=True, monkeypatch=monkeypatch)
+
+        assert "┃" not in output
+        assert "n24" in output
+        assert "Nodes (25)" in output
+
+
+
+class TestResultCache:
+    """Tests for memoized graph results."""
+
+    def test_repeated_calls_hit(self) -> None:
+        """Test that a repeated call returns the cached result."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        first = graph.get_centrality(CentralityType.PAGERANK)
+        second = graph.get_centrality(centrality_type=CentralityType.PAGERANK)
+
+        assert second == first
+        stats = graph.cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+        assert stats.size > 0
+
+    def test_results_are_copies(self) -> None:
+        """Test that changing a returned result does not change later calls."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        degrees = graph.get_degree()
+        expected = graph.get_degree()
+        degrees.clear()
+        components = graph.get_components("weakly")
+        components.components[0].clear()
+        components.component_sizes.sort(reverse=True)
+        stats = graph.get_stats()
+        stats.node_count = 0
+        centrality = graph.get_centrality(CentralityType.DEGREE)
+        centrality.values[:] = 0
+
+        assert graph.get_degree() == expected
+        assert graph.get_components("weakly").components[0]
+        assert graph.get_stats().node_count == 5
+        assert graph.get_centrality(CentralityType.DEGREE).values.max() > 0
+        assert graph.get_centrality(CentralityType.DEGREE).node_ids is graph.node_ids
+        assert graph.cache.stats().hits == 6
+
+    def test_arguments_are_part_of_the_key(self) -> None:
+        """Test that different arguments get separate entries."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        graph.get_components("strongly")
+        graph.personalized_pagerank(["lb1"])
+        graph.personalized_pagerank(["lb1"], alpha=0.5)
+
+        assert graph.get_components("weakly") is not graph.get_components("strongly")
+        assert graph.cache.stats().entries == 4
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used entry goes first."""
+        from grph.memo import ResultCache
+
+        cache = ResultCache(max_size=100)
+        cache.put("a", 1, size=40)
+        cache.put("b", 2, size=40)
+        cache.get("a")
+        cache.put("c", 3, size=40)
+        cache.put("huge", 4, size=500)
+
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c"), cache.get("huge")) == (1, 3, None)
+        assert cache.stats().evictions == 1
+
+    def test_disabled(self) -> None:
+        """Test that a zero budget turns caching off."""
+        graph = GEXFGraph(SAMPLE_FILE, cache_size=0)
+
+        assert graph.get_stats() is not graph.get_stats()
+        assert graph.cache.stats().entries == 0
+
+    def test_reload_and_refresh(self, tmp_path: Path) -> None:
+        """Test that reloading drops results and refresh notices file changes."""
+        import os
+
+        path = tmp_path / "graph.gexf"
+        path.write_text(SAMPLE_FILE.read_text())
+        graph = GEXFGraph(path)
+        stats = graph.get_stats()
+
+        assert graph.refresh() is False
+        assert graph.get_stats() == stats
+        assert graph.cache.stats().hits == 1
+
+        path.write_text(SAMPLE_FILE.read_text().replace('<node id="lb1"', '<node id="lb2"'))
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+        assert graph.refresh() is True
+        graph.get_stats()
+        assert graph.cache.stats().hits == 1
+        assert "lb2" in graph.node_index
+
+        graph.reload()
+        assert graph.cache.stats().entries == 0
+
+    def test_subgraph_has_own_cache(self) -> None:
+        """Test that subgraphs cache separately and cannot be reloaded."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        sub = graph.subgraph(["lb1", "server1"])
+
+        assert sub.get_stats().node_count == 2
+        assert graph.get_stats().node_count == 5
+        with pytest.raises(GEXFParseError):
+            sub.reload()
+
+
+class TestResultStore:
+    """Tests for the on-disk result store."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test that stored results decode to equal objects."""
+        from grph.models import CentralityResult
+        from grph.result_store import ResultStore
+
+        graph = GEXFGraph(SAMPLE_FILE)
+        store = ResultStore(tmp_path)
+        results = [
+            graph.get_stats(),
+            graph.get_components("strongly"),
+            graph.get_degree(),
+            CentralityResult.combine(
+                [
+                    graph.get_centrality(CentralityType.PAGERANK),
+                    graph.personalized_pagerank(["lb1"]),
+                ]
+            ),
+        ]
+        for i, result in enumerate(results):
+            key = store.key(SAMPLE_FILE, f"test{i}", {})
+            assert store.put(key, result)
+            assert store.get(key) == result
+
+    def test_invalid_size_from_environment(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a bad GRPH_CACHE_SIZE falls back to the default budget."""
+        from grph.result_store import DEFAULT_MAX_SIZE, ResultStore
+
+        monkeypatch.setenv("GRPH_CACHE_DIR", str(tmp_path))
+        for value, expected in (("1G", DEFAULT_MAX_SIZE), ("-5", DEFAULT_MAX_SIZE), ("4096", 4096)):
+            monkeypatch.setenv("GRPH_CACHE_SIZE", value)
+            assert ResultStore.default().max_size == expected
+
+    def test_key_follows_content(self, tmp_path: Path) -> None:
+        """Test that keys depend on file contents and arguments, not the path."""
+        from grph.result_store import ResultStore
+
+        store = ResultStore(tmp_path / "cache")
+        copy = tmp_path / "copy.gexf"
+        copy.write_bytes(SAMPLE_FILE.read_bytes())
+        key = store.key(SAMPLE_FILE, "stats", {})
+
+        assert store.key(copy, "stats", {}) == key
+        assert store.key(copy, "stats", {"type": "weakly"}) != key
+        copy.write_text(SAMPLE_FILE.read_text().replace("lb1", "lb2"))
+        assert store.key(copy, "stats", {}) != key
+
+    def test_eviction(self, tmp_path: Path) -> None:
+        """Test that the oldest entries are evicted beyond the budget."""
+        import os
+
+        from grph.result_store import ResultStore
+
+        store = ResultStore(tmp_path, max_size=250)
+        for i in range(3):
+            store.put(f"degree-{i}", {"degrees": list(range(20))})
+            entry = tmp_path / "results" / f"degree-{i}.bin"
+            os.utime(entry, ns=(i, i))
+
+        store.put("degree-3", {"degrees": list(range(20))})
+
+        assert store.get("degree-0") is None
+        assert store.get("degree-3") is not None
+        assert store.stats().size <= 250
+
+    def test_damaged_entry_is_a_miss(self, tmp_path: Path) -> None:
+        """Test that an unreadable entry is dropped instead of failing."""
+        from grph.result_store import ResultStore
+
+        store = ResultStore(tmp_path)
+        store.put("stats-x", {"a": 1})
+        (tmp_path / "results" / "stats-x.bin").write_bytes(b"GRPH-RESULT 1\nxx")
+
+        assert store.get("stats-x") is None
+        assert store.stats().entries == 0
+
+
+class TestSidecarIndex:
+    """Tests for sidecar indexes built next to a graph file."""
+
+    @pytest.fixture
+    def graph_file(self, tmp_path: Path) -> Path:
+        """Copy the sample graph somewhere its sidecar can be written."""
+        path = tmp_path / "sample.gexf"
+        path.write_bytes(SAMPLE_FILE.read_bytes())
+        return path
+
+    def test_index_is_used_on_load(self, graph_file: Path) -> None:
+        """Test that a built index is detected by later loads."""
+        from grph.sidecar import SECTIONS, index_path
+
+        path = GEXFGraph(graph_file).build_index()
+        graph = GEXFGraph(graph_file)
+
+        assert path == index_path(graph_file)
+        assert graph.sidecar is not None
+        assert graph.sidecar.sections == list(SECTIONS)
+
+    def test_results_match_unindexed(self, graph_file: Path) -> None:
+        """Test that queries answer the same with and without the index."""
+        plain = GEXFGraph(graph_file)
+        GEXFGraph(graph_file).build_index()
+        indexed = GEXFGraph(graph_file)
+
+        node_ids = plain.node_ids
+        for source in node_ids:
+            for target in node_ids:
+                assert indexed.has_path(source, target) == plain.has_path(source, target)
+                assert indexed.shortest_path(source, target) == plain.shortest_path(
+                    source, target
+                )
+        for component_type in ("connected", "strongly", "weakly"):
+            assert indexed.get_components(component_type) == plain.get_components(
+                component_type
+            )
+        assert indexed.get_degree() == plain.get_degree()
+        for filters in ([("type", "server")], [("weight", "2.0")], [("type", "none")]):
+            assert indexed.node_frame(attr_filters=filters).ids() == plain.node_frame(
+                attr_filters=filters
+            ).ids()
+        for pattern in ("Web*", "Web Server [2]", "*Cache", "Nothing*"):
+            assert indexed.node_frame(label_pattern=pattern).ids() == plain.node_frame(
+                label_pattern=pattern
+            ).ids()
+        edge_filters = [("relationship", "routes")]
+        assert [n.id for n in indexed.reachable("lb1", edge_filters=edge_filters)] == [
+            n.id for n in plain.reachable("lb1", edge_filters=edge_filters)
+        ]
+
+    def test_stale_index_is_ignored(self, graph_file: Path) -> None:
+        """Test that an index is not used once the file changes."""
+        from grph.sidecar import read_info
+
+        GEXFGraph(graph_file).build_index(["attrs"])
+        graph_file.write_text(graph_file.read_text() + "\n")
+
+        info = read_info(graph_file)
+        assert GEXFGraph(graph_file).sidecar is None
+        assert info is not None and info.stale
+        assert info.sections == ["attrs"]
+
+    def test_unknown_section(self, graph_file: Path) -> None:
+        """Test that unknown sections are rejected."""
+        graph = GEXFGraph(graph_file)
+        with pytest.raises(GEXFParseError, match="Unknown index section"):
+            graph.build_index(["attrs", "bloom"])
+
+
+class TestDiskGraph:
+    """Tests for out-of-core indexes, queried without loading the graph."""
+
+    @staticmethod
+    def random_graph(path: Path, directed: bool, seed: int) -> Path:
+        """Write a random multigraph with loops, attributes and undeclared endpoints."""
+        import random
+
+        rng = random.Random(seed)
+        nodes, edges = [], []
+        for i in range(50):
+            values = f'<attvalue for="0" value="{rng.randrange(4)}"/>' if rng.random() < 0.7 else ""
+            nodes.append(f'<node id="n{rng.randrange(1000)}-{i}" label="N{i}">'
+                         f"<attvalues>{values}</attvalues></node>")
+        ids = [node.split('"')[1] for node in nodes]
+        for _ in range(300):
+            source = rng.choice(ids) if rng.random() < 0.95 else f"x{rng.randrange(10)}"
+            target = rng.choice(ids) if rng.random() < 0.9 else source
+            weight = f' weight="{rng.randrange(1, 9)}"' if rng.random() < 0.8 else ""
+            kind = f'<attvalue for="0" value="k{rng.randrange(3)}"/>' if rng.random() < 0.5 else ""
+            edges.append(f'<edge source="{source}" target="{target}"{weight}>'
+                         f"<attvalues>{kind}</attvalues></edge>")
+        path.write_text(
+            '<gexf xmlns="http://gexf.net/1.3" version="1.3">'
+            f'<graph defaultedgetype="{"directed" if directed else "undirected"}">'
+            '<attributes class="node"><attribute id="0" title="score" type="integer"/></attributes>'
+            '<attributes class="edge"><attribute id="0" title="kind" type="string"/></attributes>'
+            f'<nodes>{"".join(nodes)}</nodes><edges>{"".join(edges)}</edges></graph></gexf>'
+        )
+        return path
+
+    @staticmethod
+    def check_against_parsed(path: Path) -> None:
+        """Check that every supported query answers as on the parsed graph."""
+        from grph.diskgraph import DiskGraph
+
+        plain = GEXFGraph(path)
+        disk = DiskGraph.open(path)
+        assert disk is not None
+
+        def answer(query):
+            try:
+                result = query()
+            except GEXFParseError as e:
+                return str(e)
+            return result.to_dict() if hasattr(result, "to_dict") else result
+
+        assert list(disk.node_ids) == list(plain.node_ids)
+        assert disk.metadata == plain.metadata
+        node_ids = list(plain.node_ids)[:12]
+        for edge_filters, node_filters in (
+            (None, None), ([("kind", "k1")], None), (None, [("score", "2")]),
+        ):
+            filters = {"edge_filters": edge_filters, "node_filters": node_filters}
+            for source in node_ids:
+                for direction in ("in", "out", "all"):
+                    assert answer(lambda: disk.neighbors(source, direction, 2, **filters)) == (
+                        answer(lambda: plain.neighbors(source, direction, 2, **filters))
+                    )
+                for direction in ("forward", "backward", "both"):
+                    assert answer(lambda: disk.reachable(source, direction, **filters)) == (
+                        answer(lambda: plain.reachable(source, direction, **filters))
+                    )
+                for target in node_ids:
+                    for weighted in (False, True):
+                        assert answer(
+                            lambda: disk.shortest_path(source, target, weighted, **filters)
+                        ) == answer(
+                            lambda: plain.shortest_path(source, target, weighted, **filters)
+                        )
+        for component_type in ("connected", "strongly", "weakly"):
+            assert disk.get_components(component_type) == plain.get_components(component_type)
+        assert disk.get_degree() == plain.get_degree()
+        assert disk.get_degree(limit=5) == plain.get_degree(limit=5)
+        for node_id in node_ids:
+            assert disk.get_degree(node_id) == plain.get_degree(node_id)
+            assert disk.get_node(node_id) == plain.get_node(node_id)
+
+    def test_sample_matches_parsed(self, tmp_path: Path) -> None:
+        """Test that queries on the sample graph answer as on the parsed graph."""
+        from grph.diskbuild import build_disk_index
+
+        path = tmp_path / "sample.gexf"
+        path.write_bytes(SAMPLE_FILE.read_bytes())
+        build_disk_index(path)
+
+        self.check_against_parsed(path)
+
+    @pytest.mark.parametrize("directed", [True, False])
+    def test_random_multigraph_matches_parsed(self, tmp_path: Path, directed: bool) -> None:
+        """Test parallel edges, loops and undeclared nodes, sorted in many buckets."""
+        from grph.diskbuild import build_disk_index
+
+        path = self.random_graph(tmp_path / "random.gexf", directed, seed=3)
+        # A tiny memory budget forces the external sort to use many buckets
+        build_disk_index(path, memory=1024)
+
+        self.check_against_parsed(path)
+
+    def test_stale_index_is_ignored(self, tmp_path: Path) -> None:
+        """Test that an out-of-core index is not used once the file changes."""
+        from grph.diskbuild import build_disk_index
+        from grph.diskgraph import DiskGraph
+
+        path = tmp_path / "sample.gexf"
+        path.write_bytes(SAMPLE_FILE.read_bytes())
+        assert DiskGraph.open(path) is None
+        build_disk_index(path)
+        path.write_text(path.read_text() + "\n")
+
+        assert DiskGraph.open(path) is None
+
+    def test_duplicate_node_ids(self, tmp_path: Path) -> None:
+        """Test that duplicate node IDs are rejected."""
+        from grph.diskbuild import build_disk_index
+
+        path = tmp_path / "duplicates.gexf"
+        path.write_text(
+            '<gexf xmlns="http://gexf.net/1.3" version="1.3"><graph>'
+            '<nodes><node id="a"/><node id="b"/><node id="a"/></nodes>'
+            '<edges><edge source="a" target="b"/></edges></graph></gexf>'
+        )
+        with pytest.raises(GEXFParseError, match="Duplicate node ID: a"):
+            build_disk_index(path)
+        assert not (tmp_path / "duplicates.gexf.grphidx").exists()
+
+    def test_parse_size(self) -> None:
+        """Test memory sizes with and without units."""
+        from grph.diskbuild import parse_size
+
+        assert parse_size("4096") == 4096
+        assert parse_size("512M") == 512 << 20
+        assert parse_size("1.5gib") == 3 << 29
+        for text in ("", "0", "lots", "-1G"):
+            with pytest.raises(GEXFParseError):
+                parse_size(text)
+
+
+class TestTimeSlicing:
+    """Tests for slicing dynamic graphs by time."""
+
+    DYNAMIC_FILE = FIXTURES_DIR / "dynamic.gexf"
+
+    def test_at(self) -> None:
+        """Test that a snapshot holds the nodes and edges alive at a time."""
+        graph = GEXFGraph(self.DYNAMIC_FILE)
+        snapshot = graph.at("2024-03-15")
+
+        # db's first spell ended in February, so api -> db is gone with it
+        assert snapshot.node_ids == ["web", "api"]
+        assert [(e.source, e.target) for e in snapshot.edges()] == [("web", "api")]
+        assert snapshot.metadata.node_count == 2
+
+    def test_spells_and_open_bounds(self) -> None:
+        """Test that nodes come back with a later spell and open ends never expire."""
+        graph = GEXFGraph(self.DYNAMIC_FILE)
+        snapshot = graph.at("2030-01-01")
+
+        assert snapshot.node_ids == ["web", "db", "cache"]
+        assert snapshot.shortest_path("web", "db").path == ["web", "cache", "db"]
+
+    def test_between(self) -> None:
+        """Test that a range holds everything alive at any time within it."""
+        graph = GEXFGraph(self.DYNAMIC_FILE)
+        window = graph.between("2024-03-01", "2024-04-30")
+
+        assert window.node_ids == ["web", "api", "cache"]
+        assert window.get_components().num_components == 1
+        assert len(graph.between("2024-04-30", "2024-03-01").node_ids) == 0
+
+    def test_numeric_open_spells(self, tmp_path: Path) -> None:
+        """Test numeric times, including open spells NetworkX cannot read."""
+        path = tmp_path / "numeric.gexf"
+        path.write_text(
+            self.DYNAMIC_FILE.read_text()
+            .replace(' timeformat="date"', "")
+            .replace("2024-0", "")
+            .replace("-01", ".01")
+            .replace("-29", ".29")
+            .replace("-30", ".30")
+            .replace("-31", ".31")
+        )
+        graph = GEXFGraph(path)
+
+        assert graph.at(3.15).node_ids == ["web", "api"]
+        assert graph.at("7").node_ids == ["web", "db", "cache"]
+
+    def test_static_graph(self) -> None:
+        """Test that static graphs cannot be sliced."""
+        with pytest.raises(GEXFParseError, match="dynamic graph"):
+            GEXFGraph(SAMPLE_FILE).at(1)
+
+    def test_invalid_time(self) -> None:
+        """Test that times must match the graph's time format."""
+        with pytest.raises(GEXFParseError, match="Invalid time"):
+            GEXFGraph(self.DYNAMIC_FILE).at("last week")
+
+    def test_interval_index_matches_scan(self) -> None:
+        """Test the interval tree against a scan of every interval."""
+        import numpy as np
+
+        from grph.intervals import IntervalIndex
+
+        rng = np.random.default_rng(0)
+        starts = rng.uniform(0, 100, 5000)
+        ends = starts + rng.exponential(5, 5000)
+        starts[:50], ends[50:100] = -np.inf, np.inf
+        owners = rng.integers(0, 3000, 5000)
+        index = IntervalIndex(starts, ends, owners)
+
+        for time in (-1.0, 0.0, 12.5, 50.0, 99.0, 500.0):
+            expected = np.unique(owners[(starts <= time) & (ends >= time)])
+            assert np.array_equal(index.at(time), expected)
+        for low, high in ((10.0, 20.0), (-5.0, 0.0), (95.0, 1000.0)):
+            expected = np.unique(owners[(starts <= high) & (ends >= low)])
+            assert np.array_equal(index.between(low, high), expected)
+
+
+class TestTimeline:
+    """Tests for incrementally maintained metrics over time."""
+
+    DYNAMIC_FILE = FIXTURES_DIR / "dynamic.gexf"
+
+    @staticmethod
+    def check_against_snapshots(graph: GEXFGraph, points: list) -> None:
+        """Compare each timeline point with metrics of the snapshot at its time."""
+        import networkx as nx
+
+        for point in points:
+            snapshot = graph.at(point.time)
+            stats = snapshot.get_stats()
+            assert (point.node_count, point.edge_count) == (stats.node_count, stats.edge_count)
+            assert point.metrics["num_components"] == stats.num_components
+            components = snapshot.get_components()
+            assert point.metrics["largest_component_size"] == components.largest_component_size
+            degrees = [d for _, d in snapshot._graph.degree()]
+            assert point.metrics["max_degree"] == max(degrees, default=0)
+            if stats.node_count:
+                scores = nx.pagerank(snapshot._graph)
+                assert point.metrics["top_pagerank"] == pytest.approx(
+                    max(scores.values()), abs=2e-3
+                )
+
+    def test_matches_snapshots(self) -> None:
+        """Test that every step agrees with the snapshot at its time."""
+        graph = GEXFGraph(self.DYNAMIC_FILE)
+        points = list(graph.timeline("1d", start="2023-12-30", end="2024-07-05"))
+
+        assert points[0].time == "2023-12-30"
+        assert points[0].node_count == 0
+        assert len(points) == 189
+        self.check_against_snapshots(graph, points)
+
+    def test_random_graph_matches_snapshots(self, tmp_path: Path) -> None:
+        """Test removals, spells and parallel edges on a random undirected graph."""
+        import random
+
+        rng = random.Random(7)
+        nodes, edges = [], []
+        for i in range(60):
+            start = rng.randrange(40)
+            end = start + rng.randrange(40)
+            if i % 5 == 0:
+                spells = f'<spell start="{start}" end="{end}"/><spell start="{end + 3}"/>'
+                nodes.append(f'<node id="n{i}"><spells>{spells}</spells></node>')
+            else:
+                nodes.append(f'<node id="n{i}" start="{start}" end="{end}"/>')
+        for e in range(150):
+            u, v = rng.randrange(60), rng.randrange(60)
+            start = rng.randrange(40)
+            edges.append(
+                f'<edge id="e{e}" source="n{u}" target="n{v}" weight="{rng.choice([1, 2])}"'
+                f' start="{start}" end="{start + rng.randrange(15)}"/>'
+            )
+        path = tmp_path / "random.gexf"
+        path.write_text(
+            '<gexf xmlns="http://gexf.net/1.3" version="1.3">'
+            '<graph mode="dynamic" defaultedgetype="undirected" timeformat="integer">'
+            f'<nodes>{"".join(nodes)}</nodes><edges>{"".join(edges)}</edges></graph></gexf>'
+        )
+        graph = GEXFGraph(path)
+
+        self.check_against_snapshots(graph, list(graph.timeline(2)))
+
+    def test_warm_start(self) -> None:
+        """Test that PageRank converges at once when nothing changed."""
+        graph = GEXFGraph(self.DYNAMIC_FILE)
+        points = list(graph.timeline("1w", metrics=["pagerank"], end="2024-01-31"))
+
+        assert [p.metrics["pagerank_iterations"] > 1 for p in points] == [
+            True, False, False, False, False
+        ]
+        assert set(points[0].to_dict()) == {
+            "time", "node_count", "edge_count",
+            "top_pagerank_node", "top_pagerank", "pagerank_iterations",
+        }
+
+    def test_numeric_step(self, tmp_path: Path) -> None:
+        """Test that numeric time formats take a plain number as the step."""
+        path = tmp_path / "numeric.gexf"
+        path.write_text(
+            '<gexf xmlns="http://gexf.net/1.3" version="1.3">'
+            '<graph mode="dynamic" defaultedgetype="directed"><nodes>'
+            '<node id="a" start="0" end="10"/><node id="b" start="5"/></nodes>'
+            '<edges><edge source="a" target="b" end="7"/></edges></graph></gexf>'
+        )
+        points = list(GEXFGraph(path).timeline(2.5, metrics=["degree"]))
+
+        assert [p.time for p in points] == [0, 2.5, 5, 7.5, 10]
+        assert [p.edge_count for p in points] == [0, 0, 1, 0, 0]
+
+    def test_invalid_arguments(self) -> None:
+        """Test errors for bad steps and metrics, and for static graphs."""
+        graph = GEXFGraph(self.DYNAMIC_FILE)
+
+        with pytest.raises(GEXFParseError, match="Invalid step"):
+            graph.timeline("1")
+        with pytest.raises(GEXFParseError, match="positive"):
+            graph.timeline("0d")
+        with pytest.raises(GEXFParseError, match="Unknown metrics: closeness"):
+            graph.timeline("1d", metrics=["closeness"])
+        with pytest.raises(GEXFParseError, match="dynamic graph"):
+            GEXFGraph(SAMPLE_FILE).timeline(1)
+
+
+class TestProfiling:
+    """Tests for phase spans and the hook API."""
+
+    def test_hook_receives_parse_phases(self) -> None:
+        """Test that loading a graph reports its phases to a hook."""
+        from grph.profiling import Span, add_span_hook, remove_span_hook
+
+        names: list[str] = []
+
+        def hook(finished: Span) -> None:
+            names.append(finished.name)
+
+        add_span_hook(hook)
+        try:
+            GEXFGraph(SAMPLE_FILE).get_centrality(CentralityType.DEGREE)
+        finally:
+            remove_span_hook(hook)
+
+        assert names == ["read_gexf", "metadata", "attribute_keys", "intern", "get_centrality"]
+
+    def test_profiler_nests_spans(self) -> None:
+        """Test that nested spans record depth, timing and memory."""
+        from grph.profiling import Profiler, span
+
+        with Profiler(memory=True) as profiler:
+            with span("outer"):
+                with span("inner"):
+                    data = [0] * 100_000
+                del data
+
+        outer, inner = profiler.spans
+        assert (outer.name, outer.depth) == ("outer", 0)
+        assert (inner.name, inner.depth) == ("inner", 1)
+        assert outer.wall_time >= inner.wall_time
+        assert outer.peak_memory >= inner.peak_memory >= 800_000
+
+    def test_spans_are_free_without_hooks(self) -> None:
+        """Test that spans record nothing when no hook is registered."""
+        from grph.profiling import Profiler, span
+
+        profiler = Profiler(memory=False)
+        with span("ignored"):
+            pass
+        with profiler:
+            pass
+
+        assert profiler.spans == []
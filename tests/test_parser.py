@@ -143,6 +143,104 @@ class TestGEXFGraph:
 
         assert node is None
 
+    def test_strings_are_shared(self) -> None:
+        """Test that node IDs and repeated attribute values are interned at load."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        ids = {node: node for node in graph._graph}
+        types = [attrs["type"] for _, attrs in graph._graph.nodes(data=True)]
+
+        for neighbors in graph._graph.adj.values():
+            assert all(node is ids[node] for node in neighbors)
+        assert types[0] is types[1]
+        assert graph.node_index[graph.node_ids[2]] == 2
+
+
+class TestCompressedInput:
+    """Tests for reading compressed GEXF files."""
+
+    @pytest.mark.parametrize("codec", ["gzip", "bz2", "lzma"])
+    def test_load_compressed_file(self, codec: str, tmp_path: Path) -> None:
+        """Test that compressed files parse the same as the plain file."""
+        import importlib
+
+        module = importlib.import_module(codec)
+        path = tmp_path / "sample.gexf.cmp"
+        path.write_bytes(module.compress(SAMPLE_FILE.read_bytes()))
+
+        graph = GEXFGraph(path)
+
+        assert graph.metadata.node_count == 5
+        assert graph.metadata.edge_count == 6
+        assert graph.metadata.creator == "GFX Test Suite"
+        assert graph.metadata.default_edge_type == "directed"
+
+    def test_detect_compression_ignores_extension(self, tmp_path: Path) -> None:
+        """Test that compression is detected from content, not the file name."""
+        import gzip
+
+        from grph.compression import detect_compression
+        from grph.models import Compression
+
+        compressed = tmp_path / "plain-name.gexf"
+        compressed.write_bytes(gzip.compress(SAMPLE_FILE.read_bytes()))
+        plain = tmp_path / "fake.gexf.gz"
+        plain.write_bytes(SAMPLE_FILE.read_bytes())
+
+        assert detect_compression(compressed) == Compression.GZIP
+        assert detect_compression(plain) is None
+        assert GEXFGraph(plain).metadata.node_count == 5
+
+    def test_load_corrupt_compressed_file(self, tmp_path: Path) -> None:
+        """Test that a truncated compressed file raises a parse error."""
+        import gzip
+
+        path = tmp_path / "broken.gexf.gz"
+        path.write_bytes(gzip.compress(SAMPLE_FILE.read_bytes())[:40])
+
+        with pytest.raises(GEXFParseError):
+            GEXFGraph(path)
+
+
+class TestReadMetadata:
+    """Tests for reading metadata without building the graph."""
+
+    def test_counts_elements(self) -> None:
+        """Test that the streaming reader matches the full parser."""
+        from grph.metadata import read_metadata
+
+        metadata = read_metadata(SAMPLE_FILE)
+
+        assert metadata == GEXFGraph(SAMPLE_FILE).metadata
+
+    def test_header_only(self) -> None:
+        """Test that counting can be skipped."""
+        from grph.metadata import read_metadata
+
+        metadata = read_metadata(SAMPLE_FILE, count_elements=False)
+
+        assert metadata.creator == "GFX Test Suite"
+        assert metadata.node_count == 0
+
+    def test_time_format(self) -> None:
+        """Test that the time format of dynamic graphs is read."""
+        from grph.metadata import read_metadata
+
+        metadata = read_metadata(FIXTURES_DIR / "dynamic.gexf", count_elements=False)
+
+        assert metadata.mode == "dynamic"
+        assert metadata.time_format == "date"
+        assert read_metadata(SAMPLE_FILE).time_format is None
+
+    def test_invalid_xml(self, tmp_path: Path) -> None:
+        """Test that malformed files raise a parse error."""
+        from grph.metadata import read_metadata
+
+        path = tmp_path / "broken.gexf"
+        path.write_text("<gexf><graph>")
+
+        with pytest.raises(GEXFParseError, match="Invalid XML"):
+            read_metadata(path)
+
 
 class TestModels:
     """Tests for the data models."""
@@ -195,3 +293,28 @@ class TestModels:
         assert d["description"] == "A test graph"
         assert d["node_count"] == 10
         assert d["edge_count"] == 20
+
+    def test_attribute_view_hides_standard_fields(self) -> None:
+        """Test that edge attributes are a read-only view without standard fields."""
+        graph = GEXFGraph(SAMPLE_FILE)
+        edge = next(graph.edges())
+
+        assert "id" not in edge.attributes
+        assert "weight" not in edge.attributes
+        assert edge.attributes.get("id") is None
+        assert set(edge.attributes) == set(edge.to_dict()["attributes"])
+        with pytest.raises(TypeError):
+            edge.attributes["new"] = 1  # type: ignore[index]
+
+    def test_models_are_slotted_and_hashable(self) -> None:
+        """Test that nodes and edges have no instance dict and hash by identity fields."""
+        from grph.models import Edge, Node
+
+        node = Node(id="a", attributes={"k": 1})
+        edge = Edge(id="e1", source="a", target="b", attributes={"k": 1})
+
+        assert not hasattr(node, "__dict__")
+        assert not hasattr(edge, "__dict__")
+        assert {node, Node(id="a", attributes={"k": 1})} == {node}
+        assert hash(edge) == hash(Edge(id="e1", source="a", target="b"))
+        assert edge == Edge(id="e1", source="a", target="b", attributes={"k": 1})
@@ -0,0 +1,165 @@
+"""Tests for the CSR adjacency and traversal primitives."""
+
+from pathlib import Path
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from grph.csr import CSRAdjacency
+from grph.parser import GEXFGraph
+from grph.traversal import UNREACHED, bfs, bfs_path, dijkstra_path, visited
+
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+SAMPLE_FILE = FIXTURES_DIR / "sample.gexf"
+
+
+def _chain(directed: bool = True) -> CSRAdjacency:
+    """Build the chain a -> b -> c -> d plus an isolated node e."""
+    graph = nx.DiGraph() if directed else nx.Graph()
+    graph.add_nodes_from("abcde")
+    graph.add_edges_from([("a", "b"), ("b", "c"), ("c", "d")])
+    return CSRAdjacency.from_networkx(graph)
+
+
+class TestCSRAdjacency:
+    """Tests for building the CSR adjacency."""
+
+    def test_successors_and_predecessors(self) -> None:
+        """Test forward and reverse rows."""
+        adj = _chain()
+        b = adj.index_of("b")
+
+        assert [adj.node_ids[i] for i in adj.neighbors(b)] == ["c"]
+        assert [adj.node_ids[i] for i in adj.reverse.neighbors(b)] == ["a"]
+
+    def test_reverse_is_cached(self) -> None:
+        """Test that the reverse adjacency is built only once."""
+        adj = _chain()
+        assert adj.reverse is adj.reverse
+        assert adj.reverse.reverse is adj
+
+    def test_undirected_stores_both_directions(self) -> None:
+        """Test that undirected edges are visible from both endpoints."""
+        adj = _chain(directed=False)
+        b = adj.index_of("b")
+
+        assert sorted(adj.node_ids[i] for i in adj.neighbors(b)) == ["a", "c"]
+        assert adj.reverse is adj
+
+    def test_edge_index_maps_slots_to_edges(self) -> None:
+        """Test that CSR slots point back to edge ordinals."""
+        adj = _chain()
+        c = adj.index_of("c")
+
+        assert list(adj.edge_index[adj.slots(np.array([c]))]) == [2]
+
+    def test_missing_node(self) -> None:
+        """Test looking up an unknown node ID."""
+        assert _chain().index_of("zzz") == -1
+
+
+class TestBFS:
+    """Tests for the multi-source BFS."""
+
+    def test_distances(self) -> None:
+        """Test hop distances from a single source."""
+        adj = _chain()
+        dist = bfs(adj, [adj.index_of("a")])
+
+        assert list(dist) == [0, 1, 2, 3, UNREACHED]
+
+    def test_max_depth(self) -> None:
+        """Test that the search stops at the depth limit."""
+        adj = _chain()
+        dist = bfs(adj, [adj.index_of("a")], max_depth=2)
+
+        assert sorted(adj.node_ids[i] for i in visited(dist)) == ["a", "b", "c"]
+
+    def test_backward(self) -> None:
+        """Test walking predecessors."""
+        adj = _chain()
+        dist = bfs(adj, [adj.index_of("d")], direction="in", max_depth=2)
+
+        assert sorted(adj.node_ids[i] for i in visited(dist)) == ["b", "c", "d"]
+
+    def test_multi_source(self) -> None:
+        """Test starting from several nodes at once."""
+        adj = _chain()
+        dist = bfs(adj, [adj.index_of("a"), adj.index_of("c")], max_depth=1)
+
+        assert list(dist) == [0, 1, 0, 1, UNREACHED]
+
+    def test_backward_reachable_does_not_copy_graph(self, monkeypatch) -> None:
+        """Test that backward traversal never reverses the NetworkX graph."""
+        graph = GEXFGraph(SAMPLE_FILE)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("graph.reverse() should not be called")
+
+        monkeypatch.setattr(nx.DiGraph, "reverse", fail)
+        reachable = graph.reachable("db1", direction="backward", max_depth=1)
+
+        assert {n.id for n in reachable} == {"server1", "server2"}
+
+
+class TestMaskedSearch:
+    """Tests for searches constrained by edge and node masks."""
+
+    def test_edge_mask(self) -> None:
+        """Test that masked-out edges are not followed."""
+        adj = _chain()
+        edge_mask = np.array([True, False, True])
+        dist = bfs(adj, [adj.index_of("a")], edge_mask=edge_mask)
+
+        assert sorted(adj.node_ids[i] for i in visited(dist)) == ["a", "b"]
+
+    def test_node_mask_keeps_source(self) -> None:
+        """Test that the start node is included even when masked out."""
+        adj = _chain()
+        node_mask = np.array([False, True, True, False, True])
+        dist = bfs(adj, [adj.index_of("a")], node_mask=node_mask)
+
+        assert sorted(adj.node_ids[i] for i in visited(dist)) == ["a", "b", "c"]
+
+    def test_bfs_path(self) -> None:
+        """Test the fewest-hops path search."""
+        adj = _chain()
+        path = bfs_path(adj, adj.index_of("a"), adj.index_of("d"))
+
+        assert [adj.node_ids[i] for i in path] == ["a", "b", "c", "d"]
+        assert bfs_path(adj, adj.index_of("d"), adj.index_of("a")) is None
+
+    def test_dijkstra_prefers_lighter_route(self) -> None:
+        """Test that the weighted search follows the lowest total weight."""
+        graph = nx.DiGraph()
+        graph.add_edge("a", "b", weight=1.0)
+        graph.add_edge("b", "c", weight=1.0)
+        graph.add_edge("a", "c", weight=5.0)
+        adj = CSRAdjacency.from_networkx(graph)
+        weights = np.array([d["weight"] for _, _, d in graph.edges(data=True)])
+
+        path, total = dijkstra_path(adj, adj.index_of("a"), adj.index_of("c"), weights)
+        assert [adj.node_ids[i] for i in path] == ["a", "b", "c"]
+        assert total == 2.0
+
+        # Excluding a -> b forces the heavy direct edge
+        edge_mask = np.array([False, True, True])
+        path, total = dijkstra_path(
+            adj, adj.index_of("a"), adj.index_of("c"), weights, edge_mask=edge_mask
+        )
+        assert [adj.node_ids[i] for i in path] == ["a", "c"]
+        assert total == 5.0
+
+    def test_dijkstra_rejects_negative_weights(self) -> None:
+        """Test that negative weights raise instead of giving a wrong path."""
+        graph = nx.DiGraph()
+        graph.add_edge("a", "c", weight=5.0)
+        graph.add_edge("a", "b", weight=10.0)
+        graph.add_edge("b", "c", weight=-20.0)
+        adj = CSRAdjacency.from_networkx(graph)
+        weights = np.array([d["weight"] for _, _, d in graph.edges(data=True)])
+
+        with pytest.raises(ValueError, match="Negative edge weights"):
+            dijkstra_path(adj, adj.index_of("a"), adj.index_of("c"), weights)